@@ -0,0 +1,18 @@
+#!/usr/bin/env bash
+#
+# Benchmark Python Package
+#
+# Runs the benchmarks against an in-process fake S3 server (or Minio when
+# --minio-host is passed), writing the JSON results to --output. All other
+# arguments are passed to benchmarks/benchmark_minio_helpers.py
+#
+# Example Call:
+#    ./benchmark_python_package.sh --output=benchmark.json --baseline=baseline.json
+#
+
+echo "$(date +%c): Running Benchmarks"
+PYTHONPATH="$(dirname "$0"):${PYTHONPATH}" python3 "$(dirname "$0")/benchmarks/benchmark_minio_helpers.py" "$@"
+
+BENCHMARK_STATUS=$?
+echo "$(date +%c): Benchmark Exit Status - ${BENCHMARK_STATUS}"
+exit ${BENCHMARK_STATUS}
@@ -0,0 +1,676 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Benchmark the minio_helpers against Minio (or an in-process fake S3
+        server when no Minio host is given) and write the results as JSON, to be
+        compared across releases
+
+    Steps:
+        - Connect to Minio (or start the fake server)
+        - Create a scratch bucket and upload the benchmark objects
+        - Measure listing throughput, small object GET/PUT operations per
+          second, large object MB/s, stat latency percentiles, and the memory
+          peak of download_object_to_memory
+        - Write the results as JSON (and compare them to a baseline)
+        - Delete the scratch bucket
+
+    function call:python3 benchmark_minio_helpers.py {--access-key=access_key} \
+        {--secret-key=secret_key} {--minio-host=minio_host} {--minio-port=minio_port} \
+        {--output=output} {--baseline=baseline} {--max-regression=max_regression} \
+        {--list-objects=list_objects} {--small-objects=small_objects} \
+        {--large-object-mb=large_object_mb} {--stat-requests=stat_requests} \
+        {--memory-object-mb=memory_object_mb} {--workers=workers}
+"""
+
+# Python Library Imports
+import datetime
+import gc
+import io
+import logging
+import minio
+import os
+import platform
+import simplejson as json
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+
+# Local Library Imports
+from minio_helpers import minio_bucket_helpers, minio_connection_helpers, \
+    minio_object_helpers
+from minio_helpers.tests.fake_s3_server import FakeS3Server
+
+
+def main():
+    """
+    Purpose:
+        Run the Benchmarks
+    """
+    logging.info("Starting minio_helpers Benchmarks")
+
+    opts = get_options()
+
+    fake_s3_server = None
+    if opts.minio_host:
+        minio_url = minio_connection_helpers.build_minio_url(
+            opts.minio_host, opts.minio_port
+        )
+        target = minio_url
+    else:
+        fake_s3_server = FakeS3Server().start()
+        minio_url = fake_s3_server.minio_url
+        target = "fake_s3_server"
+
+    minio_client = minio_connection_helpers.connect_to_minio(
+        minio_url, opts.access_key, opts.secret_key,
+        max_pool_size=max(opts.workers, minio_connection_helpers.DEFAULT_MAX_POOL_SIZE),
+    )
+
+    bucket_name = f"minio-helpers-benchmark-{uuid.uuid4().hex[:8]}"
+    minio_bucket_helpers.create_bucket(minio_client, bucket_name)
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            results = run_benchmarks(minio_client, bucket_name, work_dir, opts)
+    finally:
+        minio_bucket_helpers.delete_bucket(minio_client, bucket_name, force=True)
+        if fake_s3_server:
+            fake_s3_server.stop()
+
+    benchmark_report = {
+        "benchmark": "minio_helpers",
+        "started_at": datetime.datetime.utcnow().isoformat() + "Z",
+        "target": target,
+        "environment": get_environment(),
+        "options": {
+            key: value for key, value in vars(opts).items()
+            if key not in ("access_key", "secret_key", "output", "baseline")
+        },
+        "results": results,
+    }
+
+    benchmark_json = json.dumps(benchmark_report, indent=2, sort_keys=True)
+    if opts.output:
+        with open(opts.output, "w") as output_file:
+            output_file.write(benchmark_json + "\n")
+        logging.info(f"Wrote Benchmark Results to {opts.output}")
+    else:
+        print(benchmark_json)
+
+    if opts.baseline:
+        with open(opts.baseline) as baseline_file:
+            baseline_report = json.load(baseline_file)
+        regressions = compare_results(
+            baseline_report["results"], results, opts.max_regression
+        )
+        for regression in regressions:
+            logging.error(
+                f"Regression in {regression['benchmark']}.{regression['metric']}: "
+                f"{regression['baseline']} -> {regression['value']} "
+                f"{regression['unit']} ({regression['change']:+.1%})"
+            )
+        if regressions:
+            sys.exit(1)
+
+    logging.info("minio_helpers Benchmarks Complete")
+
+
+###
+# Benchmarks
+###
+
+
+def run_benchmarks(minio_client, bucket_name, work_dir, opts):
+    """
+    Purpose:
+        Run every benchmark against a scratch bucket
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the scratch bucket
+        work_dir (String): Scratch directory for local files
+        opts (argparse Namespace): Benchmark options
+    Returns:
+        results (Dict): Metrics of each benchmark, by benchmark name
+    """
+
+    return {
+        "list_objects": benchmark_list_objects(
+            minio_client, bucket_name, opts.list_objects, opts.workers
+        ),
+        "small_objects": benchmark_small_objects(
+            minio_client, bucket_name, work_dir, opts.small_objects
+        ),
+        "large_object": benchmark_large_object(
+            minio_client, bucket_name, work_dir, opts.large_object_mb, opts.workers
+        ),
+        "stat_object": benchmark_stat_object(
+            minio_client, bucket_name, opts.stat_requests
+        ),
+        "download_object_to_memory": benchmark_download_to_memory(
+            minio_client, bucket_name, opts.memory_object_mb
+        ),
+    }
+
+
+def benchmark_list_objects(minio_client, bucket_name, num_objects, workers):
+    """
+    Purpose:
+        Measure listing throughput (objects listed per second) of
+        get_object_names over num_objects objects
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the scratch bucket
+        num_objects (Int): Number of objects to list
+        workers (Int): Number of objects uploaded at once while seeding
+    Returns:
+        metrics (Dict): Metrics of the benchmark
+    """
+    logging.info(f"Benchmarking Listing {num_objects} Objects")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(
+            lambda idx: put_bytes(
+                minio_client, bucket_name, f"list/{idx // 100:04d}/{idx:08d}", b""
+            ),
+            range(num_objects),
+        ))
+
+    durations = time_calls(
+        lambda: minio_object_helpers.get_object_names(
+            minio_client, bucket_name, prefix="list/", recursive=True
+        ),
+        3,
+    )
+
+    return {
+        "objects_per_second": build_metric(
+            num_objects / min(durations), "objects/s", higher_is_better=True
+        ),
+    }
+
+
+def benchmark_small_objects(minio_client, bucket_name, work_dir, num_objects):
+    """
+    Purpose:
+        Measure operations per second of uploading (upload_object) and
+        downloading (download_object_to_memory) small JSON objects one at a time
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the scratch bucket
+        work_dir (String): Scratch directory for local files
+        num_objects (Int): Number of objects to upload and download
+    Returns:
+        metrics (Dict): Metrics of the benchmark
+    """
+    logging.info(f"Benchmarking {num_objects} Small Object GETs and PUTs")
+
+    small_file = os.path.join(work_dir, "small.json")
+    with open(small_file, "w") as small_file_obj:
+        json.dump({"key": "value", "values": list(range(64))}, small_file_obj)
+
+    put_durations = [
+        time_call(
+            lambda: minio_object_helpers.upload_object(
+                minio_client, bucket_name, small_file, object_name=f"small/{idx}.json"
+            )
+        )
+        for idx in range(num_objects)
+    ]
+    get_durations = [
+        time_call(
+            lambda: minio_object_helpers.download_object_to_memory(
+                minio_client, bucket_name, f"small/{idx}.json"
+            )
+        )
+        for idx in range(num_objects)
+    ]
+
+    return {
+        "put_ops_per_second": build_metric(
+            num_objects / sum(put_durations), "ops/s", higher_is_better=True
+        ),
+        "get_ops_per_second": build_metric(
+            num_objects / sum(get_durations), "ops/s", higher_is_better=True
+        ),
+        "put_p99_ms": build_metric(
+            get_percentile(put_durations, 99) * 1000, "ms", higher_is_better=False
+        ),
+        "get_p99_ms": build_metric(
+            get_percentile(get_durations, 99) * 1000, "ms", higher_is_better=False
+        ),
+    }
+
+
+def benchmark_large_object(minio_client, bucket_name, work_dir, object_mb, workers):
+    """
+    Purpose:
+        Measure MB/s of uploading a large object (as a parallel multipart upload)
+        and downloading it as a single stream and as parallel byte ranges
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the scratch bucket
+        work_dir (String): Scratch directory for local files
+        object_mb (Int): Size of the object in MiB
+        workers (Int): Number of parts or ranges transferred at once
+    Returns:
+        metrics (Dict): Metrics of the benchmark
+    """
+    logging.info(f"Benchmarking a {object_mb}MiB Object Upload and Download")
+
+    large_file = os.path.join(work_dir, "large.bin")
+    with open(large_file, "wb") as large_file_obj:
+        for _ in range(object_mb):
+            large_file_obj.write(os.urandom(1024 * 1024))
+
+    upload_duration = time_call(
+        lambda: minio_object_helpers.upload_object(
+            minio_client, bucket_name, large_file, object_name="large/large.bin",
+            part_size=8 * 1024 * 1024, max_workers=workers,
+        )
+    )
+    download_duration = time_call(
+        lambda: minio_object_helpers.download_object_to_file(
+            minio_client, bucket_name, "large/large.bin",
+            filename=os.path.join(work_dir, "large.download"),
+        )
+    )
+    ranged_download_duration = time_call(
+        lambda: minio_object_helpers.download_object_to_file(
+            minio_client, bucket_name, "large/large.bin",
+            filename=os.path.join(work_dir, "large.ranged"), ranged=True,
+            part_size=8 * 1024 * 1024, max_workers=workers,
+        )
+    )
+
+    return {
+        "upload_mb_per_second": build_metric(
+            object_mb / upload_duration, "MiB/s", higher_is_better=True
+        ),
+        "download_mb_per_second": build_metric(
+            object_mb / download_duration, "MiB/s", higher_is_better=True
+        ),
+        "ranged_download_mb_per_second": build_metric(
+            object_mb / ranged_download_duration, "MiB/s", higher_is_better=True
+        ),
+    }
+
+
+def benchmark_stat_object(minio_client, bucket_name, num_requests):
+    """
+    Purpose:
+        Measure latency percentiles of get_object_stats
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the scratch bucket
+        num_requests (Int): Number of stats to time
+    Returns:
+        metrics (Dict): Metrics of the benchmark
+    """
+    logging.info(f"Benchmarking {num_requests} Object Stats")
+
+    put_bytes(minio_client, bucket_name, "stat/object.txt", b"stat")
+    durations = [
+        time_call(
+            lambda: minio_object_helpers.get_object_stats(
+                minio_client, bucket_name, "stat/object.txt"
+            )
+        )
+        for _ in range(num_requests)
+    ]
+
+    return {
+        f"p{percentile}_ms": build_metric(
+            get_percentile(durations, percentile) * 1000, "ms", higher_is_better=False
+        )
+        for percentile in (50, 90, 99)
+    }
+
+
+def benchmark_download_to_memory(minio_client, bucket_name, object_mb):
+    """
+    Purpose:
+        Measure the throughput of download_object_to_memory decoding a JSON
+        object, and the peak Python memory it allocates compared to the size of
+        the object
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the scratch bucket
+        object_mb (Int): Approximate size of the object in MiB
+    Returns:
+        metrics (Dict): Metrics of the benchmark
+    """
+    logging.info(f"Benchmarking Memory Peak of a {object_mb}MiB Download to Memory")
+
+    record = {"id": 0, "name": "x" * 64, "values": list(range(8))}
+    record_size = len(json.dumps(record)) + 2
+    object_data = json.dumps(
+        [record] * max(object_mb * 1024 * 1024 // record_size, 1)
+    ).encode("utf-8")
+    put_bytes(minio_client, bucket_name, "memory/object.json", object_data)
+    del object_data
+
+    def download_object():
+        return minio_object_helpers.download_object_to_memory(
+            minio_client, bucket_name, "memory/object.json"
+        )
+
+    duration = min(time_calls(download_object, 3))
+
+    # Tracing allocations slows decoding down, so the peak is measured apart
+    gc.collect()
+    tracemalloc.start()
+    try:
+        download_object()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    object_size = minio_client.stat_object(bucket_name, "memory/object.json").size
+
+    return {
+        "peak_mb": build_metric(
+            peak_bytes / 1024 / 1024, "MiB", higher_is_better=False
+        ),
+        "peak_to_object_size_ratio": build_metric(
+            peak_bytes / object_size, "ratio", higher_is_better=False
+        ),
+        "mb_per_second": build_metric(
+            object_size / 1024 / 1024 / duration, "MiB/s", higher_is_better=True
+        ),
+    }
+
+
+###
+# Result Helpers
+###
+
+
+def build_metric(value, unit, higher_is_better):
+    """
+    Purpose:
+        Build a metric of a benchmark
+    Args:
+        value (Float): Measured value
+        unit (String): Unit of the value
+        higher_is_better (Boolean): Whether a higher value is an improvement
+    Returns:
+        metric (Dict): value, unit, and higher_is_better
+    """
+
+    return {
+        "value": round(value, 4),
+        "unit": unit,
+        "higher_is_better": higher_is_better,
+    }
+
+
+def compare_results(baseline_results, results, max_regression):
+    """
+    Purpose:
+        Find metrics that got worse than a baseline by more than max_regression
+    Args:
+        baseline_results (Dict): Results of a previous run
+        results (Dict): Results of this run
+        max_regression (Float): Fraction a metric may get worse by (such as 0.1
+            for 10%)
+    Returns:
+        regressions (List of Dicts): benchmark, metric, baseline, value, unit, and
+            change of each regressed metric
+    """
+
+    regressions = []
+    for benchmark_name, metrics in results.items():
+        for metric_name, metric in metrics.items():
+            baseline_metric = baseline_results.get(benchmark_name, {}).get(metric_name)
+            if not baseline_metric or not baseline_metric["value"]:
+                continue
+
+            change = (metric["value"] - baseline_metric["value"]) / \
+                baseline_metric["value"]
+            if (-change if metric["higher_is_better"] else change) > max_regression:
+                regressions.append(
+                    {
+                        "benchmark": benchmark_name,
+                        "metric": metric_name,
+                        "baseline": baseline_metric["value"],
+                        "value": metric["value"],
+                        "unit": metric["unit"],
+                        "change": change,
+                    }
+                )
+
+    return regressions
+
+
+def get_environment():
+    """
+    Purpose:
+        Describe the environment the benchmarks ran in
+    Args:
+        N/A
+    Returns:
+        environment (Dict): Versions of python, minio, and minio_helpers, and the
+            platform
+    """
+
+    version_file = os.path.join(os.path.dirname(__file__), "..", "VERSION")
+    minio_helpers_version = "unknown"
+    if os.path.exists(version_file):
+        with open(version_file) as version_file_obj:
+            minio_helpers_version = version_file_obj.readline().strip()
+
+    return {
+        "minio_helpers": minio_helpers_version,
+        "minio": minio.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+###
+# General/Helper Methods
+###
+
+
+def put_bytes(minio_client, bucket_name, object_name, data):
+    """
+    Purpose:
+        Upload bytes as an object
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket
+        object_name (String): Name of the object
+        data (Bytes): Contents of the object
+    Returns:
+        N/A
+    """
+
+    minio_client.put_object(bucket_name, object_name, io.BytesIO(data), len(data))
+
+
+def time_call(func):
+    """
+    Purpose:
+        Time one call of a function
+    Args:
+        func (Function): Function to call with no arguments
+    Returns:
+        duration (Float): Seconds the call took
+    """
+
+    start_time = time.perf_counter()
+    func()
+
+    return time.perf_counter() - start_time
+
+
+def time_calls(func, iterations):
+    """
+    Purpose:
+        Time several calls of a function
+    Args:
+        func (Function): Function to call with no arguments
+        iterations (Int): Number of calls
+    Returns:
+        durations (List of Floats): Seconds each call took
+    """
+
+    return [time_call(func) for _ in range(iterations)]
+
+
+def get_percentile(durations, percentile):
+    """
+    Purpose:
+        Get a percentile of durations (nearest rank)
+    Args:
+        durations (List of Floats): Measured durations
+        percentile (Int): Percentile to get (0-100)
+    Returns:
+        duration (Float): Duration at the percentile
+    """
+
+    sorted_durations = sorted(durations)
+    rank = max(int(round(percentile / 100 * len(sorted_durations))) - 1, 0)
+
+    return sorted_durations[min(rank, len(sorted_durations) - 1)]
+
+
+def get_options():
+    """
+    Purpose:
+        Parse CLI arguments for script
+    Args:
+        N/A
+    Return:
+        N/A
+    """
+
+    parser = ArgumentParser(description="Benchmark minio_helpers")
+    optional = parser.add_argument_group('Optional Arguments')
+
+    # Optional Arguments
+    optional.add_argument(
+        "--access-key",
+        dest="access_key",
+        default="access",
+        help="Access Key for Minio",
+        required=False,
+    )
+    optional.add_argument(
+        "--secret-key",
+        dest="secret_key",
+        default="secret-key",
+        help="Secret Key for Minio",
+        required=False,
+    )
+    optional.add_argument(
+        "--minio-host",
+        dest="minio_host",
+        default=None,
+        help="Host for Minio (Defaults to an in-process fake S3 server)",
+        required=False,
+    )
+    optional.add_argument(
+        "--minio-port",
+        dest="minio_port",
+        default=9000,
+        help="Port for Minio",
+        required=False,
+    )
+    optional.add_argument(
+        "--output",
+        dest="output",
+        default=None,
+        help="File to write the JSON results to (Defaults to stdout)",
+        required=False,
+    )
+    optional.add_argument(
+        "--baseline",
+        dest="baseline",
+        default=None,
+        help="JSON results of a previous run to check for regressions against",
+        required=False,
+    )
+    optional.add_argument(
+        "--max-regression",
+        dest="max_regression",
+        default=0.2,
+        type=float,
+        help="Fraction a metric may get worse than the baseline by",
+        required=False,
+    )
+    optional.add_argument(
+        "--list-objects",
+        dest="list_objects",
+        default=2000,
+        type=int,
+        help="Number of objects to list",
+        required=False,
+    )
+    optional.add_argument(
+        "--small-objects",
+        dest="small_objects",
+        default=200,
+        type=int,
+        help="Number of small objects to upload and download",
+        required=False,
+    )
+    optional.add_argument(
+        "--large-object-mb",
+        dest="large_object_mb",
+        default=64,
+        type=int,
+        help="Size of the large object in MiB",
+        required=False,
+    )
+    optional.add_argument(
+        "--stat-requests",
+        dest="stat_requests",
+        default=500,
+        type=int,
+        help="Number of object stats to time",
+        required=False,
+    )
+    optional.add_argument(
+        "--memory-object-mb",
+        dest="memory_object_mb",
+        default=8,
+        type=int,
+        help="Size of the JSON object downloaded into memory in MiB",
+        required=False,
+    )
+    optional.add_argument(
+        "--workers",
+        dest="workers",
+        default=8,
+        type=int,
+        help="Number of parts, ranges, or objects transferred at once",
+        required=False,
+    )
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    # The helpers log every call at INFO, which would be timed with them
+    log_level = logging.WARNING
+    logging.getLogger().setLevel(log_level)
+    logging.basicConfig(
+        stream=sys.stderr,
+        level=log_level,
+        format="[benchmark_minio_helpers] %(asctime)s %(levelname)s %(message)s",
+        datefmt="%a, %d %b %Y %H:%M:%S"
+    )
+
+    try:
+        main()
+    except Exception as err:
+        print(
+            "{0} failed due to error: {1}".format(os.path.basename(__file__), err)
+        )
+        raise err
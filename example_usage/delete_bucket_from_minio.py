@@ -9,7 +9,7 @@
 
     function call:python3 delete_bucket_from_minio.py {--access-key=access_key} \
         {--secret-key=secret_key} {--minio-host=minio_host} {--minio-port=minio_port} \
-        {--bucket-name=bucket_name}
+        {--bucket-name=bucket_name} {--force}
 """
 
 # Python Library Imports
@@ -45,7 +45,9 @@ def main():
         logging.info(f"{opts.bucket_name} doesn't exist, expecting an exception")
 
     try:
-        minio_bucket_helpers.delete_bucket(minio_client, opts.bucket_name)
+        minio_bucket_helpers.delete_bucket(
+            minio_client, opts.bucket_name, force=opts.force
+        )
     except BucketDoesntExist as ba_err:
         logging.error(f"Got expected Error: {ba_err}")
     except Exception as err:
@@ -77,7 +79,14 @@ def get_options():
     optional = parser.add_argument_group('Optional Arguments')
 
     # Optional Arguments
-    # N/A
+    optional.add_argument(
+        "--force",
+        dest="force",
+        default=False,
+        action="store_true",
+        help="Delete every Object in the Bucket before Deleting it",
+        required=False,
+    )
 
     # Required Arguments
     required.add_argument(
@@ -10,7 +10,8 @@
 
     function call:python3 get_objects_from_Bucket.py {--access-key=access_key} \
         {--secret-key=secret_key} {--minio-host=minio_host} {--minio-port=minio_port} \
-        {--bucket-name=bucket_name} {--object-name=object_name}
+        {--bucket-name=bucket_name} {--object-name=object_name} {--workers=workers} \
+        {--checkpoint-file=checkpoint_file}
 """
 
 # Python Library Imports
@@ -21,6 +22,7 @@ from argparse import ArgumentParser
 
 # Local Library Imports
 from minio_helpers import minio_connection_helpers, minio_object_helpers
+from minio_helpers.minio_transfer_helpers import TransferJob
 from minio_helpers.minio_exceptions import BucketDoesntExist
 
 
@@ -37,37 +39,63 @@ def main():
         minio_connection_helpers.build_minio_url(opts.minio_host, opts.minio_port)
 
     minio_client = minio_connection_helpers.connect_to_minio(
-        minio_url, opts.access_key, opts.secret_key
+        minio_url, opts.access_key, opts.secret_key,
+        max_pool_size=max(
+            opts.workers, minio_connection_helpers.DEFAULT_MAX_POOL_SIZE
+        ),
     )
 
     if not opts.object_names:
-        objects = minio_object_helpers.get_objects(minio_client, opts.bucket_name)
-        object_names = minio_object_helpers.get_object_names(minio_client, opts.bucket_name)
+        # Listed names exist, so only names passed in are checked
+        existing_object_names =\
+            minio_object_helpers.get_object_names(minio_client, opts.bucket_name)
     else:
-        object_names = opts.object_names
-
-    for object_name in object_names:
-        object_exists = minio_object_helpers.is_object_in_bucket(
-            minio_client, opts.bucket_name, object_name
+        objects_exist = minio_object_helpers.are_objects_in_bucket(
+            minio_client, opts.bucket_name, opts.object_names
         )
 
-        if not object_exists:
-            logging.error(f"{object_name} doesnt exist in {opts.bucket_name}")
-            continue
-
+        existing_object_names = []
+        for object_name in opts.object_names:
+            if not objects_exist[object_name]:
+                logging.error(f"{object_name} doesnt exist in {opts.bucket_name}")
+                continue
+            existing_object_names.append(object_name)
 
-        if opts.download_to_memory:
+    if opts.download_to_memory:
+        for object_name in existing_object_names:
             minio_object = minio_object_helpers.download_object_to_memory(
                 minio_client, opts.bucket_name, object_name
             )
             import pdb; pdb.set_trace()
-        else:
-            minio_object_helpers.download_object_to_file(
-                minio_client,
+    elif opts.checkpoint_file:
+        with TransferJob(
+            minio_client, opts.checkpoint_file, max_workers=opts.workers
+        ) as transfer_job:
+            download_results = transfer_job.download_objects(
                 opts.bucket_name,
-                object_name,
-                filename=f"{opts.download_dir}/{object_name}",
+                existing_object_names,
+                download_dir=opts.download_dir,
             )
+        for download_result in download_results:
+            if download_result["error"]:
+                logging.error(
+                    f"Failed to Download {download_result['object_name']}: "
+                    f"{download_result['error']}"
+                )
+    else:
+        download_results = minio_object_helpers.download_objects(
+            minio_client,
+            opts.bucket_name,
+            existing_object_names,
+            download_dir=opts.download_dir,
+            max_workers=opts.workers,
+        )
+        for download_result in download_results:
+            if download_result["error"]:
+                logging.error(
+                    f"Failed to Download {download_result['object_name']}: "
+                    f"{download_result['error']}"
+                )
 
     import pdb; pdb.set_trace()
 
@@ -109,6 +137,21 @@ def get_options():
         help="Where to Download the Files",
         required=False,
     )
+    required.add_argument(
+        "--workers",
+        dest="workers",
+        default=8,
+        type=int,
+        help="Number of Objects to Download at Once",
+        required=False,
+    )
+    required.add_argument(
+        "--checkpoint-file",
+        dest="checkpoint_file",
+        default=None,
+        help="Checkpoint File to Resume an Interrupted Download From",
+        required=False,
+    )
     required.add_argument(
         "--download-to-memory",
         dest="download_to_memory",
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Upload a Local Directory to a Bucket in Minio
+
+    Steps:
+        - Connect to Minio
+        - Upload every changed file in the directory to the Bucket
+
+    function call:python3 upload_directory_to_minio.py {--access-key=access_key} \
+        {--secret-key=secret_key} {--minio-host=minio_host} {--minio-port=minio_port} \
+        {--bucket-name=bucket_name} {--upload-dir=upload_dir} {--prefix=prefix} \
+        {--workers=workers} {--compare=compare} {--no-skip-unchanged}
+"""
+
+# Python Library Imports
+import logging
+import os
+import sys
+from argparse import ArgumentParser
+
+# Local Library Imports
+from minio_helpers import minio_connection_helpers, minio_object_helpers
+
+
+def main():
+    """
+    Purpose:
+        Upload a Local Directory to Minio
+    """
+    logging.info("Starting Upload Directory to Minio")
+
+    opts = get_options()
+
+    minio_url =\
+        minio_connection_helpers.build_minio_url(opts.minio_host, opts.minio_port)
+
+    minio_client = minio_connection_helpers.connect_to_minio(
+        minio_url, opts.access_key, opts.secret_key,
+        max_pool_size=max(
+            opts.workers, minio_connection_helpers.DEFAULT_MAX_POOL_SIZE
+        ),
+    )
+
+    upload_results = minio_object_helpers.upload_directory(
+        minio_client,
+        opts.bucket_name,
+        opts.upload_dir,
+        prefix=opts.prefix,
+        max_workers=opts.workers,
+        skip_unchanged=opts.skip_unchanged,
+        compare=opts.compare,
+    )
+    for upload_result in upload_results:
+        if upload_result["error"]:
+            logging.error(
+                f"Failed to Upload {upload_result['filename']}: {upload_result['error']}"
+            )
+
+    logging.info("Upload Directory to Minio Complete")
+
+
+###
+# General/Helper Methods
+###
+
+
+def get_options():
+    """
+    Purpose:
+        Parse CLI arguments for script
+    Args:
+        N/A
+    Return:
+        N/A
+    """
+
+    parser = ArgumentParser(description="Upload Directory to Minio")
+    required = parser.add_argument_group('Required Arguments')
+    optional = parser.add_argument_group('Optional Arguments')
+
+    # Optional Arguments
+    optional.add_argument(
+        "--upload-dir",
+        dest="upload_dir",
+        default="./data",
+        help="Local Directory to Upload",
+        required=False,
+    )
+    optional.add_argument(
+        "--prefix",
+        dest="prefix",
+        default="",
+        help="Directory to put every Object under",
+        required=False,
+    )
+    optional.add_argument(
+        "--workers",
+        dest="workers",
+        default=8,
+        type=int,
+        help="Number of Files to Upload at Once",
+        required=False,
+    )
+    optional.add_argument(
+        "--compare",
+        dest="compare",
+        default="size_mtime",
+        choices=minio_object_helpers.UPLOAD_COMPARE_STRATEGIES,
+        help="How to find Files that are Unchanged in Minio",
+        required=False,
+    )
+    optional.add_argument(
+        "--no-skip-unchanged",
+        dest="skip_unchanged",
+        default=True,
+        action="store_false",
+        help="Upload Files even if they are Unchanged in Minio",
+        required=False,
+    )
+
+    # Required Arguments
+    required.add_argument(
+        "--access-key",
+        dest="access_key",
+        help="Access Key for Minio",
+        required=True,
+    )
+    required.add_argument(
+        "--secret-key",
+        dest="secret_key",
+        help="Secret Key for Minio",
+        required=True,
+    )
+    required.add_argument(
+        "--minio-host",
+        dest="minio_host",
+        help="Host for Minio",
+        required=True,
+    )
+    required.add_argument(
+        "--minio-port",
+        dest="minio_port",
+        help="Port for Minio",
+        required=True,
+    )
+    required.add_argument(
+        "--bucket-name",
+        dest="bucket_name",
+        help="Bucket Name to Upload to",
+        required=True,
+    )
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    log_level = logging.INFO
+    logging.getLogger().setLevel(log_level)
+    logging.basicConfig(
+        stream=sys.stdout,
+        level=log_level,
+        format="[upload_directory_to_minio] %(asctime)s %(levelname)s %(message)s",
+        datefmt="%a, %d %b %Y %H:%M:%S"
+    )
+
+    try:
+        main()
+    except Exception as err:
+        print(
+            "{0} failed due to error: {1}".format(os.path.basename(__file__), err)
+        )
+        raise err
@@ -3,9 +3,17 @@
         Add Libraries to Path for Pip Installing
 """
 
+from .minio_async_helpers import *
 from .minio_client import *
 from .minio_bucket_helpers import *
+from .minio_cache_helpers import *
 from .minio_connection_helpers import *
+from .minio_decoder_helpers import *
 from .minio_exceptions import *
 from .minio_general_helpers import *
+from .minio_instrumentation_helpers import *
+from .minio_inventory_helpers import *
 from .minio_object_helpers import *
+from .minio_retry_helpers import *
+from .minio_sync_helpers import *
+from .minio_transfer_helpers import *
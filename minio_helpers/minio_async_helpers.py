@@ -0,0 +1,901 @@
+"""
+    Purpose:
+        Minio Object Storage Async Helpers.
+
+        This library is used to interact with Minio object storage from asyncio
+        applications. AsyncMinioClient signs requests with the same SigV4 signer as
+        the minio lib and sends them over a single shared aiohttp connection pool,
+        so thousands of small object operations can run on one event loop without
+        a thread per call. The async_* helper functions mirror the blocking helpers
+        in minio_bucket_helpers and minio_object_helpers
+
+        aiohttp is an optional dependency (pip install ctodd-python-lib-minio[async])
+"""
+
+# Python Library Imports
+import asyncio
+import base64
+import collections
+import hashlib
+import io
+import itertools
+import logging
+from minio.credentials import Credentials, Static
+from minio.error import MultiDeleteError, ResponseError, NoSuchBucket, NoSuchKey
+from minio.fold_case_dict import FoldCaseDict
+from minio.helpers import amzprefix_user_metadata, get_sha256_hexdigest, \
+    get_target_url
+from minio.parsers import parse_list_buckets, parse_list_objects_v2, \
+    parse_multi_delete_response
+from minio.signer import sign_v4
+from minio.xml_marshal import xml_marshal_bucket_constraint, xml_marshal_delete_objects
+
+try:
+    import aiohttp
+    import yarl
+except ImportError:
+    aiohttp = None
+    yarl = None
+
+# Local Library Imports
+from minio_helpers.minio_decoder_helpers import decode_object_stream, get_decoder
+from minio_helpers.minio_exceptions import BucketAlreadyExists, BucketDoesntExist, \
+    ObjectDoesntExist
+from minio_helpers.minio_general_helpers import iter_batches
+from minio_helpers.minio_instrumentation_helpers import add_bytes_transferred, \
+    instrumented
+from minio_helpers.minio_object_helpers import format_object_stats, \
+    get_object_from_headers
+
+
+###
+# Constants
+###
+
+
+DEFAULT_ASYNC_MAX_CONNECTIONS = 100
+DEFAULT_ASYNC_MAX_CONCURRENCY = 100
+MAX_ASYNC_DELETE_BATCH_SIZE = 1000
+
+AsyncResponse = collections.namedtuple(
+    "AsyncResponse", ["status", "reason", "headers", "data"]
+)
+
+
+###
+# Async Minio Client
+###
+
+
+class AsyncMinioClient(object):
+    """
+        AsyncMinioClient Class. Class objects hold a pooled aiohttp session to the
+        Minio service and expose coroutine versions of the minio lib calls used by
+        the helpers. Use as an async context manager (or await close()) so the
+        pool is released
+    """
+
+    ###
+    # Class Lifecycle Methods
+    ###
+
+    def __init__(
+        self, minio_url, access_key=None, secret_key=None, secure=False,
+        region="us-east-1", max_connections=DEFAULT_ASYNC_MAX_CONNECTIONS,
+        session=None
+    ):
+        """
+        Purpose:
+            Initilize the AsyncMinioClient Class. The aiohttp session is created on
+            first use so the client can be built outside of a running event loop
+        Args:
+            minio_url (String): URL of Minio (host:port)
+            access_key (String): Access Key for Minio
+            secret_key (String): Secret Key for Minio
+            secure (Boolean): Use https (Defaults to False)
+            region (String): Region used to sign requests (Defaults to us-east-1)
+            max_connections (Int): Size of the shared connection pool (Defaults
+                to 100)
+            session (aiohttp.ClientSession): Session to send requests with instead
+                of a pool owned by the client
+        Returns:
+            N/A
+        """
+        logging.info(f"Initializing AsyncMinioClient Object Connected to {minio_url}")
+
+        if session is None and aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for AsyncMinioClient "
+                "(pip install ctodd-python-lib-minio[async])"
+            )
+
+        self.minio_url = minio_url
+        self.endpoint_url = f"{'https' if secure else 'http'}://{minio_url}"
+        self.region = region
+        self.max_connections = max_connections
+        self.credentials = Credentials(provider=Static(access_key, secret_key))
+
+        self._session = session
+        self._owns_session = session is None
+
+    async def __aenter__(self):
+        """
+        Purpose:
+            Enter the async context manager
+        Args:
+            N/A
+        Returns:
+            async_client (AsyncMinioClient): This client
+        """
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Purpose:
+            Exit the async context manager, closing the connection pool
+        Args:
+            exc_type, exc_value, traceback: Exception details (if any)
+        Returns:
+            N/A
+        """
+
+        await self.close()
+
+    async def close(self):
+        """
+        Purpose:
+            Close the connection pool if it is owned by the client
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+            self._session = None
+
+    ###
+    # Request Methods
+    ###
+
+    def _get_session(self):
+        """
+        Purpose:
+            Get the shared aiohttp session, creating it (and its connection pool)
+            on first use
+        Args:
+            N/A
+        Returns:
+            session (aiohttp.ClientSession): Session used for every request
+        """
+
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                auto_decompress=False,
+            )
+
+        return self._session
+
+    async def _url_open(
+        self, method, bucket_name=None, object_name=None, query=None, headers=None,
+        body=b""
+    ):
+        """
+        Purpose:
+            Sign and send a request to Minio, reading the full response body. Error
+            responses are raised as the same exceptions the minio lib raises
+        Args:
+            method (String): HTTP method
+            bucket_name (String): Bucket the request is for
+            object_name (String): Object the request is for
+            query (Dict): Query parameters
+            headers (Dict): Request headers
+            body (Bytes): Request body
+        Returns:
+            response (AsyncResponse): Status, reason, headers, and body
+        """
+
+        url = get_target_url(
+            self.endpoint_url,
+            bucket_name=bucket_name,
+            object_name=object_name,
+            bucket_region=self.region,
+            query=query,
+        )
+
+        request_headers = FoldCaseDict()
+        for header_name, header_value in (headers or {}).items():
+            request_headers[header_name] = header_value
+        request_headers = sign_v4(
+            method,
+            url,
+            self.region,
+            request_headers,
+            self.credentials,
+            content_sha256=get_sha256_hexdigest(body),
+        )
+
+        # The URL was encoded exactly as it was signed, so it must not be requoted
+        request_url = yarl.URL(url, encoded=True) if yarl else url
+        async with self._get_session().request(
+            method, request_url, headers=dict(request_headers), data=body or None
+        ) as http_response:
+            response = AsyncResponse(
+                http_response.status,
+                http_response.reason,
+                http_response.headers,
+                b"" if method == "HEAD" else await http_response.read(),
+            )
+
+        if response.status not in (200, 204, 206):
+            raise ResponseError(
+                response, method, bucket_name, object_name
+            ).get_exception()
+
+        return response
+
+    ###
+    # Bucket Methods
+    ###
+
+    async def list_buckets(self):
+        """
+        Purpose:
+            List the buckets in Minio
+        Args:
+            N/A
+        Returns:
+            buckets (List of minio Bucket Objs): Buckets in Minio
+        """
+
+        response = await self._url_open("GET")
+
+        return parse_list_buckets(response.data)
+
+    async def bucket_exists(self, bucket_name):
+        """
+        Purpose:
+            Check if a bucket exists with a single HEAD request
+        Args:
+            bucket_name (String): Name of the bucket
+        Returns:
+            bucket_exists (Boolean): Boolean if the bucket exists or not
+        """
+
+        try:
+            await self._url_open("HEAD", bucket_name=bucket_name)
+        except NoSuchBucket:
+            return False
+
+        return True
+
+    async def make_bucket(self, bucket_name, location="us-east-1"):
+        """
+        Purpose:
+            Create a bucket
+        Args:
+            bucket_name (String): Name of the bucket
+            location (String): Region of the bucket (Defaults to us-east-1)
+        Returns:
+            N/A
+        """
+
+        body = b""
+        if location and location != "us-east-1":
+            body = xml_marshal_bucket_constraint(location)
+
+        await self._url_open("PUT", bucket_name=bucket_name, body=body)
+
+    async def remove_bucket(self, bucket_name):
+        """
+        Purpose:
+            Remove an empty bucket
+        Args:
+            bucket_name (String): Name of the bucket
+        Returns:
+            N/A
+        """
+
+        await self._url_open("DELETE", bucket_name=bucket_name)
+
+    ###
+    # Object Methods
+    ###
+
+    async def list_objects_v2(
+        self, bucket_name, prefix=None, recursive=False, start_after=None
+    ):
+        """
+        Purpose:
+            Lazily list objects in a bucket, one page (up to 1000 keys) at a time
+        Args:
+            bucket_name (String): Name of the bucket
+            prefix (String): Only list objects starting with the prefix
+            recursive (Boolean): List past "/" delimiters (Defaults to False)
+            start_after (String): Only list objects after this name
+        Yields:
+            object (minio Object): Object (or prefix) in the bucket
+        """
+
+        continuation_token = None
+        is_truncated = True
+        while is_truncated:
+            query = {
+                "list-type": "2",
+                "delimiter": "" if recursive else "/",
+                "max-keys": "1000",
+                "prefix": prefix or "",
+            }
+            if continuation_token:
+                query["continuation-token"] = continuation_token
+            elif start_after:
+                query["start-after"] = start_after
+
+            response = await self._url_open("GET", bucket_name=bucket_name, query=query)
+            objects, is_truncated, continuation_token = parse_list_objects_v2(
+                response.data, bucket_name
+            )
+            for listed_object in objects:
+                yield listed_object
+
+    async def stat_object(self, bucket_name, object_name):
+        """
+        Purpose:
+            Get the stats of an object with a single HEAD request
+        Args:
+            bucket_name (String): Name of the bucket
+            object_name (String): Name of the object
+        Returns:
+            object_stats_obj (minio Object): Stats of the object, matching the
+                minio lib's stat_object
+        """
+
+        response = await self._url_open(
+            "HEAD", bucket_name=bucket_name, object_name=object_name
+        )
+
+        return get_object_from_headers(bucket_name, object_name, response.headers)
+
+    async def get_object(self, bucket_name, object_name, offset=0, length=None):
+        """
+        Purpose:
+            Get the body of an object (or a byte range of it)
+        Args:
+            bucket_name (String): Name of the bucket
+            object_name (String): Name of the object
+            offset (Int): First byte to get (Defaults to 0)
+            length (Int): Number of bytes to get (Defaults to the rest of the
+                object)
+        Returns:
+            response (AsyncResponse): Response with the object body as data
+        """
+
+        headers = {}
+        if offset or length:
+            last_byte = "" if length is None else offset + length - 1
+            headers["Range"] = f"bytes={offset}-{last_byte}"
+
+        return await self._url_open(
+            "GET", bucket_name=bucket_name, object_name=object_name, headers=headers
+        )
+
+    async def put_object(
+        self, bucket_name, object_name, data, content_type=None, metadata=None
+    ):
+        """
+        Purpose:
+            Put an object from bytes in a single request
+        Args:
+            bucket_name (String): Name of the bucket
+            object_name (String): Name of the object
+            data (Bytes): Body of the object
+            content_type (String): Content type of the object (Defaults to
+                application/octet-stream)
+            metadata (Dict): User metadata to store with the object
+        Returns:
+            etag (String): ETag of the uploaded object
+        """
+
+        headers = amzprefix_user_metadata(metadata or {})
+        headers["Content-Type"] = content_type or "application/octet-stream"
+
+        response = await self._url_open(
+            "PUT",
+            bucket_name=bucket_name,
+            object_name=object_name,
+            headers=headers,
+            body=data,
+        )
+
+        return response.headers.get("etag", "").replace('"', "")
+
+    async def remove_object(self, bucket_name, object_name):
+        """
+        Purpose:
+            Remove an object
+        Args:
+            bucket_name (String): Name of the bucket
+            object_name (String): Name of the object
+        Returns:
+            N/A
+        """
+
+        await self._url_open("DELETE", bucket_name=bucket_name, object_name=object_name)
+
+    async def remove_objects(self, bucket_name, object_names):
+        """
+        Purpose:
+            Remove up to 1000 objects with a single Multi-Object Delete request
+        Args:
+            bucket_name (String): Name of the bucket
+            object_names (List of Strings): Names of the objects
+        Returns:
+            delete_errors (List of minio MultiDeleteError): Objects that failed
+        """
+
+        body = xml_marshal_delete_objects(object_names)
+        headers = {"Content-Md5": base64.b64encode(hashlib.md5(body).digest()).decode()}
+
+        response = await self._url_open(
+            "POST",
+            bucket_name=bucket_name,
+            query={"delete": ""},
+            headers=headers,
+            body=body,
+        )
+
+        return parse_multi_delete_response(response.data)
+
+
+###
+# Async General Helpers
+###
+
+
+async def async_iter_bounded(
+    func, items, max_concurrency=DEFAULT_ASYNC_MAX_CONCURRENCY
+):
+    """
+    Purpose:
+        Await func(item) for every item on the running event loop and yield
+        results as they complete. Only max_concurrency items are pulled from
+        items at a time, so iterators of items are consumed lazily
+    Args:
+        func (Coroutine Function): Coroutine function to call with each item
+        items (Iterable): Items to call func with
+        max_concurrency (Int): Max calls in flight at once (Defaults to 100)
+    Yields:
+        work_result (Tuple): (item, result, error) for each item, where error is
+            the exception func raised (result is None) or None
+    """
+
+    max_concurrency = max(max_concurrency, 1)
+    items = iter(items)
+    pending_tasks = {}
+
+    try:
+        while True:
+            for item in itertools.islice(
+                items, max(max_concurrency - len(pending_tasks), 0)
+            ):
+                pending_tasks[asyncio.ensure_future(func(item))] = item
+
+            if not pending_tasks:
+                break
+
+            done_tasks, _ = await asyncio.wait(
+                pending_tasks, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done_tasks:
+                item = pending_tasks.pop(task)
+                error = task.exception()
+                yield (item, None if error else task.result(), error)
+    finally:
+        for task in pending_tasks:
+            task.cancel()
+
+
+async def async_map_bounded(func, items, max_concurrency=DEFAULT_ASYNC_MAX_CONCURRENCY):
+    """
+    Purpose:
+        Await func(item) for every item on the running event loop, with at most
+        max_concurrency calls in flight at once. Items are pulled lazily, so only
+        the results are held in memory
+    Args:
+        func (Coroutine Function): Coroutine function to call with each item
+        items (Iterable): Items to call func with
+        max_concurrency (Int): Max calls in flight at once (Defaults to 100)
+    Returns:
+        results (List): Result (or raised Exception) for each item, in order
+    """
+
+    async def run_indexed(indexed_item):
+        return await func(indexed_item[1])
+
+    results = {}
+    async for (index, _), result, error in async_iter_bounded(
+        run_indexed, enumerate(items), max_concurrency=max_concurrency
+    ):
+        results[index] = result if error is None else error
+
+    return [results[index] for index in range(len(results))]
+
+
+###
+# Async Bucket Helpers
+###
+
+
+@instrumented
+async def async_get_buckets(async_client):
+    """
+    Purpose:
+        Get a list of buckets that exist in Minio
+    Args:
+        async_client (AsyncMinioClient): Async client connection to Minio
+    Returns:
+        buckets (List of minio Bucket Objs): List of buckets
+    """
+    logging.info("Getting Buckets")
+
+    try:
+        return await async_client.list_buckets()
+    except ResponseError as con_err:
+        logging.error(f"Error Connecting to Minio: {con_err}")
+        raise con_err
+    except Exception as err:
+        logging.error(f"Error Getting Buckets: {err}")
+        raise err
+
+
+@instrumented
+async def async_get_bucket_names(async_client):
+    """
+    Purpose:
+        Get a list of bucket names that exist in Minio
+    Args:
+        async_client (AsyncMinioClient): Async client connection to Minio
+    Returns:
+        bucket_names (List of Strings): List of bucket names
+    """
+
+    return [bucket.name for bucket in await async_get_buckets(async_client)]
+
+
+@instrumented
+async def async_create_bucket(async_client, bucket_name):
+    """
+    Purpose:
+        Create a specified Bucket by name
+    Args:
+        async_client (AsyncMinioClient): Async client connection to Minio
+        bucket_name (String): Name of bucket to create
+    Returns:
+        N/A
+    """
+    logging.info(f"Creating Bucket {bucket_name}")
+
+    try:
+        if not await async_client.bucket_exists(bucket_name):
+            await async_client.make_bucket(bucket_name, location="us-east-1")
+        else:
+            raise BucketAlreadyExists(f"{bucket_name} Already Exists in Minio")
+    except ResponseError as con_err:
+        logging.error(f"Error Connecting to Minio: {con_err}")
+        raise con_err
+    except Exception as err:
+        logging.error(f"Error Creating Bucket {bucket_name}: {err}")
+        raise err
+
+
+@instrumented
+async def async_delete_bucket(async_client, bucket_name):
+    """
+    Purpose:
+        Delete a specified (empty) Bucket by name
+    Args:
+        async_client (AsyncMinioClient): Async client connection to Minio
+        bucket_name (String): Name of bucket to delete
+    Returns:
+        N/A
+    """
+    logging.info(f"Deleting Bucket {bucket_name}")
+
+    try:
+        if await async_client.bucket_exists(bucket_name):
+            await async_client.remove_bucket(bucket_name)
+        else:
+            raise BucketDoesntExist(f"{bucket_name} Doesn't Exist in Minio")
+    except ResponseError as con_err:
+        logging.error(f"Error Connecting to Minio: {con_err}")
+        raise con_err
+    except Exception as err:
+        logging.error(f"Error Deleting Bucket {bucket_name}: {err}")
+        raise err
+
+
+###
+# Async Object Getter Helpers
+###
+
+
+@instrumented
+async def async_iter_objects(
+    async_client, bucket_name, prefix=None, recursive=False, start_after=None
+):
+    """
+    Purpose:
+        Lazily iterate over the objects in a bucket, one listing page at a time
+    Args:
+        async_client (AsyncMinioClient): Async client connection to Minio
+        bucket_name (String): Name of the bucket to list objects from
+        prefix (String): Only list objects starting with the prefix
+        recursive (Boolean): List past "/" delimiters (Defaults to False)
+        start_after (String): Only list objects after this name
+    Yields:
+        object (minio Object): Object in the bucket
+    """
+    logging.info(f"Iterating Objects in {bucket_name}")
+
+    try:
+        async for listed_object in async_client.list_objects_v2(
+            bucket_name, prefix=prefix, recursive=recursive, start_after=start_after
+        ):
+            yield listed_object
+    except ResponseError as con_err:
+        logging.error(f"Error Connecting to Minio: {con_err}")
+        raise con_err
+    except Exception as err:
+        logging.error(f"Error Listing Objects: {err}")
+        raise err
+
+
+@instrumented
+async def async_get_object_names(
+    async_client, bucket_name, prefix=None, recursive=False, start_after=None
+):
+    """
+    Purpose:
+        Get a list of object names in a bucket
+    Args:
+        async_client (AsyncMinioClient): Async client connection to Minio
+        bucket_name (String): Name of the bucket to list objects from
+        prefix (String): Only list objects starting with the prefix
+        recursive (Boolean): List past "/" delimiters (Defaults to False)
+        start_after (String): Only list objects after this name
+    Returns:
+        object_names (List of Strings): Names of objects in the bucket
+    """
+
+    return [
+        listed_object.object_name async for listed_object in async_iter_objects(
+            async_client, bucket_name, prefix=prefix, recursive=recursive,
+            start_after=start_after
+        )
+    ]
+
+
+@instrumented
+async def async_is_object_in_bucket(async_client, bucket_name, object_name):
+    """
+    Purpose:
+        Check if Object exists in Bucket with a single HEAD request
+    Args:
+        async_client (AsyncMinioClient): Async client connection to Minio
+        bucket_name (String): Name of the bucket to check for object
+        object_name (String): Name of object to check for in Minio
+    Returns:
+        object_exists (Boolean): Boolean if the object exists or not
+    """
+
+    try:
+        await async_client.stat_object(bucket_name, object_name)
+    except NoSuchKey:
+        return False
+    except ResponseError as con_err:
+        logging.error(f"Error Connecting to Minio: {con_err}")
+        raise con_err
+    except Exception as err:
+        logging.error(f"Error Checking for Object {object_name}: {err}")
+        raise err
+
+    return True
+
+
+@instrumented
+async def async_get_object_stats(async_client, bucket_name, object_name):
+    """
+    Purpose:
+        Get Stats of the Object
+    Args:
+        async_client (AsyncMinioClient): Async client connection to Minio
+        bucket_name (String): Name of the bucket to check for object
+        object_name (String): Name of object to get stats for in Minio
+    Returns:
+        object_stats (Dict): Dict of stats about the object (same keys as
+            get_object_stats)
+    """
+
+    try:
+        object_stats_obj = await async_client.stat_object(bucket_name, object_name)
+    except ResponseError as con_err:
+        logging.error(f"Error Connecting to Minio: {con_err}")
+        raise con_err
+    except Exception as err:
+        logging.error(f"Error Getting Object Stats: {err}")
+        raise err
+
+    return format_object_stats(object_stats_obj)
+
+
+###
+# Async Object Manipulation Helpers
+###
+
+
+@instrumented
+async def async_download_object_to_memory(
+    async_client, bucket_name, object_name, encoding="utf-8"
+):
+    """
+    Purpose:
+        Download an Object from Minio into memory, decoded by the decoder
+        registered for its extension (or content type) in minio_decoder_helpers
+    Args:
+        async_client (AsyncMinioClient): Async client connection to Minio
+        bucket_name (String): Name of the bucket to get object from
+        object_name (String): Name of object to download from Minio
+        encoding (String): Encoding of text objects (Defaults to utf-8)
+    Returns:
+        parsed_object (Obj, depending on extension): Object parsed from Minio, same
+            as download_object_to_memory
+    """
+    logging.info(f"Downloading Object {bucket_name}/{object_name} into Memory")
+
+    decoder, _ = get_decoder(object_name)
+
+    try:
+        response = await async_client.get_object(bucket_name, object_name)
+        add_bytes_transferred(len(response.data))
+        return decode_object_stream(
+            object_name,
+            io.BytesIO(response.data),
+            content_type=None if decoder else response.headers.get("content-type"),
+            encoding=encoding,
+        )
+    except ResponseError as con_err:
+        logging.error(f"Error Connecting to Minio: {con_err}")
+        raise con_err
+    except NoSuchKey as no_key_err:
+        logging.error(f"Key Doesn't Exist in Minio: {no_key_err}")
+        raise no_key_err
+    except Exception as err:
+        logging.error(f"Error Downloading Object {object_name}: {err}")
+        raise err
+
+
+@instrumented
+async def async_upload_object_from_memory(
+    async_client, bucket_name, object_name, data, content_type=None, metadata=None
+):
+    """
+    Purpose:
+        Upload bytes (or a str, encoded as utf-8) to Minio as an Object
+    Args:
+        async_client (AsyncMinioClient): Async client connection to Minio
+        bucket_name (String): Name of the bucket to upload to
+        object_name (String): Name of object to upload in Minio
+        data (Bytes or String): Body of the object
+        content_type (String): Content type of the object
+        metadata (Dict): User metadata to store with the object
+    Returns:
+        etag (String): ETag of the uploaded object
+    """
+    logging.info(f"Uploading Object {bucket_name}/{object_name} from Memory")
+
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    try:
+        etag = await async_client.put_object(
+            bucket_name, object_name, bytes(data), content_type=content_type,
+            metadata=metadata
+        )
+        add_bytes_transferred(len(data))
+        return etag
+    except ResponseError as con_err:
+        logging.error(f"Error Connecting to Minio: {con_err}")
+        raise con_err
+    except Exception as err:
+        logging.error(f"Error Uploading Object {object_name}: {err}")
+        raise err
+
+
+@instrumented
+async def async_delete_object(
+    async_client, bucket_name, object_name, check_exists=True
+):
+    """
+    Purpose:
+        Delete an Object from Minio
+    Args:
+        async_client (AsyncMinioClient): Async client connection to Minio
+        bucket_name (String): Name of the bucket to delete from
+        object_name (String): Name of object to delete in Minio
+        check_exists (Boolean): Raise ObjectDoesntExist if the object is missing
+            (Defaults to True)
+    Returns:
+        N/A
+    """
+    logging.info(f"Deleting Object {bucket_name}/{object_name}")
+
+    if check_exists and not await async_is_object_in_bucket(
+        async_client, bucket_name, object_name
+    ):
+        raise ObjectDoesntExist(f"{object_name} Doesn't Exist in {bucket_name}")
+
+    try:
+        await async_client.remove_object(bucket_name, object_name)
+    except ResponseError as con_err:
+        logging.error(f"Error Connecting to Minio: {con_err}")
+        raise con_err
+    except Exception as err:
+        logging.error(f"Error Deleting Object {object_name}: {err}")
+        raise err
+
+
+@instrumented
+async def async_delete_objects(
+    async_client, bucket_name, object_names, batch_size=MAX_ASYNC_DELETE_BATCH_SIZE,
+    max_concurrency=4
+):
+    """
+    Purpose:
+        Delete many Objects from Minio with concurrent Multi-Object Delete requests
+        of up to batch_size objects each. Object names are consumed lazily, so a
+        streaming listing can be passed in
+    Args:
+        async_client (AsyncMinioClient): Async client connection to Minio
+        bucket_name (String): Name of the bucket to delete from
+        object_names (Iterable of Strings): Names of objects to delete in Minio
+        batch_size (Int): Objects per delete request (Defaults to 1000, the max)
+        max_concurrency (Int): Delete requests in flight at once (Defaults to 4)
+    Returns:
+        failures (List of Dicts): Objects that failed to delete, with keys
+            object_name, error_code, and error_message
+    """
+    logging.info(f"Deleting Objects from {bucket_name}")
+
+    if not 0 < batch_size <= MAX_ASYNC_DELETE_BATCH_SIZE:
+        raise ValueError(
+            f"batch_size must be between 1 and {MAX_ASYNC_DELETE_BATCH_SIZE}"
+        )
+
+    async def delete_batch(batch):
+        return await async_client.remove_objects(bucket_name, batch)
+
+    failures = []
+    async for batch, batch_result, error in async_iter_bounded(
+        delete_batch,
+        iter_batches(object_names, batch_size),
+        max_concurrency=max_concurrency,
+    ):
+        if error is not None:
+            logging.error(f"Error Deleting Objects from {bucket_name}: {error}")
+            batch_result = [
+                MultiDeleteError(object_name, type(error).__name__, str(error))
+                for object_name in batch
+            ]
+        failures.extend(
+            {
+                "object_name": delete_error.object_name,
+                "error_code": delete_error.error_code,
+                "error_message": delete_error.error_message,
+            }
+            for delete_error in batch_result
+        )
+
+    return failures
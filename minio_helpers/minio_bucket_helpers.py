@@ -8,11 +8,32 @@
 
 # Python Library Imports
 import logging
+import time
 from minio import Minio
-from minio.error import ResponseError
+from minio.error import BucketAlreadyOwnedByYou, NoSuchBucket, ResponseError
+from minio.error import BucketAlreadyExists as MinioBucketAlreadyExists
 
 # Local Library Imports
-from minio_helpers.minio_exceptions import BucketAlreadyExists, BucketDoesntExist
+from minio_helpers import minio_object_helpers
+from minio_helpers.minio_connection_helpers import get_credentials_key
+from minio_helpers.minio_exceptions import BucketAlreadyExists, BucketDoesntExist, \
+    BucketPurgeIncomplete
+from minio_helpers.minio_general_helpers import TTLCache, iter_pool_results
+from minio_helpers.minio_instrumentation_helpers import instrumented
+
+
+###
+# Constants
+###
+
+
+KNOWN_BUCKETS_TTL = 300.0
+BUCKET_LISTING_TTL = 10.0
+
+# Buckets this process has created, ensured, or listed, keyed by
+# (endpoint key, bucket name), and bucket listings keyed by endpoint key
+KNOWN_BUCKETS = TTLCache(max_size=10000, ttl=KNOWN_BUCKETS_TTL)
+BUCKET_LISTINGS = TTLCache(max_size=100, ttl=BUCKET_LISTING_TTL)
 
 
 ###
@@ -20,52 +41,125 @@ from minio_helpers.minio_exceptions import BucketAlreadyExists, BucketDoesntExis
 ###
 
 
-def get_buckets(minio_client):
+@instrumented
+def get_buckets(minio_client, use_cache=False):
     """
     Purpose:
-        Get a list of buckets that exist in the Minio Client
+        Get a list of buckets that exist in the Minio Client. Listed buckets are
+        added to the known-buckets cache
     Args:
         minio_client (minio client Obj): Client obj connection to Minio
+        use_cache (Boolean): Return the listing cached in the last 10 seconds
+            (if any) instead of listing again (Defaults to False)
     Returns:
         buckets (List of Bucket Objs): List of Bucket OBJs in Minio
     """
 
+    endpoint_key = get_endpoint_key(minio_client)
+    if use_cache:
+        buckets = BUCKET_LISTINGS.get(endpoint_key)
+        if buckets is not None:
+            return list(buckets)
+
     buckets = []
 
     try:
         buckets = list(minio_client.list_buckets())
     except ResponseError as con_err:
         logging.error(f"Error Connecting to Minio: {con_err}")
-        raise err
+        raise con_err
     except Exception as err:
         logging.error(f"Error Listing Buckets: {err}")
         raise err
 
-    return buckets
+    BUCKET_LISTINGS.set(endpoint_key, buckets)
+    for bucket in buckets:
+        KNOWN_BUCKETS.set((endpoint_key, bucket.name), True)
 
+    return list(buckets)
 
-def get_bucket_names(minio_client):
+
+@instrumented
+def get_bucket_names(minio_client, use_cache=False):
     """
     Purpose:
         Get a list of buckets that exist in the Minio Client
     Args:
         minio_client (minio client Obj): Client obj connection to Minio
+        use_cache (Boolean): Use the listing cached in the last 10 seconds (if
+            any) instead of listing again (Defaults to False)
     Returns:
         bucket_names (List of Strings): List of Buckets in Minio
     """
 
-    bucket_names = []
+    return [
+        bucket.name for bucket in get_buckets(minio_client, use_cache=use_cache)
+    ]
 
-    try:
-        bucket_names = [bucket.name for bucket in minio_client.list_buckets()]
-    except ResponseError as con_err:
-        logging.error(f"Error Connecting to Minio: {con_err}")
-        raise err
-    except Exception as err:
-        logging.error(f"Error Listing Buckets: {err}")
-        raise err
 
-    return bucket_names
+def is_bucket_known(minio_client, bucket_name):
+    """
+    Purpose:
+        Check the known-buckets cache (without a request to Minio) for a bucket
+        this process recently created, ensured, or listed
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket
+    Returns:
+        bucket_known (Boolean): Boolean if the bucket is known to exist
+    """
+
+    return KNOWN_BUCKETS.get((get_endpoint_key(minio_client), bucket_name), False)
+
+
+def get_endpoint_key(minio_client):
+    """
+    Purpose:
+        Get the key the bucket caches use for the Minio a client is connected to
+        and the credentials it is connected with, so clients with different
+        credentials don't share what buckets they can see
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+    Returns:
+        endpoint_key (Hashable): Endpoint URL and credentials key of the client
+            (or the client's id if it has no endpoint URL)
+    """
+
+    endpoint_url = getattr(minio_client, "_endpoint_url", None)
+    if not isinstance(endpoint_url, str):
+        return id(minio_client)
+
+    return (endpoint_url,) + get_credentials_key(
+        getattr(minio_client, "_access_key", None),
+        getattr(minio_client, "_secret_key", None),
+    )
+
+
+def forget_known_buckets(minio_client=None, bucket_name=None):
+    """
+    Purpose:
+        Drop cached bucket existence and listings, for example after buckets were
+        deleted outside of this library
+    Args:
+        minio_client (minio client Obj): Only forget buckets of this client's Minio
+            (Defaults to every Minio)
+        bucket_name (String): Only forget this bucket (Defaults to every bucket)
+    Returns:
+        N/A
+    """
+
+    if minio_client is None:
+        KNOWN_BUCKETS.pop_matching(
+            lambda key: bucket_name is None or key[1] == bucket_name
+        )
+        BUCKET_LISTINGS.clear()
+        return
+
+    endpoint_key = get_endpoint_key(minio_client)
+    KNOWN_BUCKETS.pop_matching(
+        lambda key: key[0] == endpoint_key and bucket_name in (None, key[1])
+    )
+    BUCKET_LISTINGS.pop(endpoint_key)
 
 
 ###
@@ -73,10 +167,11 @@ def get_bucket_names(minio_client):
 ###
 
 
+@instrumented
 def create_bucket(minio_client, bucket_name):
     """
     Purpose:
-        Create a specified Bucket by name
+        Create a specified Bucket by name, with a single request to Minio
     Args:
         minio_client (minio client Obj): Client obj connection to Minio
         bucket_name (String): Name of bucket to create
@@ -85,13 +180,12 @@ def create_bucket(minio_client, bucket_name):
     """
     logging.info(f"Creating Bucket {bucket_name}")
 
+    forget_known_buckets(minio_client, bucket_name)
+
     try:
-        if not minio_client.bucket_exists(bucket_name):
-            minio_client.make_bucket(
-                bucket_name, location="us-east-1"
-            )
-        else:
-            raise BucketAlreadyExists(f"{bucket_name} Already Exists in Minio")
+        minio_client.make_bucket(bucket_name, location="us-east-1")
+    except (BucketAlreadyOwnedByYou, MinioBucketAlreadyExists):
+        raise BucketAlreadyExists(f"{bucket_name} Already Exists in Minio")
     except ResponseError as con_err:
         logging.error(f"Error Connecting to Minio: {con_err}")
         raise con_err
@@ -99,27 +193,162 @@ def create_bucket(minio_client, bucket_name):
         logging.error(f"Error Creating Bucket {bucket_name}: {err}")
         raise err
 
+    KNOWN_BUCKETS.set((get_endpoint_key(minio_client), bucket_name), True)
 
-def delete_bucket(minio_client, bucket_name):
+
+@instrumented
+def ensure_bucket(minio_client, bucket_name):
     """
     Purpose:
-        Delete a specified Bucket by name
+        Make sure a Bucket exists. Buckets in the known-buckets cache are returned
+        without a request to Minio; otherwise the bucket is created, and a bucket
+        already owned by the caller counts as success. A bucket owned by someone
+        else raises BucketAlreadyExists
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of bucket to ensure
+    Returns:
+        bucket_created (Boolean): Boolean if the bucket was created by this call
+    """
+
+    bucket_key = (get_endpoint_key(minio_client), bucket_name)
+    if KNOWN_BUCKETS.get(bucket_key):
+        return False
+
+    bucket_created = True
+    try:
+        minio_client.make_bucket(bucket_name, location="us-east-1")
+    except BucketAlreadyOwnedByYou:
+        bucket_created = False
+    except MinioBucketAlreadyExists:
+        raise BucketAlreadyExists(f"{bucket_name} Is Owned by Another Account")
+    except ResponseError as con_err:
+        logging.error(f"Error Connecting to Minio: {con_err}")
+        raise con_err
+    except Exception as err:
+        logging.error(f"Error Ensuring Bucket {bucket_name}: {err}")
+        raise err
+
+    if bucket_created:
+        logging.info(f"Created Bucket {bucket_name}")
+        BUCKET_LISTINGS.pop(bucket_key[0])
+    KNOWN_BUCKETS.set(bucket_key, True)
+
+    return bucket_created
+
+
+@instrumented
+def delete_bucket(
+    minio_client, bucket_name, force=False, max_workers=4, progress_interval=10.0
+):
+    """
+    Purpose:
+        Delete a specified Bucket by name, with a single request to Minio unless
+        force is set
     Args:
         minio_client (minio client Obj): Client obj connection to Minio
         bucket_name (String): Name of bucket to delete
+        force (Boolean): Purge every object and incomplete upload in the bucket
+            before deleting it (Defaults to False)
+        max_workers (Int): Number of delete requests sent at once when force is
+            set (Defaults to 4)
+        progress_interval (Float): Log purge progress every progress_interval
+            seconds when force is set (Defaults to 10.0)
     Returns:
         N/A
     """
     logging.info(f"Deleting Bucket {bucket_name}")
 
     try:
-        if minio_client.bucket_exists(bucket_name):
-            minio_client.remove_bucket(bucket_name)
-        else:
-            raise BucketDoesntExist(f"{bucket_name} Doesn't Exist in Minio")
+        if force:
+            purge_bucket(
+                minio_client,
+                bucket_name,
+                max_workers=max_workers,
+                progress_interval=progress_interval,
+            )
+        minio_client.remove_bucket(bucket_name)
+    except NoSuchBucket:
+        raise BucketDoesntExist(f"{bucket_name} Doesn't Exist in Minio")
     except ResponseError as con_err:
         logging.error(f"Error Connecting to Minio: {con_err}")
         raise con_err
     except Exception as err:
         logging.error(f"Error Deleting Bucket: {err}")
         raise err
+    finally:
+        forget_known_buckets(minio_client, bucket_name)
+
+
+@instrumented
+def purge_bucket(minio_client, bucket_name, max_workers=4, progress_interval=10.0):
+    """
+    Purpose:
+        Delete every object and incomplete multipart upload in a Bucket. Uploads
+        and object names are streamed from their listings into parallel abort
+        and multi-object delete requests, so memory doesn't grow with the size
+        of the bucket
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of bucket to purge
+        max_workers (Int): Number of delete requests sent at once (Defaults to 4)
+        progress_interval (Float): Log progress every progress_interval seconds
+            (Defaults to 10.0)
+    Returns:
+        purge_summary (Dict): Dict of aborted_uploads, deleted_objects, and
+            elapsed_seconds
+    """
+    logging.info(f"Purging Bucket {bucket_name}")
+
+    start_time = time.monotonic()
+
+    # Uploads are aborted by ID as they are listed, without listing each object's
+    # uploads again or aggregating their sizes with a ListParts request each
+    aborted_uploads = 0
+    for _, _, error in iter_pool_results(
+        lambda incomplete_upload: minio_client._remove_incomplete_upload(
+            bucket_name, incomplete_upload.object_name, incomplete_upload.upload_id
+        ),
+        minio_client._list_incomplete_uploads(
+            bucket_name, recursive=True, is_aggregate_size=False
+        ),
+        max_workers=max_workers,
+    ):
+        if error:
+            raise error
+        aborted_uploads += 1
+
+    deleted_objects = 0
+
+    def get_object_names_to_delete():
+        nonlocal deleted_objects
+        for object_name in minio_object_helpers.iter_object_names(
+            minio_client, bucket_name, recursive=True
+        ):
+            deleted_objects += 1
+            yield object_name
+
+    delete_failures = minio_object_helpers.delete_objects(
+        minio_client,
+        bucket_name,
+        get_object_names_to_delete(),
+        max_workers=max_workers,
+        progress_interval=progress_interval,
+    )
+    if delete_failures:
+        raise BucketPurgeIncomplete(
+            f"Failed to Delete {len(delete_failures)} Objects from {bucket_name}, "
+            f"First Failure: {delete_failures[0]}"
+        )
+
+    elapsed_seconds = time.monotonic() - start_time
+    logging.info(
+        f"Purged {deleted_objects} Objects and {aborted_uploads} Incomplete Uploads "
+        f"from {bucket_name} in {elapsed_seconds:.1f}s"
+    )
+
+    return {
+        "aborted_uploads": aborted_uploads,
+        "deleted_objects": deleted_objects,
+        "elapsed_seconds": elapsed_seconds,
+    }
@@ -0,0 +1,947 @@
+"""
+    Purpose:
+        Minio Object Storage Cache Helpers.
+
+        This library is used to interact with Minio object storage. Will handle
+        caching metadata and contents of objects so hot paths don't go to Minio
+        on every call. Stale entries are revalidated with conditional requests on
+        their ETag instead of being fetched again, object contents can be kept
+        on local disk across runs, and small parsed objects can be kept in memory
+"""
+
+# Python Library Imports
+import copy
+import hashlib
+import io
+import mmap
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from types import MappingProxyType
+from datetime import datetime
+from minio.error import NoSuchKey, ResponseError
+from minio.fold_case_dict import FoldCaseDict
+from minio.helpers import get_target_url
+from minio.signer import sign_v4
+
+# Local Library Imports
+from minio_helpers.minio_general_helpers import TTLCache
+from minio_helpers.minio_instrumentation_helpers import add_response_stats
+from minio_helpers.minio_object_helpers import format_object_stats, \
+    get_object_from_headers
+
+
+###
+# Constants
+###
+
+
+DEFAULT_STAT_CACHE_TTL = 30.0
+DEFAULT_STAT_CACHE_MAX_SIZE = 10000
+DEFAULT_CONTENT_CACHE_MAX_BYTES = 10 * 1024 * 1024 * 1024
+CONTENT_CACHE_CHUNK_SIZE = 1024 * 1024
+CONTENT_CACHE_READ_ATTEMPTS = 3
+DEFAULT_OBJECT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_OBJECT_CACHE_TTL = 60.0
+
+
+###
+# Conditional Request Helpers
+###
+
+
+def revalidate_object_stats(minio_client, bucket_name, object_name, etag):
+    """
+    Purpose:
+        Stat an object with a HEAD request conditional on its ETag
+        (If-None-Match). An unchanged object costs a 304 with no body. The request
+        is signed and sent like the minio lib's own requests, but a 304 is returned
+        as a result rather than raised, so the client's bucket region cache is kept
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket
+        object_name (String): Name of the object
+        etag (String): ETag of the cached stats
+    Returns:
+        object_stats_obj (minio Object): Stats of the object if it changed, or None
+            if it still matches etag
+    Raises:
+        NoSuchKey: The object no longer exists
+    """
+
+    region = minio_client._get_bucket_region(bucket_name)
+    url = get_target_url(
+        minio_client._endpoint_url,
+        bucket_name=bucket_name,
+        object_name=object_name,
+        bucket_region=region,
+    )
+
+    headers = FoldCaseDict()
+    headers["User-Agent"] = minio_client._user_agent
+    headers["If-None-Match"] = f'"{etag}"'
+    headers = sign_v4(
+        "HEAD", url, region, headers, minio_client._credentials, None, datetime.utcnow()
+    )
+
+    response = minio_client._http.urlopen("HEAD", url, headers=headers)
+    if response.status == 304:
+        return None
+    if response.status != 200:
+        raise ResponseError(response, "HEAD", bucket_name, object_name).get_exception()
+
+    return get_object_from_headers(bucket_name, object_name, response.headers)
+
+
+###
+# Stat Cache
+###
+
+
+class StatCache(object):
+    """
+        StatCache Class. Thread-safe cache of stat_object results. Entries are
+        fresh for ttl seconds, then revalidated with a conditional request on
+        their ETag; the least recently used entries are evicted past max_size.
+        Missing objects are cached too, and re-stat'd once stale
+    """
+
+    def __init__(
+        self, max_size=DEFAULT_STAT_CACHE_MAX_SIZE, ttl=DEFAULT_STAT_CACHE_TTL
+    ):
+        """
+        Purpose:
+            Initilize the StatCache Class.
+        Args:
+            max_size (Int): Max objects cached (Defaults to 10000)
+            ttl (Float): Seconds an entry is used without revalidation (Defaults to
+                30)
+        Returns:
+            N/A
+        """
+
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.revalidated_unchanged = 0
+
+        self._entries = TTLCache(max_size=max_size)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """
+        Purpose:
+            Get the number of cached entries (fresh and stale)
+        Args:
+            N/A
+        Returns:
+            num_entries (Int): Number of entries
+        """
+
+        return len(self._entries)
+
+    def stat_object(self, minio_client, bucket_name, object_name):
+        """
+        Purpose:
+            Get the stats of an object from the cache, revalidating stale entries
+            and stat'ing objects not in the cache
+        Args:
+            minio_client (minio client Obj): Client obj connection to Minio
+            bucket_name (String): Name of the bucket
+            object_name (String): Name of the object
+        Returns:
+            object_stats_obj (minio Object): Stats of the object
+        Raises:
+            NoSuchKey: The object does not exist
+        """
+
+        stat_key = (bucket_name, object_name)
+        entry = self._entries.get(stat_key)
+
+        if entry is not None and entry[1] > time.monotonic():
+            self._count("hits")
+            object_stats_obj = entry[0]
+        elif entry is not None and entry[0] is not None:
+            self._count("revalidations")
+            try:
+                object_stats_obj = revalidate_object_stats(
+                    minio_client, bucket_name, object_name, entry[0].etag
+                )
+                if object_stats_obj is None:
+                    self._count("revalidated_unchanged")
+                    object_stats_obj = entry[0]
+            except NoSuchKey:
+                object_stats_obj = None
+            self._set(stat_key, object_stats_obj)
+        else:
+            self._count("misses")
+            try:
+                object_stats_obj = minio_client.stat_object(bucket_name, object_name)
+            except NoSuchKey:
+                object_stats_obj = None
+            self._set(stat_key, object_stats_obj)
+
+        if object_stats_obj is None:
+            raise NoSuchKey()
+
+        return object_stats_obj
+
+    def get_object_stats(self, minio_client, bucket_name, object_name):
+        """
+        Purpose:
+            Get Stats of the Object (as get_object_stats does) from the cache
+        Args:
+            minio_client (minio client Obj): Client obj connection to Minio
+            bucket_name (String): Name of the bucket
+            object_name (String): Name of the object
+        Returns:
+            object_stats (Dict): Dict of stats about the object
+        """
+
+        return format_object_stats(
+            self.stat_object(minio_client, bucket_name, object_name)
+        )
+
+    def invalidate(self, bucket_name, object_names=None):
+        """
+        Purpose:
+            Drop cached stats, for example after objects are written
+        Args:
+            bucket_name (String): Name of the bucket
+            object_names (List of Strings): Names of the objects (Defaults to every
+                object in the bucket)
+        Returns:
+            N/A
+        """
+
+        if object_names is None:
+            self._entries.pop_matching(lambda stat_key: stat_key[0] == bucket_name)
+            return
+
+        for object_name in object_names:
+            self._entries.pop((bucket_name, object_name))
+
+    def clear(self):
+        """
+        Purpose:
+            Drop every cached entry (counters are kept)
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        self._entries.clear()
+
+    def get_counters(self):
+        """
+        Purpose:
+            Get the hit, miss, and revalidation counters of the cache
+        Args:
+            N/A
+        Returns:
+            counters (Dict): hits (fresh entries used), misses (objects stat'd),
+                revalidations (conditional requests sent), revalidated_unchanged
+                (conditional requests answered 304), and entries
+        """
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "revalidated_unchanged": self.revalidated_unchanged,
+                "entries": len(self._entries),
+            }
+
+    def _count(self, counter_name):
+        """
+        Purpose:
+            Increment a counter
+        Args:
+            counter_name (String): Name of the counter attribute
+        Returns:
+            N/A
+        """
+
+        with self._lock:
+            setattr(self, counter_name, getattr(self, counter_name) + 1)
+
+    def _set(self, stat_key, object_stats_obj):
+        """
+        Purpose:
+            Cache stats (or None for a missing object) as fresh for ttl seconds
+        Args:
+            stat_key (Tuple): (bucket_name, object_name)
+            object_stats_obj (minio Object): Stats of the object, or None
+        Returns:
+            N/A
+        """
+
+        self._entries.set(stat_key, (object_stats_obj, time.monotonic() + self.ttl))
+
+
+###
+# Content Cache
+###
+
+
+class MappedFileStream(io.RawIOBase):
+    """
+        MappedFileStream Class. Read-only binary stream over a memory-mapped
+        file. Reads are copied straight from the mapping into the caller's buffer
+    """
+
+    def __init__(self, mapped_file):
+        """
+        Purpose:
+            Initilize the MappedFileStream Class.
+        Args:
+            mapped_file (mmap.mmap): Memory-mapped file to read
+        Returns:
+            N/A
+        """
+
+        self.mapped_file = mapped_file
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """
+        Purpose:
+            Move the position of the stream
+        Args:
+            offset (Int): Offset in bytes
+            whence (Int): io.SEEK_SET, io.SEEK_CUR, or io.SEEK_END
+        Returns:
+            position (Int): New position of the stream
+        """
+
+        base = {
+            io.SEEK_SET: 0,
+            io.SEEK_CUR: self.position,
+            io.SEEK_END: len(self.mapped_file),
+        }[whence]
+        self.position = max(base + offset, 0)
+
+        return self.position
+
+    def readinto(self, buffer):
+        """
+        Purpose:
+            Copy the next bytes of the mapping into buffer
+        Args:
+            buffer (Writable bytes-like Obj): Buffer to fill
+        Returns:
+            bytes_read (Int): Bytes copied (0 at the end of the file)
+        """
+
+        with memoryview(buffer) as buffer_view, \
+                memoryview(self.mapped_file) as mapped_view:
+            buffer_view = buffer_view.cast("B")
+            bytes_read = max(
+                min(len(buffer_view), len(mapped_view) - self.position), 0
+            )
+            buffer_view[:bytes_read] = mapped_view[
+                self.position:self.position + bytes_read
+            ]
+            buffer_view.release()
+
+        self.position += bytes_read
+
+        return bytes_read
+
+
+class ContentCache(object):
+    """
+        ContentCache Class. Thread-safe cache of object contents on local disk,
+        addressed by bucket, object name, and ETag so a changed object is never
+        served from the cache. Every lookup checks the object's current ETag
+        (with a HEAD, or through a StatCache), hits are read from a
+        memory-mapped file, and the least recently used files are evicted once
+        the cache grows past max_bytes. The cache directory is reused across runs
+    """
+
+    def __init__(
+        self, cache_dir, max_bytes=DEFAULT_CONTENT_CACHE_MAX_BYTES, stat_cache=None
+    ):
+        """
+        Purpose:
+            Initilize the ContentCache Class. Files already in cache_dir are
+            indexed, oldest use first
+        Args:
+            cache_dir (String): Directory to keep cached objects in
+            max_bytes (Int): Max bytes of cached objects (Defaults to 10GiB)
+            stat_cache (StatCache): Cache to get ETags from, instead of a HEAD on
+                every lookup (Defaults to no cache)
+        Returns:
+            N/A
+        """
+
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.stat_cache = stat_cache
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._files = OrderedDict()
+        self._total_bytes = 0
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        cached_files = []
+        for dirpath, _, filenames in os.walk(self.cache_dir):
+            for filename in filenames:
+                if filename.endswith(".tmp"):
+                    continue
+                cached_file = os.path.join(dirpath, filename)
+                file_stat = os.stat(cached_file)
+                cached_files.append(
+                    (file_stat.st_mtime, cached_file, file_stat.st_size)
+                )
+        for _, cached_file, file_size in sorted(cached_files):
+            self._files[cached_file] = file_size
+            self._total_bytes += file_size
+
+    def __len__(self):
+        """
+        Purpose:
+            Get the number of cached files
+        Args:
+            N/A
+        Returns:
+            num_files (Int): Number of files
+        """
+
+        return len(self._files)
+
+    def get_object_file(self, minio_client, bucket_name, object_name):
+        """
+        Purpose:
+            Get a local file with the current contents of an object, downloading
+            it only if the cache has no file for the object's current ETag
+        Args:
+            minio_client (minio client Obj): Client obj connection to Minio
+            bucket_name (String): Name of the bucket
+            object_name (String): Name of the object
+        Returns:
+            cached_file (String): Path of the cached file. It is only read from,
+                and may be evicted once other objects are cached
+            content_type (String): Content type of the object
+        Raises:
+            NoSuchKey: The object does not exist
+        """
+
+        if self.stat_cache is not None:
+            object_stats_obj = self.stat_cache.stat_object(
+                minio_client, bucket_name, object_name
+            )
+        else:
+            object_stats_obj = minio_client.stat_object(bucket_name, object_name)
+
+        cached_file = self.get_cached_filename(
+            bucket_name, object_name, object_stats_obj.etag
+        )
+        with self._lock:
+            is_cached = cached_file in self._files
+            if is_cached:
+                self._files.move_to_end(cached_file)
+        if is_cached:
+            try:
+                os.utime(cached_file)
+            except FileNotFoundError:
+                # Evicted by another thread since the lookup, so download it again
+                pass
+            else:
+                self._count("hits")
+                return cached_file, object_stats_obj.content_type
+
+        self._count("misses")
+        return self._download_object(minio_client, bucket_name, object_name)
+
+    def read_object_file(self, minio_client, bucket_name, object_name, read_func):
+        """
+        Purpose:
+            Get a local file with the current contents of an object and read it.
+            Another thread may evict the file before read_func opens it, so a
+            file missing by then is treated as a miss and downloaded again
+        Args:
+            minio_client (minio client Obj): Client obj connection to Minio
+            bucket_name (String): Name of the bucket
+            object_name (String): Name of the object
+            read_func (Function): Called as read_func(cached_file, content_type)
+                to open or copy the file. Files evicted once open stay readable
+        Returns:
+            result (Obj): Result of read_func
+        Raises:
+            NoSuchKey: The object does not exist
+        """
+
+        for attempt in range(1, CONTENT_CACHE_READ_ATTEMPTS + 1):
+            cached_file, content_type = self.get_object_file(
+                minio_client, bucket_name, object_name
+            )
+            try:
+                return read_func(cached_file, content_type)
+            except FileNotFoundError:
+                if os.path.exists(cached_file) or attempt == CONTENT_CACHE_READ_ATTEMPTS:
+                    raise
+
+    @contextmanager
+    def open_object_file(self, cached_file):
+        """
+        Purpose:
+            Open a cached file as a memory-mapped binary stream
+        Args:
+            cached_file (String): Path of the cached file
+        Yields:
+            object_stream (io.BufferedReader): Binary stream of the file
+        """
+
+        with open(cached_file, "rb") as file_obj:
+            if not os.fstat(file_obj.fileno()).st_size:
+                yield io.BufferedReader(io.BytesIO(b""))
+                return
+
+            mapped_file = mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield io.BufferedReader(
+                    MappedFileStream(mapped_file), buffer_size=CONTENT_CACHE_CHUNK_SIZE
+                )
+            finally:
+                mapped_file.close()
+
+    def get_cached_filename(self, bucket_name, object_name, etag):
+        """
+        Purpose:
+            Get the path an object's contents are cached at. Files of the same
+            object share a prefix so older versions can be found and removed
+        Args:
+            bucket_name (String): Name of the bucket
+            object_name (String): Name of the object
+            etag (String): ETag of the object
+        Returns:
+            cached_file (String): Path of the cached file
+        """
+
+        object_key = hashlib.sha256(
+            f"{bucket_name}/{object_name}".encode("utf-8")
+        ).hexdigest()
+        etag_key = hashlib.sha256(etag.strip('"').encode("utf-8")).hexdigest()[:32]
+
+        return os.path.join(self.cache_dir, object_key[:2], f"{object_key}.{etag_key}")
+
+    def clear(self):
+        """
+        Purpose:
+            Delete every cached file (counters are kept)
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        with self._lock:
+            cached_files = list(self._files)
+            self._files.clear()
+            self._total_bytes = 0
+        for cached_file in cached_files:
+            self._remove_file(cached_file)
+
+    def get_counters(self):
+        """
+        Purpose:
+            Get the hit and miss counters and the size of the cache
+        Args:
+            N/A
+        Returns:
+            counters (Dict): hits (objects read from disk), misses (objects
+                downloaded), files, and bytes
+        """
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "files": len(self._files),
+                "bytes": self._total_bytes,
+            }
+
+    def _download_object(self, minio_client, bucket_name, object_name):
+        """
+        Purpose:
+            Download an object into the cache. The file is named by the ETag of
+            the response, so an object changed since it was stat'd is still
+            cached correctly
+        Args:
+            minio_client (minio client Obj): Client obj connection to Minio
+            bucket_name (String): Name of the bucket
+            object_name (String): Name of the object
+        Returns:
+            cached_file (String): Path of the cached file
+            content_type (String): Content type of the object
+        """
+
+        minio_object = minio_client.get_object(bucket_name, object_name)
+        add_response_stats(minio_object)
+        try:
+            cached_file = self.get_cached_filename(
+                bucket_name, object_name, minio_object.headers.get("etag", "")
+            )
+            content_type = minio_object.headers.get("content-type")
+
+            os.makedirs(os.path.dirname(cached_file), exist_ok=True)
+            tmp_file = f"{cached_file}.{uuid.uuid4().hex}.tmp"
+            try:
+                with open(tmp_file, "wb") as file_obj:
+                    for data in minio_object.stream(CONTENT_CACHE_CHUNK_SIZE):
+                        file_obj.write(data)
+                os.replace(tmp_file, cached_file)
+            except BaseException:
+                self._remove_file(tmp_file)
+                raise
+        finally:
+            minio_object.close()
+            minio_object.release_conn()
+
+        self._add_file(cached_file, os.path.getsize(cached_file))
+
+        return cached_file, content_type
+
+    def _add_file(self, cached_file, file_size):
+        """
+        Purpose:
+            Index a cached file, remove older versions of the same object, and
+            evict the least recently used files past max_bytes
+        Args:
+            cached_file (String): Path of the cached file
+            file_size (Int): Size of the file in bytes
+        Returns:
+            N/A
+        """
+
+        object_prefix = cached_file.rsplit(".", 1)[0] + "."
+
+        with self._lock:
+            self._total_bytes -= self._files.pop(cached_file, 0)
+            removed_files = [
+                indexed_file for indexed_file in self._files
+                if indexed_file.startswith(object_prefix)
+            ]
+            for removed_file in removed_files:
+                self._total_bytes -= self._files.pop(removed_file)
+
+            self._files[cached_file] = file_size
+            self._total_bytes += file_size
+            while self._total_bytes > self.max_bytes and len(self._files) > 1:
+                evicted_file, evicted_size = self._files.popitem(last=False)
+                self._total_bytes -= evicted_size
+                removed_files.append(evicted_file)
+
+        for removed_file in removed_files:
+            self._remove_file(removed_file)
+
+    def _remove_file(self, cached_file):
+        """
+        Purpose:
+            Delete a file from the cache directory if it still exists
+        Args:
+            cached_file (String): Path of the file
+        Returns:
+            N/A
+        """
+
+        try:
+            os.remove(cached_file)
+        except FileNotFoundError:
+            pass
+
+    def _count(self, counter_name):
+        """
+        Purpose:
+            Increment a counter
+        Args:
+            counter_name (String): Name of the counter attribute
+        Returns:
+            N/A
+        """
+
+        with self._lock:
+            setattr(self, counter_name, getattr(self, counter_name) + 1)
+
+
+###
+# Object Cache
+###
+
+
+def freeze_object(parsed_object):
+    """
+    Purpose:
+        Get a read-only view of a parsed object. Dicts become MappingProxyTypes,
+        lists become tuples, sets become frozensets, and bytearrays become bytes,
+        recursively; other objects are returned as they are
+    Args:
+        parsed_object (Obj): Object parsed from Minio
+    Returns:
+        frozen_object (Obj): Read-only version of the object
+    """
+
+    if isinstance(parsed_object, dict):
+        return MappingProxyType(
+            {key: freeze_object(value) for key, value in parsed_object.items()}
+        )
+    if isinstance(parsed_object, (list, tuple)):
+        return tuple(freeze_object(value) for value in parsed_object)
+    if isinstance(parsed_object, (set, frozenset)):
+        return frozenset(parsed_object)
+    if isinstance(parsed_object, bytearray):
+        return bytes(parsed_object)
+
+    return parsed_object
+
+
+def get_object_size(parsed_object):
+    """
+    Purpose:
+        Estimate the bytes of memory held by a parsed object, counting the
+        contents of dicts, lists, tuples, and sets, and the nbytes of objects
+        that report it (such as pyarrow Tables)
+    Args:
+        parsed_object (Obj): Object parsed from Minio
+    Returns:
+        object_size (Int): Estimated size in bytes
+    """
+
+    if hasattr(parsed_object, "nbytes"):
+        return int(parsed_object.nbytes)
+
+    object_size = sys.getsizeof(parsed_object)
+    if isinstance(parsed_object, (dict, MappingProxyType)):
+        object_size += sum(
+            get_object_size(key) + get_object_size(value)
+            for key, value in parsed_object.items()
+        )
+    elif isinstance(parsed_object, (list, tuple, set, frozenset)):
+        object_size += sum(get_object_size(value) for value in parsed_object)
+
+    return object_size
+
+
+class ObjectCache(object):
+    """
+        ObjectCache Class. Thread-safe in-process cache of parsed objects (as
+        returned by download_object_to_memory), bounded by their estimated size
+        in bytes. Entries are used for ttl seconds and the least recently used
+        entries are evicted past max_bytes. Concurrent loads of the same object
+        share one download. Hits return a read-only view of the cached object,
+        or a deep copy when copy_objects is set
+    """
+
+    def __init__(
+        self, max_bytes=DEFAULT_OBJECT_CACHE_MAX_BYTES, ttl=DEFAULT_OBJECT_CACHE_TTL,
+        copy_objects=False
+    ):
+        """
+        Purpose:
+            Initilize the ObjectCache Class.
+        Args:
+            max_bytes (Int): Max estimated bytes of cached objects (Defaults to
+                64MiB). Larger objects are returned but not cached
+            ttl (Float): Seconds an object is cached for (Defaults to 60)
+            copy_objects (Boolean): Return deep copies instead of read-only views
+                (Defaults to False)
+        Returns:
+            N/A
+        """
+
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.copy_objects = copy_objects
+        self.hits = 0
+        self.misses = 0
+        self.shared_loads = 0
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._loads = {}
+        self._total_bytes = 0
+
+    def __len__(self):
+        """
+        Purpose:
+            Get the number of cached objects (including expired ones not yet
+            evicted)
+        Args:
+            N/A
+        Returns:
+            num_entries (Int): Number of entries
+        """
+
+        return len(self._entries)
+
+    def get_object(self, bucket_name, object_name, load_object, encoding="utf-8"):
+        """
+        Purpose:
+            Get a parsed object from the cache, calling load_object to download it
+            if it is not cached. If another thread is already loading the object,
+            wait for its result instead of loading it again
+        Args:
+            bucket_name (String): Name of the bucket
+            object_name (String): Name of the object
+            load_object (Function): Called with no arguments to download and parse
+                the object
+            encoding (String): Encoding the object is decoded with (Defaults to
+                utf-8)
+        Returns:
+            parsed_object (Obj): Read-only view or copy of the parsed object
+        """
+
+        cache_key = (bucket_name, object_name, encoding)
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[2] > time.monotonic():
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return self._get_result(entry[0])
+
+            load = self._loads.get(cache_key)
+            is_loader = load is None
+            if is_loader:
+                load = {"done": threading.Event(), "result": None, "error": None}
+                self._loads[cache_key] = load
+                self.misses += 1
+            else:
+                self.shared_loads += 1
+
+        if not is_loader:
+            load["done"].wait()
+            if load["error"] is not None:
+                raise load["error"]
+            return self._get_result(load["result"])
+
+        try:
+            parsed_object = load_object()
+            if not self.copy_objects:
+                parsed_object = freeze_object(parsed_object)
+            load["result"] = parsed_object
+            self._set(cache_key, parsed_object)
+        except Exception as err:
+            load["error"] = err
+            raise err
+        finally:
+            with self._lock:
+                self._loads.pop(cache_key, None)
+            load["done"].set()
+
+        return self._get_result(parsed_object)
+
+    def invalidate(self, bucket_name, object_names=None):
+        """
+        Purpose:
+            Drop cached objects, for example after they are written
+        Args:
+            bucket_name (String): Name of the bucket
+            object_names (List of Strings): Names of the objects (Defaults to every
+                object in the bucket)
+        Returns:
+            N/A
+        """
+
+        with self._lock:
+            for cache_key in list(self._entries):
+                if cache_key[0] == bucket_name and (
+                    object_names is None or cache_key[1] in object_names
+                ):
+                    self._total_bytes -= self._entries.pop(cache_key)[1]
+
+    def clear(self):
+        """
+        Purpose:
+            Drop every cached object (counters are kept)
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def get_counters(self):
+        """
+        Purpose:
+            Get the hit and miss counters and the size of the cache
+        Args:
+            N/A
+        Returns:
+            counters (Dict): hits (objects served from the cache), misses (objects
+                loaded), shared_loads (calls that waited on another thread's
+                load), entries, and bytes
+        """
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "shared_loads": self.shared_loads,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+            }
+
+    def _get_result(self, parsed_object):
+        """
+        Purpose:
+            Get what a caller is given for a cached object
+        Args:
+            parsed_object (Obj): Cached object
+        Returns:
+            parsed_object (Obj): A deep copy of the object if copy_objects is set,
+                otherwise the (read-only) object itself
+        """
+
+        return copy.deepcopy(parsed_object) if self.copy_objects else parsed_object
+
+    def _set(self, cache_key, parsed_object):
+        """
+        Purpose:
+            Cache an object, evicting the least recently used objects past
+            max_bytes. Objects larger than max_bytes are not cached
+        Args:
+            cache_key (Tuple): (bucket_name, object_name, encoding)
+            parsed_object (Obj): Object to cache
+        Returns:
+            N/A
+        """
+
+        object_size = get_object_size(parsed_object)
+        if object_size > self.max_bytes:
+            return
+
+        with self._lock:
+            old_entry = self._entries.pop(cache_key, None)
+            if old_entry is not None:
+                self._total_bytes -= old_entry[1]
+
+            self._entries[cache_key] = (
+                parsed_object, object_size, time.monotonic() + self.ttl
+            )
+            self._total_bytes += object_size
+            while self._total_bytes > self.max_bytes:
+                _, evicted_entry = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_entry[1]
@@ -7,30 +7,97 @@
 # Python Library Imports
 import simplejson as json
 import logging
+import os
+from minio.error import NoSuchKey
 
 # Local Library Imports
+from minio_helpers import minio_bucket_helpers
+from minio_helpers import minio_cache_helpers
 from minio_helpers import minio_connection_helpers
+from minio_helpers import minio_object_helpers
+from minio_helpers import minio_sync_helpers
+from minio_helpers.minio_general_helpers import TTLCache
+from minio_helpers.minio_retry_helpers import call_with_retry_policy
+
+
+###
+# Constants
+###
+
+
+DEFAULT_CACHE_TTL = 10.0
+DEFAULT_CACHE_MAX_SIZE = 10000
+
+_CACHE_MISS = object()
 
 
 class MinioClient(object):
     """
         MinioClient Class. Class objects will hold connection to the
-        Minio service and can be used to interact with buckets and objects
+        Minio service and can be used to interact with buckets and objects.
+        Methods wrap the bucket and object helpers, and bucket existence, object
+        stats, and (optionally) listings are served from a per-instance TTL/LRU
+        cache
     """
 
     ###
     # Class Lifecycle Methods
     ###
 
-    def __init__(self, minio_host, access_key, secret_key, minio_port=9000):
+    def __init__(
+        self, minio_host, access_key, secret_key, minio_port=9000, secure=False,
+        max_pool_size=minio_connection_helpers.DEFAULT_MAX_POOL_SIZE,
+        connect_timeout=None, read_timeout=None,
+        max_retries=minio_connection_helpers.DEFAULT_MAX_RETRIES, use_cache=True,
+        cache_ttl=DEFAULT_CACHE_TTL, cache_max_size=DEFAULT_CACHE_MAX_SIZE,
+        listing_cache_max_objects=None, content_cache_dir=None,
+        content_cache_max_bytes=minio_cache_helpers.DEFAULT_CONTENT_CACHE_MAX_BYTES,
+        object_cache_max_bytes=None, copy_cached_objects=False, retry_policy=None
+    ):
         """
         Purpose:
-            Initilize the MinioClient Class.
+            Initilize the MinioClient Class. Instances connected to the same Minio
+            with the same options share one minio client and connection pool, but
+            each instance holds its own metadata cache of bucket existence and
+            object stats (and given listing_cache_max_objects, of listings).
+            Writes made through the instance invalidate the entries they affect;
+            writes made elsewhere are seen once entries expire. Given a
+            content_cache_dir, downloads are served from local copies of unchanged
+            objects, and given object_cache_max_bytes, objects parsed into memory
+            are cached for cache_ttl seconds. Given a retry_policy, reads are
+            retried (and hedged) under it
         Args:
             minio_host (String): Host for Minio
             access_key (String): Access Key for Minio
             secret_key (String): Secret Key for Minio
             minio_port (Int): Port for Minio (Defaults to 9000)
+            secure (Boolean): Use https (Defaults to False)
+            max_pool_size (Int): Connections kept open to Minio (Defaults to 10)
+            connect_timeout (Float): Seconds to wait for a connection (Defaults to
+                no timeout)
+            read_timeout (Float): Seconds to wait between bytes of a response
+                (Defaults to no timeout)
+            max_retries (Int): Retries of failed connections and 5xx responses
+                (Defaults to 5)
+            use_cache (Boolean): Cache bucket existence, object stats, and listings
+                (Defaults to True)
+            cache_ttl (Float): Seconds cached metadata is used for (Defaults to 10)
+            cache_max_size (Int): Max entries in the bucket and stat caches, least
+                recently used entries are evicted first (Defaults to 10000)
+            listing_cache_max_objects (Int): Max objects across all cached
+                listings, least recently used listings are evicted first
+                (Defaults to not caching listings)
+            content_cache_dir (String): Directory to cache object contents in
+                across runs (Defaults to no content cache)
+            content_cache_max_bytes (Int): Max bytes of cached contents, least
+                recently used objects are evicted first (Defaults to 10GiB)
+            object_cache_max_bytes (Int): Max estimated bytes of objects parsed
+                into memory to cache (Defaults to no object cache)
+            copy_cached_objects (Boolean): Return deep copies of cached parsed
+                objects instead of read-only views (Defaults to False)
+            retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry (and
+                hedge) listings, stats, and downloads under (Defaults to no
+                retries)
         Returns:
             N/A
         """
@@ -48,5 +115,607 @@ class MinioClient(object):
             self.minio_host, self.minio_port
         )
         self.minio_client = minio_connection_helpers.connect_to_minio(
-            self.minio_url, self.access_key, self.secret_key
+            self.minio_url,
+            self.access_key,
+            self.secret_key,
+            secure=secure,
+            max_pool_size=max_pool_size,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_retries=max_retries,
+        )
+
+        self.use_cache = use_cache
+        self.retry_policy = retry_policy
+        self.bucket_cache = TTLCache(max_size=cache_max_size, ttl=cache_ttl)
+        self.stat_cache = minio_cache_helpers.StatCache(
+            max_size=cache_max_size, ttl=cache_ttl
+        )
+        self.listing_cache = None
+        if listing_cache_max_objects:
+            self.listing_cache = TTLCache(
+                max_size=listing_cache_max_objects, ttl=cache_ttl, get_size=len
+            )
+        self.content_cache = None
+        if content_cache_dir:
+            self.content_cache = minio_cache_helpers.ContentCache(
+                content_cache_dir,
+                max_bytes=content_cache_max_bytes,
+                stat_cache=self.stat_cache if self.use_cache else None,
+            )
+        self.object_cache = None
+        if object_cache_max_bytes:
+            self.object_cache = minio_cache_helpers.ObjectCache(
+                max_bytes=object_cache_max_bytes,
+                ttl=cache_ttl,
+                copy_objects=copy_cached_objects,
+            )
+
+
+    ###
+    # Cache Methods
+    ###
+
+    def clear_cache(self):
+        """
+        Purpose:
+            Drop all cached bucket existence, object stats, listings, and parsed
+            objects
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        self.bucket_cache.clear()
+        self.stat_cache.clear()
+        if self.listing_cache is not None:
+            self.listing_cache.clear()
+        if self.object_cache is not None:
+            self.object_cache.clear()
+
+    def _invalidate_bucket(self, bucket_name):
+        """
+        Purpose:
+            Drop all cached metadata about a bucket and its objects
+        Args:
+            bucket_name (String): Name of the bucket
+        Returns:
+            N/A
+        """
+
+        self.bucket_cache.pop(bucket_name)
+        self._invalidate_objects(bucket_name)
+
+    def _invalidate_objects(self, bucket_name, object_names=None):
+        """
+        Purpose:
+            Drop cached stats of objects and every cached listing of their bucket
+        Args:
+            bucket_name (String): Name of the bucket
+            object_names (List of Strings): Names of the objects (Defaults to every
+                object in the bucket)
+        Returns:
+            N/A
+        """
+
+        self.stat_cache.invalidate(bucket_name, object_names=object_names)
+        if self.listing_cache is not None:
+            self.listing_cache.pop_matching(lambda key: key[0] == bucket_name)
+        if self.object_cache is not None:
+            self.object_cache.invalidate(bucket_name, object_names=object_names)
+
+    ###
+    # Bucket Methods
+    ###
+
+    def get_buckets(self):
+        """
+        Purpose:
+            Get a list of buckets that exist in Minio. Every listed bucket is
+            cached as existing
+        Args:
+            N/A
+        Returns:
+            buckets (List of Bucket Objs): List of buckets
+        """
+
+        buckets = minio_bucket_helpers.get_buckets(self.minio_client)
+        if self.use_cache:
+            for bucket in buckets:
+                self.bucket_cache.set(bucket.name, True)
+
+        return buckets
+
+    def get_bucket_names(self):
+        """
+        Purpose:
+            Get a list of bucket names that exist in Minio
+        Args:
+            N/A
+        Returns:
+            bucket_names (List of Strings): List of bucket names
+        """
+
+        return [bucket.name for bucket in self.get_buckets()]
+
+    def bucket_exists(self, bucket_name):
+        """
+        Purpose:
+            Check if a bucket exists, using the cache when possible
+        Args:
+            bucket_name (String): Name of the bucket
+        Returns:
+            bucket_exists (Boolean): Boolean if the bucket exists or not
+        """
+
+        bucket_exists = self.bucket_cache.get(bucket_name, _CACHE_MISS)
+        if not self.use_cache or bucket_exists is _CACHE_MISS:
+            bucket_exists = self.minio_client.bucket_exists(bucket_name)
+            if self.use_cache:
+                self.bucket_cache.set(bucket_name, bucket_exists)
+
+        return bucket_exists
+
+    def create_bucket(self, bucket_name):
+        """
+        Purpose:
+            Create a specified Bucket by name
+        Args:
+            bucket_name (String): Name of bucket to create
+        Returns:
+            N/A
+        """
+
+        self._invalidate_bucket(bucket_name)
+        minio_bucket_helpers.create_bucket(self.minio_client, bucket_name)
+        if self.use_cache:
+            self.bucket_cache.set(bucket_name, True)
+
+    def ensure_bucket(self, bucket_name):
+        """
+        Purpose:
+            Make sure a Bucket exists, without a request to Minio if it is already
+            known to exist
+        Args:
+            bucket_name (String): Name of bucket to ensure
+        Returns:
+            bucket_created (Boolean): Boolean if the bucket was created by this call
+        """
+
+        bucket_created = minio_bucket_helpers.ensure_bucket(
+            self.minio_client, bucket_name
+        )
+        if bucket_created:
+            self._invalidate_bucket(bucket_name)
+        if self.use_cache:
+            self.bucket_cache.set(bucket_name, True)
+
+        return bucket_created
+
+    def delete_bucket(self, bucket_name, force=False, **kwargs):
+        """
+        Purpose:
+            Delete a specified Bucket by name
+        Args:
+            bucket_name (String): Name of bucket to delete
+            force (Boolean): Delete every object and incomplete upload in the
+                bucket first (Defaults to False)
+            kwargs: Other options of minio_bucket_helpers.delete_bucket
+        Returns:
+            N/A
+        """
+
+        try:
+            minio_bucket_helpers.delete_bucket(
+                self.minio_client, bucket_name, force=force, **kwargs
+            )
+        finally:
+            self._invalidate_bucket(bucket_name)
+
+    def purge_bucket(self, bucket_name, **kwargs):
+        """
+        Purpose:
+            Delete every object and incomplete upload in a bucket
+        Args:
+            bucket_name (String): Name of bucket to purge
+            kwargs: Other options of minio_bucket_helpers.purge_bucket
+        Returns:
+            purge_stats (Dict): Stats returned by minio_bucket_helpers.purge_bucket
+        """
+
+        try:
+            return minio_bucket_helpers.purge_bucket(
+                self.minio_client, bucket_name, **kwargs
+            )
+        finally:
+            self._invalidate_objects(bucket_name)
+
+    def sync_bucket(
+        self, bucket_name, source_bucket_name, source_client=None, **kwargs
+    ):
+        """
+        Purpose:
+            Mirror the objects of a source bucket into a bucket
+        Args:
+            bucket_name (String): Name of the bucket to sync into
+            source_bucket_name (String): Name of the bucket to sync from
+            source_client (MinioClient or minio client Obj): Connection to the
+                Minio of the source bucket (Defaults to this Minio)
+            kwargs: Other options of minio_sync_helpers.sync_bucket
+        Returns:
+            sync_summary (Dict): Summary returned by minio_sync_helpers.sync_bucket
+        """
+
+        if isinstance(source_client, MinioClient):
+            source_client = source_client.minio_client
+
+        kwargs.setdefault("retry_policy", self.retry_policy)
+        try:
+            return minio_sync_helpers.sync_bucket(
+                self.minio_client, bucket_name, source_bucket_name,
+                source_client=source_client, **kwargs
+            )
+        finally:
+            self._invalidate_objects(bucket_name)
+
+    ###
+    # Object Getter Methods
+    ###
+
+    def iter_objects(self, bucket_name, **kwargs):
+        """
+        Purpose:
+            Lazily iterate over the objects in a bucket (never cached)
+        Args:
+            bucket_name (String): Name of the bucket to list objects from
+            kwargs: Options of minio_object_helpers.iter_objects
+        Yields:
+            object (minio Object): Object in the bucket
+        """
+
+        kwargs.setdefault("retry_policy", self.retry_policy)
+
+        return minio_object_helpers.iter_objects(
+            self.minio_client, bucket_name, **kwargs
+        )
+
+    def iter_objects_parallel(self, bucket_name, **kwargs):
+        """
+        Purpose:
+            Iterate over the objects in a bucket with prefix-sharded parallel
+            listings (never cached)
+        Args:
+            bucket_name (String): Name of the bucket to list objects from
+            kwargs: Options of minio_object_helpers.iter_objects_parallel
+        Yields:
+            object (minio Object): Object in the bucket
+        """
+
+        kwargs.setdefault("retry_policy", self.retry_policy)
+
+        return minio_object_helpers.iter_objects_parallel(
+            self.minio_client, bucket_name, **kwargs
         )
+
+    def get_objects(
+        self, bucket_name, prefix=None, recursive=False, start_after=None,
+        max_keys=None
+    ):
+        """
+        Purpose:
+            Get a list of objects in a bucket, using the listing cache (if
+            enabled) when possible
+        Args:
+            bucket_name (String): Name of the bucket to list objects from
+            prefix (String): Only list objects starting with the prefix
+            recursive (Boolean): List past "/" delimiters (Defaults to False)
+            start_after (String): Only list objects after this name
+            max_keys (Int): Max objects to list (Defaults to all)
+        Returns:
+            objects (List of minio Objects): Objects in the bucket
+        """
+
+        use_listing_cache = self.use_cache and self.listing_cache is not None
+        listing_key = (bucket_name, prefix, recursive, start_after, max_keys)
+        objects = _CACHE_MISS
+        if use_listing_cache:
+            objects = self.listing_cache.get(listing_key, _CACHE_MISS)
+        if objects is _CACHE_MISS:
+            objects = minio_object_helpers.get_objects(
+                self.minio_client,
+                bucket_name,
+                prefix=prefix,
+                recursive=recursive,
+                start_after=start_after,
+                max_keys=max_keys,
+                retry_policy=self.retry_policy,
+            )
+            if use_listing_cache:
+                self.listing_cache.set(listing_key, objects)
+
+        return list(objects)
+
+    def get_object_names(
+        self, bucket_name, prefix=None, recursive=False, start_after=None,
+        max_keys=None
+    ):
+        """
+        Purpose:
+            Get a list of object names in a bucket, using the cache when possible
+        Args:
+            bucket_name (String): Name of the bucket to list objects from
+            prefix (String): Only list objects starting with the prefix
+            recursive (Boolean): List past "/" delimiters (Defaults to False)
+            start_after (String): Only list objects after this name
+            max_keys (Int): Max objects to list (Defaults to all)
+        Returns:
+            object_names (List of Strings): Names of objects in the bucket
+        """
+
+        return [
+            listed_object.object_name for listed_object in self.get_objects(
+                bucket_name, prefix=prefix, recursive=recursive,
+                start_after=start_after, max_keys=max_keys
+            )
+        ]
+
+    def stat_object(self, bucket_name, object_name):
+        """
+        Purpose:
+            Get the stats of an object, using the cache when possible. Stale
+            entries are revalidated with a conditional request on their ETag, and
+            missing objects are cached too
+        Args:
+            bucket_name (String): Name of the bucket
+            object_name (String): Name of the object
+        Returns:
+            object_stats_obj (minio Object): Stats of the object
+        Raises:
+            NoSuchKey: The object does not exist
+        """
+
+        if not self.use_cache:
+            return call_with_retry_policy(
+                self.retry_policy,
+                "stat_object",
+                lambda: self.minio_client.stat_object(bucket_name, object_name),
+                hedged=True,
+            )
+
+        return call_with_retry_policy(
+            self.retry_policy,
+            "stat_object",
+            lambda: self.stat_cache.stat_object(
+                self.minio_client, bucket_name, object_name
+            ),
+        )
+
+    def get_object_stats(self, bucket_name, object_name):
+        """
+        Purpose:
+            Get Stats of the Object, using the cache when possible
+        Args:
+            bucket_name (String): Name of the bucket to check for object
+            object_name (String): Name of object to get stats for in Minio
+        Returns:
+            object_stats (Dict):Dict of stats about the object
+        """
+
+        return minio_object_helpers.format_object_stats(
+            self.stat_object(bucket_name, object_name)
+        )
+
+    def is_object_in_bucket(self, bucket_name, object_name):
+        """
+        Purpose:
+            Check if Object exists in Bucket, using the cache when possible
+        Args:
+            bucket_name (String): Name of the bucket to check for object
+            object_name (String): Name of object to check for in Minio
+        Returns:
+            object_exists (Boolean): Boolean if the object exists or not
+        """
+
+        try:
+            self.stat_object(bucket_name, object_name)
+        except NoSuchKey:
+            return False
+
+        return True
+
+    def are_objects_in_bucket(self, bucket_name, object_names):
+        """
+        Purpose:
+            Check if many Objects exist in Bucket with a single listing pass
+        Args:
+            bucket_name (String): Name of the bucket to check for objects
+            object_names (List of Strings): Names of objects to check for in Minio
+        Returns:
+            objects_exist (Dict): Dict of object name to Boolean if the object exists
+        """
+
+        return minio_object_helpers.are_objects_in_bucket(
+            self.minio_client, bucket_name, object_names,
+            retry_policy=self.retry_policy,
+        )
+
+    ###
+    # Object Manipulation Methods
+    ###
+
+    def download_object_to_memory(self, bucket_name, object_name, **kwargs):
+        """
+        Purpose:
+            Download an Object from Minio into memory, decoded by its extension
+        Args:
+            bucket_name (String): Name of the bucket to get object from
+            object_name (String): Name of object to download from Minio
+            kwargs: Options of minio_object_helpers.download_object_to_memory
+        Returns:
+            parsed_object (Obj, depending on extension): Object parsed from Minio
+        """
+
+        kwargs.setdefault("content_cache", self.content_cache)
+        kwargs.setdefault("object_cache", self.object_cache)
+        kwargs.setdefault("retry_policy", self.retry_policy)
+
+        return minio_object_helpers.download_object_to_memory(
+            self.minio_client, bucket_name, object_name, **kwargs
+        )
+
+    def iter_records(self, bucket_name, object_name, **kwargs):
+        """
+        Purpose:
+            Lazily iterate over the records of an object
+        Args:
+            bucket_name (String): Name of the bucket to get object from
+            object_name (String): Name of object to read records from
+            kwargs: Options of minio_object_helpers.iter_records
+        Yields:
+            record (Obj, depending on format): Parsed record
+        """
+
+        kwargs.setdefault("retry_policy", self.retry_policy)
+
+        return minio_object_helpers.iter_records(
+            self.minio_client, bucket_name, object_name, **kwargs
+        )
+
+    def download_object_to_file(self, bucket_name, object_name, **kwargs):
+        """
+        Purpose:
+            Download a file from Minio to local storage
+        Args:
+            bucket_name (String): Name of the bucket to get object from
+            object_name (String): Name of object to download from Minio
+            kwargs: Options of minio_object_helpers.download_object_to_file
+        Returns:
+            N/A
+        """
+
+        kwargs.setdefault("content_cache", self.content_cache)
+        kwargs.setdefault("retry_policy", self.retry_policy)
+
+        return minio_object_helpers.download_object_to_file(
+            self.minio_client, bucket_name, object_name, **kwargs
+        )
+
+    def download_objects(self, bucket_name, objects, **kwargs):
+        """
+        Purpose:
+            Download many Objects from Minio to local storage concurrently
+        Args:
+            bucket_name (String): Name of the bucket to get objects from
+            objects (Iterable of Strings or minio Objects): Objects to download
+            kwargs: Options of minio_object_helpers.download_objects
+        Returns:
+            download_results (List of Dicts): Result of each download
+        """
+
+        kwargs.setdefault("content_cache", self.content_cache)
+        kwargs.setdefault("retry_policy", self.retry_policy)
+
+        return minio_object_helpers.download_objects(
+            self.minio_client, bucket_name, objects, **kwargs
+        )
+
+    def upload_object(self, bucket_name, filename, object_name=None, **kwargs):
+        """
+        Purpose:
+            Upload a file to Minio as an Object
+        Args:
+            bucket_name (String): Name of the bucket to upload to
+            filename (String): Location (And Path) of file to upload
+            object_name (String): Name of object to upload in Minio (Defaults to
+                the name of the file)
+            kwargs: Options of minio_object_helpers.upload_object
+        Returns:
+            etag (String): ETag of the uploaded object
+        """
+
+        object_name = object_name or os.path.basename(filename)
+        try:
+            return minio_object_helpers.upload_object(
+                self.minio_client, bucket_name, filename, object_name=object_name,
+                **kwargs
+            )
+        finally:
+            self._invalidate_objects(bucket_name, [object_name])
+
+    def upload_directory(self, bucket_name, directory, **kwargs):
+        """
+        Purpose:
+            Upload every file in a directory to Minio
+        Args:
+            bucket_name (String): Name of the bucket to upload to
+            directory (String): Directory to upload
+            kwargs: Options of minio_object_helpers.upload_directory
+        Returns:
+            upload_results (List of Dicts): Result of each upload
+        """
+
+        try:
+            return minio_object_helpers.upload_directory(
+                self.minio_client, bucket_name, directory, **kwargs
+            )
+        finally:
+            self._invalidate_objects(bucket_name)
+
+    def delete_object(self, bucket_name, object_name, check_exists=True):
+        """
+        Purpose:
+            Delete an Object from Minio
+        Args:
+            bucket_name (String): Name of the bucket to delete from
+            object_name (String): Name of object to delete in Minio
+            check_exists (Boolean): Raise ObjectDoesntExist if the object is missing
+                (Defaults to True)
+        Returns:
+            N/A
+        """
+
+        try:
+            minio_object_helpers.delete_object(
+                self.minio_client, bucket_name, object_name, check_exists=check_exists
+            )
+        finally:
+            self._invalidate_objects(bucket_name, [object_name])
+
+    def delete_objects(self, bucket_name, object_names, **kwargs):
+        """
+        Purpose:
+            Delete many Objects from Minio with batched delete requests
+        Args:
+            bucket_name (String): Name of the bucket to delete from
+            object_names (Iterable of Strings): Names of objects to delete in Minio
+            kwargs: Options of minio_object_helpers.delete_objects
+        Returns:
+            failures (List of Dicts): Objects that failed to delete
+        """
+
+        try:
+            return minio_object_helpers.delete_objects(
+                self.minio_client, bucket_name, object_names, **kwargs
+            )
+        finally:
+            self._invalidate_objects(bucket_name)
+
+    def delete_objects_by_prefix(self, bucket_name, prefix, **kwargs):
+        """
+        Purpose:
+            Delete every Object in Minio starting with a prefix
+        Args:
+            bucket_name (String): Name of the bucket to delete from
+            prefix (String): Prefix of objects to delete
+            kwargs: Options of minio_object_helpers.delete_objects_by_prefix
+        Returns:
+            failures (List of Dicts): Objects that failed to delete
+        """
+
+        try:
+            return minio_object_helpers.delete_objects_by_prefix(
+                self.minio_client, bucket_name, prefix, **kwargs
+            )
+        finally:
+            self._invalidate_objects(bucket_name)
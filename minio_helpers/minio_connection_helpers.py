@@ -8,9 +8,31 @@
 """
 
 # Python Library Imports
+import certifi
+import hashlib
 import logging
+import os
+import socket
+import threading
+import urllib3
 from minio import Minio
 from minio.error import ResponseError
+from minio.helpers import MAX_POOL_SIZE
+from urllib3.connection import HTTPConnection
+
+
+###
+# Constants
+###
+
+
+DEFAULT_MAX_POOL_SIZE = MAX_POOL_SIZE
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_RETRY_BACKOFF_FACTOR = 0.2
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+_MINIO_CLIENT_REGISTRY = {}
+_MINIO_CLIENT_REGISTRY_LOCK = threading.Lock()
 
 
 ###
@@ -18,39 +40,194 @@ from minio.error import ResponseError
 ###
 
 
-def connect_to_minio(minio_url, access_key=None, secret_key=None, secure=False):
+def connect_to_minio(
+    minio_url, access_key=None, secret_key=None, secure=False,
+    max_pool_size=DEFAULT_MAX_POOL_SIZE, connect_timeout=None, read_timeout=None,
+    max_retries=DEFAULT_MAX_RETRIES, retry_backoff_factor=DEFAULT_RETRY_BACKOFF_FACTOR,
+    keep_alive=True, shared=True
+):
     """
     Purpose:
-        Connect to Minio and return the minio_client of minio lib
+        Connect to Minio and return the minio_client of minio lib. By default the
+        client is shared: calls with the same URL, credentials, and connection
+        options return the client (and warm connection pool) already built for
+        them in this process
     Args:
         minio_url (String): URL of Minio
         access_key (String): Access Key for Minio
         secret_key (String): Secret Key for Minio
+        secure (Boolean): Use https (Defaults to False)
+        max_pool_size (Int): Connections kept open per host. Size this to the
+            number of threads sharing the client (Defaults to 10)
+        connect_timeout (Float): Seconds to wait for a connection (Defaults to
+            no timeout)
+        read_timeout (Float): Seconds to wait between bytes of a response
+            (Defaults to no timeout)
+        max_retries (Int): Retries of failed connections and 5xx responses
+            (Defaults to 5)
+        retry_backoff_factor (Float): Backoff factor between retries (Defaults to
+            0.2)
+        keep_alive (Boolean): Enable TCP keep-alive on pooled connections so idle
+            connections are not dropped (Defaults to True)
+        shared (Boolean): Reuse the client registered for the same URL,
+            credentials, and options (Defaults to True)
     Returns:
         minio_client (minio client Obj): Client obj connection to Minio
     """
     logging.info(f"Connecting to Minio: {minio_url}")
 
-    try:
-        if access_key:
-            minio_client = Minio(
-                minio_url,
-                access_key=access_key,
-                secret_key=secret_key,
-                secure=secure
+    connection_options = (
+        secure, max_pool_size, connect_timeout, read_timeout, max_retries,
+        retry_backoff_factor, keep_alive,
+    )
+    registry_key = get_minio_client_registry_key(
+        minio_url, access_key, secret_key, connection_options
+    )
+
+    with _MINIO_CLIENT_REGISTRY_LOCK:
+        if shared and registry_key in _MINIO_CLIENT_REGISTRY:
+            return _MINIO_CLIENT_REGISTRY[registry_key]
+
+        try:
+            http_client = build_http_client(
+                secure=secure,
+                max_pool_size=max_pool_size,
+                connect_timeout=connect_timeout,
+                read_timeout=read_timeout,
+                max_retries=max_retries,
+                retry_backoff_factor=retry_backoff_factor,
+                keep_alive=keep_alive,
             )
-        else:
-            minio_client = Minio(minio_url, secure=secure)
-    except ResponseError as con_err:
-        logging.exception(f"Can't Connect to Minio URL ({minio_url}): {con_err}")
-        raise con_err
-    except Exception as err:
-        logging.exception(f"Exception connecting to minio: {err}")
-        raise err
+            if access_key:
+                minio_client = Minio(
+                    minio_url,
+                    access_key=access_key,
+                    secret_key=secret_key,
+                    secure=secure,
+                    http_client=http_client,
+                )
+            else:
+                minio_client = Minio(minio_url, secure=secure, http_client=http_client)
+        except ResponseError as con_err:
+            logging.exception(f"Can't Connect to Minio URL ({minio_url}): {con_err}")
+            raise con_err
+        except Exception as err:
+            logging.exception(f"Exception connecting to minio: {err}")
+            raise err
+
+        if shared:
+            _MINIO_CLIENT_REGISTRY[registry_key] = minio_client
 
     return minio_client
 
 
+def build_http_client(
+    secure=False, max_pool_size=DEFAULT_MAX_POOL_SIZE, connect_timeout=None,
+    read_timeout=None, max_retries=DEFAULT_MAX_RETRIES,
+    retry_backoff_factor=DEFAULT_RETRY_BACKOFF_FACTOR, keep_alive=True
+):
+    """
+    Purpose:
+        Build the urllib3 connection pool used by a minio client. Defaults match
+        the pool the minio lib builds for itself
+    Args:
+        secure (Boolean): Verify certificates for https (Defaults to False)
+        max_pool_size (Int): Connections kept open per host (Defaults to 10)
+        connect_timeout (Float): Seconds to wait for a connection (Defaults to
+            no timeout)
+        read_timeout (Float): Seconds to wait between bytes of a response
+            (Defaults to no timeout)
+        max_retries (Int): Retries of failed connections and 5xx responses
+            (Defaults to 5)
+        retry_backoff_factor (Float): Backoff factor between retries (Defaults to
+            0.2)
+        keep_alive (Boolean): Enable TCP keep-alive on pooled connections
+            (Defaults to True)
+    Returns:
+        http_client (urllib3.PoolManager): Connection pool for a minio client
+    """
+
+    timeout = urllib3.Timeout.DEFAULT_TIMEOUT
+    if connect_timeout is not None or read_timeout is not None:
+        timeout = urllib3.Timeout(connect=connect_timeout, read=read_timeout)
+
+    pool_kwargs = {}
+    if keep_alive:
+        pool_kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        ]
+    if secure:
+        pool_kwargs["cert_reqs"] = "CERT_REQUIRED"
+        pool_kwargs["ca_certs"] = os.environ.get("SSL_CERT_FILE") or certifi.where()
+
+    return urllib3.PoolManager(
+        timeout=timeout,
+        maxsize=max_pool_size,
+        retries=urllib3.Retry(
+            total=max_retries,
+            backoff_factor=retry_backoff_factor,
+            status_forcelist=list(RETRY_STATUS_CODES),
+        ),
+        **pool_kwargs,
+    )
+
+
+def get_minio_client_registry_key(
+    minio_url, access_key, secret_key, connection_options
+):
+    """
+    Purpose:
+        Build the key shared clients are registered under. The secret key is
+        hashed so it is not held in the registry's keys
+    Args:
+        minio_url (String): URL of Minio
+        access_key (String): Access Key for Minio
+        secret_key (String): Secret Key for Minio
+        connection_options (Tuple): Hashable connection options of the client
+    Returns:
+        registry_key (Tuple): Key of the client in the registry
+    """
+
+    return (
+        (minio_url,) + get_credentials_key(access_key, secret_key) +
+        (connection_options,)
+    )
+
+
+def get_credentials_key(access_key, secret_key):
+    """
+    Purpose:
+        Build a key identifying a client's credentials, with the secret key
+        hashed so it is not held in cache keys
+    Args:
+        access_key (String): Access Key for Minio
+        secret_key (String): Secret Key for Minio
+    Returns:
+        credentials_key (Tuple): Access key and hash of the secret key
+    """
+
+    secret_key_hash = None
+    if secret_key:
+        secret_key_hash = hashlib.sha256(secret_key.encode("utf-8")).hexdigest()
+
+    return (access_key, secret_key_hash)
+
+
+def clear_minio_client_registry():
+    """
+    Purpose:
+        Forget every shared client, so the next connect_to_minio call builds a
+        new client and connection pool. Clients already handed out keep working
+    Args:
+        N/A
+    Returns:
+        N/A
+    """
+
+    with _MINIO_CLIENT_REGISTRY_LOCK:
+        _MINIO_CLIENT_REGISTRY.clear()
+
+
 def build_minio_url(minio_host, minio_port=9000):
     """
     Purpose:
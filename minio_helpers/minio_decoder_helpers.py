@@ -0,0 +1,548 @@
+"""
+    Purpose:
+        Minio Object Storage Decoder Helpers.
+
+        This library is used to interact with Minio object storage. Will handle
+        decoding objects downloaded from Minio into python objects. Decoders are
+        registered by file extension and content type, and read the object from
+        the response stream instead of a fully read byte string. Compressed
+        objects (.gz, .zst) are decompressed as they are read
+"""
+
+# Python Library Imports
+import codecs
+import csv
+import gzip
+import io
+import logging
+import simplejson as json
+
+# Optional Library Imports
+try:
+    import fastavro
+except ImportError:
+    fastavro = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Local Library Imports
+from minio_helpers.minio_exceptions import ObjectDecodingNotSupported, \
+    ObjectDownloadIncomplete
+
+
+###
+# Decoder Registry
+###
+
+
+DECODERS_BY_EXTENSION = {}
+DECODERS_BY_CONTENT_TYPE = {}
+DECOMPRESSORS_BY_EXTENSION = {}
+RECORD_ITERATORS_BY_EXTENSION = {}
+RECORD_ITERATORS_BY_CONTENT_TYPE = {}
+
+
+def register_decoder(decoder, extensions=(), content_types=()):
+    """
+    Purpose:
+        Register a decoder for objects with the given extensions and content
+        types. Registering an extension or content type again replaces the
+        decoder it used
+    Args:
+        decoder (Function): Function called as decoder(object_stream, encoding)
+            that reads a binary file-like object and returns the parsed object
+        extensions (List of Strings): File extensions (without the ".")
+        content_types (List of Strings): Content types (such as text/csv)
+    Returns:
+        N/A
+    """
+
+    for extension in extensions:
+        DECODERS_BY_EXTENSION[extension.lower()] = decoder
+    for content_type in content_types:
+        DECODERS_BY_CONTENT_TYPE[content_type.lower()] = decoder
+
+
+def register_decompressor(decompressor, extensions=()):
+    """
+    Purpose:
+        Register a decompressor for objects with the given extensions
+    Args:
+        decompressor (Function): Function called as decompressor(object_stream)
+            that wraps a binary file-like object in a decompressing one
+        extensions (List of Strings): File extensions (without the ".")
+    Returns:
+        N/A
+    """
+
+    for extension in extensions:
+        DECOMPRESSORS_BY_EXTENSION[extension.lower()] = decompressor
+
+
+def register_record_iterator(record_iterator, extensions=(), content_types=()):
+    """
+    Purpose:
+        Register a record iterator for objects with the given extensions and
+        content types, used to stream records out of an object one at a time
+    Args:
+        record_iterator (Function): Generator called as
+            record_iterator(object_stream, encoding) that yields parsed records
+        extensions (List of Strings): File extensions (without the ".")
+        content_types (List of Strings): Content types (such as text/csv)
+    Returns:
+        N/A
+    """
+
+    for extension in extensions:
+        RECORD_ITERATORS_BY_EXTENSION[extension.lower()] = record_iterator
+    for content_type in content_types:
+        RECORD_ITERATORS_BY_CONTENT_TYPE[content_type.lower()] = record_iterator
+
+
+def get_decoder(object_name, content_type=None):
+    """
+    Purpose:
+        Find the decoder for an object from its extension (after stripping any
+        compression extensions), falling back to its content type
+    Args:
+        object_name (String): Name of object in Minio
+        content_type (String): Content type of the object, if known
+    Returns:
+        decoder (Function): Decoder for the object (None if not supported)
+        decompressors (List of Functions): Decompressors to apply to the object
+            stream, outermost first
+    """
+
+    return _find_registered(
+        object_name, DECODERS_BY_EXTENSION, DECODERS_BY_CONTENT_TYPE, content_type
+    )
+
+
+def get_record_iterator(object_name, content_type=None):
+    """
+    Purpose:
+        Find the record iterator for an object from its extension (after
+        stripping any compression extensions), falling back to its content type
+    Args:
+        object_name (String): Name of object in Minio
+        content_type (String): Content type of the object, if known
+    Returns:
+        record_iterator (Function): Record iterator for the object (None if not
+            supported)
+        decompressors (List of Functions): Decompressors to apply to the object
+            stream, outermost first
+    """
+
+    return _find_registered(
+        object_name,
+        RECORD_ITERATORS_BY_EXTENSION,
+        RECORD_ITERATORS_BY_CONTENT_TYPE,
+        content_type,
+    )
+
+
+def _find_registered(object_name, by_extension, by_content_type, content_type=None):
+    """
+    Purpose:
+        Find a registered function for an object from its extension (after
+        stripping any compression extensions), falling back to its content type
+    Args:
+        object_name (String): Name of object in Minio
+        by_extension (Dict): Registered functions keyed by extension
+        by_content_type (Dict): Registered functions keyed by content type
+        content_type (String): Content type of the object, if known
+    Returns:
+        registered (Function): Registered function (None if not supported)
+        decompressors (List of Functions): Decompressors to apply to the object
+            stream, outermost first
+    """
+
+    extensions = object_name.rsplit("/", 1)[-1].lower().split(".")[1:]
+
+    decompressors = []
+    while extensions and extensions[-1] in DECOMPRESSORS_BY_EXTENSION:
+        decompressors.append(DECOMPRESSORS_BY_EXTENSION[extensions.pop()])
+
+    registered = None
+    if extensions:
+        registered = by_extension.get(extensions[-1])
+    if not registered and content_type:
+        registered = by_content_type.get(content_type.split(";")[0].strip().lower())
+
+    return registered, decompressors
+
+
+def decode_object_stream(
+    object_name, object_stream, content_type=None, encoding="utf-8"
+):
+    """
+    Purpose:
+        Decompress and decode an object stream with the registered decoders
+    Args:
+        object_name (String): Name of object in Minio
+        object_stream (File-like Obj): Binary stream of the object
+        content_type (String): Content type of the object, if known
+        encoding (String): Encoding of text objects (Defaults to utf-8)
+    Returns:
+        parsed_object (Obj, depending on decoder): Object parsed from the stream
+    """
+
+    decoder, decompressors = get_decoder(object_name, content_type=content_type)
+    if not decoder:
+        error_msg = f"Object {object_name} Does Not Support Download into Memory"
+        logging.error(error_msg)
+        raise ObjectDecodingNotSupported(error_msg)
+
+    for decompressor in decompressors:
+        object_stream = decompressor(object_stream)
+
+    return decoder(object_stream, encoding=encoding)
+
+
+###
+# Stream Helpers
+###
+
+
+def read_object_into_buffer(minio_object, chunk_size=1024 * 1024):
+    """
+    Purpose:
+        Read the body of a get_object response into a bytearray. When the
+        response has a Content-Length (and no Content-Encoding, as the length is
+        then of the encoded body, not of the decoded bytes read) the buffer is
+        allocated once and filled in place with readinto, otherwise chunks are
+        appended to it
+    Args:
+        minio_object (urllib3 HTTPResponse): Response returned by get_object (or
+            any binary file-like object)
+        chunk_size (Int): Bytes to read at a time (Defaults to 1MiB)
+    Returns:
+        object_buffer (bytearray): Body of the response
+    """
+
+    headers = getattr(minio_object, "headers", {})
+    content_length = headers.get("content-length")
+    content_encoding = headers.get("content-encoding", "identity")
+    if content_length is None or content_encoding.lower() != "identity":
+        object_buffer = bytearray()
+        for data in iter(lambda: minio_object.read(chunk_size), b""):
+            object_buffer += data
+        return object_buffer
+
+    content_length = int(content_length)
+    object_buffer = bytearray(content_length)
+    buffer_view = memoryview(object_buffer)
+
+    bytes_read = 0
+    while bytes_read < content_length:
+        chunk_read = minio_object.readinto(
+            buffer_view[bytes_read:bytes_read + chunk_size]
+        )
+        if not chunk_read:
+            break
+        bytes_read += chunk_read
+    buffer_view.release()
+
+    if bytes_read != content_length:
+        raise ObjectDownloadIncomplete(
+            f"Read {bytes_read} of {content_length} bytes from Minio"
+        )
+
+    return object_buffer
+
+
+def get_text_stream(object_stream, encoding="utf-8"):
+    """
+    Purpose:
+        Wrap a binary object stream to read it as text line by line
+    Args:
+        object_stream (File-like Obj): Binary stream of the object
+        encoding (String): Encoding of the object (Defaults to utf-8)
+    Returns:
+        text_stream (io.TextIOWrapper): Text stream over the object
+    """
+
+    return io.TextIOWrapper(object_stream, encoding=encoding, newline="")
+
+
+###
+# Record Iterators
+###
+
+
+def iter_text_lines(object_stream, encoding="utf-8"):
+    """
+    Purpose:
+        Lazily read lines of text from an object stream, without line endings
+    Args:
+        object_stream (File-like Obj): Binary stream of the object
+        encoding (String): Encoding of the object (Defaults to utf-8)
+    Yields:
+        line (String): Line of the object
+    """
+
+    for line in get_text_stream(object_stream, encoding=encoding):
+        yield line.rstrip("\r\n")
+
+
+def iter_ndjson_records(object_stream, encoding="utf-8"):
+    """
+    Purpose:
+        Lazily parse newline-delimited JSON records from an object stream,
+        skipping blank lines
+    Args:
+        object_stream (File-like Obj): Binary stream of the object
+        encoding (String): Encoding of the object (Defaults to utf-8)
+    Yields:
+        record (Obj): Parsed JSON record
+    """
+
+    for line in get_text_stream(object_stream, encoding=encoding):
+        if line.strip():
+            yield json.loads(line)
+
+
+def iter_csv_records(object_stream, encoding="utf-8"):
+    """
+    Purpose:
+        Lazily parse CSV records from an object stream, using the first row as
+        the header
+    Args:
+        object_stream (File-like Obj): Binary stream of the object
+        encoding (String): Encoding of the object (Defaults to utf-8)
+    Yields:
+        record (Dict): CSV row keyed by header
+    """
+
+    for record in csv.DictReader(get_text_stream(object_stream, encoding=encoding)):
+        yield record
+
+
+def iter_avro_records(object_stream, encoding="utf-8"):
+    """
+    Purpose:
+        Lazily parse Avro records from an object stream (requires fastavro)
+    Args:
+        object_stream (File-like Obj): Binary stream of the object
+        encoding (String): Unused, Avro is a binary format
+    Yields:
+        record (Dict): Avro record
+    """
+
+    if fastavro is None:
+        raise ObjectDecodingNotSupported("Decoding .avro Objects Requires fastavro")
+
+    for record in fastavro.reader(object_stream):
+        yield record
+
+
+###
+# Decoders
+###
+
+
+def decode_text(object_stream, encoding="utf-8"):
+    """
+    Purpose:
+        Decode an object stream as a string
+    Args:
+        object_stream (File-like Obj): Binary stream of the object
+        encoding (String): Encoding of the object (Defaults to utf-8)
+    Returns:
+        decoded_object (String): Decoded object
+    """
+
+    return read_object_into_buffer(object_stream).decode(encoding)
+
+
+def decode_json(object_stream, encoding="utf-8"):
+    """
+    Purpose:
+        Decode an object stream as a JSON document. With ijson installed UTF-8
+        documents are parsed incrementally from the stream, so only the parsed
+        object is held in memory (ijson's C backend limits integers to 64 bits).
+        Otherwise the raw buffer is freed once it is decoded, before parsing
+    Args:
+        object_stream (File-like Obj): Binary stream of the object
+        encoding (String): Encoding of the object (Defaults to utf-8)
+    Returns:
+        parsed_object (Dict/List/JSON): Parsed object
+    Raises:
+        ValueError: The object isn't a valid JSON document
+    """
+
+    if ijson is not None and codecs.lookup(encoding).name == "utf-8":
+        parsed_objects = ijson.items(object_stream, "", use_float=True)
+        try:
+            parsed_object = next(parsed_objects)
+            # Finish parsing the stream so trailing data is refused like json.loads
+            for _ in parsed_objects:
+                pass
+        except ijson.JSONError as err:
+            raise ValueError(f"Invalid JSON Object: {err}") from err
+        return parsed_object
+
+    decoded_object = read_object_into_buffer(object_stream).decode(encoding)
+
+    return json.loads(decoded_object)
+
+
+def decode_ndjson(object_stream, encoding="utf-8"):
+    """
+    Purpose:
+        Decode an object stream of newline-delimited JSON records
+    Args:
+        object_stream (File-like Obj): Binary stream of the object
+        encoding (String): Encoding of the object (Defaults to utf-8)
+    Returns:
+        records (List): Parsed JSON records
+    """
+
+    return list(iter_ndjson_records(object_stream, encoding=encoding))
+
+
+def decode_csv(object_stream, encoding="utf-8"):
+    """
+    Purpose:
+        Decode an object stream of CSV records
+    Args:
+        object_stream (File-like Obj): Binary stream of the object
+        encoding (String): Encoding of the object (Defaults to utf-8)
+    Returns:
+        records (List of Dicts): CSV rows keyed by header
+    """
+
+    return list(iter_csv_records(object_stream, encoding=encoding))
+
+
+def decode_avro(object_stream, encoding="utf-8"):
+    """
+    Purpose:
+        Decode an object stream of Avro records (requires fastavro)
+    Args:
+        object_stream (File-like Obj): Binary stream of the object
+        encoding (String): Unused, Avro is a binary format
+    Returns:
+        records (List of Dicts): Avro records
+    """
+
+    return list(iter_avro_records(object_stream, encoding=encoding))
+
+
+def decode_parquet(object_stream, encoding="utf-8"):
+    """
+    Purpose:
+        Decode an object stream as a Parquet table (requires pyarrow). Parquet
+        keeps its metadata at the end of the file, so the object is read into a
+        single buffer that pyarrow reads without copying
+    Args:
+        object_stream (File-like Obj): Binary stream of the object
+        encoding (String): Unused, Parquet is a binary format
+    Returns:
+        table (pyarrow.Table): Parsed table
+    """
+
+    if pyarrow is None:
+        raise ObjectDecodingNotSupported("Decoding .parquet Objects Requires pyarrow")
+
+    object_buffer = read_object_into_buffer(object_stream)
+
+    return pyarrow.parquet.read_table(
+        pyarrow.BufferReader(pyarrow.py_buffer(object_buffer))
+    )
+
+
+###
+# Decompressors
+###
+
+
+def decompress_gzip(object_stream):
+    """
+    Purpose:
+        Wrap an object stream to gunzip it as it is read
+    Args:
+        object_stream (File-like Obj): Binary stream of the object
+    Returns:
+        decompressed_stream (gzip.GzipFile): Decompressing stream
+    """
+
+    return gzip.GzipFile(fileobj=object_stream, mode="rb")
+
+
+def decompress_zstd(object_stream):
+    """
+    Purpose:
+        Wrap an object stream to decompress it with zstd as it is read (requires
+        zstandard)
+    Args:
+        object_stream (File-like Obj): Binary stream of the object
+    Returns:
+        decompressed_stream (File-like Obj): Decompressing stream
+    """
+
+    if zstandard is None:
+        raise ObjectDecodingNotSupported("Decoding .zst Objects Requires zstandard")
+
+    return zstandard.ZstdDecompressor().stream_reader(object_stream)
+
+
+###
+# Built-in Registrations
+###
+
+
+register_decoder(decode_text, extensions=["txt"], content_types=["text/plain"])
+register_decoder(decode_json, extensions=["json"], content_types=["application/json"])
+register_decoder(
+    decode_ndjson,
+    extensions=["ndjson", "jsonl"],
+    content_types=["application/x-ndjson", "application/jsonl"],
+)
+register_decoder(decode_csv, extensions=["csv"], content_types=["text/csv"])
+register_decompressor(decompress_gzip, extensions=["gz", "gzip"])
+register_record_iterator(
+    iter_text_lines, extensions=["txt", "log"], content_types=["text/plain"]
+)
+register_record_iterator(
+    iter_ndjson_records,
+    extensions=["ndjson", "jsonl"],
+    content_types=["application/x-ndjson", "application/jsonl"],
+)
+register_record_iterator(
+    iter_csv_records, extensions=["csv"], content_types=["text/csv"]
+)
+
+if fastavro is not None:
+    register_decoder(
+        decode_avro,
+        extensions=["avro"],
+        content_types=["avro/binary", "application/avro"],
+    )
+    register_record_iterator(
+        iter_avro_records,
+        extensions=["avro"],
+        content_types=["avro/binary", "application/avro"],
+    )
+if pyarrow is not None:
+    register_decoder(
+        decode_parquet,
+        extensions=["parquet"],
+        content_types=["application/vnd.apache.parquet", "application/x-parquet"],
+    )
+if zstandard is not None:
+    register_decompressor(decompress_zstd, extensions=["zst", "zstd"])
@@ -30,6 +30,16 @@ class BucketDoesntExist(Exception):
     pass
 
 
+class BucketPurgeIncomplete(Exception):
+    """
+    Purpose:
+        The BucketPurgeIncomplete will be raised when objects in a bucket can't
+        be deleted while purging it
+    """
+
+    pass
+
+
 ###
 # Object Exceptions
 ###
@@ -64,3 +74,57 @@ class ObjectDecodingNotSupported(Exception):
 
     pass
 
+
+class ObjectDownloadIncomplete(Exception):
+    """
+    Purpose:
+        The ObjectDownloadIncomplete will be raised when a download from Minio
+        returns fewer (or more) bytes than the object holds
+    """
+
+    pass
+
+
+class ObjectChangedDuringDownload(Exception):
+    """
+    Purpose:
+        The ObjectChangedDuringDownload will be raised when the object in Minio
+        no longer matches the ETag it was downloaded at
+    """
+
+    pass
+
+
+class ObjectUploadIncomplete(Exception):
+    """
+    Purpose:
+        The ObjectUploadIncomplete will be raised when the parts uploaded to Minio
+        don't add up to the size of the file being uploaded
+    """
+
+    pass
+
+
+class ObjectListingUnsorted(Exception):
+    """
+    Purpose:
+        The ObjectListingUnsorted will be raised when a listing being merged with
+        another is not sorted by object name
+    """
+
+    pass
+
+
+###
+# Operation Exceptions
+###
+
+
+class OperationDeadlineExceeded(Exception):
+    """
+    Purpose:
+        The OperationDeadlineExceeded will be raised when an operation retried or
+        hedged by a RetryPolicy gets no response before its deadline
+    """
+
+    pass
@@ -6,11 +6,280 @@
 """
 
 # Python Library Imports
+import collections
+import contextvars
+import itertools
 import logging
 import minio
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 
 ###
 # General Helpers
 ###
 
+
+def iter_batches(items, batch_size):
+    """
+    Purpose:
+        Lazily group items into lists of up to batch_size items
+    Args:
+        items (Iterable): Items to group
+        batch_size (Int): Max number of items per batch
+    Yields:
+        batch (List): Next batch of items
+    """
+
+    items = iter(items)
+    batch = list(itertools.islice(items, batch_size))
+    while batch:
+        yield batch
+        batch = list(itertools.islice(items, batch_size))
+
+
+def iter_pool_results(func, work_items, max_workers=8, max_pending=None):
+    """
+    Purpose:
+        Run func over each work item on a bounded thread pool and yield results
+        as they complete. Only max_pending work items are pulled from work_items
+        at a time, so iterators of work are consumed lazily. Each call runs in a
+        copy of the caller's context, so context variables (such as the running
+        instrumented operation) carry over to the pool
+    Args:
+        func (Function): Function called with each work item
+        work_items (Iterable): Work items to pass to func
+        max_workers (Int): Number of threads in the pool (Defaults to 8)
+        max_pending (Int): Max work items submitted but not yet yielded
+            (Defaults to max_workers * 2)
+    Yields:
+        work_result (Tuple): (work_item, result, error) for each work item, where
+            error is the exception func raised (result is None) or None
+    """
+
+    max_workers = max(max_workers, 1)
+    max_pending = max_pending or max_workers * 2
+    work_items = iter(work_items)
+    pending_futures = {}
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        while True:
+            for work_item in itertools.islice(
+                work_items, max(max_pending - len(pending_futures), 0)
+            ):
+                pending_futures[
+                    executor.submit(contextvars.copy_context().run, func, work_item)
+                ] = work_item
+
+            if not pending_futures:
+                break
+
+            done_futures, _ = wait(pending_futures, return_when=FIRST_COMPLETED)
+            for future in done_futures:
+                work_item = pending_futures.pop(future)
+                error = future.exception()
+                yield (work_item, None if error else future.result(), error)
+    finally:
+        for future in pending_futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+###
+# General Classes
+###
+
+
+class ByteBudget(object):
+    """
+        ByteBudget Class. Bounds the number of bytes in flight across threads.
+        A single request larger than the budget is admitted once nothing else
+        is in flight, so oversized objects never deadlock
+    """
+
+    def __init__(self, max_bytes=None):
+        """
+        Purpose:
+            Initilize the ByteBudget Class.
+        Args:
+            max_bytes (Int): Max bytes in flight (Defaults to unbounded)
+        Returns:
+            N/A
+        """
+
+        self.max_bytes = max_bytes
+        self.in_flight_bytes = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, num_bytes):
+        """
+        Purpose:
+            Block until num_bytes fit in the budget, then reserve them
+        Args:
+            num_bytes (Int): Bytes to reserve
+        Returns:
+            N/A
+        """
+
+        with self._condition:
+            while self.max_bytes and self.in_flight_bytes and\
+                    self.in_flight_bytes + num_bytes > self.max_bytes:
+                self._condition.wait()
+            self.in_flight_bytes += num_bytes
+
+    def release(self, num_bytes):
+        """
+        Purpose:
+            Return num_bytes to the budget and wake waiting threads
+        Args:
+            num_bytes (Int): Bytes to release
+        Returns:
+            N/A
+        """
+
+        with self._condition:
+            self.in_flight_bytes -= num_bytes
+            self._condition.notify_all()
+
+
+class TTLCache(object):
+    """
+        TTLCache Class. Thread-safe mapping whose entries expire ttl seconds after
+        they are set, and which evicts the least recently used entries once it
+        holds more than max_size entries (or, given get_size, once the total size
+        of its entries is over max_size)
+    """
+
+    def __init__(self, max_size=1024, ttl=None, get_size=None):
+        """
+        Purpose:
+            Initilize the TTLCache Class.
+        Args:
+            max_size (Int): Max entries held, or max total size of the entries
+                held given get_size (Defaults to 1024)
+            ttl (Float): Seconds an entry is valid for (Defaults to no expiry)
+            get_size (Function): Called with each value to get its size
+                (Defaults to every entry having a size of 1)
+        Returns:
+            N/A
+        """
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.get_size = get_size
+        self.total_size = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """
+        Purpose:
+            Get the number of entries held (including expired entries not yet
+            evicted)
+        Args:
+            N/A
+        Returns:
+            num_entries (Int): Number of entries
+        """
+
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """
+        Purpose:
+            Get the value of an unexpired entry and mark it recently used
+        Args:
+            key (Hashable): Key of the entry
+            default (Obj): Value returned if there is no unexpired entry
+        Returns:
+            value (Obj): Value of the entry, or default
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at, size = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.total_size -= size
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """
+        Purpose:
+            Set the value of an entry, evicting the least recently used entries
+            past max_size. Values larger than max_size on their own aren't held
+        Args:
+            key (Hashable): Key of the entry
+            value (Obj): Value of the entry
+        Returns:
+            N/A
+        """
+
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        size = 1 if self.get_size is None else self.get_size(value)
+
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self.total_size -= old_entry[2]
+            if size > self.max_size:
+                return
+            self._entries[key] = (value, expires_at, size)
+            self.total_size += size
+            while self.total_size > self.max_size:
+                self.total_size -= self._entries.popitem(last=False)[1][2]
+
+    def pop(self, key, default=None):
+        """
+        Purpose:
+            Remove an entry
+        Args:
+            key (Hashable): Key of the entry
+            default (Obj): Value returned if there is no entry
+        Returns:
+            value (Obj): Value of the removed entry, or default
+        """
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.total_size -= entry[2]
+
+        return default if entry is None else entry[0]
+
+    def pop_matching(self, match_func):
+        """
+        Purpose:
+            Remove every entry whose key matches
+        Args:
+            match_func (Function): Called with each key, returns True to remove it
+        Returns:
+            num_removed (Int): Number of entries removed
+        """
+
+        with self._lock:
+            matching_keys = [key for key in self._entries if match_func(key)]
+            for key in matching_keys:
+                self.total_size -= self._entries.pop(key)[2]
+
+        return len(matching_keys)
+
+    def clear(self):
+        """
+        Purpose:
+            Remove every entry
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self.total_size = 0
@@ -0,0 +1,589 @@
+"""
+    Purpose:
+        Minio Object Storage Instrumentation Helpers.
+
+        This library is used to interact with Minio object storage. Will handle
+        reporting each bucket and object helper call (operation, bucket, object,
+        duration, bytes transferred, retries, and error class) to registered
+        hooks. Helpers are wrapped with the instrumented decorator, which calls
+        straight through to the helper while no hooks are registered.
+        OpenTelemetry (pip install ctodd-python-lib-minio[opentelemetry]) and
+        Prometheus (pip install ctodd-python-lib-minio[prometheus]) hooks are
+        included
+"""
+
+# Python Library Imports
+import contextvars
+import functools
+import inspect
+import logging
+import threading
+import time
+from collections import namedtuple
+
+try:
+    from opentelemetry import metrics as otel_metrics
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_metrics = None
+    otel_trace = None
+
+try:
+    import prometheus_client
+except ImportError:
+    prometheus_client = None
+
+
+###
+# Constants
+###
+
+
+OperationEvent = namedtuple(
+    "OperationEvent",
+    [
+        "operation",
+        "bucket_name",
+        "object_name",
+        "start_time",
+        "duration",
+        "bytes_transferred",
+        "retries",
+        "error_class",
+        "parent_operation",
+    ],
+)
+
+_HOOKS = []
+_HOOKS_LOCK = threading.Lock()
+_RECORD_LOCK = threading.Lock()
+_CURRENT_OPERATION = contextvars.ContextVar("minio_helpers_operation", default=None)
+
+
+###
+# Hook Registry
+###
+
+
+def register_hook(hook):
+    """
+    Purpose:
+        Register a hook to be called with an OperationEvent after every
+        instrumented helper call. Exceptions raised by hooks are logged and
+        ignored
+    Args:
+        hook (Function): Called with each OperationEvent
+    Returns:
+        hook (Function): The registered hook (so this can be used as a decorator)
+    """
+
+    with _HOOKS_LOCK:
+        if hook not in _HOOKS:
+            _HOOKS.append(hook)
+
+    return hook
+
+
+def unregister_hook(hook):
+    """
+    Purpose:
+        Stop calling a registered hook
+    Args:
+        hook (Function): Registered hook
+    Returns:
+        N/A
+    """
+
+    with _HOOKS_LOCK:
+        if hook in _HOOKS:
+            _HOOKS.remove(hook)
+
+
+def clear_hooks():
+    """
+    Purpose:
+        Unregister every hook
+    Args:
+        N/A
+    Returns:
+        N/A
+    """
+
+    with _HOOKS_LOCK:
+        del _HOOKS[:]
+
+
+def get_hooks():
+    """
+    Purpose:
+        Get the registered hooks
+    Args:
+        N/A
+    Returns:
+        hooks (List of Functions): Registered hooks
+    """
+
+    return list(_HOOKS)
+
+
+###
+# Operation Recording
+###
+
+
+def add_bytes_transferred(num_bytes):
+    """
+    Purpose:
+        Count bytes sent to or received from Minio against the running
+        instrumented operation and the operations it was called from. Does
+        nothing outside of an instrumented operation
+    Args:
+        num_bytes (Int): Bytes transferred
+    Returns:
+        N/A
+    """
+
+    _add_to_operations("bytes_transferred", num_bytes)
+
+
+def add_retries(num_retries=1):
+    """
+    Purpose:
+        Count retried requests against the running instrumented operation and the
+        operations it was called from. Does nothing outside of an instrumented
+        operation
+    Args:
+        num_retries (Int): Retries made (Defaults to 1)
+    Returns:
+        N/A
+    """
+
+    _add_to_operations("retries", num_retries)
+
+
+def add_response_stats(response):
+    """
+    Purpose:
+        Count the body size (Content-Length) of a response, and the retries
+        urllib3 made for it (see minio_connection_helpers.build_http_client),
+        against the running instrumented operation
+    Args:
+        response (urllib3 HTTPResponse): Response returned by the minio lib
+    Returns:
+        N/A
+    """
+
+    if _CURRENT_OPERATION.get() is None:
+        return
+
+    add_bytes_transferred(int(response.headers.get("content-length") or 0))
+    retries = getattr(response, "retries", None)
+    if retries is not None:
+        add_retries(len(retries.history))
+
+
+def _add_to_operations(counter_name, value):
+    """
+    Purpose:
+        Add to a counter of the running operation and each of its parents
+    Args:
+        counter_name (String): bytes_transferred or retries
+        value (Int): Value to add
+    Returns:
+        N/A
+    """
+
+    operation_record = _CURRENT_OPERATION.get()
+    if operation_record is None or not value:
+        return
+
+    with _RECORD_LOCK:
+        while operation_record is not None:
+            operation_record[counter_name] += value
+            operation_record = operation_record["parent"]
+
+
+###
+# Instrumentation Decorator
+###
+
+
+def instrumented(func=None, operation=None):
+    """
+    Purpose:
+        Decorate a helper to report an OperationEvent to the registered hooks
+        each time it is called. Generators (and async generators) are timed until
+        they are exhausted or closed. bucket_name and object_name are taken from
+        the helper's arguments of those names. With no hooks registered the
+        helper is called directly
+    Args:
+        func (Function): Helper to instrument
+        operation (String): Name of the operation (Defaults to the name of func)
+    Returns:
+        instrumented_func (Function): Instrumented helper
+    """
+
+    if func is None:
+        return functools.partial(instrumented, operation=operation)
+
+    operation = operation or func.__name__
+    get_names = _get_name_getter(func)
+
+    def start_operation(args, kwargs):
+        bucket_name, object_name = get_names(args, kwargs)
+        return {
+            "operation": operation,
+            "bucket_name": bucket_name,
+            "object_name": object_name,
+            "start_time": time.time(),
+            "start_counter": time.perf_counter(),
+            "bytes_transferred": 0,
+            "retries": 0,
+            "parent": _CURRENT_OPERATION.get(),
+        }
+
+    if inspect.isasyncgenfunction(func):
+
+        @functools.wraps(func)
+        def instrumented_func(*args, **kwargs):
+            if not _HOOKS:
+                return func(*args, **kwargs)
+            return _iter_async_operation(
+                func(*args, **kwargs), start_operation(args, kwargs)
+            )
+
+    elif inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def instrumented_func(*args, **kwargs):
+            if not _HOOKS:
+                return await func(*args, **kwargs)
+
+            operation_record = start_operation(args, kwargs)
+            token = _CURRENT_OPERATION.set(operation_record)
+            error = None
+            try:
+                return await func(*args, **kwargs)
+            except BaseException as err:
+                error = err
+                raise
+            finally:
+                _CURRENT_OPERATION.reset(token)
+                _finish_operation(operation_record, error)
+
+    elif inspect.isgeneratorfunction(func):
+
+        @functools.wraps(func)
+        def instrumented_func(*args, **kwargs):
+            if not _HOOKS:
+                return func(*args, **kwargs)
+            return _iter_operation(
+                func(*args, **kwargs), start_operation(args, kwargs)
+            )
+
+    else:
+
+        @functools.wraps(func)
+        def instrumented_func(*args, **kwargs):
+            if not _HOOKS:
+                return func(*args, **kwargs)
+
+            operation_record = start_operation(args, kwargs)
+            token = _CURRENT_OPERATION.set(operation_record)
+            error = None
+            try:
+                return func(*args, **kwargs)
+            except BaseException as err:
+                error = err
+                raise
+            finally:
+                _CURRENT_OPERATION.reset(token)
+                _finish_operation(operation_record, error)
+
+    return instrumented_func
+
+
+def _get_name_getter(func):
+    """
+    Purpose:
+        Build a function getting bucket_name and object_name from the arguments
+        of a call to func
+    Args:
+        func (Function): Function being instrumented
+    Returns:
+        get_names (Function): Called with (args, kwargs), returns (bucket_name,
+            object_name), either of which may be None
+    """
+
+    parameter_names = list(inspect.signature(func).parameters)
+    positions = [
+        (name, parameter_names.index(name) if name in parameter_names else None)
+        for name in ("bucket_name", "object_name")
+    ]
+
+    def get_names(args, kwargs):
+        return tuple(
+            None if position is None
+            else args[position] if position < len(args) else kwargs.get(name)
+            for name, position in positions
+        )
+
+    return get_names
+
+
+def _iter_operation(generator, operation_record):
+    """
+    Purpose:
+        Yield from an instrumented generator, running each step as part of the
+        operation, and report the operation once the generator finishes
+    Args:
+        generator (Generator): Generator returned by the helper
+        operation_record (Dict): Record of the operation
+    Yields:
+        item (Obj): Items of the generator
+    """
+
+    error = None
+    try:
+        while True:
+            token = _CURRENT_OPERATION.set(operation_record)
+            try:
+                item = next(generator)
+            except StopIteration:
+                return
+            finally:
+                _CURRENT_OPERATION.reset(token)
+            yield item
+    except BaseException as err:
+        error = None if isinstance(err, GeneratorExit) else err
+        raise
+    finally:
+        generator.close()
+        _finish_operation(operation_record, error)
+
+
+async def _iter_async_operation(async_generator, operation_record):
+    """
+    Purpose:
+        Yield from an instrumented async generator, running each step as part of
+        the operation, and report the operation once the generator finishes
+    Args:
+        async_generator (Async Generator): Async generator returned by the helper
+        operation_record (Dict): Record of the operation
+    Yields:
+        item (Obj): Items of the async generator
+    """
+
+    error = None
+    try:
+        while True:
+            token = _CURRENT_OPERATION.set(operation_record)
+            try:
+                item = await async_generator.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                _CURRENT_OPERATION.reset(token)
+            yield item
+    except BaseException as err:
+        error = None if isinstance(err, GeneratorExit) else err
+        raise
+    finally:
+        await async_generator.aclose()
+        _finish_operation(operation_record, error)
+
+
+def _finish_operation(operation_record, error):
+    """
+    Purpose:
+        Report a finished operation to every registered hook
+    Args:
+        operation_record (Dict): Record of the operation
+        error (Exception): Exception the operation raised, or None
+    Returns:
+        N/A
+    """
+
+    parent_record = operation_record["parent"]
+    operation_event = OperationEvent(
+        operation=operation_record["operation"],
+        bucket_name=operation_record["bucket_name"],
+        object_name=operation_record["object_name"],
+        start_time=operation_record["start_time"],
+        duration=time.perf_counter() - operation_record["start_counter"],
+        bytes_transferred=operation_record["bytes_transferred"],
+        retries=operation_record["retries"],
+        error_class=type(error).__name__ if error is not None else None,
+        parent_operation=parent_record["operation"] if parent_record else None,
+    )
+
+    for hook in list(_HOOKS):
+        try:
+            hook(operation_event)
+        except Exception as err:
+            logging.error(f"Instrumentation Hook {hook} Failed: {err}")
+
+
+###
+# Instrumentation Hooks
+###
+
+
+class OpenTelemetryHook(object):
+    """
+        OpenTelemetryHook Class. Hook recording each operation as an
+        OpenTelemetry span (minio_helpers.<operation>) and recording its
+        duration, bytes, and retries as metrics
+    """
+
+    def __init__(self, tracer=None, meter=None):
+        """
+        Purpose:
+            Initilize the OpenTelemetryHook Class.
+        Args:
+            tracer (opentelemetry Tracer): Tracer to record spans with (Defaults to
+                the global tracer provider's minio_helpers tracer)
+            meter (opentelemetry Meter): Meter to record metrics with (Defaults to
+                the global meter provider's minio_helpers meter)
+        Returns:
+            N/A
+        """
+
+        if otel_trace is None:
+            raise ImportError(
+                "opentelemetry-api is required for OpenTelemetryHook "
+                "(pip install ctodd-python-lib-minio[opentelemetry])"
+            )
+
+        self.tracer = tracer or otel_trace.get_tracer("minio_helpers")
+        meter = meter or otel_metrics.get_meter("minio_helpers")
+        self.duration_histogram = meter.create_histogram(
+            "minio_helpers.operation.duration", unit="s",
+            description="Duration of minio_helpers operations",
+        )
+        self.bytes_counter = meter.create_counter(
+            "minio_helpers.operation.bytes", unit="By",
+            description="Bytes transferred by minio_helpers operations",
+        )
+        self.retries_counter = meter.create_counter(
+            "minio_helpers.operation.retries",
+            description="Requests retried by minio_helpers operations",
+        )
+
+    def __call__(self, operation_event):
+        """
+        Purpose:
+            Record an operation
+        Args:
+            operation_event (OperationEvent): Finished operation
+        Returns:
+            N/A
+        """
+
+        attributes = {"minio.operation": operation_event.operation}
+        if operation_event.bucket_name:
+            attributes["minio.bucket"] = operation_event.bucket_name
+        metric_attributes = dict(attributes)
+        if operation_event.error_class:
+            metric_attributes["error.type"] = operation_event.error_class
+
+        span_attributes = dict(
+            metric_attributes,
+            **{
+                "minio.bytes_transferred": operation_event.bytes_transferred,
+                "minio.retries": operation_event.retries,
+            }
+        )
+        if operation_event.object_name:
+            span_attributes["minio.object"] = operation_event.object_name
+
+        start_time_ns = int(operation_event.start_time * 1e9)
+        span = self.tracer.start_span(
+            f"minio_helpers.{operation_event.operation}",
+            start_time=start_time_ns,
+            attributes=span_attributes,
+        )
+        if operation_event.error_class:
+            span.set_status(
+                otel_trace.Status(
+                    otel_trace.StatusCode.ERROR, operation_event.error_class
+                )
+            )
+        span.end(end_time=start_time_ns + int(operation_event.duration * 1e9))
+
+        self.duration_histogram.record(operation_event.duration, metric_attributes)
+        if operation_event.bytes_transferred:
+            self.bytes_counter.add(operation_event.bytes_transferred, attributes)
+        if operation_event.retries:
+            self.retries_counter.add(operation_event.retries, attributes)
+
+
+class PrometheusHook(object):
+    """
+        PrometheusHook Class. Hook recording the duration, bytes, retries, and
+        errors of operations as Prometheus metrics labeled by operation and
+        bucket
+    """
+
+    def __init__(self, registry=None, namespace="minio_helpers"):
+        """
+        Purpose:
+            Initilize the PrometheusHook Class.
+        Args:
+            registry (prometheus_client CollectorRegistry): Registry to add the
+                metrics to (Defaults to the global registry)
+            namespace (String): Prefix of the metric names (Defaults to
+                minio_helpers)
+        Returns:
+            N/A
+        """
+
+        if prometheus_client is None:
+            raise ImportError(
+                "prometheus_client is required for PrometheusHook "
+                "(pip install ctodd-python-lib-minio[prometheus])"
+            )
+
+        registry_kwargs = {} if registry is None else {"registry": registry}
+        labels = ["operation", "bucket"]
+
+        self.duration_histogram = prometheus_client.Histogram(
+            f"{namespace}_operation_duration_seconds",
+            "Duration of minio_helpers operations",
+            labels, **registry_kwargs
+        )
+        self.bytes_counter = prometheus_client.Counter(
+            f"{namespace}_operation_bytes",
+            "Bytes transferred by minio_helpers operations",
+            labels, **registry_kwargs
+        )
+        self.retries_counter = prometheus_client.Counter(
+            f"{namespace}_operation_retries",
+            "Requests retried by minio_helpers operations",
+            labels, **registry_kwargs
+        )
+        self.errors_counter = prometheus_client.Counter(
+            f"{namespace}_operation_errors",
+            "minio_helpers operations that raised, by error class",
+            labels + ["error_class"], **registry_kwargs
+        )
+
+    def __call__(self, operation_event):
+        """
+        Purpose:
+            Record an operation
+        Args:
+            operation_event (OperationEvent): Finished operation
+        Returns:
+            N/A
+        """
+
+        labels = (operation_event.operation, operation_event.bucket_name or "")
+
+        self.duration_histogram.labels(*labels).observe(operation_event.duration)
+        if operation_event.bytes_transferred:
+            self.bytes_counter.labels(*labels).inc(operation_event.bytes_transferred)
+        if operation_event.retries:
+            self.retries_counter.labels(*labels).inc(operation_event.retries)
+        if operation_event.error_class:
+            self.errors_counter.labels(*labels, operation_event.error_class).inc()
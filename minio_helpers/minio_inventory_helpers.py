@@ -0,0 +1,650 @@
+"""
+    Purpose:
+        Minio Object Storage Inventory Helpers.
+
+        This library is used to interact with Minio object storage. Will handle
+        building compact in-memory inventories of the objects in a bucket for
+        capacity planning. Object names, sizes, modification times, and ETags
+        are held in flat array columns (viewed as NumPy arrays when NumPy is
+        installed) instead of a minio Object per key, and inventories are
+        queried for the size of prefixes, the age of objects, and the largest
+        objects, and saved to and loaded from binary snapshots
+"""
+
+# Python Library Imports
+import array
+import bisect
+import heapq
+import logging
+import os
+import re
+import simplejson as json
+import struct
+import sys
+import time
+
+# Optional Library Imports
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Local Library Imports
+from minio_helpers.minio_exceptions import ObjectListingUnsorted
+from minio_helpers.minio_object_helpers import get_last_modified_timestamp, \
+    iter_objects
+
+
+###
+# Constants
+###
+
+
+DEFAULT_AGE_HISTOGRAM_DAYS = (1, 7, 30, 90, 365)
+INVENTORY_SNAPSHOT_MAGIC = b"MINV"
+INVENTORY_SNAPSHOT_VERSION = 1
+
+_SNAPSHOT_HEADER = struct.Struct("<4sHQQQ")
+_ETAG_PATTERN = re.compile(r"([0-9a-fA-F]{32})(?:-([0-9]+))?")
+_ETAG_NOT_MD5 = 0xFFFFFFFF
+
+
+###
+# Inventory Class
+###
+
+
+class BucketInventory(object):
+    """
+        BucketInventory Class. Columnar inventory of objects sorted by name.
+        Names are stored as one UTF-8 buffer with an offsets column, ETags as
+        16 byte digests with a part count (ETags that aren't MD5 based are kept
+        aside), and sizes and modification times as 64 bit integer columns, so
+        each object costs its name plus about 44 bytes. Queries on a prefix
+        binary search the sorted names for the objects under it
+    """
+
+    def __init__(self, use_numpy=None):
+        """
+        Purpose:
+            Initilize the BucketInventory Class.
+        Args:
+            use_numpy (Boolean): Run queries on NumPy views of the columns
+                (Defaults to True if NumPy is installed)
+        Returns:
+            N/A
+        """
+
+        if use_numpy and numpy is None:
+            raise ImportError(
+                "numpy is required for use_numpy "
+                "(pip install ctodd-python-lib-minio[numpy])"
+            )
+
+        self.use_numpy = numpy is not None if use_numpy is None else use_numpy
+
+        self._names = bytearray()
+        self._name_offsets = array.array("q", [0])
+        self._sizes = array.array("q")
+        self._last_modified = array.array("q")
+        self._etag_digests = bytearray()
+        self._etag_parts = array.array("I")
+        self._other_etags = {}
+        self._numpy_columns = None
+
+    def __len__(self):
+        """
+        Purpose:
+            Get the number of objects in the inventory
+        Args:
+            N/A
+        Returns:
+            num_objects (Int): Number of objects in the inventory
+        """
+
+        return len(self._sizes)
+
+    ###
+    # Building Methods
+    ###
+
+    def add_object(self, object_name, size, last_modified, etag):
+        """
+        Purpose:
+            Add an object to the inventory. Objects must be added in the order
+            S3 lists them (sorted by the UTF-8 bytes of their names)
+        Args:
+            object_name (String): Name of the object
+            size (Int): Size of the object
+            last_modified (Float): Epoch timestamp the object was last modified
+                (None is stored as 0)
+            etag (String): ETag of the object
+        Returns:
+            N/A
+        Raises:
+            ObjectListingUnsorted: object_name doesn't sort after the last object
+        """
+
+        name_bytes = object_name.encode("utf-8")
+        if len(self) and name_bytes <= self._get_name_bytes(len(self) - 1):
+            raise ObjectListingUnsorted(
+                f"{object_name} Added After {self.get_object_name(len(self) - 1)}"
+            )
+
+        # Views of the columns would stop them from growing
+        self._numpy_columns = None
+
+        etag_match = _ETAG_PATTERN.fullmatch((etag or "").strip('"'))
+        if etag_match:
+            self._etag_digests += bytes.fromhex(etag_match.group(1))
+            self._etag_parts.append(int(etag_match.group(2) or 0))
+        else:
+            self._other_etags[len(self)] = etag
+            self._etag_digests += bytes(16)
+            self._etag_parts.append(_ETAG_NOT_MD5)
+
+        self._names += name_bytes
+        self._name_offsets.append(len(self._names))
+        self._sizes.append(size or 0)
+        self._last_modified.append(int(last_modified or 0))
+
+    def add_objects(self, minio_objects):
+        """
+        Purpose:
+            Add the objects of a recursive listing to the inventory, skipping
+            directories
+        Args:
+            minio_objects (Iterable of Object Objs): Listing sorted by name
+        Returns:
+            N/A
+        """
+
+        for minio_object in minio_objects:
+            if minio_object.is_dir:
+                continue
+            self.add_object(
+                minio_object.object_name,
+                minio_object.size,
+                get_last_modified_timestamp(minio_object.last_modified),
+                minio_object.etag,
+            )
+
+    ###
+    # Object Methods
+    ###
+
+    def get_object_name(self, index):
+        """
+        Purpose:
+            Get the name of the object at an index of the inventory
+        Args:
+            index (Int): Index of the object
+        Returns:
+            object_name (String): Name of the object
+        """
+
+        return self._get_name_bytes(index).decode("utf-8")
+
+    def get_object(self, index):
+        """
+        Purpose:
+            Get the columns of the object at an index of the inventory
+        Args:
+            index (Int): Index of the object
+        Returns:
+            inventory_object (Dict): Dict of object_name, size, last_modified
+                (epoch seconds), and etag
+        """
+
+        return {
+            "object_name": self.get_object_name(index),
+            "size": self._sizes[index],
+            "last_modified": self._last_modified[index],
+            "etag": self._get_etag(index),
+        }
+
+    def get_memory_size(self):
+        """
+        Purpose:
+            Get the bytes used by the columns of the inventory (ETags that
+            aren't MD5 based are counted by their length)
+        Args:
+            N/A
+        Returns:
+            memory_size (Int): Bytes used by the columns
+        """
+
+        return len(self._names) + len(self._etag_digests) + sum(
+            len(column) * column.itemsize for column in self._get_int_columns()
+        ) + sum(len(etag or "") for etag in self._other_etags.values())
+
+    ###
+    # Query Methods
+    ###
+
+    def get_prefix_size(self, prefix=""):
+        """
+        Purpose:
+            Get the number and total size of the objects under a prefix
+        Args:
+            prefix (String): Prefix of the objects (Defaults to every object)
+        Returns:
+            prefix_size (Dict): Dict of object_count and total_size
+        """
+
+        first_index, end_index = self._get_prefix_range(prefix.encode("utf-8"))
+        return {
+            "object_count": end_index - first_index,
+            "total_size": self._sum_sizes(first_index, end_index),
+        }
+
+    def get_size_by_prefix(self, prefix="", delimiter="/"):
+        """
+        Purpose:
+            Get the number and total size of the objects under each common
+            prefix one level below a prefix, the way a listing with a delimiter
+            groups them. Each common prefix is summed from a binary searched
+            range of the sorted names, so the cost grows with the number of
+            common prefixes rather than the number of objects
+        Args:
+            prefix (String): Prefix to group the objects under (Defaults to
+                every object)
+            delimiter (String): Delimiter ending each common prefix (Defaults
+                to "/")
+        Returns:
+            prefix_sizes (Dict): Dict of object_count and total_size per common
+                prefix, with objects directly under prefix counted under prefix
+        """
+
+        prefix_bytes = prefix.encode("utf-8")
+        delimiter_bytes = delimiter.encode("utf-8")
+        index, end_index = self._get_prefix_range(prefix_bytes)
+
+        prefix_sizes = {}
+        while index < end_index:
+            name_bytes = self._get_name_bytes(index)
+            delimiter_index = name_bytes.find(delimiter_bytes, len(prefix_bytes))
+            if delimiter_index < 0:
+                common_prefix, group_end_index = prefix, index + 1
+            else:
+                common_prefix_bytes =\
+                    name_bytes[:delimiter_index + len(delimiter_bytes)]
+                common_prefix = common_prefix_bytes.decode("utf-8")
+                _, group_end_index = self._get_prefix_range(
+                    common_prefix_bytes, index, end_index
+                )
+
+            prefix_size = prefix_sizes.setdefault(
+                common_prefix, {"object_count": 0, "total_size": 0}
+            )
+            prefix_size["object_count"] += group_end_index - index
+            prefix_size["total_size"] += self._sum_sizes(index, group_end_index)
+            index = group_end_index
+
+        return prefix_sizes
+
+    def get_age_histogram(
+        self, prefix="", bin_days=DEFAULT_AGE_HISTOGRAM_DAYS, now=None
+    ):
+        """
+        Purpose:
+            Count the objects under a prefix (and their total size) by how many
+            days ago they were last modified
+        Args:
+            prefix (String): Prefix of the objects (Defaults to every object)
+            bin_days (Tuple of Numbers): Ascending ages in days the bins are
+                split at (Defaults to 1, 7, 30, 90, and 365 days)
+            now (Float): Epoch timestamp ages are measured from (Defaults to
+                the current time)
+        Returns:
+            age_histogram (List of Dicts): Dict per bin of min_age_days,
+                max_age_days (None for the last bin), object_count, and
+                total_size
+        """
+
+        now = time.time() if now is None else now
+        bin_seconds = [days * 86400 for days in bin_days]
+        first_index, end_index = self._get_prefix_range(prefix.encode("utf-8"))
+
+        if self.use_numpy:
+            columns = self._get_numpy_columns()
+            bin_indexes = numpy.searchsorted(
+                bin_seconds,
+                now - columns["last_modified"][first_index:end_index],
+                side="right",
+            )
+            bin_counts = numpy.bincount(
+                bin_indexes, minlength=len(bin_seconds) + 1
+            ).tolist()
+            bin_sizes = numpy.bincount(
+                bin_indexes,
+                weights=columns["sizes"][first_index:end_index],
+                minlength=len(bin_seconds) + 1,
+            ).tolist()
+        else:
+            bin_counts = [0] * (len(bin_seconds) + 1)
+            bin_sizes = [0] * (len(bin_seconds) + 1)
+            for index in range(first_index, end_index):
+                bin_index = bisect.bisect_right(
+                    bin_seconds, now - self._last_modified[index]
+                )
+                bin_counts[bin_index] += 1
+                bin_sizes[bin_index] += self._sizes[index]
+
+        bin_edges = [0] + list(bin_days) + [None]
+        return [
+            {
+                "min_age_days": bin_edges[bin_index],
+                "max_age_days": bin_edges[bin_index + 1],
+                "object_count": int(bin_counts[bin_index]),
+                "total_size": int(bin_sizes[bin_index]),
+            }
+            for bin_index in range(len(bin_counts))
+        ]
+
+    def get_largest_objects(self, num_objects=10, prefix=""):
+        """
+        Purpose:
+            Get the largest objects under a prefix, with ties in name order
+        Args:
+            num_objects (Int): Number of objects to get (Defaults to 10)
+            prefix (String): Prefix of the objects (Defaults to every object)
+        Returns:
+            largest_objects (List of Dicts): Object (see get_object) of each of
+                the largest objects, largest first
+        """
+
+        first_index, end_index = self._get_prefix_range(prefix.encode("utf-8"))
+        num_objects = min(num_objects, end_index - first_index)
+        if num_objects <= 0:
+            return []
+
+        if self.use_numpy:
+            sizes = self._get_numpy_columns()["sizes"][first_index:end_index]
+            indexes = numpy.argpartition(sizes, len(sizes) - num_objects)
+            indexes = indexes[len(sizes) - num_objects:]
+            indexes = indexes[numpy.lexsort((indexes, -sizes[indexes]))]
+            largest_indexes = (indexes + first_index).tolist()
+        else:
+            largest_indexes = heapq.nlargest(
+                num_objects, range(first_index, end_index),
+                key=self._sizes.__getitem__,
+            )
+
+        return [self.get_object(index) for index in largest_indexes]
+
+    ###
+    # Snapshot Methods
+    ###
+
+    def save(self, filename):
+        """
+        Purpose:
+            Save the inventory to a binary snapshot. The columns are written as
+            little endian arrays after a header, and the snapshot is written
+            and synced to a temp file and moved into place so it's never left
+            partial
+        Args:
+            filename (String): Location (And Path) of the snapshot
+        Returns:
+            N/A
+        """
+        logging.info(f"Saving Inventory of {len(self)} Objects to {filename}")
+
+        other_etags = json.dumps(
+            {str(index): etag for index, etag in self._other_etags.items()}
+        ).encode("utf-8")
+
+        with open(f"{filename}.tmp", "wb") as snapshot_file:
+            snapshot_file.write(
+                _SNAPSHOT_HEADER.pack(
+                    INVENTORY_SNAPSHOT_MAGIC, INVENTORY_SNAPSHOT_VERSION, len(self),
+                    len(self._names), len(other_etags),
+                )
+            )
+            snapshot_file.write(self._names)
+            snapshot_file.write(self._etag_digests)
+            for column in self._get_int_columns():
+                snapshot_file.write(_to_little_endian(column).tobytes())
+            snapshot_file.write(other_etags)
+            snapshot_file.flush()
+            os.fsync(snapshot_file.fileno())
+
+        os.replace(f"{filename}.tmp", filename)
+
+    ###
+    # Private Methods
+    ###
+
+    def _get_name_bytes(self, index):
+        """
+        Purpose:
+            Get the UTF-8 name of the object at an index
+        Args:
+            index (Int): Index of the object
+        Returns:
+            name_bytes (Bytes): UTF-8 name of the object
+        """
+
+        return bytes(
+            self._names[self._name_offsets[index]:self._name_offsets[index + 1]]
+        )
+
+    def _get_etag(self, index):
+        """
+        Purpose:
+            Rebuild the ETag of the object at an index
+        Args:
+            index (Int): Index of the object
+        Returns:
+            etag (String): ETag of the object
+        """
+
+        etag_parts = self._etag_parts[index]
+        if etag_parts == _ETAG_NOT_MD5:
+            return self._other_etags[index]
+
+        etag = self._etag_digests[index * 16:(index + 1) * 16].hex()
+        return f"{etag}-{etag_parts}" if etag_parts else etag
+
+    def _get_prefix_range(self, prefix_bytes, first_index=0, end_index=None):
+        """
+        Purpose:
+            Binary search the sorted names for the objects under a prefix
+        Args:
+            prefix_bytes (Bytes): UTF-8 prefix of the objects
+            first_index (Int): Index to search from (Defaults to 0)
+            end_index (Int): Index to search to (Defaults to the end)
+        Returns:
+            prefix_range (Tuple): (first_index, end_index) of the objects under
+                the prefix
+        """
+
+        end_index = len(self) if end_index is None else end_index
+        first_index = self._bisect_names(prefix_bytes, first_index, end_index)
+
+        # The first name after every name starting with the prefix
+        prefix_end_bytes = prefix_bytes.rstrip(b"\xff")
+        if not prefix_end_bytes:
+            return first_index, end_index
+        prefix_end_bytes = prefix_end_bytes[:-1] + bytes([prefix_end_bytes[-1] + 1])
+
+        return first_index, self._bisect_names(prefix_end_bytes, first_index, end_index)
+
+    def _bisect_names(self, name_bytes, first_index, end_index):
+        """
+        Purpose:
+            Find the first index in a range whose name doesn't sort before a name
+        Args:
+            name_bytes (Bytes): UTF-8 name to search for
+            first_index (Int): Index to search from
+            end_index (Int): Index to search to
+        Returns:
+            index (Int): First index whose name is >= name_bytes
+        """
+
+        while first_index < end_index:
+            middle_index = (first_index + end_index) // 2
+            if self._get_name_bytes(middle_index) < name_bytes:
+                first_index = middle_index + 1
+            else:
+                end_index = middle_index
+
+        return first_index
+
+    def _sum_sizes(self, first_index, end_index):
+        """
+        Purpose:
+            Sum the sizes of a range of objects
+        Args:
+            first_index (Int): First index of the range
+            end_index (Int): Index after the range
+        Returns:
+            total_size (Int): Total size of the objects
+        """
+
+        if self.use_numpy:
+            return int(self._get_numpy_columns()["sizes"][first_index:end_index].sum())
+
+        return sum(self._sizes[first_index:end_index])
+
+    def _get_numpy_columns(self):
+        """
+        Purpose:
+            Get NumPy views of the size and modification time columns, which
+            share memory with the columns rather than copying them
+        Args:
+            N/A
+        Returns:
+            numpy_columns (Dict): NumPy arrays of sizes and last_modified
+        """
+
+        if self._numpy_columns is None:
+            self._numpy_columns = {
+                "sizes": numpy.frombuffer(self._sizes, dtype=numpy.int64),
+                "last_modified": numpy.frombuffer(
+                    self._last_modified, dtype=numpy.int64
+                ),
+            }
+
+        return self._numpy_columns
+
+    def _get_int_columns(self):
+        """
+        Purpose:
+            Get the integer columns in the order they are snapshotted
+        Args:
+            N/A
+        Returns:
+            int_columns (List of arrays): Name offsets, sizes, last modified,
+                and ETag part columns
+        """
+
+        return [
+            self._name_offsets, self._sizes, self._last_modified, self._etag_parts
+        ]
+
+
+###
+# Inventory Helpers
+###
+
+
+def build_bucket_inventory(
+    minio_client, bucket_name, prefix=None, use_numpy=None, retry_policy=None
+):
+    """
+    Purpose:
+        Build an inventory of the objects in a bucket from a recursive listing.
+        Objects are added to the columns as the listing is streamed, so only
+        one page of minio Objects is held at a time
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket to inventory
+        prefix (String): Only inventory objects under this prefix (Defaults to
+            every object)
+        use_numpy (Boolean): Run queries on NumPy views of the columns
+            (Defaults to True if NumPy is installed)
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry the
+            listing under (Defaults to no retries)
+    Returns:
+        bucket_inventory (BucketInventory): Inventory of the objects
+    """
+    logging.info(f"Building Inventory of {bucket_name}")
+
+    bucket_inventory = BucketInventory(use_numpy=use_numpy)
+    bucket_inventory.add_objects(
+        iter_objects(
+            minio_client, bucket_name, prefix=prefix, recursive=True,
+            retry_policy=retry_policy,
+        )
+    )
+
+    logging.info(
+        f"Built Inventory of {len(bucket_inventory)} Objects in {bucket_name} "
+        f"({bucket_inventory.get_memory_size()} Bytes)"
+    )
+
+    return bucket_inventory
+
+
+def load_bucket_inventory(filename, use_numpy=None):
+    """
+    Purpose:
+        Load an inventory from a snapshot saved by BucketInventory.save
+    Args:
+        filename (String): Location (And Path) of the snapshot
+        use_numpy (Boolean): Run queries on NumPy views of the columns
+            (Defaults to True if NumPy is installed)
+    Returns:
+        bucket_inventory (BucketInventory): Inventory of the objects
+    """
+    logging.info(f"Loading Inventory from {filename}")
+
+    bucket_inventory = BucketInventory(use_numpy=use_numpy)
+    with open(filename, "rb") as snapshot_file:
+        magic, version, num_objects, names_length, other_etags_length =\
+            _SNAPSHOT_HEADER.unpack(snapshot_file.read(_SNAPSHOT_HEADER.size))
+        if magic != INVENTORY_SNAPSHOT_MAGIC or\
+                version != INVENTORY_SNAPSHOT_VERSION:
+            raise ValueError(f"{filename} is Not an Inventory Snapshot")
+
+        def read_snapshot(length):
+            snapshot_data = snapshot_file.read(length)
+            if len(snapshot_data) != length:
+                raise ValueError(f"Inventory Snapshot {filename} is Truncated")
+            return snapshot_data
+
+        bucket_inventory._names = bytearray(read_snapshot(names_length))
+        bucket_inventory._etag_digests = bytearray(read_snapshot(16 * num_objects))
+        for column in bucket_inventory._get_int_columns():
+            del column[:]
+            column_length = num_objects + 1 if column is\
+                bucket_inventory._name_offsets else num_objects
+            column.frombytes(read_snapshot(column_length * column.itemsize))
+            if sys.byteorder == "big":
+                column.byteswap()
+
+        bucket_inventory._other_etags = {
+            int(index): etag for index, etag in
+            json.loads(read_snapshot(other_etags_length)).items()
+        }
+
+    return bucket_inventory
+
+
+def _to_little_endian(column):
+    """
+    Purpose:
+        Get a column in little endian byte order
+    Args:
+        column (array): Column to convert
+    Returns:
+        column (array): The column, or a byteswapped copy on big endian hosts
+    """
+
+    if sys.byteorder == "big":
+        column = array.array(column.typecode, column)
+        column.byteswap()
+
+    return column
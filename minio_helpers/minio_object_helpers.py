@@ -7,15 +7,53 @@
 """
 
 # Python Library Imports
+import calendar
+import collections
+import contextvars
+import datetime
+import functools
+import hashlib
+import itertools
 import logging
+import os
+import shutil
 import simplejson as json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from time import strftime
 from minio import Minio
-from minio.error import ResponseError, NoSuchKey
+from minio.definitions import Object, UploadPart
+from minio.error import MultiDeleteError, ResponseError, NoSuchKey, NoSuchUpload
+from minio.helpers import MAX_MULTIPART_COUNT, MIN_PART_SIZE, amzprefix_user_metadata, \
+    is_amz_header, is_supported_header
 
 # Local Library Imports
+from minio_helpers.minio_decoder_helpers import decode_object_stream, get_decoder, \
+    get_record_iterator
+from minio_helpers.minio_general_helpers import ByteBudget, iter_batches, \
+    iter_pool_results
 from minio_helpers.minio_exceptions import ObjectAlreadyExists, ObjectDoesntExist, \
-    ObjectDecodingNotSupported
+    ObjectDecodingNotSupported, ObjectDownloadIncomplete, ObjectChangedDuringDownload, \
+    ObjectUploadIncomplete
+from minio_helpers.minio_instrumentation_helpers import add_bytes_transferred, \
+    add_response_stats, instrumented
+from minio_helpers.minio_retry_helpers import call_with_retry_policy
+
+
+###
+# Constants
+###
+
+
+OBJECT_EXISTS_STRATEGIES = ("stat", "prefix", "list")
+DEFAULT_RANGE_PART_SIZE = 16 * 1024 * 1024
+DEFAULT_UPLOAD_PART_SIZE = 16 * 1024 * 1024
+UPLOAD_COMPARE_STRATEGIES = ("size_mtime", "hash")
+MAX_DELETE_BATCH_SIZE = 1000
+RANGE_STATE_SAVE_INTERVAL = 16
+
+_SEEK_WRITE_LOCK = threading.Lock()
 
 
 ###
@@ -23,73 +61,481 @@ from minio_helpers.minio_exceptions import ObjectAlreadyExists, ObjectDoesntExis
 ###
 
 
-def get_objects(minio_client, bucket_name):
+@instrumented
+def iter_objects(
+    minio_client, bucket_name, prefix=None, recursive=False, start_after=None,
+    max_keys=None, retry_policy=None
+):
     """
     Purpose:
-        Get a list of objects that exist in the Minio Client
+        Lazily iterate over objects that exist in the Minio Client. Objects are
+        yielded page by page as the server returns them instead of being held in
+        memory until the listing completes. Under a retry policy, a listing that
+        fails part way through resumes after the last object yielded, and the
+        first page of the listing may be hedged
     Args:
         minio_client (minio client Obj): Client obj connection to Minio
         bucket_name (String): Name of the bucket to get objects for
-    Returns:
-        objects (List of Object Objs): List of Object OBJs in Minio
+        prefix (String): Only yield objects whose name starts with prefix
+        recursive (Boolean): List recursively instead of emulating directories
+        start_after (String): Only yield objects whose name sorts after start_after
+        max_keys (Int): Stop after yielding this many objects (Defaults to all)
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry (and
+            hedge) the listing under (Defaults to no retries)
+    Yields:
+        minio_object (Object Obj): Object OBJ in Minio
     """
 
-    objects = []
+    if max_keys is not None and max_keys <= 0:
+        return
+
+    retry_state = None
+    if retry_policy is not None:
+        retry_state = retry_policy.start_operation("list_objects")
 
     try:
-        objects = list(minio_client.list_objects(bucket_name))
+        listed_keys = 0
+        last_object_name = start_after
+        resumed_after = None
+        while True:
+            listed_objects, _ = call_with_retry_policy(
+                retry_policy,
+                "list_objects",
+                functools.partial(
+                    _start_listing, minio_client, bucket_name, prefix, recursive,
+                    last_object_name,
+                ),
+                hedged=True,
+                discard_result=lambda started_listing: started_listing[1].close(),
+            )
+            try:
+                for minio_object in listed_objects:
+                    # A resumed listing repeats the common prefix it stopped in
+                    if resumed_after is not None and\
+                            minio_object.object_name == resumed_after:
+                        continue
+
+                    yield minio_object
+                    last_object_name = minio_object.object_name
+
+                    listed_keys += 1
+                    if max_keys is not None and listed_keys >= max_keys:
+                        return
+                return
+            except Exception as err:
+                if retry_state is None:
+                    raise err
+                retry_state.retry_or_raise(err)
+                resumed_after = last_object_name
     except ResponseError as con_err:
         logging.error(f"Error Connecting to Minio: {con_err}")
-        raise err
+        raise con_err
     except Exception as err:
         logging.error(f"Error Listing Objects: {err}")
         raise err
 
-    return objects
 
+def _start_listing(minio_client, bucket_name, prefix, recursive, start_after):
+    """
+    Purpose:
+        Start a listing and wait for its first page, so the request for it can be
+        retried or hedged like any other read
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket to list
+        prefix (String): Only list objects whose name starts with prefix
+        recursive (Boolean): List recursively instead of emulating directories
+        start_after (String): Only list objects whose name sorts after start_after
+    Returns:
+        started_listing (Tuple): (Iterator of every listed object, the listing
+            generator to close if the listing is abandoned)
+    """
+
+    listing = iter(
+        minio_client.list_objects_v2(
+            bucket_name, prefix=prefix, recursive=recursive, start_after=start_after
+        )
+    )
+    first_objects = list(itertools.islice(listing, 1))
+
+    return itertools.chain(first_objects, listing), listing
+
+
+@instrumented
+def iter_object_names(
+    minio_client, bucket_name, prefix=None, recursive=False, start_after=None,
+    max_keys=None, retry_policy=None
+):
+    """
+    Purpose:
+        Lazily iterate over names of objects that exist in the Minio Client
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket to get objects for
+        prefix (String): Only yield objects whose name starts with prefix
+        recursive (Boolean): List recursively instead of emulating directories
+        start_after (String): Only yield objects whose name sorts after start_after
+        max_keys (Int): Stop after yielding this many objects (Defaults to all)
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry (and
+            hedge) the listing under (Defaults to no retries)
+    Yields:
+        object_name (String): Name of Object in Minio
+    """
+
+    for minio_object in iter_objects(
+        minio_client,
+        bucket_name,
+        prefix=prefix,
+        recursive=recursive,
+        start_after=start_after,
+        max_keys=max_keys,
+        retry_policy=retry_policy,
+    ):
+        yield minio_object.object_name
 
-def get_object_names(minio_client, bucket_name):
+
+@instrumented
+def get_objects(
+    minio_client, bucket_name, prefix=None, recursive=False, start_after=None,
+    max_keys=None, retry_policy=None
+):
     """
     Purpose:
         Get a list of objects that exist in the Minio Client
     Args:
         minio_client (minio client Obj): Client obj connection to Minio
         bucket_name (String): Name of the bucket to get objects for
+        prefix (String): Only get objects whose name starts with prefix
+        recursive (Boolean): List recursively instead of emulating directories
+        start_after (String): Only get objects whose name sorts after start_after
+        max_keys (Int): Get at most this many objects (Defaults to all)
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry (and
+            hedge) the listing under (Defaults to no retries)
+    Returns:
+        objects (List of Object Objs): List of Object OBJs in Minio
+    """
+
+    return list(
+        iter_objects(
+            minio_client,
+            bucket_name,
+            prefix=prefix,
+            recursive=recursive,
+            start_after=start_after,
+            max_keys=max_keys,
+            retry_policy=retry_policy,
+        )
+    )
+
+
+@instrumented
+def get_object_names(
+    minio_client, bucket_name, prefix=None, recursive=False, start_after=None,
+    max_keys=None, retry_policy=None
+):
+    """
+    Purpose:
+        Get a list of objects that exist in the Minio Client
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket to get objects for
+        prefix (String): Only get objects whose name starts with prefix
+        recursive (Boolean): List recursively instead of emulating directories
+        start_after (String): Only get objects whose name sorts after start_after
+        max_keys (Int): Get at most this many objects (Defaults to all)
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry (and
+            hedge) the listing under (Defaults to no retries)
     Returns:
         object_names (List of Strings): List of Objects in Minio
     """
 
-    object_names = []
+    return list(
+        iter_object_names(
+            minio_client,
+            bucket_name,
+            prefix=prefix,
+            recursive=recursive,
+            start_after=start_after,
+            max_keys=max_keys,
+            retry_policy=retry_policy,
+        )
+    )
+
 
+@instrumented
+def get_listing_shards(
+    minio_client, bucket_name, prefix=None, shard_depth=1, retry_policy=None
+):
+    """
+    Purpose:
+        Split a bucket listing into shards using the "/" delimiter. Each level of
+        shard_depth replaces every common prefix with the entries one level below
+        it, so the shards stay in lexicographic order
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket to shard
+        prefix (String): Only shard objects whose name starts with prefix
+        shard_depth (Int): Number of delimiter levels to expand (Defaults to 1)
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry (and
+            hedge) the listings under (Defaults to no retries)
+    Returns:
+        shards (List of Object Objs): Sorted Object OBJs in Minio, where entries
+            with is_dir set are prefixes that still need a recursive listing
+    """
+
+    shards = get_objects(
+        minio_client, bucket_name, prefix=prefix, retry_policy=retry_policy
+    )
+
+    for _ in range(shard_depth - 1):
+        expanded_shards = []
+        for shard in shards:
+            if shard.is_dir:
+                expanded_shards.extend(
+                    get_objects(
+                        minio_client, bucket_name, prefix=shard.object_name,
+                        retry_policy=retry_policy,
+                    )
+                )
+            else:
+                expanded_shards.append(shard)
+
+        if len(expanded_shards) == len(shards):
+            break
+        shards = expanded_shards
+
+    return shards
+
+
+@instrumented
+def iter_objects_parallel(
+    minio_client, bucket_name, prefix=None, max_workers=8, ordered=True,
+    shard_depth=1, retry_policy=None
+):
+    """
+    Purpose:
+        Recursively iterate over objects that exist in the Minio Client, listing
+        the delimiter-based shards of the bucket at the same time on a bounded
+        thread pool. At most max_workers * 2 shards are listed ahead of the caller
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket to get objects for
+        prefix (String): Only yield objects whose name starts with prefix
+        max_workers (Int): Number of shards listed at the same time (Defaults to 8)
+        ordered (Boolean): Yield objects in lexicographic order (True) or in the
+            order shards finish listing (False) (Defaults to True)
+        shard_depth (Int): Number of delimiter levels to shard on (Defaults to 1)
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry (and
+            hedge) the listings under (Defaults to no retries)
+    Yields:
+        minio_object (Object Obj): Object OBJ in Minio
+    """
+
+    shards = get_listing_shards(
+        minio_client, bucket_name, prefix=prefix, shard_depth=shard_depth,
+        retry_policy=retry_policy,
+    )
+    shard_prefixes = []
+    for shard in shards:
+        if shard.is_dir:
+            shard_prefixes.append(shard.object_name)
+        elif not ordered:
+            yield shard
+
+    max_pending = max(max_workers, 1) * 2
+    pending_futures = collections.deque()
+    shard_prefixes = iter(shard_prefixes)
+
+    def submit_shards(executor):
+        for shard_prefix in itertools.islice(
+            shard_prefixes, max_pending - len(pending_futures)
+        ):
+            pending_futures.append(
+                executor.submit(
+                    contextvars.copy_context().run,
+                    get_objects,
+                    minio_client,
+                    bucket_name,
+                    prefix=shard_prefix,
+                    recursive=True,
+                    retry_policy=retry_policy,
+                )
+            )
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
     try:
-        object_names =\
-            [object.object_name for object in minio_client.list_objects(bucket_name)]
+        submit_shards(executor)
+
+        if ordered:
+            for shard in shards:
+                if not shard.is_dir:
+                    yield shard
+                    continue
+
+                shard_objects = pending_futures.popleft().result()
+                submit_shards(executor)
+                yield from shard_objects
+        else:
+            while pending_futures:
+                done_futures, _ = wait(pending_futures, return_when=FIRST_COMPLETED)
+                for future in done_futures:
+                    pending_futures.remove(future)
+                submit_shards(executor)
+
+                for future in done_futures:
+                    yield from future.result()
+    finally:
+        for future in pending_futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+@instrumented
+def get_objects_parallel(
+    minio_client, bucket_name, prefix=None, max_workers=8, ordered=True,
+    shard_depth=1, retry_policy=None
+):
+    """
+    Purpose:
+        Recursively get a list of objects that exist in the Minio Client, listing
+        the delimiter-based shards of the bucket at the same time
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket to get objects for
+        prefix (String): Only get objects whose name starts with prefix
+        max_workers (Int): Number of shards listed at the same time (Defaults to 8)
+        ordered (Boolean): Return objects in lexicographic order (True) or in the
+            order shards finish listing (False) (Defaults to True)
+        shard_depth (Int): Number of delimiter levels to shard on (Defaults to 1)
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry (and
+            hedge) the listings under (Defaults to no retries)
+    Returns:
+        objects (List of Object Objs): List of Object OBJs in Minio
+    """
+
+    return list(
+        iter_objects_parallel(
+            minio_client,
+            bucket_name,
+            prefix=prefix,
+            max_workers=max_workers,
+            ordered=ordered,
+            shard_depth=shard_depth,
+            retry_policy=retry_policy,
+        )
+    )
+
+
+@instrumented
+def is_object_in_bucket(
+    minio_client, bucket_name, object_name, strategy="stat", retry_policy=None
+):
+    """
+    Purpose:
+        Check if Object exists in Bucket. The "stat" strategy issues a single
+        HEAD request, the "prefix" strategy issues a single listing request bounded
+        by the object name, and the "list" strategy lists the whole bucket
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket to check for object
+        object_name (String): Name of object to check for in Minio
+        strategy (String): How to check for the object. One of "stat", "prefix",
+            or "list" (Defaults to "stat")
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry (and
+            hedge) the requests under (Defaults to no retries)
+    Returns:
+        object_exists (Boolean): Boolean if the object exists or not
+    """
+
+    if strategy not in OBJECT_EXISTS_STRATEGIES:
+        raise ValueError(
+            f"Strategy {strategy} not in {', '.join(OBJECT_EXISTS_STRATEGIES)}"
+        )
+
+    if strategy == "list":
+        return object_name in get_object_names(
+            minio_client, bucket_name, retry_policy=retry_policy
+        )
+
+    try:
+        if strategy == "stat":
+            call_with_retry_policy(
+                retry_policy,
+                "stat_object",
+                functools.partial(minio_client.stat_object, bucket_name, object_name),
+                hedged=True,
+            )
+            return True
+
+        # The object itself sorts first among every key that starts with its name
+        for listed_name in iter_object_names(
+            minio_client, bucket_name, prefix=object_name, recursive=True, max_keys=1,
+            retry_policy=retry_policy,
+        ):
+            return listed_name == object_name
+    except NoSuchKey:
+        return False
     except ResponseError as con_err:
         logging.error(f"Error Connecting to Minio: {con_err}")
-        raise err
+        raise con_err
     except Exception as err:
-        logging.error(f"Error Listing Objects: {err}")
+        logging.error(f"Error Checking for Object {object_name}: {err}")
         raise err
 
-    return object_names
+    return False
 
 
-def is_object_in_bucket(minio_client, bucket_name, object_name):
+@instrumented
+def are_objects_in_bucket(minio_client, bucket_name, object_names, retry_policy=None):
     """
     Purpose:
-        Check if Object exists in Bucket
+        Check if many Objects exist in Bucket with a single sorted listing pass.
+        The listing is bounded by the common prefix of the names and stops once it
+        passes the last name being checked
     Args:
         minio_client (minio client Obj): Client obj connection to Minio
-        bucket_name (String): Name of the bucket to check for object
-        object_name (String): Name of object to check for in Minio
+        bucket_name (String): Name of the bucket to check for objects
+        object_names (List of Strings): Names of objects to check for in Minio
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry (and
+            hedge) the listing under (Defaults to no retries)
     Returns:
-        object_exists (Boolean): Boolean if the object exists or not
+        objects_exist (Dict): Dict of object name to Boolean if the object exists
     """
 
-    return True if object_name in get_object_names(minio_client, bucket_name) else False
+    objects_exist = {object_name: False for object_name in object_names}
+    if not objects_exist:
+        return objects_exist
+
+    sorted_names = sorted(objects_exist)
+    common_prefix = os.path.commonprefix(sorted_names)
 
+    try:
+        name_idx = 0
+        for listed_name in iter_object_names(
+            minio_client, bucket_name, prefix=common_prefix, recursive=True,
+            retry_policy=retry_policy,
+        ):
+            while name_idx < len(sorted_names) and sorted_names[name_idx] < listed_name:
+                name_idx += 1
+            if name_idx >= len(sorted_names):
+                break
+            if sorted_names[name_idx] == listed_name:
+                objects_exist[listed_name] = True
+                name_idx += 1
+    except ResponseError as con_err:
+        logging.error(f"Error Connecting to Minio: {con_err}")
+        raise con_err
+    except Exception as err:
+        logging.error(f"Error Checking for Objects in {bucket_name}: {err}")
+        raise err
 
-def get_object_stats(minio_client, bucket_name, object_name):
+    return objects_exist
+
+
+@instrumented
+def get_object_stats(
+    minio_client, bucket_name, object_name, stat_cache=None, retry_policy=None
+):
     """
     Purpose:
         Get Stats of the Object
@@ -97,6 +543,11 @@ def get_object_stats(minio_client, bucket_name, object_name):
         minio_client (minio client Obj): Client obj connection to Minio
         bucket_name (String): Name of the bucket to check for object
         object_name (String): Name of object to get stats for in Minio
+        stat_cache (StatCache): Cache (from minio_cache_helpers) to get the stats
+            from instead of stat'ing the object every call
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry the stat
+            under. Stats are only hedged without a stat_cache (Defaults to no
+            retries)
     Returns:
         object_stats (Dict):Dict of stats about the object
     """
@@ -104,24 +555,25 @@ def get_object_stats(minio_client, bucket_name, object_name):
     object_stats = {}
 
     try:
-        object_stats_obj = minio_client.stat_object(bucket_name, object_name)
-        object_stats = {
-            "bucket_name": object_stats_obj.bucket_name,
-            "content_type": object_stats_obj.content_type,
-            "etag": object_stats_obj.etag,
-            "is_dir": object_stats_obj.is_dir,
-            "last_modified_obj": object_stats_obj.last_modified,
-            "last_modified_readable":
-                strftime("%a, %d %b %Y %H:%M:%S", object_stats_obj.last_modified),
-            "last_modified_int":
-                int(strftime("%Y%m%d%H%M%S", object_stats_obj.last_modified)),
-            "object_name": object_stats_obj.object_name,
-            "metadata": object_stats_obj.metadata,
-            "size": object_stats_obj.size,
-        }
+        if stat_cache is not None:
+            object_stats_obj = call_with_retry_policy(
+                retry_policy,
+                "stat_object",
+                functools.partial(
+                    stat_cache.stat_object, minio_client, bucket_name, object_name
+                ),
+            )
+        else:
+            object_stats_obj = call_with_retry_policy(
+                retry_policy,
+                "stat_object",
+                functools.partial(minio_client.stat_object, bucket_name, object_name),
+                hedged=True,
+            )
+        object_stats = format_object_stats(object_stats_obj)
     except ResponseError as con_err:
         logging.error(f"Error Connecting to Minio: {con_err}")
-        raise err
+        raise con_err
     except Exception as err:
         logging.error(f"Error Listing Objects: {err}")
         raise err
@@ -129,43 +581,163 @@ def get_object_stats(minio_client, bucket_name, object_name):
     return object_stats
 
 
+def format_object_stats(object_stats_obj):
+    """
+    Purpose:
+        Format the stats returned by stat_object as a Dict
+    Args:
+        object_stats_obj (minio Object): Stats returned by stat_object
+    Returns:
+        object_stats (Dict):Dict of stats about the object
+    """
+
+    return {
+        "bucket_name": object_stats_obj.bucket_name,
+        "content_type": object_stats_obj.content_type,
+        "etag": object_stats_obj.etag,
+        "is_dir": object_stats_obj.is_dir,
+        "last_modified_obj": object_stats_obj.last_modified,
+        "last_modified_readable":
+            strftime("%a, %d %b %Y %H:%M:%S", object_stats_obj.last_modified),
+        "last_modified_int":
+            int(strftime("%Y%m%d%H%M%S", object_stats_obj.last_modified)),
+        "object_name": object_stats_obj.object_name,
+        "metadata": object_stats_obj.metadata,
+        "size": object_stats_obj.size,
+    }
+
+
+def get_object_from_headers(bucket_name, object_name, headers):
+    """
+    Purpose:
+        Build a minio Object from the headers of a HEAD/GET response, the same way
+        the minio lib's stat_object does
+    Args:
+        bucket_name (String): Name of the bucket
+        object_name (String): Name of the object
+        headers (Dict): Response headers
+    Returns:
+        object_stats_obj (minio Object): Stats of the object
+    """
+
+    last_modified = headers.get("last-modified")
+    if last_modified:
+        last_modified = time.strptime(last_modified, "%a, %d %b %Y %H:%M:%S GMT")
+
+    return Object(
+        bucket_name,
+        object_name,
+        last_modified=last_modified,
+        etag=headers.get("etag", "").replace('"', ""),
+        size=int(headers.get("content-length", "0")),
+        content_type=headers.get("content-type"),
+        metadata={
+            header_name: header_value for header_name, header_value in headers.items()
+            if is_supported_header(header_name) or is_amz_header(header_name)
+        },
+    )
+
+
 ###
 # Object Manipulation Helpers
 ###
 
 
-def download_object_to_memory(minio_client, bucket_name, object_name, encoding="utf-8"):
+@instrumented
+def download_object_to_memory(
+    minio_client, bucket_name, object_name, encoding="utf-8", content_cache=None,
+    object_cache=None, retry_policy=None
+):
     """
     Purpose:
-        Download an Object from Mino into memory (if supported)
+        Download an Object from Mino into memory (if supported). The object is
+        decoded from the response stream by the decoder registered for its
+        extension (or, failing that, its content type) in minio_decoder_helpers,
+        and the connection is released as soon as the decoder returns. With a
+        content cache, unchanged objects are decoded from a memory-mapped local
+        copy instead. With an object cache, recently parsed objects are returned
+        from memory without going to Minio at all
     Args:
         minio_client (minio client Obj): Client obj connection to Minio
         bucket_name (String): Name of the bucket to get object from
-        filename (String): Location (And Path) of file to upload
-        object_name (String): Name of object to upload in Minio
+        object_name (String): Name of object to download from Minio
+        encoding (String): Encoding of text objects (Defaults to utf-8)
+        content_cache (minio_cache_helpers.ContentCache): Local cache of object
+            contents to read from (Defaults to no cache)
+        object_cache (minio_cache_helpers.ObjectCache): In-memory cache of parsed
+            objects to read from (Defaults to no cache). Cached objects are
+            returned as read-only views or copies, as the cache is configured
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry (and
+            hedge) the download under (Defaults to no retries)
     Returns:
         parsed_object (Obj, depending on extension): Object parsed from Minio from the
-            extension of the file. Current supported = .txt -> str, .json -> Dict/JSON
+            extension of the file. Built-in support = .txt -> str, .json -> Dict/JSON,
+            .ndjson/.jsonl -> List, .csv -> List of Dicts, .avro -> List of Dicts
+            (with fastavro), .parquet -> pyarrow.Table (with pyarrow), optionally
+            compressed as .gz or .zst (with zstandard)
     """
+    if object_cache is not None:
+        return object_cache.get_object(
+            bucket_name,
+            object_name,
+            lambda: download_object_to_memory(
+                minio_client,
+                bucket_name,
+                object_name,
+                encoding=encoding,
+                content_cache=content_cache,
+                retry_policy=retry_policy,
+            ),
+            encoding=encoding,
+        )
+
     logging.info(f"Downloading Object {bucket_name}/{object_name} into Memory")
 
     parsed_object = None
 
+    # Objects without a known extension may still be decodable by content type
+    decoder, _ = get_decoder(object_name)
+
     try:
-        minio_object = minio_client.get_object(bucket_name, object_name)
-
-        file_extension = object_name.split(".")[-1]
-        if file_extension == "txt":
-            decoded_object = minio_object.read().decode("utf-8")
-            parsed_object = decoded_object
-        elif file_extension == "json":
-            decoded_object = minio_object.read().decode("utf-8")
-            parsed_object = json.loads(decoded_object)
-        else:
-            error_msg =\
-                f"File Extension {file_extension} Does Not Support Download into Memory"
-            logging.error(error_msg)
-            raise ObjectDecodingNotSupported(error_msg)
+        if content_cache is not None:
+
+            def decode_cached_file(cached_file, content_type):
+                with content_cache.open_object_file(cached_file) as object_stream:
+                    return decode_object_stream(
+                        object_name,
+                        object_stream,
+                        content_type=None if decoder else content_type,
+                        encoding=encoding,
+                    )
+
+            return call_with_retry_policy(
+                retry_policy,
+                "get_object_file",
+                functools.partial(
+                    content_cache.read_object_file, minio_client, bucket_name,
+                    object_name, decode_cached_file,
+                ),
+            )
+
+        minio_object = call_with_retry_policy(
+            retry_policy,
+            "get_object",
+            functools.partial(minio_client.get_object, bucket_name, object_name),
+            hedged=True,
+            discard_result=_release_response,
+        )
+        add_response_stats(minio_object)
+        try:
+            parsed_object = decode_object_stream(
+                object_name,
+                minio_object,
+                content_type=None if decoder else minio_object.headers.get(
+                    "content-type"
+                ),
+                encoding=encoding,
+            )
+        finally:
+            _release_response(minio_object)
     except ResponseError as con_err:
         logging.error(f"Error Connecting to Minio: {con_err}")
         raise con_err
@@ -179,15 +751,114 @@ def download_object_to_memory(minio_client, bucket_name, object_name, encoding="
     return parsed_object
 
 
-def download_object_to_file(minio_client, bucket_name, object_name, filename=None):
+@instrumented
+def iter_records(
+    minio_client, bucket_name, object_name, record_format=None, compression=None,
+    batch_size=None, encoding="utf-8", retry_policy=None
+):
     """
     Purpose:
-        Download a file from Minio to local storage
+        Lazily iterate over the records of an object (such as NDJSON lines or
+        CSV rows) as the response body arrives. Only the current chunk of the
+        response is buffered, so memory stays constant however large the object
+        is. The connection is closed once the records are exhausted or the
+        iterator is closed
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket to get object from
+        object_name (String): Name of object to read records from
+        record_format (String): Record format to use instead of the object's
+            extension (such as "ndjson", "csv", "txt")
+        compression (String): Compression to use instead of the object's
+            extension (such as "gz", "zst"). Compression is still detected from
+            the object name when only record_format is set
+        batch_size (Int): Yield lists of up to batch_size records instead of
+            single records (Defaults to single records)
+        encoding (String): Encoding of text objects (Defaults to utf-8)
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry (and
+            hedge) the request for the object under (Defaults to no retries)
+    Yields:
+        record (Obj, depending on format): Parsed record, or a List of records if
+            batch_size is set
+    """
+    logging.info(f"Reading Records from {bucket_name}/{object_name}")
+
+    format_name = f"records.{record_format}" if record_format else object_name
+    record_iterator, decompressors = get_record_iterator(format_name)
+    if compression:
+        _, decompressors = get_record_iterator(f"records.{compression}")
+    elif record_format:
+        _, decompressors = get_record_iterator(object_name)
+
+    try:
+        minio_object = call_with_retry_policy(
+            retry_policy,
+            "get_object",
+            functools.partial(minio_client.get_object, bucket_name, object_name),
+            hedged=True,
+            discard_result=_release_response,
+        )
+        add_response_stats(minio_object)
+    except ResponseError as con_err:
+        logging.error(f"Error Connecting to Minio: {con_err}")
+        raise con_err
+    except NoSuchKey as no_key_err:
+        logging.error(f"Key Doesn't Exist in Minio: {no_key_err}")
+        raise no_key_err
+
+    try:
+        if not record_iterator:
+            record_iterator, _ = get_record_iterator(
+                "", content_type=minio_object.headers.get("content-type")
+            )
+        if not record_iterator:
+            raise ObjectDecodingNotSupported(
+                f"Object {object_name} Does Not Support Reading Records"
+            )
+
+        object_stream = minio_object
+        for decompressor in decompressors:
+            object_stream = decompressor(object_stream)
+
+        records = record_iterator(object_stream, encoding=encoding)
+        if batch_size:
+            records = iter_batches(records, batch_size)
+
+        for record in records:
+            yield record
+    except Exception as err:
+        logging.error(f"Error Reading Records from {object_name}: {err}")
+        raise err
+    finally:
+        _release_response(minio_object)
+
+
+@instrumented
+def download_object_to_file(
+    minio_client, bucket_name, object_name, filename=None, ranged=False,
+    part_size=DEFAULT_RANGE_PART_SIZE, max_workers=8, content_cache=None,
+    retry_policy=None
+):
+    """
+    Purpose:
+        Download a file from Minio to local storage. With a content cache,
+        unchanged objects are copied from the local cache instead
     Args:
         minio_client (minio client Obj): Client obj connection to Minio
         bucket_name (String): Name of the bucket to get object from
         filename (String): Location (And Path) of file to upload
         object_name (String): Name of object to upload in Minio
+        ranged (Boolean): Download byte ranges in parallel instead of a single
+            stream (Defaults to False)
+        part_size (Int): Size of each byte range when ranged (Defaults to 16MiB)
+        max_workers (Int): Number of ranges downloaded at once when ranged
+            (Defaults to 8)
+        content_cache (minio_cache_helpers.ContentCache): Local cache of object
+            contents to copy from (Defaults to no cache)
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry the
+            download under. A retried stream starts again from the first byte
+            (ranged downloads resume from their completed ranges) (Defaults to
+            no retries)
     Returns:
         N/A
     """
@@ -196,8 +867,47 @@ def download_object_to_file(minio_client, bucket_name, object_name, filename=Non
     if not filename:
         filename = f"./{object_name}"
 
+    if content_cache is not None:
+        if os.path.dirname(filename):
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+        try:
+            call_with_retry_policy(
+                retry_policy,
+                "get_object_file",
+                functools.partial(
+                    content_cache.read_object_file, minio_client, bucket_name,
+                    object_name,
+                    lambda cached_file, _: shutil.copyfile(cached_file, filename),
+                ),
+            )
+        except ResponseError as con_err:
+            logging.error(f"Error Connecting to Minio: {con_err}")
+            raise con_err
+        except NoSuchKey as no_key_err:
+            logging.error(f"Key Doesn't Exist in Minio: {no_key_err}")
+            raise no_key_err
+        return
+
+    if ranged:
+        return download_object_to_file_ranged(
+            minio_client,
+            bucket_name,
+            object_name,
+            filename=filename,
+            part_size=part_size,
+            max_workers=max_workers,
+            retry_policy=retry_policy,
+        )
+
     try:
-        minio_object = minio_client.fget_object(bucket_name, object_name, filename)
+        minio_object = call_with_retry_policy(
+            retry_policy,
+            "fget_object",
+            functools.partial(
+                minio_client.fget_object, bucket_name, object_name, filename
+            ),
+        )
+        add_bytes_transferred(minio_object.size)
     except ResponseError as con_err:
         logging.error(f"Error Connecting to Minio: {con_err}")
         raise con_err
@@ -209,61 +919,897 @@ def download_object_to_file(minio_client, bucket_name, object_name, filename=Non
         raise err
 
 
+@instrumented
+def download_object_to_file_ranged(
+    minio_client, bucket_name, object_name, filename=None,
+    part_size=DEFAULT_RANGE_PART_SIZE, max_workers=8, verify_etag=True,
+    retry_policy=None, checkpoint=None, checkpoint_key=None
+):
+    """
+    Purpose:
+        Download a file from Minio to local storage as parallel byte ranges. Each
+        range is written at its offset into a preallocated temporary file, and the
+        completed ranges are recorded next to it (or in a transfer checkpoint) so
+        a failed download resumes from where it stopped (as long as the object's
+        ETag has not changed)
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket to get object from
+        object_name (String): Name of object to download from Minio
+        filename (String): Location (And Path) to download the object to
+        part_size (Int): Size of each byte range (Defaults to 16MiB)
+        max_workers (Int): Number of ranges downloaded at once (Defaults to 8)
+        verify_etag (Boolean): Check the ETag once the download completes. The
+            object is re-stat'd to make sure it did not change, and single-part
+            ETags are compared against the MD5 of the file (Defaults to True)
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry each
+            range under (Defaults to no retries)
+        checkpoint (minio_transfer_helpers.TransferCheckpoint): Checkpoint to
+            record completed ranges in instead of a state file next to the
+            download (Defaults to a state file)
+        checkpoint_key (String): Key of the download in the checkpoint (Defaults
+            to bucket_name/object_name)
+    Returns:
+        N/A
+    """
+    logging.info(
+        f"Downloading Object {bucket_name}/{object_name} to {filename} in Ranges"
+    )
+
+    if part_size <= 0:
+        raise ValueError(f"Part Size {part_size} is not a Positive Number of Bytes")
+
+    if not filename:
+        filename = f"./{object_name}"
+
+    object_stats = get_object_stats(
+        minio_client, bucket_name, object_name, retry_policy=retry_policy
+    )
+    object_size = object_stats["size"]
+    object_etag = object_stats["etag"]
+
+    download_dir = os.path.dirname(filename)
+    if download_dir:
+        os.makedirs(download_dir, exist_ok=True)
+
+    part_filename = f"{filename}.{object_etag}.part.minio"
+    state_filename = f"{part_filename}.json"
+    checkpoint_key = checkpoint_key or f"{bucket_name}/{object_name}"
+    if checkpoint is not None:
+        partial_state = checkpoint.get_partial_state(
+            checkpoint_key, object_etag, part_size
+        )
+        range_state = {
+            "etag": object_etag,
+            "size": object_size,
+            "part_size": part_size,
+            "completed_parts": set(partial_state["parts"]) if partial_state else set(),
+        }
+    else:
+        range_state = load_range_download_state(
+            state_filename, object_etag, object_size, part_size
+        )
+    if not os.path.exists(part_filename):
+        range_state["completed_parts"] = set()
+    elif not range_state["completed_parts"]:
+        os.remove(part_filename)
+
+    part_fd = os.open(part_filename, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        os.ftruncate(part_fd, object_size)
+
+        def download_range_once(part_number):
+            offset = part_number * part_size
+            length = min(part_size, object_size - offset)
+
+            response = minio_client.get_partial_object(
+                bucket_name, object_name, offset=offset, length=length
+            )
+            add_response_stats(response)
+            try:
+                written = 0
+                for data in response.stream(amt=1024 * 1024):
+                    written += _write_at(part_fd, data, offset + written)
+            finally:
+                _release_response(response)
+
+            if written != length:
+                raise ObjectDownloadIncomplete(
+                    f"Range {offset}-{offset + length - 1} of {object_name} "
+                    f"returned {written} of {length} bytes"
+                )
+
+        def download_range(part_number):
+            # Ranges are rewritten at their offset, so a failed range is retried
+            # from its start
+            call_with_retry_policy(
+                retry_policy,
+                "get_partial_object",
+                functools.partial(download_range_once, part_number),
+            )
+
+        num_parts = -(-object_size // part_size)
+        remaining_parts = [
+            part_number for part_number in range(num_parts)
+            if part_number not in range_state["completed_parts"]
+        ]
+
+        range_errors = []
+        for completed_idx, (part_number, _, error) in enumerate(
+            iter_pool_results(download_range, remaining_parts, max_workers=max_workers),
+            start=1,
+        ):
+            if error:
+                logging.error(f"Error Downloading Range {part_number}: {error}")
+                range_errors.append(error)
+                continue
+
+            range_state["completed_parts"].add(part_number)
+            if checkpoint is not None:
+                checkpoint.record_part(
+                    checkpoint_key, object_etag, part_size, part_number
+                )
+            elif completed_idx % RANGE_STATE_SAVE_INTERVAL == 0:
+                save_range_download_state(state_filename, range_state)
+
+        if range_errors:
+            if checkpoint is not None:
+                checkpoint.flush()
+            else:
+                save_range_download_state(state_filename, range_state)
+            raise range_errors[0]
+    finally:
+        os.close(part_fd)
+
+    if verify_etag:
+        verify_downloaded_etag(
+            minio_client, bucket_name, object_name, part_filename, object_etag
+        )
+
+    os.replace(part_filename, filename)
+    if os.path.exists(state_filename):
+        os.remove(state_filename)
 
-def upload_object(minio_client, bucket_name, filename, object_name=None):
+
+def load_range_download_state(state_filename, etag, size, part_size):
+    """
+    Purpose:
+        Load the completed ranges of an earlier ranged download. State recorded
+        for a different ETag, size, or part size is discarded
+    Args:
+        state_filename (String): Location of the range state file
+        etag (String): ETag of the object being downloaded
+        size (Int): Size of the object being downloaded
+        part_size (Int): Size of each byte range
+    Returns:
+        range_state (Dict): Dict of etag, size, part_size, and completed_parts
+            (Set of Ints)
+    """
+
+    range_state = {
+        "etag": etag,
+        "size": size,
+        "part_size": part_size,
+        "completed_parts": set(),
+    }
+
+    try:
+        with open(state_filename) as state_file:
+            saved_state = json.load(state_file)
+    except (OSError, ValueError):
+        return range_state
+
+    if (saved_state.get("etag"), saved_state.get("size"), saved_state.get("part_size"))\
+            == (etag, size, part_size):
+        range_state["completed_parts"] = set(saved_state.get("completed_parts", []))
+        logging.info(
+            f"Resuming Download with {len(range_state['completed_parts'])} "
+            f"Completed Ranges"
+        )
+
+    return range_state
+
+
+def save_range_download_state(state_filename, range_state):
     """
     Purpose:
-        Uploading a local file to Minio
+        Atomically save the completed ranges of a ranged download
+    Args:
+        state_filename (String): Location of the range state file
+        range_state (Dict): Dict of etag, size, part_size, and completed_parts
+    Returns:
+        N/A
+    """
+
+    with open(f"{state_filename}.tmp", "w") as state_file:
+        json.dump(
+            dict(range_state, completed_parts=sorted(range_state["completed_parts"])),
+            state_file,
+        )
+    os.replace(f"{state_filename}.tmp", state_filename)
+
+
+@instrumented
+def verify_downloaded_etag(minio_client, bucket_name, object_name, filename, etag):
+    """
+    Purpose:
+        Verify a downloaded file against the ETag it was downloaded at. Multipart
+        ETags ("<md5>-<parts>") can't be recomputed without the upload part size,
+        so those are only checked against a fresh stat of the object
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket the object was downloaded from
+        object_name (String): Name of object downloaded from Minio
+        filename (String): Location of the downloaded file
+        etag (String): ETag of the object when the download started
+    Returns:
+        N/A
+    """
+
+    current_etag = get_object_stats(minio_client, bucket_name, object_name)["etag"]
+    if current_etag != etag:
+        raise ObjectChangedDuringDownload(
+            f"{object_name} changed from ETag {etag} to {current_etag} during download"
+        )
+
+    if "-" in etag:
+        return
+
+    file_md5 = hashlib.md5()
+    with open(filename, "rb") as downloaded_file:
+        for data in iter(lambda: downloaded_file.read(1024 * 1024), b""):
+            file_md5.update(data)
+
+    if file_md5.hexdigest() != etag:
+        raise ObjectChangedDuringDownload(
+            f"MD5 of {filename} ({file_md5.hexdigest()}) doesn't match ETag {etag}"
+        )
+
+
+def _write_at(file_descriptor, data, offset):
+    """
+    Purpose:
+        Write data at an offset of an open file without moving a shared file
+        position, so ranges can be written from many threads at once
+    Args:
+        file_descriptor (Int): Open file descriptor
+        data (Bytes): Data to write
+        offset (Int): Offset in the file to write the data at
+    Returns:
+        written (Int): Number of bytes written
+    """
+
+    if hasattr(os, "pwrite"):
+        written = 0
+        data = memoryview(data)
+        while written < len(data):
+            written += os.pwrite(file_descriptor, data[written:], offset + written)
+        return written
+
+    with _SEEK_WRITE_LOCK:
+        os.lseek(file_descriptor, offset, os.SEEK_SET)
+        return os.write(file_descriptor, data)
+
+
+def _release_response(response):
+    """
+    Purpose:
+        Close a streamed response and return its connection to the pool
+    Args:
+        response (urllib3 HTTPResponse): Response returned by the minio lib
+    Returns:
+        N/A
+    """
+
+    response.close()
+    response.release_conn()
+
+
+@instrumented
+def download_objects(
+    minio_client, bucket_name, objects, download_dir=".", max_workers=8,
+    max_in_flight_bytes=None, content_cache=None, retry_policy=None
+):
+    """
+    Purpose:
+        Download many objects from Minio to local storage on a thread pool. Object
+        sizes count against max_in_flight_bytes when Object OBJs are passed; plain
+        object names are only bounded by max_workers
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket to get objects from
+        objects (Iterable of Strings or Object Objs): Objects to download
+        download_dir (String): Directory to download objects into (Defaults to ".")
+        max_workers (Int): Number of objects downloaded at once (Defaults to 8)
+        max_in_flight_bytes (Int): Max bytes being downloaded at once (Defaults to
+            unbounded)
+        content_cache (minio_cache_helpers.ContentCache): Local cache of object
+            contents to copy from (Defaults to no cache)
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry each
+            download under (Defaults to no retries)
+    Returns:
+        download_results (List of Dicts): Dict per object with object_name,
+            filename, size, and error (None if the download succeeded)
+    """
+    logging.info(f"Downloading Objects from {bucket_name} to {download_dir}")
+
+    byte_budget = ByteBudget(max_in_flight_bytes)
+
+    def get_download_work_items():
+        for minio_object in objects:
+            if getattr(minio_object, "is_dir", False):
+                continue
+
+            object_name = getattr(minio_object, "object_name", minio_object)
+            object_size = getattr(minio_object, "size", 0) or 0
+            byte_budget.acquire(object_size)
+            yield (object_name, object_size)
+
+    def download_work_item(work_item):
+        object_name, object_size = work_item
+        try:
+            download_object_to_file(
+                minio_client,
+                bucket_name,
+                object_name,
+                filename=os.path.join(download_dir, object_name),
+                content_cache=content_cache,
+                retry_policy=retry_policy,
+            )
+        finally:
+            byte_budget.release(object_size)
+
+    download_results = []
+    for (object_name, object_size), _, error in iter_pool_results(
+        download_work_item, get_download_work_items(), max_workers=max_workers
+    ):
+        download_results.append(
+            {
+                "object_name": object_name,
+                "filename": os.path.join(download_dir, object_name),
+                "size": object_size,
+                "error": error,
+            }
+        )
+
+    failed_downloads = sum(1 for result in download_results if result["error"])
+    if failed_downloads:
+        logging.error(
+            f"Failed Downloading {failed_downloads}/{len(download_results)} Objects "
+            f"from {bucket_name}"
+        )
+
+    return download_results
+
+
+@instrumented
+def upload_object(
+    minio_client, bucket_name, filename, object_name=None,
+    part_size=DEFAULT_UPLOAD_PART_SIZE, max_workers=4, content_type=None,
+    metadata=None, overwrite=True, checkpoint=None, checkpoint_key=None
+):
+    """
+    Purpose:
+        Uploading a local file to Minio. Files larger than part_size are uploaded
+        as a multipart upload with max_workers parts in flight, each part read
+        from the file by the worker sending it, so memory stays capped at
+        max_workers * part_size regardless of the size of the file
     Args:
         minio_client (minio client Obj): Client obj connection to Minio
         bucket_name (String): Name of the bucket to get to upload object to
         filename (String): Location (And Path) of file to upload
         object_name (String): Name of object to upload in Minio
+        part_size (Int): Size of each multipart part, raised as needed to stay
+            within S3's 5MiB minimum and 10000 part maximum (Defaults to 16MiB)
+        max_workers (Int): Number of parts uploaded at once (Defaults to 4)
+        content_type (String): Content type of the object (Defaults to
+            application/octet-stream)
+        metadata (Dict): User metadata to store with the object
+        overwrite (Boolean): Replace the object if it already exists (Defaults to
+            True)
+        checkpoint (minio_transfer_helpers.TransferCheckpoint): Checkpoint to
+            record uploaded parts in, so a failed multipart upload is kept and
+            resumed by the next call instead of being aborted (Defaults to None)
+        checkpoint_key (String): Key of the upload in the checkpoint (Defaults
+            to bucket_name/object_name)
     Returns:
-        N/A
+        etag (String): ETag of the uploaded object
     """
     logging.info(f"Uploading Object {filename} to {bucket_name}/{object_name}")
 
     if not object_name:
-        object_name = filename.split("/")[-1]
+        object_name = os.path.basename(filename)
 
-    import pdb; pdb.set_trace()
+    if not overwrite and is_object_in_bucket(minio_client, bucket_name, object_name):
+        raise ObjectAlreadyExists(f"{object_name} Already Exists in Minio")
 
-    # try:
-    #     if not minio_client.object_exists(object_name):
-    #         minio_client.make_object(
-    #             object_name, location="us-east-1"
-    #         )
-    #     else:
-    #         raise ObjectAlreadyExists(f"{object_name} Already Exists in Minio")
-    # except ResponseError as con_err:
-    #     logging.error(f"Error Connecting to Minio: {con_err}")
-    #     raise con_err
-    # except Exception as err:
-    #     logging.error(f"Error Creating Object {object_name}: {err}")
-    #     raise err
+    object_headers = amzprefix_user_metadata(metadata or {})
+    object_headers["Content-Type"] = content_type or "application/octet-stream"
 
+    try:
+        file_size = os.path.getsize(filename)
+        part_size = max(part_size, MIN_PART_SIZE, -(-file_size // MAX_MULTIPART_COUNT))
+
+        if file_size <= part_size:
+            with open(filename, "rb") as upload_file:
+                etag, _ = minio_client.put_object(
+                    bucket_name,
+                    object_name,
+                    upload_file,
+                    file_size,
+                    content_type=object_headers.pop("Content-Type"),
+                    metadata=object_headers,
+                    part_size=part_size,
+                )
+            add_bytes_transferred(file_size)
+            return etag
 
-def delete_object(minio_client, bucket_name, object_name):
+        return _upload_file_multipart(
+            minio_client,
+            bucket_name,
+            object_name,
+            filename,
+            file_size,
+            part_size,
+            max_workers,
+            object_headers,
+            checkpoint=checkpoint,
+            checkpoint_key=checkpoint_key or f"{bucket_name}/{object_name}",
+        )
+    except ResponseError as con_err:
+        logging.error(f"Error Connecting to Minio: {con_err}")
+        raise con_err
+    except Exception as err:
+        logging.error(f"Error Creating Object {object_name}: {err}")
+        raise err
+
+
+def get_directory_prefix(prefix):
+    """
+    Purpose:
+        Get a prefix that names a directory, adding a trailing "/" to non-empty
+        prefixes without one
+    Args:
+        prefix (String): Prefix of objects (None or "" for the bucket root)
+    Returns:
+        directory_prefix (String): Prefix ending in "/", or "" for the root
+    """
+
+    if prefix and not prefix.endswith("/"):
+        return f"{prefix}/"
+
+    return prefix or ""
+
+
+def iter_directory_files(directory, prefix=""):
+    """
+    Purpose:
+        Lazily walk a local directory tree, naming each file by its path relative
+        to directory (with "/" separators) under a directory prefix
+    Args:
+        directory (String): Local directory to walk
+        prefix (String): Directory to put every object name under (Defaults to
+            the root of the bucket)
+    Yields:
+        directory_file (Tuple): (local_filename, object_name) of each file
+    """
+
+    prefix = get_directory_prefix(prefix)
+    for dir_path, _, filenames in os.walk(directory):
+        for filename in sorted(filenames):
+            local_filename = os.path.join(dir_path, filename)
+            relative_path = os.path.relpath(local_filename, directory)
+            yield (local_filename, prefix + relative_path.replace(os.sep, "/"))
+
+
+@instrumented
+def upload_directory(
+    minio_client, bucket_name, directory, prefix="", max_workers=8,
+    skip_unchanged=True, compare="size_mtime", part_size=DEFAULT_UPLOAD_PART_SIZE
+):
+    """
+    Purpose:
+        Upload a local directory tree to Minio on a thread pool. Object names are
+        the file paths relative to directory (with "/" separators) under prefix,
+        which is treated as a directory ("backups" uploads to "backups/...").
+        Unchanged files are found with a single listing of prefix instead of a
+        stat per file, and are skipped
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket to upload objects to
+        directory (String): Local directory to upload
+        prefix (String): Directory to put every object under (Defaults to the
+            root of the bucket)
+        max_workers (Int): Number of files uploaded at once (Defaults to 8)
+        skip_unchanged (Boolean): Skip files already in Minio (Defaults to True)
+        compare (String): How unchanged files are found. "size_mtime" skips files
+            with the same size that were modified before the object was uploaded,
+            "hash" skips files with the same size whose MD5 matches the object's
+            ETag (Defaults to "size_mtime")
+        part_size (Int): Multipart part size for large files (Defaults to 16MiB)
+    Returns:
+        upload_results (List of Dicts): Dict per file with filename, object_name,
+            skipped, and error (None if the upload succeeded or was skipped)
+    """
+    logging.info(f"Uploading Directory {directory} to {bucket_name}/{prefix}")
+
+    if compare not in UPLOAD_COMPARE_STRATEGIES:
+        raise ValueError(
+            f"Compare {compare} not in {', '.join(UPLOAD_COMPARE_STRATEGIES)}"
+        )
+
+    prefix = get_directory_prefix(prefix)
+
+    remote_objects = {}
+    if skip_unchanged:
+        for minio_object in iter_objects(
+            minio_client, bucket_name, prefix=prefix or None, recursive=True
+        ):
+            remote_objects[minio_object.object_name] = (
+                minio_object.size,
+                get_last_modified_timestamp(minio_object.last_modified),
+                minio_object.etag,
+            )
+
+    def upload_work_item(work_item):
+        local_filename, object_name = work_item
+
+        remote_object = remote_objects.get(object_name)
+        if remote_object and is_file_unchanged(local_filename, *remote_object, compare):
+            return True
+
+        upload_object(
+            minio_client, bucket_name, local_filename, object_name=object_name,
+            part_size=part_size, max_workers=1,
+        )
+        return False
+
+    upload_results = []
+    for (local_filename, object_name), skipped, error in iter_pool_results(
+        upload_work_item, iter_directory_files(directory, prefix),
+        max_workers=max_workers
+    ):
+        upload_results.append(
+            {
+                "filename": local_filename,
+                "object_name": object_name,
+                "skipped": bool(skipped),
+                "error": error,
+            }
+        )
+
+    skipped_uploads = sum(1 for result in upload_results if result["skipped"])
+    failed_uploads = sum(1 for result in upload_results if result["error"])
+    logging.info(
+        f"Uploaded {len(upload_results) - skipped_uploads - failed_uploads} Files, "
+        f"Skipped {skipped_uploads} Unchanged, {failed_uploads} Failed"
+    )
+
+    return upload_results
+
+
+def is_file_unchanged(filename, size, last_modified, etag, compare="size_mtime"):
+    """
+    Purpose:
+        Check if a local file matches an object in Minio
+    Args:
+        filename (String): Location (And Path) of local file
+        size (Int): Size of the object in Minio
+        last_modified (Float): Epoch timestamp the object was last modified
+        etag (String): ETag of the object in Minio
+        compare (String): "size_mtime" or "hash" (see upload_directory)
+    Returns:
+        file_unchanged (Boolean): Boolean if the file matches the object
+    """
+
+    file_stat = os.stat(filename)
+    if file_stat.st_size != size:
+        return False
+
+    if compare == "size_mtime":
+        return last_modified is not None and file_stat.st_mtime <= last_modified
+
+    # Multipart ETags aren't the MD5 of the object, so those files are re-uploaded
+    file_md5 = hashlib.md5()
+    with open(filename, "rb") as local_file:
+        for data in iter(lambda: local_file.read(1024 * 1024), b""):
+            file_md5.update(data)
+
+    return file_md5.hexdigest() == etag
+
+
+def get_last_modified_timestamp(last_modified):
+    """
+    Purpose:
+        Convert the last modified time of an object to an epoch timestamp.
+        Listings return datetimes and stats return time.struct_time
+    Args:
+        last_modified (datetime or struct_time): Last modified time of an object
+    Returns:
+        last_modified_timestamp (Float): Epoch timestamp (None if not known)
+    """
+
+    if last_modified is None:
+        return None
+    if isinstance(last_modified, datetime.datetime):
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=datetime.timezone.utc)
+        return last_modified.timestamp()
+
+    return float(calendar.timegm(last_modified))
+
+
+def get_file_version(filename):
+    """
+    Purpose:
+        Identify the version of a local file by its size and modification time,
+        so work recorded for a file is not reused once the file changes
+    Args:
+        filename (String): Location (And Path) of the file
+    Returns:
+        file_version (String): "<size>:<mtime in ns>" of the file
+    """
+
+    file_stat = os.stat(filename)
+    return f"{file_stat.st_size}:{file_stat.st_mtime_ns}"
+
+
+def _upload_file_multipart(
+    minio_client, bucket_name, object_name, filename, file_size, part_size,
+    max_workers, object_headers, checkpoint=None, checkpoint_key=None
+):
+    """
+    Purpose:
+        Upload a local file to Minio as a multipart upload with parts uploaded in
+        parallel. The SDK's own multipart upload reads every part into memory
+        before uploading, so the multipart calls are driven here instead. The
+        upload is aborted if any part fails, unless its parts are recorded in a
+        checkpoint, in which case it is resumed by the next call
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket to get to upload object to
+        object_name (String): Name of object to upload in Minio
+        filename (String): Location (And Path) of file to upload
+        file_size (Int): Size of the file to upload
+        part_size (Int): Size of each part
+        max_workers (Int): Number of parts uploaded at once
+        object_headers (Dict): Content-Type and metadata headers of the object
+        checkpoint (minio_transfer_helpers.TransferCheckpoint): Checkpoint to
+            resume the upload from and record uploaded parts in (Defaults to None)
+        checkpoint_key (String): Key of the upload in the checkpoint
+    Returns:
+        etag (String): ETag of the uploaded object
+    """
+
+    file_version = None
+    partial_state = None
+    if checkpoint is not None:
+        file_version = get_file_version(filename)
+        partial_state = checkpoint.get_partial_state(
+            checkpoint_key, file_version, part_size
+        )
+
+    if partial_state and partial_state["upload_id"]:
+        upload_id = partial_state["upload_id"]
+        logging.info(
+            f"Resuming Multipart Upload of {object_name} with "
+            f"{len(partial_state['parts'])} Uploaded Parts"
+        )
+    else:
+        partial_state = None
+        upload_id = minio_client._new_multipart_upload(
+            bucket_name, object_name, object_headers
+        )
+
+    def get_part_size(part_number):
+        return min(part_size, file_size - (part_number - 1) * part_size)
+
+    def upload_part(part_number):
+        offset = (part_number - 1) * part_size
+        with open(filename, "rb") as upload_file:
+            upload_file.seek(offset)
+            part_data = upload_file.read(min(part_size, file_size - offset))
+
+        etag, _ = minio_client._do_put_object(
+            bucket_name,
+            object_name,
+            part_data,
+            len(part_data),
+            upload_id=upload_id,
+            part_number=part_number,
+        )
+        add_bytes_transferred(len(part_data))
+        return UploadPart(
+            bucket_name, object_name, upload_id, part_number, etag, None,
+            len(part_data)
+        )
+
+    uploaded_parts = {}
+    if partial_state:
+        uploaded_parts = {
+            part_number: UploadPart(
+                bucket_name, object_name, upload_id, part_number, part_etag, None,
+                get_part_size(part_number)
+            )
+            for part_number, part_etag in partial_state["parts"].items()
+        }
+
+    try:
+        num_parts = -(-file_size // part_size)
+        remaining_parts = [
+            part_number for part_number in range(1, num_parts + 1)
+            if part_number not in uploaded_parts
+        ]
+        for part_number, uploaded_part, error in iter_pool_results(
+            upload_part, remaining_parts, max_workers=max_workers,
+            max_pending=max_workers,
+        ):
+            if error:
+                raise error
+            uploaded_parts[part_number] = uploaded_part
+            if checkpoint is not None:
+                checkpoint.record_part(
+                    checkpoint_key, file_version, part_size, part_number,
+                    part_etag=uploaded_part.etag, upload_id=upload_id,
+                )
+
+        uploaded_size = sum(part.size for part in uploaded_parts.values())
+        if uploaded_size != file_size:
+            raise ObjectUploadIncomplete(
+                f"Uploaded {uploaded_size} of {file_size} bytes for {object_name}"
+            )
+
+        upload_result, _ = minio_client._complete_multipart_upload(
+            bucket_name, object_name, upload_id, uploaded_parts
+        )
+    except NoSuchUpload as no_upload_err:
+        if not partial_state:
+            raise no_upload_err
+
+        # The upload being resumed was aborted or expired, so start over
+        logging.warning(f"Restarting Multipart Upload of {object_name}")
+        checkpoint.forget(checkpoint_key)
+        return _upload_file_multipart(
+            minio_client, bucket_name, object_name, filename, file_size, part_size,
+            max_workers, object_headers, checkpoint=checkpoint,
+            checkpoint_key=checkpoint_key,
+        )
+    except Exception as err:
+        if checkpoint is not None:
+            logging.error(f"Keeping Multipart Upload of {object_name}: {err}")
+            checkpoint.flush()
+            raise err
+
+        logging.error(f"Aborting Multipart Upload of {object_name}: {err}")
+        minio_client._remove_incomplete_upload(bucket_name, object_name, upload_id)
+        raise err
+
+    return upload_result.etag
+
+
+@instrumented
+def delete_object(minio_client, bucket_name, object_name, check_exists=True):
     """
     Purpose:
         Delete a specified Object by name
     Args:
         minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket to delete the object from
         object_name (String): Name of object in Minio to delete
+        check_exists (Boolean): Raise ObjectDoesntExist if the object doesn't
+            exist, at the cost of a HEAD request (Defaults to True)
     Returns:
         N/A
     """
     logging.info(f"Deleting Object {object_name}")
 
-    # try:
-    #     if minio_client.object_exists(object_name):
-    #         minio_client.remove_object(object_name)
-    #     else:
-    #         raise ObjectDoesntExist(f"{object_name} Doesn't Exist in Minio")
-    # except ResponseError as con_err:
-    #     logging.error(f"Error Connecting to Minio: {con_err}")
-    #     raise con_err
-    # except Exception as err:
-    #     logging.error(f"Error Deleting Object: {err}")
-    #     raise err
+    try:
+        if check_exists and not is_object_in_bucket(
+            minio_client, bucket_name, object_name
+        ):
+            raise ObjectDoesntExist(f"{object_name} Doesn't Exist in Minio")
+        minio_client.remove_object(bucket_name, object_name)
+    except ResponseError as con_err:
+        logging.error(f"Error Connecting to Minio: {con_err}")
+        raise con_err
+    except Exception as err:
+        logging.error(f"Error Deleting Object: {err}")
+        raise err
+
+
+@instrumented
+def delete_objects(
+    minio_client, bucket_name, object_names, batch_size=MAX_DELETE_BATCH_SIZE,
+    max_workers=4, progress_interval=None
+):
+    """
+    Purpose:
+        Delete many objects using multi-object delete requests of up to
+        batch_size keys, with max_workers requests running at once. Object names
+        are consumed lazily, so a streaming listing can be passed in
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket to delete objects from
+        object_names (Iterable of Strings): Names of objects in Minio to delete
+        batch_size (Int): Keys per multi-object delete request (Defaults to 1000,
+            the most S3 allows)
+        max_workers (Int): Number of delete requests sent at once (Defaults to 4)
+        progress_interval (Float): Log progress and throughput every
+            progress_interval seconds (Defaults to no progress logging)
+    Returns:
+        delete_failures (List of Dicts): Dict per key that failed to delete with
+            object_name, error_code, and error_message
+    """
+    logging.info(f"Deleting Objects from {bucket_name}")
+
+    batch_size = min(max(batch_size, 1), MAX_DELETE_BATCH_SIZE)
+
+    def delete_batch(object_names_batch):
+        return list(minio_client.remove_objects(bucket_name, object_names_batch))
+
+    start_time = last_progress_time = time.monotonic()
+    deleted_objects = 0
+    delete_failures = []
+    for object_names_batch, delete_errors, error in iter_pool_results(
+        delete_batch, iter_batches(object_names, batch_size), max_workers=max_workers
+    ):
+        if error:
+            logging.error(f"Error Deleting Batch of Objects: {error}")
+            delete_errors = [
+                MultiDeleteError(object_name, type(error).__name__, str(error))
+                for object_name in object_names_batch
+            ]
+
+        deleted_objects += len(object_names_batch) - len(delete_errors)
+        delete_failures.extend(
+            {
+                "object_name": delete_error.object_name,
+                "error_code": delete_error.error_code,
+                "error_message": delete_error.error_message,
+            }
+            for delete_error in delete_errors
+        )
+
+        if progress_interval and\
+                time.monotonic() - last_progress_time >= progress_interval:
+            last_progress_time = time.monotonic()
+            logging.info(
+                f"Deleted {deleted_objects} Objects from {bucket_name} "
+                f"({deleted_objects / (last_progress_time - start_time):.0f}/s), "
+                f"{len(delete_failures)} Failed"
+            )
+
+    logging.info(
+        f"Deleted {deleted_objects} Objects from {bucket_name}, "
+        f"{len(delete_failures)} Failed"
+    )
+
+    return delete_failures
+
+
+@instrumented
+def delete_objects_by_prefix(
+    minio_client, bucket_name, prefix, batch_size=MAX_DELETE_BATCH_SIZE, max_workers=4
+):
+    """
+    Purpose:
+        Delete every object whose name starts with prefix, feeding a streaming
+        listing into multi-object delete requests
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket to delete objects from
+        prefix (String): Prefix of the objects to delete
+        batch_size (Int): Keys per multi-object delete request (Defaults to 1000)
+        max_workers (Int): Number of delete requests sent at once (Defaults to 4)
+    Returns:
+        delete_failures (List of Dicts): Dict per key that failed to delete with
+            object_name, error_code, and error_message
+    """
+
+    return delete_objects(
+        minio_client,
+        bucket_name,
+        iter_object_names(minio_client, bucket_name, prefix=prefix, recursive=True),
+        batch_size=batch_size,
+        max_workers=max_workers,
+    )
@@ -0,0 +1,587 @@
+"""
+    Purpose:
+        Minio Object Storage Retry Helpers.
+
+        This library is used to interact with Minio object storage. Will handle
+        retrying helper requests that fail with transient errors (5xx responses,
+        throttling, dropped connections, and timeouts) with exponential backoff,
+        full jitter, and a per-operation deadline. Idempotent reads can also be
+        hedged: when a request has not answered after the recent p95 latency of
+        its operation, a duplicate request is sent and whichever answers first
+        is used
+"""
+
+# Python Library Imports
+import contextvars
+import logging
+import random
+import threading
+import time
+import urllib3
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from minio.error import InternalError, RequestTimeout, ResponseError, \
+    ServiceUnavailable, SlowDown
+
+# Local Library Imports
+from minio_helpers.minio_connection_helpers import RETRY_STATUS_CODES
+from minio_helpers.minio_exceptions import OperationDeadlineExceeded
+from minio_helpers.minio_instrumentation_helpers import add_retries
+
+
+###
+# Constants
+###
+
+
+DEFAULT_RETRY_MAX_ATTEMPTS = 4
+DEFAULT_RETRY_BASE_DELAY = 0.05
+DEFAULT_RETRY_MAX_DELAY = 2.0
+DEFAULT_HEDGE_QUANTILE = 0.95
+DEFAULT_HEDGE_MIN_SAMPLES = 20
+DEFAULT_HEDGE_MAX_WORKERS = 32
+DEFAULT_LATENCY_WINDOW = 1000
+LATENCY_QUANTILE_REFRESH_INTERVAL = 20
+
+RETRYABLE_ERRORS = (
+    InternalError,
+    RequestTimeout,
+    ServiceUnavailable,
+    SlowDown,
+    urllib3.exceptions.HTTPError,
+    ConnectionError,
+    TimeoutError,
+)
+
+
+###
+# Retry Helpers
+###
+
+
+def call_with_retry_policy(
+    retry_policy, operation, func, hedged=False, discard_result=None
+):
+    """
+    Purpose:
+        Call func under a retry policy, or call it directly if there is none. Used
+        by the helpers so their retry_policy arguments can default to None
+    Args:
+        retry_policy (RetryPolicy): Policy to call func under, or None
+        operation (String): Name of the request (such as "get_object"), which
+            latencies are tracked under for hedging
+        func (Function): Makes the request and returns its result
+        hedged (Boolean): The request is an idempotent read that may be hedged
+            if the policy hedges reads (Defaults to False)
+        discard_result (Function): Called with the result of a hedged request
+            that lost the race, to release it (such as closing a response)
+    Returns:
+        result (Obj): Result of func
+    """
+
+    if retry_policy is None:
+        return func()
+
+    return retry_policy.call(
+        operation, func, hedged=hedged, discard_result=discard_result
+    )
+
+
+###
+# Retry Classes
+###
+
+
+class RetryPolicy(object):
+    """
+        RetryPolicy Class. Retries requests that fail with transient errors,
+        sleeping a random delay of up to base_delay * 2 ** attempt (capped at
+        max_delay) between attempts, and gives up once max_attempts are made or
+        the next attempt would start after the operation's deadline. These
+        retries sit on top of the connection's own urllib3 retries. With
+        hedge_reads, idempotent reads are hedged after the recent hedge_quantile
+        latency of their operation
+    """
+
+    def __init__(
+        self, max_attempts=DEFAULT_RETRY_MAX_ATTEMPTS,
+        base_delay=DEFAULT_RETRY_BASE_DELAY, max_delay=DEFAULT_RETRY_MAX_DELAY,
+        deadline=None, retryable_errors=RETRYABLE_ERRORS, hedge_reads=False,
+        hedge_quantile=DEFAULT_HEDGE_QUANTILE, hedge_delay=None,
+        hedge_min_samples=DEFAULT_HEDGE_MIN_SAMPLES,
+        hedge_max_workers=DEFAULT_HEDGE_MAX_WORKERS
+    ):
+        """
+        Purpose:
+            Initilize the RetryPolicy Class.
+        Args:
+            max_attempts (Int): Max attempts per operation, including the first
+                (Defaults to 4)
+            base_delay (Float): Seconds the backoff starts from (Defaults to 0.05)
+            max_delay (Float): Max seconds slept between attempts (Defaults to 2)
+            deadline (Float): Seconds after the operation started that no further
+                attempt is started, and hedged requests stop being waited on
+                (Defaults to no deadline)
+            retryable_errors (Tuple of Exception Types): Errors that are retried,
+                along with ResponseErrors with a 5xx status (Defaults to
+                throttling, 5xx, connection, and timeout errors)
+            hedge_reads (Boolean): Hedge idempotent reads (get_object,
+                stat_object, and list_objects) (Defaults to False)
+            hedge_quantile (Float): Latency quantile of an operation after which
+                a read is hedged (Defaults to 0.95)
+            hedge_delay (Float): Fixed seconds after which reads are hedged,
+                instead of the tracked latency quantile (Defaults to None)
+            hedge_min_samples (Int): Latencies tracked for an operation before its
+                reads are hedged (Defaults to 20)
+            hedge_max_workers (Int): Threads hedged reads run on. Size this to
+                twice the number of threads reading at once (Defaults to 32)
+        Returns:
+            N/A
+        """
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retryable_errors = tuple(retryable_errors)
+        self.hedge_reads = hedge_reads
+        self.hedge_quantile = hedge_quantile
+        self.hedge_delay = hedge_delay
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_max_workers = hedge_max_workers
+
+        self.retries = 0
+        self.hedged_requests = 0
+        self.hedge_wins = 0
+        self.deadlines_exceeded = 0
+
+        self._latency_trackers = {}
+        self._hedge_pool = None
+        self._lock = threading.Lock()
+
+    def call(self, operation, func, hedged=False, discard_result=None):
+        """
+        Purpose:
+            Call func, retrying transient errors and hedging it if it is an
+            idempotent read and the policy hedges reads
+        Args:
+            operation (String): Name of the request (such as "get_object")
+            func (Function): Makes the request and returns its result
+            hedged (Boolean): The request may be hedged (Defaults to False)
+            discard_result (Function): Called with the result of a hedged request
+                that lost the race, to release it
+        Returns:
+            result (Obj): Result of func
+        Raises:
+            OperationDeadlineExceeded: A hedged read got no response before the
+                deadline
+        """
+
+        retry_state = self.start_operation(operation)
+        while True:
+            try:
+                if hedged and self.hedge_reads:
+                    return self._call_hedged(
+                        operation, func, discard_result, retry_state
+                    )
+
+                request_start = time.perf_counter()
+                result = func()
+                self.record_latency(operation, time.perf_counter() - request_start)
+                return result
+            except Exception as err:
+                retry_state.retry_or_raise(err)
+
+    def start_operation(self, operation):
+        """
+        Purpose:
+            Start tracking the attempts and deadline of an operation, for helpers
+            (such as listings) that retry by resuming rather than calling again
+        Args:
+            operation (String): Name of the operation
+        Returns:
+            retry_state (RetryState): Attempts of the operation
+        """
+
+        return RetryState(self, operation)
+
+    def is_retryable(self, err):
+        """
+        Purpose:
+            Check if an error is transient and worth retrying
+        Args:
+            err (Exception): Error raised by a request
+        Returns:
+            is_retryable (Boolean): If the error should be retried
+        """
+
+        if isinstance(err, self.retryable_errors):
+            return True
+
+        response = getattr(err, "_response", None)
+        return isinstance(err, ResponseError) and\
+            getattr(response, "status", None) in RETRY_STATUS_CODES
+
+    def get_backoff_delay(self, attempt):
+        """
+        Purpose:
+            Get the seconds to sleep before an attempt, with full jitter
+        Args:
+            attempt (Int): Number of the attempt about to be made (1 for the
+                first retry)
+        Returns:
+            delay (Float): Seconds to sleep
+        """
+
+        return random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        )
+
+    def get_hedge_delay(self, operation):
+        """
+        Purpose:
+            Get the seconds after which a read of an operation is hedged
+        Args:
+            operation (String): Name of the request
+        Returns:
+            hedge_delay (Float): Seconds to wait before hedging, or None if too
+                few latencies are tracked to hedge yet
+        """
+
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+
+        latency_tracker = self._latency_trackers.get(operation)
+        if latency_tracker is None or len(latency_tracker) < self.hedge_min_samples:
+            return None
+
+        return latency_tracker.get_quantile(self.hedge_quantile)
+
+    def record_latency(self, operation, latency):
+        """
+        Purpose:
+            Track the latency of a successful request
+        Args:
+            operation (String): Name of the request
+            latency (Float): Seconds the request took
+        Returns:
+            N/A
+        """
+
+        latency_tracker = self._latency_trackers.get(operation)
+        if latency_tracker is None:
+            with self._lock:
+                latency_tracker = self._latency_trackers.setdefault(
+                    operation, LatencyTracker()
+                )
+
+        latency_tracker.add(latency)
+
+    def get_counters(self):
+        """
+        Purpose:
+            Get the retry and hedging counters of the policy
+        Args:
+            N/A
+        Returns:
+            counters (Dict): retries (attempts after the first), hedged_requests
+                (duplicate reads sent), hedge_wins (duplicates that answered
+                first), and deadlines_exceeded (operations given up at the deadline)
+        """
+
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "hedged_requests": self.hedged_requests,
+                "hedge_wins": self.hedge_wins,
+                "deadlines_exceeded": self.deadlines_exceeded,
+            }
+
+    def close(self):
+        """
+        Purpose:
+            Shut down the threads hedged reads run on. They are started again if
+            the policy is used afterwards
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        with self._lock:
+            hedge_pool, self._hedge_pool = self._hedge_pool, None
+
+        if hedge_pool is not None:
+            hedge_pool.shutdown(wait=False)
+
+    def _call_hedged(self, operation, func, discard_result, retry_state):
+        """
+        Purpose:
+            Send a request, and a duplicate of it if it has not answered after the
+            hedge delay, and return the first successful result. The result of the
+            other request is passed to discard_result when it arrives
+        Args:
+            operation (String): Name of the request
+            func (Function): Makes the request and returns its result
+            discard_result (Function): Releases the result of the losing request
+            retry_state (RetryState): Attempts of the operation
+        Returns:
+            result (Obj): Result of the first request to succeed
+        """
+
+        hedge_pool = self._get_hedge_pool()
+        request_start = time.perf_counter()
+
+        def run_request():
+            result = func()
+            self.record_latency(operation, time.perf_counter() - request_start)
+            return result
+
+        pending = {
+            hedge_pool.submit(contextvars.copy_context().run, run_request)
+        }
+        primary = next(iter(pending))
+
+        hedge_delay = self.get_hedge_delay(operation)
+        if hedge_delay is not None:
+            done, _ = wait(pending, timeout=retry_state.get_timeout(hedge_delay))
+            if not done and retry_state.get_timeout() != 0:
+                self._count("hedged_requests")
+                pending.add(
+                    hedge_pool.submit(contextvars.copy_context().run, func)
+                )
+
+        error = None
+        while pending:
+            done, pending = wait(
+                pending, timeout=retry_state.get_timeout(), return_when=FIRST_COMPLETED
+            )
+            if not done:
+                break
+
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+
+                if future is not primary:
+                    self._count("hedge_wins")
+                for other_future in done | pending:
+                    if other_future is not future:
+                        _discard_future_result(other_future, discard_result)
+                return future.result()
+
+        for future in pending:
+            _discard_future_result(future, discard_result)
+        if error is not None:
+            raise error
+
+        self._count("deadlines_exceeded")
+        raise OperationDeadlineExceeded(
+            f"{operation} Got No Response Within {self.deadline} Seconds"
+        )
+
+    def _get_hedge_pool(self):
+        """
+        Purpose:
+            Get the thread pool hedged reads run on, starting it if needed
+        Args:
+            N/A
+        Returns:
+            hedge_pool (ThreadPoolExecutor): Pool hedged reads run on
+        """
+
+        with self._lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(
+                    max_workers=self.hedge_max_workers,
+                    thread_name_prefix="minio-hedge",
+                )
+            return self._hedge_pool
+
+    def _count(self, counter_name):
+        """
+        Purpose:
+            Increment a counter
+        Args:
+            counter_name (String): Name of the counter attribute
+        Returns:
+            N/A
+        """
+
+        with self._lock:
+            setattr(self, counter_name, getattr(self, counter_name) + 1)
+
+
+class RetryState(object):
+    """
+        RetryState Class. Attempts and deadline of a single operation retried
+        under a RetryPolicy
+    """
+
+    def __init__(self, retry_policy, operation):
+        """
+        Purpose:
+            Initilize the RetryState Class.
+        Args:
+            retry_policy (RetryPolicy): Policy the operation is retried under
+            operation (String): Name of the operation
+        Returns:
+            N/A
+        """
+
+        self.retry_policy = retry_policy
+        self.operation = operation
+        self.attempt = 1
+        self.deadline_time = None
+        if retry_policy.deadline is not None:
+            self.deadline_time = time.monotonic() + retry_policy.deadline
+
+    def get_timeout(self, timeout=None):
+        """
+        Purpose:
+            Bound a timeout by the time left before the deadline
+        Args:
+            timeout (Float): Seconds to bound (Defaults to no timeout)
+        Returns:
+            timeout (Float): Seconds to wait, 0 once the deadline has passed, or
+                None to wait indefinitely
+        """
+
+        if self.deadline_time is None:
+            return timeout
+
+        remaining = max(0, self.deadline_time - time.monotonic())
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def retry_or_raise(self, err):
+        """
+        Purpose:
+            Sleep before the next attempt of the operation, or raise err if it is
+            not retryable, the attempts are used up, or the next attempt would
+            start after the deadline
+        Args:
+            err (Exception): Error the last attempt raised
+        Returns:
+            N/A
+        """
+
+        retry_policy = self.retry_policy
+        if not retry_policy.is_retryable(err) or\
+                self.attempt >= retry_policy.max_attempts:
+            raise err
+
+        delay = retry_policy.get_backoff_delay(self.attempt)
+        if self.deadline_time is not None and\
+                time.monotonic() + delay >= self.deadline_time:
+            retry_policy._count("deadlines_exceeded")
+            raise err
+
+        logging.warning(
+            f"Retrying {self.operation} in {delay:.3f}s "
+            f"(Attempt {self.attempt + 1}/{retry_policy.max_attempts}): {err}"
+        )
+        time.sleep(delay)
+        self.attempt += 1
+        retry_policy._count("retries")
+        add_retries()
+
+
+class LatencyTracker(object):
+    """
+        LatencyTracker Class. Thread-safe window of the most recent latencies of
+        an operation. Quantiles are recomputed every
+        LATENCY_QUANTILE_REFRESH_INTERVAL latencies rather than on every read
+    """
+
+    def __init__(self, window=DEFAULT_LATENCY_WINDOW):
+        """
+        Purpose:
+            Initilize the LatencyTracker Class.
+        Args:
+            window (Int): Number of recent latencies kept (Defaults to 1000)
+        Returns:
+            N/A
+        """
+
+        self._latencies = deque(maxlen=window)
+        self._quantiles = {}
+        self._added_since_refresh = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """
+        Purpose:
+            Get the number of latencies kept
+        Args:
+            N/A
+        Returns:
+            num_latencies (Int): Number of latencies kept
+        """
+
+        return len(self._latencies)
+
+    def add(self, latency):
+        """
+        Purpose:
+            Add a latency to the window
+        Args:
+            latency (Float): Seconds a request took
+        Returns:
+            N/A
+        """
+
+        with self._lock:
+            self._latencies.append(latency)
+            self._added_since_refresh += 1
+            if self._added_since_refresh >= LATENCY_QUANTILE_REFRESH_INTERVAL:
+                self._quantiles.clear()
+
+    def get_quantile(self, quantile):
+        """
+        Purpose:
+            Get a quantile of the latencies in the window
+        Args:
+            quantile (Float): Quantile to get, between 0 and 1
+        Returns:
+            latency (Float): Latency at the quantile, or None if the window is empty
+        """
+
+        with self._lock:
+            if quantile not in self._quantiles:
+                if not self._latencies:
+                    return None
+                sorted_latencies = sorted(self._latencies)
+                quantile_idx = int(quantile * len(sorted_latencies))
+                self._quantiles[quantile] = sorted_latencies[
+                    min(len(sorted_latencies) - 1, quantile_idx)
+                ]
+                self._added_since_refresh = 0
+
+            return self._quantiles[quantile]
+
+
+def _discard_future_result(future, discard_result):
+    """
+    Purpose:
+        Pass the result of a hedged request that lost the race to discard_result
+        once it arrives
+    Args:
+        future (Future): Future of the losing request
+        discard_result (Function): Releases the result, or None
+    Returns:
+        N/A
+    """
+
+    if discard_result is None:
+        return
+
+    def discard(future):
+        if future.cancelled() or future.exception() is not None:
+            return
+        try:
+            discard_result(future.result())
+        except Exception as err:
+            logging.error(f"Error Discarding Hedged Result: {err}")
+
+    future.add_done_callback(discard)
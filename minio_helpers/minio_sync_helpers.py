@@ -0,0 +1,668 @@
+"""
+    Purpose:
+        Minio Object Storage Sync Helpers.
+
+        This library is used to interact with Minio object storage. Will handle
+        mirroring the objects of one bucket into another, on the same Minio or a
+        different one. The listings of both buckets are diffed with a streaming
+        sorted merge, and objects are copied server-side when both buckets are on
+        the same Minio, or piped from the source's response straight into an
+        upload when they are not, without a local temp file
+"""
+
+# Python Library Imports
+import functools
+import logging
+import time
+from urllib.parse import quote
+from minio.definitions import UploadPart
+from minio.error import ResponseError
+from minio.helpers import MAX_MULTIPART_COUNT, MIN_PART_SIZE, is_supported_header, \
+    read_full
+from minio.parsers import S3Element
+
+# Local Library Imports
+from minio_helpers.minio_bucket_helpers import get_endpoint_key
+from minio_helpers.minio_exceptions import ObjectDownloadIncomplete, \
+    ObjectListingUnsorted, ObjectUploadIncomplete
+from minio_helpers.minio_general_helpers import iter_pool_results
+from minio_helpers.minio_instrumentation_helpers import add_bytes_transferred, \
+    add_response_stats, instrumented
+from minio_helpers.minio_object_helpers import DEFAULT_UPLOAD_PART_SIZE, \
+    MAX_DELETE_BATCH_SIZE, delete_objects, get_last_modified_timestamp, iter_objects
+from minio_helpers.minio_retry_helpers import call_with_retry_policy
+
+
+###
+# Constants
+###
+
+
+SYNC_COMPARE_STRATEGIES = ("size_mtime", "etag", "size")
+MAX_COPY_OBJECT_SIZE = 5 * 1024 * 1024 * 1024
+DEFAULT_COPY_PART_SIZE = 512 * 1024 * 1024
+
+
+###
+# Sync Helpers
+###
+
+
+@instrumented
+def sync_bucket(
+    minio_client, bucket_name, source_bucket_name, source_client=None, prefix="",
+    source_prefix="", delete=False, compare="size_mtime", max_workers=8,
+    retry_policy=None, progress_interval=10.0
+):
+    """
+    Purpose:
+        Mirror the objects of a source bucket into a bucket. Both buckets are
+        listed once and the listings are diffed with a streaming sorted merge,
+        so memory doesn't grow with the size of the buckets. Missing and changed
+        objects are copied by max_workers threads, server-side when both clients
+        are connected to the same Minio with the same credentials (so the
+        destination's credentials are known to be able to read the source), and
+        by piping the source's response into an upload when they are not
+    Args:
+        minio_client (minio client Obj): Client obj connection to the Minio to
+            sync into
+        bucket_name (String): Name of the bucket to sync into
+        source_bucket_name (String): Name of the bucket to sync from
+        source_client (minio client Obj): Client obj connection to the Minio of
+            the source bucket (Defaults to minio_client)
+        prefix (String): Prefix objects are synced under in bucket_name
+            (Defaults to "")
+        source_prefix (String): Only sync source objects under this prefix,
+            which is replaced by prefix in bucket_name (Defaults to "")
+        delete (Boolean): Delete objects under prefix that aren't in the source
+            (Defaults to False)
+        compare (String): How to tell if an object changed (Defaults to
+            "size_mtime"):
+            "size_mtime" copies objects whose size differs or whose source was
+                modified after the copy in bucket_name
+            "etag" copies objects whose size or ETag differs. ETags only match
+                for objects uploaded or copied the same way on both sides
+            "size" copies objects whose size differs
+        max_workers (Int): Number of objects copied at once (Defaults to 8)
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry the
+            listings and copies under (Defaults to no retries)
+        progress_interval (Float): Log progress every progress_interval seconds
+            (Defaults to 10.0)
+    Returns:
+        sync_summary (Dict): Dict of copied_objects, copied_bytes,
+            unchanged_objects, deleted_objects, copy_failures (List of Dicts
+            with object_name and error), delete_failures (List of Dicts with
+            object_name, error_code, and error_message), and elapsed_seconds
+    """
+    logging.info(
+        f"Syncing Bucket {source_bucket_name}/{source_prefix} to "
+        f"{bucket_name}/{prefix}"
+    )
+
+    if compare not in SYNC_COMPARE_STRATEGIES:
+        raise ValueError(
+            f"Compare {compare} not in {', '.join(SYNC_COMPARE_STRATEGIES)}"
+        )
+
+    # Endpoint keys include the clients' credentials, so clients of the same
+    # Minio with different credentials pipe objects instead of copying them
+    source_client = source_client or minio_client
+    server_side_copy =\
+        get_endpoint_key(source_client) == get_endpoint_key(minio_client)
+
+    start_time = time.monotonic()
+    sync_summary = {
+        "copied_objects": 0,
+        "copied_bytes": 0,
+        "unchanged_objects": 0,
+        "deleted_objects": 0,
+        "copy_failures": [],
+        "delete_failures": [],
+    }
+
+    def get_sync_work_items():
+        # The destination listing is always read past the names being copied
+        # or deleted, so later pages never list the objects the sync writes
+        listing_diff = iter_listing_diff(
+            iter_objects(
+                source_client, source_bucket_name, prefix=source_prefix or None,
+                recursive=True, retry_policy=retry_policy,
+            ),
+            iter_objects(
+                minio_client, bucket_name, prefix=prefix or None, recursive=True,
+                retry_policy=retry_policy,
+            ),
+            source_prefix=source_prefix,
+            destination_prefix=prefix,
+        )
+
+        delete_batch = []
+        for relative_name, source_object, destination_object in listing_diff:
+            if source_object is None:
+                if delete:
+                    delete_batch.append(prefix + relative_name)
+                if len(delete_batch) >= MAX_DELETE_BATCH_SIZE:
+                    yield "delete", delete_batch
+                    delete_batch = []
+            elif is_object_changed(source_object, destination_object, compare):
+                yield "copy", (source_object, prefix + relative_name)
+            else:
+                sync_summary["unchanged_objects"] += 1
+
+        if delete_batch:
+            yield "delete", delete_batch
+
+    def run_sync_work_item(sync_work_item):
+        work_type, work = sync_work_item
+        if work_type == "delete":
+            return delete_objects(minio_client, bucket_name, work, max_workers=1)
+
+        source_object, object_name = work
+        if server_side_copy:
+            return copy_object(
+                minio_client, bucket_name, object_name, source_bucket_name,
+                source_object.object_name, source_size=source_object.size,
+                retry_policy=retry_policy,
+            )
+        return pipe_object(
+            minio_client, bucket_name, object_name, source_client,
+            source_bucket_name, source_object.object_name, retry_policy=retry_policy,
+        )
+
+    last_progress_time = start_time
+    for (work_type, work), result, error in iter_pool_results(
+        run_sync_work_item, get_sync_work_items(), max_workers=max_workers
+    ):
+        if work_type == "delete":
+            if error:
+                result = [
+                    {
+                        "object_name": object_name,
+                        "error_code": type(error).__name__,
+                        "error_message": str(error),
+                    }
+                    for object_name in work
+                ]
+            sync_summary["deleted_objects"] += len(work) - len(result)
+            sync_summary["delete_failures"].extend(result)
+        elif error:
+            logging.error(f"Failed to Copy {work[0].object_name}: {error}")
+            sync_summary["copy_failures"].append(
+                {"object_name": work[0].object_name, "error": error}
+            )
+        else:
+            sync_summary["copied_objects"] += 1
+            sync_summary["copied_bytes"] += work[0].size or 0
+
+        if time.monotonic() - last_progress_time >= progress_interval:
+            last_progress_time = time.monotonic()
+            logging.info(
+                f"Synced {sync_summary['copied_objects']} Objects "
+                f"({sync_summary['copied_bytes']} Bytes) to {bucket_name} in "
+                f"{last_progress_time - start_time:.1f}s"
+            )
+
+    sync_summary["elapsed_seconds"] = time.monotonic() - start_time
+    logging.info(
+        f"Synced {source_bucket_name} to {bucket_name} in "
+        f"{sync_summary['elapsed_seconds']:.1f}s: "
+        f"{sync_summary['copied_objects']} Copied, "
+        f"{sync_summary['unchanged_objects']} Unchanged, "
+        f"{sync_summary['deleted_objects']} Deleted, "
+        f"{len(sync_summary['copy_failures'])} Failed"
+    )
+
+    return sync_summary
+
+
+def iter_listing_diff(
+    source_objects, destination_objects, source_prefix="", destination_prefix=""
+):
+    """
+    Purpose:
+        Diff two listings sorted by object name (as S3 listings are) in a single
+        pass, holding one object of each listing at a time. Objects are matched
+        on their names relative to each listing's prefix, and directories are
+        skipped
+    Args:
+        source_objects (Iterable of Object Objs): Sorted source listing
+        destination_objects (Iterable of Object Objs): Sorted destination listing
+        source_prefix (String): Prefix stripped from source names (Defaults
+            to "")
+        destination_prefix (String): Prefix stripped from destination names
+            (Defaults to "")
+    Yields:
+        listing_diff (Tuple): (relative_name, source_object, destination_object)
+            for each name in either listing, in order, with None for the listing
+            missing the name
+    Raises:
+        ObjectListingUnsorted: A listing isn't sorted by object name
+    """
+
+    source_objects = _iter_relative_names(source_objects, source_prefix)
+    destination_objects = _iter_relative_names(destination_objects, destination_prefix)
+    source_name, source_object = next(source_objects, (None, None))
+    destination_name, destination_object = next(destination_objects, (None, None))
+
+    while source_object is not None or destination_object is not None:
+        if destination_object is None or (
+            source_object is not None and source_name < destination_name
+        ):
+            yield source_name, source_object, None
+            source_name, source_object = next(source_objects, (None, None))
+        elif source_object is None or destination_name < source_name:
+            yield destination_name, None, destination_object
+            destination_name, destination_object =\
+                next(destination_objects, (None, None))
+        else:
+            yield source_name, source_object, destination_object
+            source_name, source_object = next(source_objects, (None, None))
+            destination_name, destination_object =\
+                next(destination_objects, (None, None))
+
+
+def _iter_relative_names(minio_objects, prefix):
+    """
+    Purpose:
+        Pair the objects of a listing with their names relative to its prefix,
+        checking the listing is sorted as it goes
+    Args:
+        minio_objects (Iterable of Object Objs): Listing of objects
+        prefix (String): Prefix stripped from object names
+    Yields:
+        relative_object (Tuple): (relative_name, minio_object) of each object
+    Raises:
+        ObjectListingUnsorted: The listing isn't sorted by object name
+    """
+
+    last_name = None
+    for minio_object in minio_objects:
+        if minio_object.is_dir:
+            continue
+
+        relative_name = minio_object.object_name[len(prefix or ""):]
+        if last_name is not None and relative_name <= last_name:
+            raise ObjectListingUnsorted(
+                f"Listing of {minio_object.bucket_name} Has {relative_name} "
+                f"After {last_name}"
+            )
+        last_name = relative_name
+
+        yield relative_name, minio_object
+
+
+def is_object_changed(source_object, destination_object, compare="size_mtime"):
+    """
+    Purpose:
+        Check if an object needs to be copied over its copy in another bucket
+    Args:
+        source_object (Object Obj): Object being synced
+        destination_object (Object Obj): Copy of the object (None if missing)
+        compare (String): "size_mtime", "etag", or "size" (see sync_bucket)
+    Returns:
+        object_changed (Boolean): Boolean if the object needs to be copied
+    """
+
+    if destination_object is None:
+        return True
+    if source_object.size != destination_object.size:
+        return True
+
+    if compare == "etag":
+        return source_object.etag != destination_object.etag
+    if compare == "size_mtime":
+        source_timestamp = get_last_modified_timestamp(source_object.last_modified)
+        destination_timestamp =\
+            get_last_modified_timestamp(destination_object.last_modified)
+        return source_timestamp is None or destination_timestamp is None or\
+            source_timestamp > destination_timestamp
+
+    return False
+
+
+###
+# Copy Helpers
+###
+
+
+@instrumented
+def copy_object(
+    minio_client, bucket_name, object_name, source_bucket_name, source_object_name,
+    source_size=None, part_size=DEFAULT_COPY_PART_SIZE, max_workers=4,
+    retry_policy=None
+):
+    """
+    Purpose:
+        Copy an object within a Minio with a server-side copy, keeping its
+        content type and metadata. Objects over the 5GiB limit of a single copy
+        are copied as a multipart upload of ranges of the source, with
+        max_workers ranges copied at once. No object data passes through the
+        client
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket to copy to
+        object_name (String): Name of the object to copy to
+        source_bucket_name (String): Name of the bucket to copy from
+        source_object_name (String): Name of the object to copy from
+        source_size (Int): Size of the source object (Defaults to a stat of it)
+        part_size (Int): Size of each range of a multipart copy, raised as needed
+            to stay within S3's 10000 part maximum (Defaults to 512MiB)
+        max_workers (Int): Number of ranges copied at once (Defaults to 4)
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry the
+            copy requests under (Defaults to no retries)
+    Returns:
+        etag (String): ETag of the copied object
+    """
+    logging.info(
+        f"Copying Object {source_bucket_name}/{source_object_name} to "
+        f"{bucket_name}/{object_name}"
+    )
+
+    try:
+        if source_size is None or source_size > MAX_COPY_OBJECT_SIZE:
+            source_stats = call_with_retry_policy(
+                retry_policy,
+                "stat_object",
+                functools.partial(
+                    minio_client.stat_object, source_bucket_name, source_object_name
+                ),
+                hedged=True,
+            )
+            source_size = source_stats.size
+
+        if source_size <= MAX_COPY_OBJECT_SIZE:
+            copy_result = call_with_retry_policy(
+                retry_policy,
+                "copy_object",
+                functools.partial(
+                    minio_client.copy_object,
+                    bucket_name,
+                    object_name,
+                    f"{source_bucket_name}/{source_object_name}",
+                ),
+            )
+            return copy_result.etag
+
+        return _copy_object_multipart(
+            minio_client,
+            bucket_name,
+            object_name,
+            source_bucket_name,
+            source_object_name,
+            source_size,
+            _get_object_headers(source_stats.metadata),
+            max(part_size, MIN_PART_SIZE, -(-source_size // MAX_MULTIPART_COUNT)),
+            max_workers,
+            retry_policy,
+        )
+    except ResponseError as con_err:
+        logging.error(f"Error Connecting to Minio: {con_err}")
+        raise con_err
+    except Exception as err:
+        logging.error(f"Error Copying Object {object_name}: {err}")
+        raise err
+
+
+def _copy_object_multipart(
+    minio_client, bucket_name, object_name, source_bucket_name, source_object_name,
+    source_size, object_headers, part_size, max_workers, retry_policy
+):
+    """
+    Purpose:
+        Copy an object as a multipart upload of ranges of the source (the
+        minio lib has no multipart copy). The upload is aborted if any range
+        fails
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket to copy to
+        object_name (String): Name of the object to copy to
+        source_bucket_name (String): Name of the bucket to copy from
+        source_object_name (String): Name of the object to copy from
+        source_size (Int): Size of the source object
+        object_headers (Dict): Content-Type and metadata headers of the object
+        part_size (Int): Size of each range
+        max_workers (Int): Number of ranges copied at once
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry the
+            copy requests under
+    Returns:
+        etag (String): ETag of the copied object
+    """
+
+    copy_source = quote(f"/{source_bucket_name}/{source_object_name}")
+    upload_id = minio_client._new_multipart_upload(
+        bucket_name, object_name, object_headers
+    )
+
+    def copy_part(part_number):
+        first_byte = (part_number - 1) * part_size
+        last_byte = min(first_byte + part_size, source_size) - 1
+        response = minio_client._url_open(
+            "PUT",
+            bucket_name=bucket_name,
+            object_name=object_name,
+            query={"partNumber": str(part_number), "uploadId": upload_id},
+            headers={
+                "X-Amz-Copy-Source": copy_source,
+                "X-Amz-Copy-Source-Range": f"bytes={first_byte}-{last_byte}",
+            },
+        )
+        etag = S3Element.fromstring("CopyPartResult", response.data).get_etag_elem()
+        return UploadPart(
+            bucket_name, object_name, upload_id, part_number, etag, None,
+            last_byte - first_byte + 1
+        )
+
+    try:
+        copied_parts = {}
+        for part_number, copied_part, error in iter_pool_results(
+            lambda part_number: call_with_retry_policy(
+                retry_policy, "copy_object", functools.partial(copy_part, part_number)
+            ),
+            range(1, -(-source_size // part_size) + 1),
+            max_workers=max_workers,
+        ):
+            if error:
+                raise error
+            copied_parts[part_number] = copied_part
+
+        upload_result, _ = minio_client._complete_multipart_upload(
+            bucket_name, object_name, upload_id, copied_parts
+        )
+    except Exception as err:
+        logging.error(f"Aborting Multipart Copy of {object_name}: {err}")
+        minio_client._remove_incomplete_upload(bucket_name, object_name, upload_id)
+        raise err
+
+    return upload_result.etag
+
+
+@instrumented
+def pipe_object(
+    minio_client, bucket_name, object_name, source_client, source_bucket_name,
+    source_object_name, part_size=DEFAULT_UPLOAD_PART_SIZE, max_workers=4,
+    retry_policy=None
+):
+    """
+    Purpose:
+        Copy an object from another Minio by piping the source's response
+        straight into an upload, keeping its content type and metadata, without
+        a local temp file. Objects larger than part_size are uploaded as a
+        multipart upload with parts read from the response in order and
+        max_workers parts in flight, so memory stays capped at
+        max_workers * part_size regardless of the size of the object
+    Args:
+        minio_client (minio client Obj): Client obj connection to the Minio to
+            copy to
+        bucket_name (String): Name of the bucket to copy to
+        object_name (String): Name of the object to copy to
+        source_client (minio client Obj): Client obj connection to the Minio to
+            copy from
+        source_bucket_name (String): Name of the bucket to copy from
+        source_object_name (String): Name of the object to copy from
+        part_size (Int): Size of each multipart part, raised as needed to stay
+            within S3's 5MiB minimum and 10000 part maximum (Defaults to 16MiB)
+        max_workers (Int): Number of parts uploaded at once (Defaults to 4)
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry the
+            download request and the part uploads under (Defaults to no
+            retries). A response that fails part way through isn't resumed
+    Returns:
+        etag (String): ETag of the copied object
+    """
+    logging.info(
+        f"Piping Object {source_bucket_name}/{source_object_name} to "
+        f"{bucket_name}/{object_name}"
+    )
+
+    def release_response(response):
+        response.close()
+        response.release_conn()
+
+    try:
+        response = call_with_retry_policy(
+            retry_policy,
+            "get_object",
+            functools.partial(
+                source_client.get_object, source_bucket_name, source_object_name
+            ),
+            hedged=True,
+            discard_result=release_response,
+        )
+        try:
+            add_response_stats(response)
+            return _pipe_response(
+                minio_client, bucket_name, object_name, response, part_size,
+                max_workers, retry_policy,
+            )
+        finally:
+            release_response(response)
+    except ResponseError as con_err:
+        logging.error(f"Error Connecting to Minio: {con_err}")
+        raise con_err
+    except Exception as err:
+        logging.error(f"Error Piping Object {object_name}: {err}")
+        raise err
+
+
+def _pipe_response(
+    minio_client, bucket_name, object_name, response, part_size, max_workers,
+    retry_policy
+):
+    """
+    Purpose:
+        Upload the body of a get_object response as an object. The SDK's own
+        multipart upload reads every part into memory before uploading, so the
+        multipart calls are driven here instead. The upload is aborted if any
+        part fails
+    Args:
+        minio_client (minio client Obj): Client obj connection to Minio
+        bucket_name (String): Name of the bucket to upload to
+        object_name (String): Name of the object to upload
+        response (urllib3 HTTPResponse): Response of the object to upload
+        part_size (Int): Size of each multipart part
+        max_workers (Int): Number of parts uploaded at once
+        retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry the
+            part uploads under
+    Returns:
+        etag (String): ETag of the uploaded object
+    """
+
+    object_size = int(response.headers["content-length"])
+    object_headers = _get_object_headers(response.headers)
+    part_size = max(part_size, MIN_PART_SIZE, -(-object_size // MAX_MULTIPART_COUNT))
+
+    def read_part(part_number):
+        expected_size = min(part_size, object_size - (part_number - 1) * part_size)
+        part_data = read_full(response, expected_size)
+        if len(part_data) != expected_size:
+            raise ObjectDownloadIncomplete(
+                f"Response for {object_name} Ended Before {object_size} Bytes"
+            )
+        return part_data
+
+    def put_part(part_data, upload_id="", part_number=0):
+        etag, _ = call_with_retry_policy(
+            retry_policy,
+            "put_object",
+            functools.partial(
+                minio_client._do_put_object,
+                bucket_name,
+                object_name,
+                part_data,
+                len(part_data),
+                upload_id=upload_id,
+                part_number=part_number,
+                metadata=None if upload_id else object_headers,
+            ),
+        )
+        add_bytes_transferred(len(part_data))
+        return etag
+
+    if object_size <= part_size:
+        return put_part(read_part(1))
+
+    upload_id = minio_client._new_multipart_upload(
+        bucket_name, object_name, object_headers
+    )
+
+    def upload_part(part):
+        part_number, part_data = part
+        return UploadPart(
+            bucket_name, object_name, upload_id, part_number,
+            put_part(part_data, upload_id=upload_id, part_number=part_number), None,
+            len(part_data)
+        )
+
+    try:
+        # Parts are read from the response in order as the pool pulls them
+        num_parts = -(-object_size // part_size)
+        uploaded_parts = {}
+        for (part_number, _), uploaded_part, error in iter_pool_results(
+            upload_part,
+            (
+                (part_number, read_part(part_number))
+                for part_number in range(1, num_parts + 1)
+            ),
+            max_workers=max_workers,
+            max_pending=max_workers,
+        ):
+            if error:
+                raise error
+            uploaded_parts[part_number] = uploaded_part
+
+        uploaded_size = sum(part.size for part in uploaded_parts.values())
+        if uploaded_size != object_size:
+            raise ObjectUploadIncomplete(
+                f"Uploaded {uploaded_size} of {object_size} bytes for {object_name}"
+            )
+
+        upload_result, _ = minio_client._complete_multipart_upload(
+            bucket_name, object_name, upload_id, uploaded_parts
+        )
+    except Exception as err:
+        logging.error(f"Aborting Multipart Upload of {object_name}: {err}")
+        minio_client._remove_incomplete_upload(bucket_name, object_name, upload_id)
+        raise err
+
+    return upload_result.etag
+
+
+def _get_object_headers(headers):
+    """
+    Purpose:
+        Get the headers to recreate an object with from the headers of a
+        response (or the metadata of a stat) of the object
+    Args:
+        headers (Dict): Response headers or stat metadata of the object
+    Returns:
+        object_headers (Dict): Content-Type, supported, and x-amz-meta-* headers
+    """
+
+    object_headers = {"Content-Type": "application/octet-stream"}
+    for header_name, header_value in headers.items():
+        if header_name.lower() == "content-type":
+            object_headers["Content-Type"] = header_value
+        elif is_supported_header(header_name) or\
+                header_name.lower().startswith("x-amz-meta-"):
+            object_headers[header_name] = header_value
+
+    return object_headers
@@ -0,0 +1,640 @@
+"""
+    Purpose:
+        Minio Object Storage Transfer Helpers.
+
+        This library is used to interact with Minio object storage. Will handle
+        running bulk downloads and uploads as resumable jobs. A job records the
+        objects it has finished (with their ETags, or the size and mtime of
+        uploaded files) and the ranges and parts of objects it is part way
+        through in a checkpoint file, so a restarted job skips finished work and
+        resumes partial objects. Checkpoint records are appended in batches and
+        the file is compacted to one line per object when it is opened and closed
+"""
+
+# Python Library Imports
+import simplejson as json
+import logging
+import os
+import threading
+import time
+
+# Local Library Imports
+from minio_helpers.minio_general_helpers import iter_pool_results
+from minio_helpers.minio_object_helpers import DEFAULT_RANGE_PART_SIZE, \
+    DEFAULT_UPLOAD_PART_SIZE, download_object_to_file, download_object_to_file_ranged, \
+    get_file_version, get_object_stats, iter_directory_files, upload_object
+
+
+###
+# Constants
+###
+
+
+DEFAULT_CHECKPOINT_SAVE_INTERVAL = 5.0
+DEFAULT_CHECKPOINT_MAX_PENDING = 1000
+
+
+###
+# Transfer Classes
+###
+
+
+class TransferCheckpoint(object):
+    """
+        TransferCheckpoint Class. Thread-safe record of the finished and partial
+        transfers of a job, kept in an append-only JSON lines file. Records are
+        buffered and appended once max_pending records are waiting or
+        save_interval seconds have passed, so checkpointing costs one write per
+        batch rather than one per object or range
+    """
+
+    def __init__(
+        self, checkpoint_filename, save_interval=DEFAULT_CHECKPOINT_SAVE_INTERVAL,
+        max_pending=DEFAULT_CHECKPOINT_MAX_PENDING
+    ):
+        """
+        Purpose:
+            Initilize the TransferCheckpoint Class. An existing checkpoint file is
+            loaded and compacted
+        Args:
+            checkpoint_filename (String): Location of the checkpoint file
+            save_interval (Float): Max seconds records are buffered before being
+                appended (Defaults to 5)
+            max_pending (Int): Max records buffered before being appended
+                (Defaults to 1000)
+        Returns:
+            N/A
+        """
+
+        self.checkpoint_filename = checkpoint_filename
+        self.save_interval = save_interval
+        self.max_pending = max_pending
+
+        self._transfers = {}
+        self._pending_records = []
+        self._last_flush = time.monotonic()
+        self._checkpoint_file = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+        self._load()
+        self.compact()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def is_completed(self, key, version):
+        """
+        Purpose:
+            Check if a transfer finished at a version
+        Args:
+            key (String): Key of the transfer (such as bucket_name/object_name)
+            version (String): ETag of the object, or version of the local file
+        Returns:
+            is_completed (Boolean): If the transfer finished at the version
+        """
+
+        with self._lock:
+            transfer = self._transfers.get(key)
+            return bool(transfer and transfer["done"] and transfer["v"] == version)
+
+    def get_partial_state(self, key, version, part_size):
+        """
+        Purpose:
+            Get the completed parts of a transfer part way through at a version
+            and part size
+        Args:
+            key (String): Key of the transfer
+            version (String): ETag of the object, or version of the local file
+            part_size (Int): Size of each part of the transfer
+        Returns:
+            partial_state (Dict): Dict of upload_id (None for downloads) and parts
+                (Dict of part number to part ETag, or None for downloads), or None
+                if no parts are recorded for the version and part size
+        """
+
+        with self._lock:
+            transfer = self._transfers.get(key)
+            if not transfer or transfer["done"] or transfer["v"] != version or\
+                    transfer["ps"] != part_size:
+                return None
+
+            return {"upload_id": transfer["uid"], "parts": dict(transfer["parts"])}
+
+    def record_completed(self, key, version):
+        """
+        Purpose:
+            Record that a transfer finished at a version
+        Args:
+            key (String): Key of the transfer
+            version (String): ETag of the object, or version of the local file
+        Returns:
+            N/A
+        """
+
+        record = {"k": key, "v": version, "done": True}
+        with self._lock:
+            self._apply_record(record)
+            self._pending_records.append(record)
+        self._flush_if_due()
+
+    def record_part(
+        self, key, version, part_size, part_number, part_etag=None, upload_id=None
+    ):
+        """
+        Purpose:
+            Record that a part of a transfer finished
+        Args:
+            key (String): Key of the transfer
+            version (String): ETag of the object, or version of the local file
+            part_size (Int): Size of each part of the transfer
+            part_number (Int): Number of the finished part
+            part_etag (String): ETag of the uploaded part (Defaults to None)
+            upload_id (String): ID of the multipart upload (Defaults to None)
+        Returns:
+            N/A
+        """
+
+        record = {
+            "k": key, "v": version, "ps": part_size, "uid": upload_id,
+            "p": [[part_number, part_etag]],
+        }
+        with self._lock:
+            self._apply_record(record)
+            self._pending_records.append(record)
+        self._flush_if_due()
+
+    def forget(self, key):
+        """
+        Purpose:
+            Forget everything recorded for a transfer
+        Args:
+            key (String): Key of the transfer
+        Returns:
+            N/A
+        """
+
+        record = {"k": key, "forget": True}
+        with self._lock:
+            self._apply_record(record)
+            self._pending_records.append(record)
+        self._flush_if_due()
+
+    def flush(self):
+        """
+        Purpose:
+            Append the buffered records to the checkpoint file
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        with self._write_lock:
+            with self._lock:
+                pending_records, self._pending_records = self._pending_records, []
+                self._last_flush = time.monotonic()
+
+            if not pending_records:
+                return
+
+            if self._checkpoint_file is None:
+                self._checkpoint_file = open(self.checkpoint_filename, "a")
+            self._checkpoint_file.write(
+                "".join(
+                    f"{json.dumps(record)}\n"
+                    for record in _merge_part_records(pending_records)
+                )
+            )
+            self._checkpoint_file.flush()
+            os.fsync(self._checkpoint_file.fileno())
+
+    def compact(self):
+        """
+        Purpose:
+            Atomically rewrite the checkpoint file with one record per transfer
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        with self._write_lock:
+            with self._lock:
+                records = [
+                    _get_transfer_record(key, transfer)
+                    for key, transfer in self._transfers.items()
+                ]
+                self._pending_records = []
+                self._last_flush = time.monotonic()
+
+            if self._checkpoint_file is not None:
+                self._checkpoint_file.close()
+                self._checkpoint_file = None
+
+            checkpoint_dir = os.path.dirname(self.checkpoint_filename)
+            if checkpoint_dir:
+                os.makedirs(checkpoint_dir, exist_ok=True)
+            with open(f"{self.checkpoint_filename}.tmp", "w") as checkpoint_file:
+                checkpoint_file.write(
+                    "".join(f"{json.dumps(record)}\n" for record in records)
+                )
+                checkpoint_file.flush()
+                os.fsync(checkpoint_file.fileno())
+            os.replace(f"{self.checkpoint_filename}.tmp", self.checkpoint_filename)
+
+    def close(self):
+        """
+        Purpose:
+            Compact the checkpoint file (writing any buffered records) and close it
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        self.compact()
+
+    def get_counters(self):
+        """
+        Purpose:
+            Get the number of finished and partial transfers recorded
+        Args:
+            N/A
+        Returns:
+            counters (Dict): completed (finished transfers), partial (transfers
+                with parts recorded), and pending (records not yet appended)
+        """
+
+        with self._lock:
+            completed = sum(
+                1 for transfer in self._transfers.values() if transfer["done"]
+            )
+            return {
+                "completed": completed,
+                "partial": len(self._transfers) - completed,
+                "pending": len(self._pending_records),
+            }
+
+    def _load(self):
+        """
+        Purpose:
+            Replay the records of an existing checkpoint file. A truncated last
+            line (from a crash part way through a write) is ignored
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        try:
+            checkpoint_file = open(self.checkpoint_filename)
+        except FileNotFoundError:
+            return
+
+        with checkpoint_file:
+            for line in checkpoint_file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    logging.warning(
+                        f"Skipping Unreadable Checkpoint Record in "
+                        f"{self.checkpoint_filename}"
+                    )
+                    continue
+                self._apply_record(record)
+
+        logging.info(
+            f"Loaded Checkpoint {self.checkpoint_filename} with "
+            f"{len(self._transfers)} Transfers"
+        )
+
+    def _apply_record(self, record):
+        """
+        Purpose:
+            Apply a record to the in-memory state of the transfers. Must be called
+            with the lock held (or before the checkpoint is shared)
+        Args:
+            record (Dict): Checkpoint record
+        Returns:
+            N/A
+        """
+
+        key = record["k"]
+        if record.get("forget"):
+            self._transfers.pop(key, None)
+            return
+
+        if record.get("done"):
+            self._transfers[key] = {
+                "v": record["v"], "done": True, "ps": None, "uid": None, "parts": {}
+            }
+            return
+
+        transfer = self._transfers.get(key)
+        if not transfer or transfer["done"] or\
+                (transfer["v"], transfer["ps"], transfer["uid"]) !=\
+                (record["v"], record["ps"], record["uid"]):
+            transfer = self._transfers[key] = {
+                "v": record["v"], "done": False, "ps": record["ps"],
+                "uid": record["uid"], "parts": {},
+            }
+        transfer["parts"].update(
+            (part_number, part_etag) for part_number, part_etag in record["p"]
+        )
+
+    def _flush_if_due(self):
+        """
+        Purpose:
+            Flush the buffered records if enough are waiting or the save interval
+            has passed
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        with self._lock:
+            flush_due = len(self._pending_records) >= self.max_pending or\
+                time.monotonic() - self._last_flush >= self.save_interval
+
+        if flush_due:
+            self.flush()
+
+
+class TransferJob(object):
+    """
+        TransferJob Class. Bulk download or upload run on a thread pool that
+        records its progress in a TransferCheckpoint. Rerunning a job with the
+        same checkpoint file skips the objects it already finished and resumes
+        ranged downloads and multipart uploads from their completed parts
+    """
+
+    def __init__(
+        self, minio_client, checkpoint_filename, max_workers=8,
+        ranged_min_size=4 * DEFAULT_RANGE_PART_SIZE,
+        range_part_size=DEFAULT_RANGE_PART_SIZE,
+        upload_part_size=DEFAULT_UPLOAD_PART_SIZE, retry_policy=None,
+        save_interval=DEFAULT_CHECKPOINT_SAVE_INTERVAL
+    ):
+        """
+        Purpose:
+            Initilize the TransferJob Class.
+        Args:
+            minio_client (minio client Obj): Client obj connection to Minio
+            checkpoint_filename (String): Location of the checkpoint file
+            max_workers (Int): Number of objects transferred at once (Defaults
+                to 8)
+            ranged_min_size (Int): Size from which objects are downloaded in
+                resumable ranges (Defaults to 64MiB)
+            range_part_size (Int): Size of each range of a ranged download
+                (Defaults to 16MiB)
+            upload_part_size (Int): Multipart part size for large files
+                (Defaults to 16MiB)
+            retry_policy (minio_retry_helpers.RetryPolicy): Policy to retry
+                downloads under (Defaults to no retries)
+            save_interval (Float): Max seconds checkpoint records are buffered
+                (Defaults to 5)
+        Returns:
+            N/A
+        """
+
+        self.minio_client = minio_client
+        self.max_workers = max_workers
+        self.ranged_min_size = ranged_min_size
+        self.range_part_size = range_part_size
+        self.upload_part_size = upload_part_size
+        self.retry_policy = retry_policy
+        self.checkpoint = TransferCheckpoint(
+            checkpoint_filename, save_interval=save_interval
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def download_objects(self, bucket_name, objects, download_dir="."):
+        """
+        Purpose:
+            Download objects that are not already downloaded at their current
+            ETag. Pass the Object OBJs of a listing (such as iter_objects with
+            recursive=True) to avoid stat'ing each object for its ETag and size
+        Args:
+            bucket_name (String): Name of the bucket to get objects from
+            objects (Iterable of Strings or Object Objs): Objects to download
+            download_dir (String): Directory to download objects into (Defaults
+                to ".")
+        Returns:
+            download_results (List of Dicts): Dict per object with object_name,
+                filename, size, skipped, and error (None if the download
+                succeeded or was skipped)
+        """
+        logging.info(f"Running Download Job from {bucket_name} to {download_dir}")
+
+        def get_download_work_items():
+            for minio_object in objects:
+                if getattr(minio_object, "is_dir", False):
+                    continue
+                yield minio_object
+
+        def download_work_item(minio_object):
+            object_name = getattr(minio_object, "object_name", minio_object)
+            object_etag = getattr(minio_object, "etag", None)
+            object_size = getattr(minio_object, "size", None)
+            if object_etag is None or object_size is None:
+                object_stats = get_object_stats(
+                    self.minio_client, bucket_name, object_name,
+                    retry_policy=self.retry_policy,
+                )
+                object_etag, object_size = object_stats["etag"], object_stats["size"]
+
+            checkpoint_key = f"{bucket_name}/{object_name}"
+            filename = os.path.join(download_dir, object_name)
+            if self.checkpoint.is_completed(checkpoint_key, object_etag) and\
+                    os.path.exists(filename):
+                return True
+
+            if object_size >= self.ranged_min_size:
+                download_object_to_file_ranged(
+                    self.minio_client, bucket_name, object_name, filename=filename,
+                    part_size=self.range_part_size, max_workers=1,
+                    retry_policy=self.retry_policy, checkpoint=self.checkpoint,
+                    checkpoint_key=checkpoint_key,
+                )
+            else:
+                download_object_to_file(
+                    self.minio_client, bucket_name, object_name, filename=filename,
+                    retry_policy=self.retry_policy,
+                )
+            self.checkpoint.record_completed(checkpoint_key, object_etag)
+            return False
+
+        download_results = []
+        for minio_object, skipped, error in iter_pool_results(
+            download_work_item, get_download_work_items(),
+            max_workers=self.max_workers,
+        ):
+            object_name = getattr(minio_object, "object_name", minio_object)
+            download_results.append(
+                {
+                    "object_name": object_name,
+                    "filename": os.path.join(download_dir, object_name),
+                    "size": getattr(minio_object, "size", None),
+                    "skipped": bool(skipped),
+                    "error": error,
+                }
+            )
+
+        self.checkpoint.flush()
+        _log_job_results("Download", download_results)
+
+        return download_results
+
+    def upload_directory(self, bucket_name, directory, prefix=""):
+        """
+        Purpose:
+            Upload the files of a local directory tree that have not already been
+            uploaded at their current size and modification time. Object names
+            are the file paths relative to directory (with "/" separators) under
+            the directory prefix, as with minio_object_helpers.upload_directory
+        Args:
+            bucket_name (String): Name of the bucket to upload objects to
+            directory (String): Local directory to upload
+            prefix (String): Directory to put every object under (Defaults to
+                the root of the bucket)
+        Returns:
+            upload_results (List of Dicts): Dict per file with filename,
+                object_name, skipped, and error (None if the upload succeeded or
+                was skipped)
+        """
+        logging.info(f"Running Upload Job from {directory} to {bucket_name}/{prefix}")
+
+        def upload_work_item(work_item):
+            local_filename, object_name = work_item
+
+            checkpoint_key = f"{bucket_name}/{object_name}"
+            file_version = get_file_version(local_filename)
+            if self.checkpoint.is_completed(checkpoint_key, file_version):
+                return True
+
+            upload_object(
+                self.minio_client, bucket_name, local_filename,
+                object_name=object_name, part_size=self.upload_part_size,
+                max_workers=1, checkpoint=self.checkpoint,
+                checkpoint_key=checkpoint_key,
+            )
+            self.checkpoint.record_completed(checkpoint_key, file_version)
+            return False
+
+        upload_results = []
+        for (local_filename, object_name), skipped, error in iter_pool_results(
+            upload_work_item, iter_directory_files(directory, prefix),
+            max_workers=self.max_workers
+        ):
+            upload_results.append(
+                {
+                    "filename": local_filename,
+                    "object_name": object_name,
+                    "skipped": bool(skipped),
+                    "error": error,
+                }
+            )
+
+        self.checkpoint.flush()
+        _log_job_results("Upload", upload_results)
+
+        return upload_results
+
+    def close(self):
+        """
+        Purpose:
+            Compact and close the checkpoint of the job
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        self.checkpoint.close()
+
+
+###
+# Transfer Helpers
+###
+
+
+def _merge_part_records(records):
+    """
+    Purpose:
+        Merge consecutive part records of the same transfer into one record, so a
+        batch of ranges of one object is appended as a single line
+    Args:
+        records (List of Dicts): Checkpoint records in the order they were made
+    Returns:
+        merged_records (List of Dicts): Equivalent records
+    """
+
+    merged_records = []
+    for record in records:
+        if "p" not in record:
+            merged_records.append(record)
+            continue
+
+        transfer_id = (record["k"], record["v"], record["ps"], record["uid"])
+        last_record = merged_records[-1] if merged_records else {}
+        if "p" in last_record and transfer_id ==\
+                (last_record["k"], last_record["v"], last_record["ps"],
+                 last_record["uid"]):
+            last_record["p"].extend(record["p"])
+        else:
+            merged_records.append(dict(record, p=list(record["p"])))
+
+    return merged_records
+
+
+def _get_transfer_record(key, transfer):
+    """
+    Purpose:
+        Build the single record a transfer is compacted to
+    Args:
+        key (String): Key of the transfer
+        transfer (Dict): In-memory state of the transfer
+    Returns:
+        record (Dict): Checkpoint record
+    """
+
+    if transfer["done"]:
+        return {"k": key, "v": transfer["v"], "done": True}
+
+    return {
+        "k": key, "v": transfer["v"], "ps": transfer["ps"], "uid": transfer["uid"],
+        "p": [
+            [part_number, transfer["parts"][part_number]]
+            for part_number in sorted(transfer["parts"])
+        ],
+    }
+
+
+def _log_job_results(job_type, job_results):
+    """
+    Purpose:
+        Log how many transfers of a job finished, were skipped, and failed
+    Args:
+        job_type (String): "Download" or "Upload"
+        job_results (List of Dicts): Results with skipped and error
+    Returns:
+        N/A
+    """
+
+    skipped_transfers = sum(1 for result in job_results if result["skipped"])
+    failed_transfers = sum(1 for result in job_results if result["error"])
+    logging.info(
+        f"{job_type} Job Transferred "
+        f"{len(job_results) - skipped_transfers - failed_transfers}, Skipped "
+        f"{skipped_transfers} Already Finished, {failed_transfers} Failed"
+    )
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Fixtures shared by the test files that run the helpers end to end
+        against the in-process FakeS3Server
+"""
+
+# Python Library Imports
+import pytest
+
+# Local Library Imports
+from minio_helpers import minio_connection_helpers
+from minio_helpers.tests.fake_s3_server import FakeS3Server
+
+
+###
+# Fixtures
+###
+
+
+@pytest.fixture
+def fake_s3_server():
+    """
+    Purpose:
+        Running FakeS3Server, stopped after the test
+    """
+
+    with FakeS3Server() as fake_s3_server:
+        yield fake_s3_server
+
+
+@pytest.fixture
+def connect_to_fake_s3_server():
+    """
+    Purpose:
+        Function connecting an unshared Minio client (without retries) to a
+        fake server, called as connect(fake_s3_server, access_key="access")
+    """
+
+    def connect(fake_s3_server, access_key="access", secret_key="secret"):
+        return minio_connection_helpers.connect_to_minio(
+            fake_s3_server.minio_url, access_key, secret_key, shared=False,
+            max_retries=0,
+        )
+
+    return connect
+
+
+@pytest.fixture
+def minio_client(fake_s3_server, connect_to_fake_s3_server):
+    """
+    Purpose:
+        Minio client connected to the fake server
+    """
+
+    return connect_to_fake_s3_server(fake_s3_server)
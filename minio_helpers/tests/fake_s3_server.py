@@ -0,0 +1,661 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        In-process S3-compatible server for tests and benchmarks.
+
+        Serves the subset of the S3 API used by the minio lib and minio_helpers
+        (buckets, listings, stat/get/put/delete of objects, ranged reads,
+        conditional requests, multi-object delete, server-side copies, and
+        multipart uploads) from
+        memory over real HTTP, so helpers can be exercised end to end without a
+        Minio server. Requests are not authenticated
+"""
+
+# Python Library Imports
+import hashlib
+import threading
+import time
+import uuid
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+
+###
+# Constants
+###
+
+
+S3_XMLNS = "http://s3.amazonaws.com/doc/2006-03-01/"
+
+
+###
+# Fake Server
+###
+
+
+class FakeS3Server(object):
+    """
+        FakeS3Server Class. Threaded HTTP server holding buckets and objects in
+        memory. Use as a context manager, or call start and stop
+    """
+
+    def __init__(self, host="127.0.0.1", port=0):
+        """
+        Purpose:
+            Initilize the FakeS3Server Class.
+        Args:
+            host (String): Host to listen on (Defaults to 127.0.0.1)
+            port (Int): Port to listen on (Defaults to a free port)
+        Returns:
+            N/A
+        """
+
+        self.buckets = {}
+        self.uploads = {}
+        self.request_count = 0
+        self.lock = threading.Lock()
+
+        self._http_server = ThreadingHTTPServer((host, port), FakeS3RequestHandler)
+        self._http_server.daemon_threads = True
+        self._http_server.fake_s3_server = self
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def minio_host(self):
+        return self._http_server.server_address[0]
+
+    @property
+    def minio_port(self):
+        return self._http_server.server_address[1]
+
+    @property
+    def minio_url(self):
+        return f"{self.minio_host}:{self.minio_port}"
+
+    def start(self):
+        """
+        Purpose:
+            Serve requests on a background thread
+        Args:
+            N/A
+        Returns:
+            fake_s3_server (FakeS3Server): The started server
+        """
+
+        self._thread = threading.Thread(
+            target=self._http_server.serve_forever, daemon=True
+        )
+        self._thread.start()
+
+        return self
+
+    def stop(self):
+        """
+        Purpose:
+            Stop serving requests and close the listening socket
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        self._http_server.shutdown()
+        self._http_server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def put_object(self, bucket_name, object_name, data, content_type=None,
+                   metadata=None, etag=None):
+        """
+        Purpose:
+            Store an object directly, creating the bucket if needed
+        Args:
+            bucket_name (String): Name of the bucket
+            object_name (String): Name of the object
+            data (Bytes): Contents of the object
+            content_type (String): Content type of the object (Defaults to
+                application/octet-stream)
+            metadata (Dict): x-amz-meta-* headers of the object
+            etag (String): ETag of the object (Defaults to the MD5 of data)
+        Returns:
+            etag (String): ETag of the object
+        """
+
+        etag = etag or hashlib.md5(data).hexdigest()
+        with self.lock:
+            self.buckets.setdefault(bucket_name, {})[object_name] = {
+                "data": bytes(data),
+                "etag": etag,
+                "content_type": content_type or "application/octet-stream",
+                "metadata": metadata or {},
+                "last_modified": time.time(),
+            }
+
+        return etag
+
+
+class FakeS3RequestHandler(BaseHTTPRequestHandler):
+    """
+        FakeS3RequestHandler Class. Handles one connection to the FakeS3Server
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.handle_s3_request("GET")
+
+    def do_HEAD(self):
+        self.handle_s3_request("HEAD")
+
+    def do_PUT(self):
+        self.handle_s3_request("PUT")
+
+    def do_POST(self):
+        self.handle_s3_request("POST")
+
+    def do_DELETE(self):
+        self.handle_s3_request("DELETE")
+
+    ###
+    # Routing
+    ###
+
+    def handle_s3_request(self, method):
+        """
+        Purpose:
+            Route a request to the bucket or object handler
+        Args:
+            method (String): HTTP method of the request
+        Returns:
+            N/A
+        """
+
+        self.fake_s3_server = self.server.fake_s3_server
+        with self.fake_s3_server.lock:
+            self.fake_s3_server.request_count += 1
+
+        split_url = urlsplit(self.path)
+        self.query = {
+            key: values[0] for key, values in
+            parse_qs(split_url.query, keep_blank_values=True).items()
+        }
+        bucket_name, _, object_name = unquote(split_url.path).lstrip("/").partition("/")
+
+        content_length = int(self.headers.get("Content-Length") or 0)
+        self.body = self.rfile.read(content_length) if content_length else b""
+
+        if not bucket_name:
+            return self.list_buckets()
+        if not object_name:
+            return self.handle_bucket_request(method, bucket_name)
+        return self.handle_object_request(method, bucket_name, object_name)
+
+    def handle_bucket_request(self, method, bucket_name):
+        """
+        Purpose:
+            Handle a request on a bucket
+        Args:
+            method (String): HTTP method of the request
+            bucket_name (String): Name of the bucket
+        Returns:
+            N/A
+        """
+
+        buckets = self.fake_s3_server.buckets
+
+        if method == "PUT":
+            if bucket_name in buckets:
+                return self.send_error_xml(409, "BucketAlreadyOwnedByYou", bucket_name)
+            buckets[bucket_name] = {}
+            return self.send_xml(200, "")
+        if bucket_name not in buckets:
+            return self.send_error_xml(404, "NoSuchBucket", bucket_name)
+
+        if method == "HEAD":
+            return self.send_xml(200, "")
+        if method == "DELETE":
+            if buckets[bucket_name]:
+                return self.send_error_xml(409, "BucketNotEmpty", bucket_name)
+            del buckets[bucket_name]
+            return self.send_xml(204, "")
+        if method == "POST" and "delete" in self.query:
+            return self.delete_objects(bucket_name)
+        if "location" in self.query:
+            return self.send_xml(
+                200, f'<LocationConstraint xmlns="{S3_XMLNS}"></LocationConstraint>'
+            )
+        return self.list_objects(bucket_name)
+
+    def handle_object_request(self, method, bucket_name, object_name):
+        """
+        Purpose:
+            Handle a request on an object
+        Args:
+            method (String): HTTP method of the request
+            bucket_name (String): Name of the bucket
+            object_name (String): Name of the object
+        Returns:
+            N/A
+        """
+
+        if bucket_name not in self.fake_s3_server.buckets:
+            return self.send_error_xml(404, "NoSuchBucket", bucket_name)
+        bucket = self.fake_s3_server.buckets[bucket_name]
+
+        if "uploads" in self.query or "uploadId" in self.query:
+            return self.handle_multipart_request(method, bucket_name, object_name)
+        if method == "PUT" and "x-amz-copy-source" in self.headers:
+            return self.copy_object(bucket_name, object_name)
+        if method == "PUT":
+            etag = self.fake_s3_server.put_object(
+                bucket_name,
+                object_name,
+                self.body,
+                content_type=self.headers.get("Content-Type"),
+                metadata=self.get_metadata_headers(),
+            )
+            return self.send_xml(200, "", headers={"ETag": f'"{etag}"'})
+        if method == "DELETE":
+            bucket.pop(object_name, None)
+            return self.send_xml(204, "")
+
+        s3_object = bucket.get(object_name)
+        if s3_object is None:
+            return self.send_error_xml(404, "NoSuchKey", bucket_name, object_name)
+
+        object_headers = {
+            "ETag": f'"{s3_object["etag"]}"',
+            "Last-Modified": formatdate(s3_object["last_modified"], usegmt=True),
+            "Content-Type": s3_object["content_type"],
+            "Accept-Ranges": "bytes",
+            **s3_object["metadata"],
+        }
+        if self.headers.get("If-None-Match", "").strip('"') == s3_object["etag"]:
+            return self.send_body(304, b"", object_headers, content_length=False)
+
+        object_data = s3_object["data"]
+        status = 200
+        range_header = self.headers.get("Range")
+        if range_header:
+            first_byte, last_byte = range_header[len("bytes="):].split("-")
+            last_byte = min(
+                int(last_byte) if last_byte else len(object_data) - 1,
+                len(object_data) - 1,
+            )
+            object_headers["Content-Range"] = \
+                f"bytes {first_byte}-{last_byte}/{len(object_data)}"
+            object_data = object_data[int(first_byte):last_byte + 1]
+            status = 206
+
+        if method == "HEAD":
+            object_headers["Content-Length"] = str(len(object_data))
+            return self.send_body(status, b"", object_headers, content_length=False)
+        return self.send_body(status, object_data, object_headers)
+
+    ###
+    # Bucket Operations
+    ###
+
+    def list_buckets(self):
+        """
+        Purpose:
+            List all buckets
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        buckets = "".join(
+            f"<Bucket><Name>{escape(bucket_name)}</Name>"
+            "<CreationDate>2020-01-01T00:00:00.000Z</CreationDate></Bucket>"
+            for bucket_name in sorted(self.fake_s3_server.buckets)
+        )
+        self.send_xml(
+            200,
+            f'<ListAllMyBucketsResult xmlns="{S3_XMLNS}"><Buckets>{buckets}</Buckets>'
+            "</ListAllMyBucketsResult>",
+        )
+
+    def list_objects(self, bucket_name):
+        """
+        Purpose:
+            List objects in a bucket (ListObjectsV2), grouping names past the
+            delimiter into common prefixes
+        Args:
+            bucket_name (String): Name of the bucket
+        Returns:
+            N/A
+        """
+
+        bucket = self.fake_s3_server.buckets[bucket_name]
+        prefix = self.query.get("prefix", "")
+        delimiter = self.query.get("delimiter", "")
+        max_keys = int(self.query.get("max-keys", 1000))
+        start_after = self.query.get(
+            "continuation-token", self.query.get("start-after", "")
+        )
+
+        contents = []
+        common_prefixes = []
+        next_token = None
+        last_name = start_after
+        for object_name in sorted(bucket):
+            if not object_name.startswith(prefix) or object_name <= start_after:
+                continue
+            if len(contents) + len(common_prefixes) == max_keys:
+                next_token = last_name
+                break
+
+            delimiter_index = object_name.find(delimiter, len(prefix)) \
+                if delimiter else -1
+            if delimiter_index >= 0:
+                common_prefix = object_name[:delimiter_index + len(delimiter)]
+                if common_prefix not in common_prefixes:
+                    common_prefixes.append(common_prefix)
+                last_name = common_prefix + "\U0010ffff"
+                continue
+
+            s3_object = bucket[object_name]
+            last_modified = time.strftime(
+                "%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(s3_object["last_modified"])
+            )
+            contents.append(
+                f"<Contents><Key>{escape(object_name)}</Key>"
+                f"<LastModified>{last_modified}</LastModified>"
+                f"<ETag>\"{s3_object['etag']}\"</ETag>"
+                f"<Size>{len(s3_object['data'])}</Size>"
+                "<StorageClass>STANDARD</StorageClass></Contents>"
+            )
+            last_name = object_name
+
+        continuation = (
+            f"<NextContinuationToken>{escape(next_token)}</NextContinuationToken>"
+            if next_token else ""
+        )
+        prefixes = "".join(
+            f"<CommonPrefixes><Prefix>{escape(common_prefix)}</Prefix>"
+            "</CommonPrefixes>"
+            for common_prefix in common_prefixes
+        )
+        self.send_xml(
+            200,
+            f'<ListBucketResult xmlns="{S3_XMLNS}"><Name>{escape(bucket_name)}</Name>'
+            f"<Prefix>{escape(prefix)}</Prefix><MaxKeys>{max_keys}</MaxKeys>"
+            f"<IsTruncated>{'true' if next_token else 'false'}</IsTruncated>"
+            f"{continuation}{''.join(contents)}{prefixes}</ListBucketResult>",
+        )
+
+    def delete_objects(self, bucket_name):
+        """
+        Purpose:
+            Delete the objects named in a multi-object delete request
+        Args:
+            bucket_name (String): Name of the bucket
+        Returns:
+            N/A
+        """
+
+        bucket = self.fake_s3_server.buckets[bucket_name]
+        for key in ElementTree.fromstring(self.body).iter():
+            if key.tag.rsplit("}", 1)[-1] == "Key":
+                bucket.pop(key.text, None)
+
+        self.send_xml(200, f'<DeleteResult xmlns="{S3_XMLNS}"></DeleteResult>')
+
+    ###
+    # Copy Operations
+    ###
+
+    def copy_object(self, bucket_name, object_name):
+        """
+        Purpose:
+            Copy the object named by the x-amz-copy-source header, keeping its
+            content type and metadata unless the request replaces them
+        Args:
+            bucket_name (String): Name of the bucket to copy to
+            object_name (String): Name of the object to copy to
+        Returns:
+            N/A
+        """
+
+        source_object = self.get_copy_source()
+        if source_object is None:
+            return self.send_error_xml(404, "NoSuchKey", bucket_name, object_name)
+
+        content_type = source_object["content_type"]
+        metadata = source_object["metadata"]
+        if self.headers.get("x-amz-metadata-directive") == "REPLACE":
+            content_type = self.headers.get("Content-Type")
+            metadata = self.get_metadata_headers()
+
+        etag = self.fake_s3_server.put_object(
+            bucket_name,
+            object_name,
+            source_object["data"],
+            content_type=content_type,
+            metadata=metadata,
+        )
+        self.send_xml(
+            200,
+            f'<CopyObjectResult xmlns="{S3_XMLNS}">'
+            f"<LastModified>{self.get_timestamp()}</LastModified>"
+            f'<ETag>"{etag}"</ETag></CopyObjectResult>',
+        )
+
+    def get_copy_source(self):
+        """
+        Purpose:
+            Get the object named by the x-amz-copy-source header of the request
+        Args:
+            N/A
+        Returns:
+            source_object (Dict): Stored object (None if it doesn't exist)
+        """
+
+        source_bucket_name, _, source_object_name = unquote(
+            self.headers["x-amz-copy-source"]
+        ).lstrip("/").partition("/")
+
+        return self.fake_s3_server.buckets.get(source_bucket_name, {}).get(
+            source_object_name
+        )
+
+    ###
+    # Multipart Operations
+    ###
+
+    def handle_multipart_request(self, method, bucket_name, object_name):
+        """
+        Purpose:
+            Create, upload a part of, complete, or abort a multipart upload
+        Args:
+            method (String): HTTP method of the request
+            bucket_name (String): Name of the bucket
+            object_name (String): Name of the object
+        Returns:
+            N/A
+        """
+
+        uploads = self.fake_s3_server.uploads
+
+        if method == "POST" and "uploads" in self.query:
+            upload_id = uuid.uuid4().hex
+            uploads[upload_id] = {
+                "parts": {},
+                "content_type": self.headers.get("Content-Type"),
+                "metadata": self.get_metadata_headers(),
+            }
+            return self.send_xml(
+                200,
+                f'<InitiateMultipartUploadResult xmlns="{S3_XMLNS}">'
+                f"<Bucket>{escape(bucket_name)}</Bucket>"
+                f"<Key>{escape(object_name)}</Key><UploadId>{upload_id}</UploadId>"
+                "</InitiateMultipartUploadResult>",
+            )
+
+        upload = uploads.get(self.query["uploadId"])
+        if upload is None:
+            return self.send_error_xml(404, "NoSuchUpload", bucket_name, object_name)
+
+        if method == "PUT" and "x-amz-copy-source" in self.headers:
+            source_object = self.get_copy_source()
+            if source_object is None:
+                return self.send_error_xml(404, "NoSuchKey", bucket_name, object_name)
+
+            part_data = source_object["data"]
+            copy_range = self.headers.get("x-amz-copy-source-range")
+            if copy_range:
+                first_byte, last_byte = copy_range[len("bytes="):].split("-")
+                part_data = part_data[int(first_byte):int(last_byte) + 1]
+            etag = hashlib.md5(part_data).hexdigest()
+            upload["parts"][int(self.query["partNumber"])] = (part_data, etag)
+            return self.send_xml(
+                200,
+                f'<CopyPartResult xmlns="{S3_XMLNS}">'
+                f"<LastModified>{self.get_timestamp()}</LastModified>"
+                f'<ETag>"{etag}"</ETag></CopyPartResult>',
+            )
+        if method == "PUT":
+            etag = hashlib.md5(self.body).hexdigest()
+            upload["parts"][int(self.query["partNumber"])] = (self.body, etag)
+            return self.send_xml(200, "", headers={"ETag": f'"{etag}"'})
+        if method == "DELETE":
+            del uploads[self.query["uploadId"]]
+            return self.send_xml(204, "")
+
+        part_numbers = [
+            int(element.text) for element in ElementTree.fromstring(self.body).iter()
+            if element.tag.rsplit("}", 1)[-1] == "PartNumber"
+        ]
+        parts = [upload["parts"][part_number] for part_number in part_numbers]
+        etag = hashlib.md5(
+            b"".join(bytes.fromhex(part_etag) for _, part_etag in parts)
+        ).hexdigest() + f"-{len(parts)}"
+        self.fake_s3_server.put_object(
+            bucket_name,
+            object_name,
+            b"".join(part_data for part_data, _ in parts),
+            content_type=upload["content_type"],
+            metadata=upload["metadata"],
+            etag=etag,
+        )
+        del uploads[self.query["uploadId"]]
+
+        self.send_xml(
+            200,
+            f'<CompleteMultipartUploadResult xmlns="{S3_XMLNS}">'
+            f"<Location>/{escape(bucket_name)}/{escape(object_name)}</Location>"
+            f"<Bucket>{escape(bucket_name)}</Bucket><Key>{escape(object_name)}</Key>"
+            f'<ETag>"{etag}"</ETag></CompleteMultipartUploadResult>',
+        )
+
+    ###
+    # Response Helpers
+    ###
+
+    def get_metadata_headers(self):
+        """
+        Purpose:
+            Get the x-amz-meta-* headers of the request
+        Args:
+            N/A
+        Returns:
+            metadata (Dict): Metadata headers
+        """
+
+        return {
+            key: value for key, value in self.headers.items()
+            if key.lower().startswith("x-amz-meta-")
+        }
+
+    def get_timestamp(self):
+        """
+        Purpose:
+            Get the current time in the format of S3 XML responses
+        Args:
+            N/A
+        Returns:
+            timestamp (String): Current time, such as 2020-01-01T00:00:00.000Z
+        """
+
+        return time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())
+
+    def send_body(self, status, body, headers=None, content_length=True):
+        """
+        Purpose:
+            Send a response
+        Args:
+            status (Int): HTTP status
+            body (Bytes): Body of the response
+            headers (Dict): Headers of the response
+            content_length (Boolean): Send a Content-Length of the body (Defaults
+                to True)
+        Returns:
+            N/A
+        """
+
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        if content_length:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def send_xml(self, status, xml, headers=None):
+        """
+        Purpose:
+            Send an XML response
+        Args:
+            status (Int): HTTP status
+            xml (String): Body of the response
+            headers (Dict): Headers of the response
+        Returns:
+            N/A
+        """
+
+        self.send_body(
+            status,
+            xml.encode("utf-8"),
+            {"Content-Type": "application/xml", **(headers or {})},
+            content_length=self.command != "HEAD" or not xml,
+        )
+
+    def send_error_xml(self, status, code, bucket_name, object_name=None):
+        """
+        Purpose:
+            Send an S3 error response (without a body for HEAD requests, as S3
+            does)
+        Args:
+            status (Int): HTTP status
+            code (String): S3 error code
+            bucket_name (String): Name of the bucket
+            object_name (String): Name of the object
+        Returns:
+            N/A
+        """
+
+        if self.command == "HEAD":
+            return self.send_body(status, b"")
+
+        self.send_xml(
+            status,
+            f"<Error><Code>{code}</Code><Message>{code}</Message>"
+            f"<BucketName>{escape(bucket_name)}</BucketName>"
+            f"<Key>{escape(object_name or '')}</Key></Error>",
+        )
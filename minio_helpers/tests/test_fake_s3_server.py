@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Test File for fake_s3_server.py, exercising the helpers end to end
+        against it with the minio lib
+"""
+
+# Python Library Imports
+import pytest
+from minio.error import NoSuchKey
+
+# Import File to Test
+from minio_helpers import minio_bucket_helpers
+from minio_helpers import minio_cache_helpers
+from minio_helpers import minio_object_helpers
+
+
+###
+# Test Payload
+###
+
+
+def test_bucket_and_object_round_trip(fake_s3_server, minio_client, tmp_path):
+    """
+    Purpose:
+        Buckets and objects are created, listed, stat'd, read, and deleted
+    """
+
+    minio_bucket_helpers.create_bucket(minio_client, "bucket")
+    assert minio_bucket_helpers.get_bucket_names(minio_client) == ["bucket"]
+
+    for idx in range(3):
+        upload_file = tmp_path / f"{idx}.json"
+        upload_file.write_text(f'{{"idx": {idx}}}')
+        minio_object_helpers.upload_object(
+            minio_client, "bucket", str(upload_file), object_name=f"a/{idx}.json"
+        )
+    fake_s3_server.put_object("bucket", "b/c.txt", b"hello")
+
+    assert minio_object_helpers.get_object_names(
+        minio_client, "bucket", recursive=True
+    ) == ["a/0.json", "a/1.json", "a/2.json", "b/c.txt"]
+    assert [
+        minio_object.object_name
+        for minio_object in minio_object_helpers.get_objects(minio_client, "bucket")
+    ] == ["a/", "b/"]
+
+    object_stats = minio_object_helpers.get_object_stats(
+        minio_client, "bucket", "b/c.txt"
+    )
+    assert object_stats["size"] == 5
+    assert minio_object_helpers.download_object_to_memory(
+        minio_client, "bucket", "a/1.json"
+    ) == {"idx": 1}
+    assert minio_cache_helpers.revalidate_object_stats(
+        minio_client, "bucket", "b/c.txt", object_stats["etag"]
+    ) is None
+
+    minio_object_helpers.delete_objects(
+        minio_client, "bucket", [f"a/{idx}.json" for idx in range(3)]
+    )
+    minio_object_helpers.delete_object(minio_client, "bucket", "b/c.txt")
+    with pytest.raises(NoSuchKey):
+        minio_client.stat_object("bucket", "b/c.txt")
+    minio_bucket_helpers.delete_bucket(minio_client, "bucket")
+    assert fake_s3_server.buckets == {}
+
+
+def test_multipart_and_ranged_transfers(fake_s3_server, minio_client, tmp_path):
+    """
+    Purpose:
+        Multipart uploads are assembled and ranged downloads are reassembled
+    """
+
+    fake_s3_server.buckets["bucket"] = {}
+    object_data = bytes(range(256)) * (6 * 1024 * 1024 // 256 + 7)
+    upload_file = tmp_path / "large.bin"
+    upload_file.write_bytes(object_data)
+
+    etag = minio_object_helpers.upload_object(
+        minio_client, "bucket", str(upload_file), object_name="large.bin",
+        part_size=5 * 1024 * 1024,
+    )
+    assert etag.endswith("-2")
+    assert fake_s3_server.buckets["bucket"]["large.bin"]["data"] == object_data
+    assert fake_s3_server.uploads == {}
+
+    download_file = tmp_path / "download" / "large.bin"
+    minio_object_helpers.download_object_to_file(
+        minio_client, "bucket", "large.bin", filename=str(download_file),
+        ranged=True, part_size=1024 * 1024, max_workers=4,
+    )
+    assert download_file.read_bytes() == object_data
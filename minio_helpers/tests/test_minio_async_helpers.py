@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Test File for minio_async_helpers.py
+"""
+
+# Python Library Imports
+import asyncio
+import hashlib
+import pytest
+from urllib.parse import parse_qs, unquote, urlsplit
+from xml.etree import ElementTree
+
+# Import File to Test
+from minio_helpers import minio_async_helpers
+from minio_helpers.minio_exceptions import BucketAlreadyExists, ObjectDoesntExist
+
+
+S3_XMLNS = 'xmlns="http://s3.amazonaws.com/doc/2006-03-01/"'
+
+
+###
+# Fixtures
+###
+
+
+@pytest.fixture
+def fake_session():
+    """
+    Purpose:
+        In-memory S3 session holding a bucket with a few objects
+    """
+
+    return FakeS3Session(
+        {"bucket": {f"a/{idx}.json": b'{"idx": %d}' % idx for idx in range(5)}}
+    )
+
+
+@pytest.fixture
+def async_client(fake_session):
+    """
+    Purpose:
+        AsyncMinioClient sending requests to the fake session
+    """
+
+    return minio_async_helpers.AsyncMinioClient(
+        "localhost:9000", access_key="access", secret_key="secret",
+        session=fake_session
+    )
+
+
+###
+# Mocked Functions
+###
+
+
+class FakeResponse(object):
+    """
+    Purpose:
+        aiohttp-like response returned by FakeS3Session
+    """
+
+    def __init__(self, status, data=b"", headers=None):
+        self.status = status
+        self.reason = "Fake"
+        self.headers = headers or {}
+        self.data = data
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+    async def read(self):
+        return self.data
+
+
+class FakeS3Session(object):
+    """
+    Purpose:
+        aiohttp-like session serving a small subset of the S3 API from a Dict of
+        bucket name to Dict of object name to bytes. Listings return two keys per
+        page so continuation tokens are exercised
+    """
+
+    page_size = 2
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.requests = []
+
+    def request(self, method, url, headers=None, data=None):
+        self.requests.append((method, str(url), headers))
+        assert headers["authorization"].startswith(
+            "AWS4-HMAC-SHA256 Credential=access/"
+        )
+
+        split_url = urlsplit(str(url))
+        query = {key: values[0] for key, values in parse_qs(
+            split_url.query, keep_blank_values=True
+        ).items()}
+        path = unquote(split_url.path).lstrip("/")
+        bucket_name, _, object_name = path.partition("/")
+
+        if not bucket_name:
+            buckets = "".join(
+                f"<Bucket><Name>{name}</Name>"
+                f"<CreationDate>2020-01-01T00:00:00.000Z</CreationDate></Bucket>"
+                for name in sorted(self.buckets)
+            )
+            return FakeResponse(
+                200, f"<ListAllMyBucketsResult {S3_XMLNS}><Buckets>{buckets}</Buckets>"
+                "</ListAllMyBucketsResult>".encode()
+            )
+        if method == "PUT" and not object_name:
+            self.buckets[bucket_name] = {}
+            return FakeResponse(200)
+        if bucket_name not in self.buckets:
+            return FakeResponse(404)
+        bucket = self.buckets[bucket_name]
+
+        if not object_name:
+            if method == "HEAD":
+                return FakeResponse(200)
+            if method == "DELETE":
+                del self.buckets[bucket_name]
+                return FakeResponse(204)
+            if method == "POST":
+                errors = ""
+                for key in ElementTree.fromstring(data).iter("Key"):
+                    if key.text.startswith("locked"):
+                        errors += f"<Error><Key>{key.text}</Key><Code>AccessDenied"\
+                            "</Code><Message>Locked</Message></Error>"
+                    else:
+                        bucket.pop(key.text, None)
+                return FakeResponse(
+                    200, f"<DeleteResult {S3_XMLNS}>{errors}</DeleteResult>".encode()
+                )
+            return self.list_objects(bucket_name, bucket, query)
+
+        if method == "PUT":
+            bucket[object_name] = bytes(data)
+            return FakeResponse(
+                200, headers={"etag": f'"{hashlib.md5(data).hexdigest()}"'}
+            )
+        if method == "DELETE":
+            bucket.pop(object_name, None)
+            return FakeResponse(204)
+        if object_name not in bucket:
+            return FakeResponse(404)
+
+        object_data = bucket[object_name]
+        object_headers = {
+            "content-length": str(len(object_data)),
+            "content-type": "application/octet-stream",
+            "etag": f'"{hashlib.md5(object_data).hexdigest()}"',
+            "last-modified": "Wed, 01 Jan 2020 00:00:00 GMT",
+        }
+        if method == "HEAD":
+            return FakeResponse(200, headers=object_headers)
+        if "range" in headers:
+            first_byte, last_byte = headers["range"][len("bytes="):].split("-")
+            object_data = object_data[
+                int(first_byte):int(last_byte) + 1 if last_byte else None
+            ]
+            return FakeResponse(206, object_data, object_headers)
+        return FakeResponse(200, object_data, object_headers)
+
+    def list_objects(self, bucket_name, bucket, query):
+        names = sorted(
+            name for name in bucket
+            if name.startswith(query["prefix"])
+            and name > query.get("continuation-token", query.get("start-after", ""))
+        )
+        page, remaining = names[:self.page_size], names[self.page_size:]
+        contents = "".join(
+            f"<Contents><Key>{name}</Key><Size>{len(bucket[name])}</Size>"
+            "<LastModified>2020-01-01T00:00:00.000Z</LastModified>"
+            "<ETag>etag</ETag></Contents>"
+            for name in page
+        )
+        continuation = (
+            f"<NextContinuationToken>{page[-1]}</NextContinuationToken>"
+            if remaining else ""
+        )
+
+        return FakeResponse(
+            200, f"<ListBucketResult {S3_XMLNS}><Name>{bucket_name}</Name>"
+            f"<IsTruncated>{'true' if remaining else 'false'}</IsTruncated>"
+            f"{continuation}{contents}</ListBucketResult>".encode()
+        )
+
+
+###
+# Test Payload
+###
+
+
+def test_async_bucket_helpers(async_client, fake_session):
+    """
+    Purpose:
+        Buckets are listed, created, and deleted through signed requests
+    """
+
+    async def run():
+        assert await minio_async_helpers.async_get_bucket_names(async_client) == [
+            "bucket"
+        ]
+        await minio_async_helpers.async_create_bucket(async_client, "new-bucket")
+        assert "new-bucket" in fake_session.buckets
+        with pytest.raises(BucketAlreadyExists):
+            await minio_async_helpers.async_create_bucket(async_client, "new-bucket")
+        await minio_async_helpers.async_delete_bucket(async_client, "new-bucket")
+        assert "new-bucket" not in fake_session.buckets
+
+    asyncio.run(run())
+
+
+def test_async_object_helpers(async_client, fake_session):
+    """
+    Purpose:
+        Objects are listed across pages, stat'd, downloaded, uploaded, and deleted
+    """
+
+    async def run():
+        assert await minio_async_helpers.async_get_object_names(
+            async_client, "bucket", prefix="a/", recursive=True, start_after="a/0.json"
+        ) == ["a/1.json", "a/2.json", "a/3.json", "a/4.json"]
+
+        object_stats = await minio_async_helpers.async_get_object_stats(
+            async_client, "bucket", "a/1.json"
+        )
+        assert object_stats["size"] == 10
+        assert object_stats["last_modified_int"] == 20200101000000
+        assert not await minio_async_helpers.async_is_object_in_bucket(
+            async_client, "bucket", "missing.json"
+        )
+
+        assert await minio_async_helpers.async_download_object_to_memory(
+            async_client, "bucket", "a/3.json"
+        ) == {"idx": 3}
+        response = await async_client.get_object("bucket", "a/3.json", 1, 5)
+        assert response.data == b'"idx"'
+
+        etag = await minio_async_helpers.async_upload_object_from_memory(
+            async_client, "bucket", "b/hello world.txt", "hello"
+        )
+        assert etag == hashlib.md5(b"hello").hexdigest()
+        assert fake_session.buckets["bucket"]["b/hello world.txt"] == b"hello"
+        assert "/bucket/b/hello%20world.txt" in fake_session.requests[-1][1]
+
+        await minio_async_helpers.async_delete_object(
+            async_client, "bucket", "b/hello world.txt"
+        )
+        with pytest.raises(ObjectDoesntExist):
+            await minio_async_helpers.async_delete_object(
+                async_client, "bucket", "b/hello world.txt"
+            )
+
+    asyncio.run(run())
+
+
+def test_async_delete_objects(async_client, fake_session):
+    """
+    Purpose:
+        Objects are deleted in concurrent batches and failures are reported
+    """
+
+    fake_session.buckets["bucket"]["locked.json"] = b"{}"
+
+    failures = asyncio.run(
+        minio_async_helpers.async_delete_objects(
+            async_client, "bucket",
+            ["locked.json"] + [f"a/{idx}.json" for idx in range(5)], batch_size=2
+        )
+    )
+    assert [failure["object_name"] for failure in failures] == ["locked.json"]
+    assert failures[0]["error_code"] == "AccessDenied"
+    assert list(fake_session.buckets["bucket"]) == ["locked.json"]
+
+
+def test_async_map_bounded():
+    """
+    Purpose:
+        No more than max_concurrency calls run at once and errors are returned
+    """
+
+    in_flight = []
+    max_in_flight = []
+
+    async def work(item):
+        in_flight.append(item)
+        max_in_flight.append(len(in_flight))
+        await asyncio.sleep(0)
+        in_flight.remove(item)
+        if item == 3:
+            raise ValueError(item)
+        return item * 2
+
+    results = asyncio.run(
+        minio_async_helpers.async_map_bounded(work, range(10), max_concurrency=3)
+    )
+    assert max(max_in_flight) == 3
+    assert results[:3] == [0, 2, 4]
+    assert isinstance(results[3], ValueError)
+
+
+def test_async_iter_bounded():
+    """
+    Purpose:
+        Items are pulled lazily, no more than max_concurrency ahead of the
+        results yielded
+    """
+
+    pulled_items = []
+
+    def iter_items():
+        for item in range(100):
+            pulled_items.append(item)
+            yield item
+
+    async def work(item):
+        await asyncio.sleep(0)
+        return item * 2
+
+    async def run():
+        results = []
+        async for item, result, error in minio_async_helpers.async_iter_bounded(
+            work, iter_items(), max_concurrency=4
+        ):
+            assert len(pulled_items) <= len(results) + 4
+            assert error is None and result == item * 2
+            results.append(item)
+        return results
+
+    assert sorted(asyncio.run(run())) == list(range(100))
@@ -10,6 +10,10 @@ import sys
 import pytest
 from unittest import mock
 
+from minio import Minio
+from minio.definitions import Bucket, IncompleteUpload
+from minio.error import BucketAlreadyOwnedByYou, MultiDeleteError, NoSuchBucket
+
 # Import File to Test
 from minio_helpers import minio_bucket_helpers
 
@@ -19,7 +23,40 @@ from minio_helpers import minio_bucket_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+@pytest.fixture(autouse=True)
+def empty_bucket_caches():
+    """
+    Purpose:
+        Start and end each test with empty known-bucket caches
+    """
+
+    minio_bucket_helpers.forget_known_buckets()
+    yield
+    minio_bucket_helpers.forget_known_buckets()
+
+
+@pytest.fixture
+def mocked_minio_client():
+    """
+    Purpose:
+        Mocked Minio client with a non-empty bucket
+    """
+
+    object_names = [f"dir/{object_idx}.txt" for object_idx in range(2500)]
+
+    minio_client = mock.MagicMock()
+    minio_client.bucket_exists.return_value = True
+    minio_client._list_incomplete_uploads.return_value = [
+        IncompleteUpload("bucket", "upload.bin", "upload-1", None),
+        IncompleteUpload("bucket", "upload.bin", "upload-2", None),
+    ]
+    minio_client.list_objects_v2.side_effect =\
+        lambda bucket_name, **kwargs: iter(
+            mock.MagicMock(object_name=object_name) for object_name in object_names
+        )
+    minio_client.remove_objects.side_effect = lambda bucket_name, names: iter([])
+
+    return minio_client
 
 
 ###
@@ -27,7 +64,7 @@ from minio_helpers import minio_bucket_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+# None at the Moment
 
 
 ###
@@ -35,4 +72,142 @@ from minio_helpers import minio_bucket_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+def test_delete_bucket(mocked_minio_client):
+    """
+    Purpose:
+        Deleting without force only removes the bucket
+    """
+
+    minio_bucket_helpers.delete_bucket(mocked_minio_client, "bucket")
+
+    mocked_minio_client.remove_bucket.assert_called_once_with("bucket")
+    mocked_minio_client.remove_objects.assert_not_called()
+
+    mocked_minio_client.remove_bucket.side_effect = NoSuchBucket
+    with pytest.raises(minio_bucket_helpers.BucketDoesntExist):
+        minio_bucket_helpers.delete_bucket(mocked_minio_client, "bucket")
+    mocked_minio_client.bucket_exists.assert_not_called()
+
+
+def test_delete_bucket_force(mocked_minio_client):
+    """
+    Purpose:
+        Force deleting purges objects and uploads before removing the bucket
+    """
+
+    minio_bucket_helpers.delete_bucket(mocked_minio_client, "bucket", force=True)
+
+    mocked_minio_client._list_incomplete_uploads.assert_called_once_with(
+        "bucket", recursive=True, is_aggregate_size=False
+    )
+    assert sorted(
+        upload_call.args
+        for upload_call in mocked_minio_client._remove_incomplete_upload.call_args_list
+    ) == [("bucket", "upload.bin", "upload-1"), ("bucket", "upload.bin", "upload-2")]
+    assert mocked_minio_client.remove_objects.call_count == 3
+    mocked_minio_client.remove_bucket.assert_called_once_with("bucket")
+
+
+def test_purge_bucket_failures(mocked_minio_client):
+    """
+    Purpose:
+        Objects that fail to delete stop the purge
+    """
+
+    mocked_minio_client.remove_objects.side_effect =\
+        lambda bucket_name, names: iter(
+            [MultiDeleteError(names[0], "AccessDenied", "Access Denied")]
+        )
+
+    with pytest.raises(minio_bucket_helpers.BucketPurgeIncomplete):
+        minio_bucket_helpers.delete_bucket(mocked_minio_client, "bucket", force=True)
+    mocked_minio_client.remove_bucket.assert_not_called()
+
+    mocked_minio_client.remove_objects.side_effect =\
+        lambda bucket_name, names: iter([])
+    purge_summary = minio_bucket_helpers.purge_bucket(mocked_minio_client, "bucket")
+    assert purge_summary["deleted_objects"] == 2500
+    assert purge_summary["aborted_uploads"] == 2
+
+
+def test_create_bucket(mocked_minio_client):
+    """
+    Purpose:
+        Buckets are created with a single request and existing buckets raise
+    """
+
+    minio_bucket_helpers.create_bucket(mocked_minio_client, "bucket")
+    mocked_minio_client.make_bucket.assert_called_once_with(
+        "bucket", location="us-east-1"
+    )
+    mocked_minio_client.bucket_exists.assert_not_called()
+    assert minio_bucket_helpers.is_bucket_known(mocked_minio_client, "bucket")
+
+    mocked_minio_client.make_bucket.side_effect = BucketAlreadyOwnedByYou
+    with pytest.raises(minio_bucket_helpers.BucketAlreadyExists):
+        minio_bucket_helpers.create_bucket(mocked_minio_client, "bucket")
+
+
+def test_ensure_bucket(mocked_minio_client):
+    """
+    Purpose:
+        Ensuring is idempotent and known buckets skip the request to Minio
+    """
+
+    assert minio_bucket_helpers.ensure_bucket(mocked_minio_client, "bucket")
+    assert not minio_bucket_helpers.ensure_bucket(mocked_minio_client, "bucket")
+    assert mocked_minio_client.make_bucket.call_count == 1
+
+    mocked_minio_client.make_bucket.side_effect = BucketAlreadyOwnedByYou
+    assert not minio_bucket_helpers.ensure_bucket(mocked_minio_client, "owned")
+    assert not minio_bucket_helpers.ensure_bucket(mocked_minio_client, "owned")
+    assert mocked_minio_client.make_bucket.call_count == 2
+
+    minio_bucket_helpers.delete_bucket(mocked_minio_client, "owned")
+    assert not minio_bucket_helpers.is_bucket_known(mocked_minio_client, "owned")
+    assert minio_bucket_helpers.is_bucket_known(mocked_minio_client, "bucket")
+
+
+def test_get_bucket_names_cache(mocked_minio_client):
+    """
+    Purpose:
+        Cached listings are reused on request and dropped by create and delete
+    """
+
+    mocked_minio_client.list_buckets.return_value = [Bucket("listed", None)]
+
+    assert minio_bucket_helpers.get_bucket_names(mocked_minio_client) == ["listed"]
+    assert minio_bucket_helpers.get_bucket_names(
+        mocked_minio_client, use_cache=True
+    ) == ["listed"]
+    assert mocked_minio_client.list_buckets.call_count == 1
+    assert minio_bucket_helpers.is_bucket_known(mocked_minio_client, "listed")
+
+    minio_bucket_helpers.ensure_bucket(mocked_minio_client, "listed")
+    mocked_minio_client.make_bucket.assert_not_called()
+
+    minio_bucket_helpers.create_bucket(mocked_minio_client, "new")
+    minio_bucket_helpers.get_bucket_names(mocked_minio_client, use_cache=True)
+    assert mocked_minio_client.list_buckets.call_count == 2
+
+
+def test_get_endpoint_key():
+    """
+    Purpose:
+        Clients of the same Minio only share cached buckets when their
+        credentials match
+    """
+
+    minio_client = Minio("localhost:9000", "access", "secret", secure=False)
+    same_client = Minio("localhost:9000", "access", "secret", secure=False)
+    other_client = Minio("localhost:9000", "other", "secret", secure=False)
+
+    assert minio_bucket_helpers.get_endpoint_key(minio_client) ==\
+        minio_bucket_helpers.get_endpoint_key(same_client)
+    assert "secret" not in minio_bucket_helpers.get_endpoint_key(minio_client)
+
+    minio_bucket_helpers.KNOWN_BUCKETS.set(
+        (minio_bucket_helpers.get_endpoint_key(minio_client), "bucket"), True
+    )
+    assert minio_bucket_helpers.is_bucket_known(same_client, "bucket")
+    assert not minio_bucket_helpers.is_bucket_known(other_client, "bucket")
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Test File for minio_cache_helpers.py
+"""
+
+# Python Library Imports
+import hashlib
+import io
+import os
+import sys
+import threading
+import time
+import pytest
+from minio.credentials import Credentials, Static
+from minio.definitions import Object
+from minio.error import NoSuchKey
+from unittest import mock
+
+# Import File to Test
+from minio_helpers import minio_cache_helpers
+from minio_helpers import minio_object_helpers
+
+
+###
+# Fixtures
+###
+
+
+@pytest.fixture
+def mocked_minio_client():
+    """
+    Purpose:
+        Mocked Minio client holding the internals used to sign requests
+    """
+
+    minio_client = mock.Mock()
+    minio_client._endpoint_url = "http://localhost:9000"
+    minio_client._user_agent = "minio-helpers-test"
+    minio_client._credentials = Credentials(provider=Static("access", "secret"))
+    minio_client._get_bucket_region.return_value = "us-east-1"
+    minio_client.stat_object.side_effect = mocked_stat_object
+
+    return minio_client
+
+
+@pytest.fixture
+def content_minio_client():
+    """
+    Purpose:
+        Mocked Minio client serving object contents from its objects Dict
+    """
+
+    minio_client = mock.Mock()
+    minio_client.objects = {
+        "a.json": b'{"a": 1}',
+        "b.csv": b"x,y\n1,2\n",
+        "c.bin": b"c" * 100,
+    }
+
+    def stat_object(bucket_name, object_name):
+        if object_name not in minio_client.objects:
+            raise NoSuchKey()
+        object_data = minio_client.objects[object_name]
+        return Object(
+            bucket_name, object_name, last_modified=time.gmtime(0),
+            etag=hashlib.md5(object_data).hexdigest(), size=len(object_data),
+            content_type="application/octet-stream",
+        )
+
+    def get_object(bucket_name, object_name):
+        return MockedObjectResponse(minio_client.objects[object_name])
+
+    minio_client.stat_object.side_effect = stat_object
+    minio_client.get_object.side_effect = get_object
+
+    return minio_client
+
+
+###
+# Mocked Functions
+###
+
+
+class MockedObjectResponse(io.BytesIO):
+    """
+    Purpose:
+        get_object response over an object's bytes
+    """
+
+    def __init__(self, object_data):
+        super().__init__(object_data)
+        self.headers = {
+            "etag": f'"{hashlib.md5(object_data).hexdigest()}"',
+            "content-type": "application/octet-stream",
+        }
+
+    def stream(self, amt):
+        return iter(lambda: self.read(4), b"")
+
+    def release_conn(self):
+        pass
+
+
+def mocked_stat_object(bucket_name, object_name, etag="etag"):
+    """
+    Purpose:
+        Stat objects, which exist unless their name starts with "missing"
+    """
+
+    if object_name.startswith("missing"):
+        raise NoSuchKey()
+
+    return Object(
+        bucket_name, object_name, last_modified=time.gmtime(0), etag=etag, size=1
+    )
+
+
+###
+# Test Payload
+###
+
+
+def test_revalidate_object_stats(mocked_minio_client):
+    """
+    Purpose:
+        Revalidation sends a signed HEAD conditional on the ETag
+    """
+
+    mocked_minio_client._http.urlopen.return_value = mock.Mock(status=304)
+    assert minio_cache_helpers.revalidate_object_stats(
+        mocked_minio_client, "bucket", "a.txt", "etag"
+    ) is None
+
+    method, url = mocked_minio_client._http.urlopen.call_args[0]
+    headers = mocked_minio_client._http.urlopen.call_args[1]["headers"]
+    assert (method, url) == ("HEAD", "http://localhost:9000/bucket/a.txt")
+    assert headers["If-None-Match"] == '"etag"'
+    assert "if-none-match" in headers["Authorization"]
+
+    mocked_minio_client._http.urlopen.return_value = mock.Mock(
+        status=200, headers={"etag": '"new"', "content-length": "7"}
+    )
+    object_stats_obj = minio_cache_helpers.revalidate_object_stats(
+        mocked_minio_client, "bucket", "a.txt", "etag"
+    )
+    assert (object_stats_obj.etag, object_stats_obj.size) == ("new", 7)
+
+
+def test_stat_cache(mocked_minio_client):
+    """
+    Purpose:
+        Fresh entries are hits, and stale entries are revalidated on their ETag
+    """
+
+    stat_cache = minio_cache_helpers.StatCache(max_size=10, ttl=60)
+
+    for _ in range(3):
+        assert minio_object_helpers.get_object_stats(
+            mocked_minio_client, "bucket", "a.txt", stat_cache=stat_cache
+        )["etag"] == "etag"
+        with pytest.raises(NoSuchKey):
+            stat_cache.stat_object(mocked_minio_client, "bucket", "missing.txt")
+    assert mocked_minio_client.stat_object.call_count == 2
+    assert stat_cache.get_counters() == {
+        "hits": 4, "misses": 2, "revalidations": 0, "revalidated_unchanged": 0,
+        "entries": 2,
+    }
+
+    stale_time = time.monotonic() + 61
+    with mock.patch.object(
+        minio_cache_helpers, "revalidate_object_stats",
+        side_effect=[None, mocked_stat_object("bucket", "a.txt", etag="new")]
+    ) as mocked_revalidate, mock.patch.object(
+        minio_cache_helpers.time, "monotonic", return_value=stale_time
+    ):
+        assert stat_cache.stat_object(
+            mocked_minio_client, "bucket", "a.txt"
+        ).etag == "etag"
+        assert stat_cache.stat_object(
+            mocked_minio_client, "bucket", "a.txt"
+        ).etag == "etag"
+        mocked_revalidate.assert_called_once_with(
+            mocked_minio_client, "bucket", "a.txt", "etag"
+        )
+
+    with mock.patch.object(
+        minio_cache_helpers, "revalidate_object_stats",
+        return_value=mocked_stat_object("bucket", "a.txt", etag="new")
+    ), mock.patch.object(
+        minio_cache_helpers.time, "monotonic", return_value=stale_time + 61
+    ):
+        assert stat_cache.stat_object(
+            mocked_minio_client, "bucket", "a.txt"
+        ).etag == "new"
+
+    counters = stat_cache.get_counters()
+    assert (counters["revalidations"], counters["revalidated_unchanged"]) == (2, 1)
+
+    stat_cache.invalidate("bucket", ["a.txt"])
+    assert len(stat_cache) == 1
+    stat_cache.invalidate("bucket")
+    assert len(stat_cache) == 0
+
+
+def test_content_cache(content_minio_client, tmp_path):
+    """
+    Purpose:
+        Unchanged objects are read from local files after the first download,
+        and changed objects are downloaded again
+    """
+
+    content_cache = minio_cache_helpers.ContentCache(str(tmp_path / "cache"))
+
+    for _ in range(2):
+        assert minio_object_helpers.download_object_to_memory(
+            content_minio_client, "bucket", "a.json", content_cache=content_cache
+        ) == {"a": 1}
+        assert minio_object_helpers.download_object_to_memory(
+            content_minio_client, "bucket", "b.csv", content_cache=content_cache
+        ) == [{"x": "1", "y": "2"}]
+        minio_object_helpers.download_object_to_file(
+            content_minio_client, "bucket", "c.bin",
+            filename=str(tmp_path / "out" / "c.bin"), content_cache=content_cache
+        )
+        assert (tmp_path / "out" / "c.bin").read_bytes() == b"c" * 100
+    assert content_minio_client.get_object.call_count == 3
+    assert content_cache.get_counters() == {
+        "hits": 3, "misses": 3, "files": 3, "bytes": 116,
+    }
+
+    content_minio_client.objects["a.json"] = b'{"a": 2}'
+    assert minio_object_helpers.download_object_to_memory(
+        content_minio_client, "bucket", "a.json", content_cache=content_cache
+    ) == {"a": 2}
+    assert len(content_cache) == 3
+
+    with pytest.raises(NoSuchKey):
+        minio_object_helpers.download_object_to_memory(
+            content_minio_client, "bucket", "missing.json", content_cache=content_cache
+        )
+
+    reopened_cache = minio_cache_helpers.ContentCache(str(tmp_path / "cache"))
+    assert reopened_cache.get_counters()["bytes"] == 116
+    reopened_cache.get_object_file(content_minio_client, "bucket", "b.csv")
+    assert reopened_cache.hits == 1
+
+
+def test_content_cache_eviction(content_minio_client, tmp_path):
+    """
+    Purpose:
+        The least recently used files are evicted past max_bytes
+    """
+
+    content_cache = minio_cache_helpers.ContentCache(str(tmp_path), max_bytes=110)
+
+    content_cache.get_object_file(content_minio_client, "bucket", "a.json")
+    content_cache.get_object_file(content_minio_client, "bucket", "b.csv")
+    content_cache.get_object_file(content_minio_client, "bucket", "a.json")
+    cached_file, _ = content_cache.get_object_file(
+        content_minio_client, "bucket", "c.bin"
+    )
+    assert content_cache.get_counters()["bytes"] == 108
+    content_cache.get_object_file(content_minio_client, "bucket", "a.json")
+    assert content_cache.hits == 2
+
+    with content_cache.open_object_file(cached_file) as object_stream:
+        object_stream.seek(95)
+        assert object_stream.read() == b"c" * 5
+
+    content_cache.clear()
+    assert len(content_cache) == 0
+    assert not os.path.exists(cached_file)
+
+
+def test_content_cache_evicted_before_read(content_minio_client, tmp_path):
+    """
+    Purpose:
+        Files evicted by another thread between the lookup and the read are
+        downloaded again
+    """
+
+    content_cache = minio_cache_helpers.ContentCache(str(tmp_path / "cache"))
+    cached_file, _ = content_cache.get_object_file(
+        content_minio_client, "bucket", "a.json"
+    )
+    os.remove(cached_file)
+    assert content_cache.get_object_file(
+        content_minio_client, "bucket", "a.json"
+    )[0] == cached_file
+    assert content_cache.get_counters()["misses"] == 2
+
+    get_object_file = content_cache.get_object_file
+
+    def get_evicted_object_file(*args):
+        cached_file, content_type = get_object_file(*args)
+        if content_cache.misses == 2:
+            os.remove(cached_file)
+        return cached_file, content_type
+
+    with mock.patch.object(
+        content_cache, "get_object_file", side_effect=get_evicted_object_file
+    ):
+        assert minio_object_helpers.download_object_to_memory(
+            content_minio_client, "bucket", "a.json", content_cache=content_cache
+        ) == {"a": 1}
+        minio_object_helpers.download_object_to_file(
+            content_minio_client, "bucket", "a.json",
+            filename=str(tmp_path / "a.json"), content_cache=content_cache
+        )
+    assert (tmp_path / "a.json").read_bytes() == b'{"a": 1}'
+    assert content_cache.get_counters()["misses"] == 3
+
+
+def test_object_cache(content_minio_client):
+    """
+    Purpose:
+        Parsed objects are served from memory as read-only views until they
+        expire, are invalidated, or are evicted past max_bytes
+    """
+
+    object_cache = minio_cache_helpers.ObjectCache(max_bytes=10000, ttl=60)
+
+    for _ in range(3):
+        parsed_object = minio_object_helpers.download_object_to_memory(
+            content_minio_client, "bucket", "a.json", object_cache=object_cache
+        )
+        assert parsed_object == {"a": 1}
+        with pytest.raises(TypeError):
+            parsed_object["a"] = 2
+    assert content_minio_client.get_object.call_count == 1
+    assert minio_object_helpers.download_object_to_memory(
+        content_minio_client, "bucket", "b.csv", object_cache=object_cache
+    ) == ({"x": "1", "y": "2"},)
+
+    content_minio_client.objects["a.json"] = b'{"a": 2}'
+    object_cache.invalidate("bucket", ["a.json"])
+    assert minio_object_helpers.download_object_to_memory(
+        content_minio_client, "bucket", "a.json", object_cache=object_cache
+    ) == {"a": 2}
+
+    with mock.patch.object(
+        minio_cache_helpers.time, "monotonic", return_value=time.monotonic() + 61
+    ):
+        minio_object_helpers.download_object_to_memory(
+            content_minio_client, "bucket", "a.json", object_cache=object_cache
+        )
+    assert object_cache.get_counters()["misses"] == 4
+
+    object_cache.max_bytes = object_cache.get_counters()["bytes"] + 1
+    object_cache.get_object("bucket", "c.json", lambda: {"c": 1})
+    assert ("bucket", "b.csv", "utf-8") not in object_cache._entries
+    assert object_cache.get_counters()["bytes"] <= object_cache.max_bytes
+
+
+def test_object_cache_single_flight():
+    """
+    Purpose:
+        Concurrent loads of an object share one call, copies are returned when
+        configured, and failed loads are not cached
+    """
+
+    object_cache = minio_cache_helpers.ObjectCache(copy_objects=True)
+    load_started = threading.Event()
+    release_load = threading.Event()
+    load_calls = []
+
+    def load_object():
+        load_calls.append(1)
+        load_started.set()
+        release_load.wait(5)
+        return {"config": [1, 2]}
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                object_cache.get_object("bucket", "config.json", load_object)
+            )
+        )
+        for _ in range(5)
+    ]
+    threads[0].start()
+    load_started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    while object_cache.get_counters()["shared_loads"] < 4:
+        time.sleep(0.001)
+    release_load.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(load_calls) == 1
+    assert results == [{"config": [1, 2]}] * 5
+    results[0]["config"].append(3)
+    assert object_cache.get_object("bucket", "config.json", load_object) == {
+        "config": [1, 2]
+    }
+
+    with pytest.raises(ValueError):
+        object_cache.get_object(
+            "bucket", "bad.json", mock.Mock(side_effect=ValueError("bad"))
+        )
+    assert object_cache.get_counters()["entries"] == 1
@@ -7,7 +7,10 @@
 # Python Library Imports
 import os
 import sys
+import time
 import pytest
+from minio.definitions import Object
+from minio.error import NoSuchKey
 from unittest import mock
 
 # Import File to Test
@@ -19,7 +22,22 @@ from minio_helpers import minio_client
 ###
 
 
-# None at the Moment (Empty Test Suite)
+@pytest.fixture
+def client():
+    """
+    Purpose:
+        MinioClient whose minio client is mocked
+    """
+
+    client = minio_client.MinioClient(
+        "localhost", "access", "secret", listing_cache_max_objects=100
+    )
+    client.minio_client = mock.Mock()
+    client.minio_client.stat_object.side_effect = mocked_stat_object
+    client.minio_client.bucket_exists.return_value = True
+    client.minio_client.list_objects_v2.side_effect = mocked_list_objects_v2
+
+    return client
 
 
 ###
@@ -27,7 +45,27 @@ from minio_helpers import minio_client
 ###
 
 
-# None at the Moment (Empty Test Suite)
+def mocked_stat_object(bucket_name, object_name):
+    """
+    Purpose:
+        Stat objects, which exist unless their name starts with "missing"
+    """
+
+    if object_name.startswith("missing"):
+        raise NoSuchKey()
+
+    return Object(
+        bucket_name, object_name, last_modified=time.gmtime(0), etag="etag", size=1
+    )
+
+
+def mocked_list_objects_v2(bucket_name, prefix=None, recursive=False, start_after=None):
+    """
+    Purpose:
+        List two objects
+    """
+
+    return iter([Object(bucket_name, "a.txt"), Object(bucket_name, "b.txt")])
 
 
 ###
@@ -35,4 +73,106 @@ from minio_helpers import minio_client
 ###
 
 
-# None at the Moment (Empty Test Suite)
+def test_minio_client_caches_metadata(client):
+    """
+    Purpose:
+        Repeated existence, stat, and listing calls are served from the cache
+    """
+
+    for _ in range(3):
+        assert client.bucket_exists("bucket")
+        assert client.is_object_in_bucket("bucket", "a.txt")
+        assert not client.is_object_in_bucket("bucket", "missing.txt")
+        assert client.get_object_stats("bucket", "a.txt")["etag"] == "etag"
+        assert client.get_object_names("bucket") == ["a.txt", "b.txt"]
+
+    assert client.minio_client.bucket_exists.call_count == 1
+    assert client.minio_client.stat_object.call_count == 2
+    assert client.minio_client.list_objects_v2.call_count == 1
+
+    with pytest.raises(NoSuchKey):
+        client.stat_object("bucket", "missing.txt")
+
+
+def test_minio_client_invalidates_on_write(client):
+    """
+    Purpose:
+        Writes through the client drop the cached metadata they affect
+    """
+
+    client.get_object_names("bucket")
+    client.stat_object("bucket", "a.txt")
+    client.stat_object("bucket", "b.txt")
+
+    client.delete_object("bucket", "a.txt", check_exists=False)
+
+    client.stat_object("bucket", "a.txt")
+    client.stat_object("bucket", "b.txt")
+    client.get_object_names("bucket")
+
+    assert client.minio_client.stat_object.call_count == 3
+    assert client.minio_client.list_objects_v2.call_count == 2
+    client.minio_client.remove_object.assert_called_once_with("bucket", "a.txt")
+
+
+def test_minio_client_without_cache():
+    """
+    Purpose:
+        Every call goes to Minio when the cache is disabled, listings aren't
+        cached by default, and expired stats are revalidated
+    """
+
+    client = minio_client.MinioClient(
+        "localhost", "access", "secret", use_cache=False
+    )
+    client.minio_client = mock.Mock()
+    client.minio_client.stat_object.side_effect = mocked_stat_object
+
+    client.stat_object("bucket", "a.txt")
+    client.stat_object("bucket", "a.txt")
+    assert client.minio_client.stat_object.call_count == 2
+
+    client = minio_client.MinioClient("localhost", "access", "secret")
+    client.minio_client = mock.Mock()
+    client.minio_client.list_objects_v2.side_effect = mocked_list_objects_v2
+
+    client.get_object_names("bucket")
+    client.get_object_names("bucket")
+    assert client.minio_client.list_objects_v2.call_count == 2
+
+    client = minio_client.MinioClient("localhost", "access", "secret", cache_ttl=0)
+    client.minio_client = mock.Mock()
+    client.minio_client.stat_object.side_effect = mocked_stat_object
+
+    with mock.patch.object(
+        minio_client.minio_cache_helpers, "revalidate_object_stats", return_value=None
+    ) as mocked_revalidate:
+        client.stat_object("bucket", "a.txt")
+        client.stat_object("bucket", "a.txt")
+    assert client.minio_client.stat_object.call_count == 1
+    mocked_revalidate.assert_called_once_with(
+        client.minio_client, "bucket", "a.txt", "etag"
+    )
+
+
+def test_minio_client_delete_objects_streams_names(client):
+    """
+    Purpose:
+        Names to delete are passed through lazily, and the bucket's cached
+        metadata is dropped after the delete
+    """
+
+    client.get_object_names("bucket")
+    client.stat_object("bucket", "a.txt")
+    object_names = (f"{idx}.txt" for idx in range(3))
+
+    with mock.patch.object(
+        minio_client.minio_object_helpers, "delete_objects", return_value=[]
+    ) as mocked_delete_objects:
+        assert client.delete_objects("bucket", object_names) == []
+    assert mocked_delete_objects.call_args[0][2] is object_names
+
+    client.stat_object("bucket", "a.txt")
+    client.get_object_names("bucket")
+    assert client.minio_client.stat_object.call_count == 2
+    assert client.minio_client.list_objects_v2.call_count == 2
@@ -6,6 +6,7 @@
 
 # Python Library Imports
 import os
+import socket
 import sys
 import pytest
 from unittest import mock
@@ -19,7 +20,16 @@ from minio_helpers import minio_connection_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+@pytest.fixture
+def empty_registry():
+    """
+    Purpose:
+        Start and end each test with no shared clients
+    """
+
+    minio_connection_helpers.clear_minio_client_registry()
+    yield
+    minio_connection_helpers.clear_minio_client_registry()
 
 
 ###
@@ -35,4 +45,51 @@ from minio_helpers import minio_connection_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+def test_connect_to_minio_shares_clients(empty_registry):
+    """
+    Purpose:
+        Clients are reused for the same URL, credentials, and options only
+    """
+
+    minio_client = minio_connection_helpers.connect_to_minio(
+        "localhost:9000", "access", "secret"
+    )
+    assert minio_client is minio_connection_helpers.connect_to_minio(
+        "localhost:9000", "access", "secret"
+    )
+    assert minio_client is not minio_connection_helpers.connect_to_minio(
+        "localhost:9000", "access", "other-secret"
+    )
+    assert minio_client is not minio_connection_helpers.connect_to_minio(
+        "localhost:9000", "access", "secret", max_pool_size=32
+    )
+    assert minio_client is not minio_connection_helpers.connect_to_minio(
+        "localhost:9000", "access", "secret", shared=False
+    )
+
+    minio_connection_helpers.clear_minio_client_registry()
+    assert minio_client is not minio_connection_helpers.connect_to_minio(
+        "localhost:9000", "access", "secret"
+    )
+
+
+def test_build_http_client():
+    """
+    Purpose:
+        Pool size, timeouts, retries, and keep-alive are set on the pool
+    """
+
+    http_client = minio_connection_helpers.build_http_client(
+        max_pool_size=32, connect_timeout=2, read_timeout=30, max_retries=1,
+        keep_alive=True
+    )
+    pool_kwargs = http_client.connection_pool_kw
+
+    assert pool_kwargs["maxsize"] == 32
+    assert pool_kwargs["timeout"].connect_timeout == 2
+    assert pool_kwargs["timeout"].read_timeout == 30
+    assert pool_kwargs["retries"].total == 1
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in pool_kwargs["socket_options"]
+
+    http_client = minio_connection_helpers.build_http_client(keep_alive=False)
+    assert "socket_options" not in http_client.connection_pool_kw
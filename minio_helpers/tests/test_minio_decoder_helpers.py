@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Test File for minio_decoder_helpers.py
+"""
+
+# Python Library Imports
+import gzip
+import io
+import os
+import sys
+import pytest
+from unittest import mock
+from urllib3.response import HTTPResponse
+
+# Import File to Test
+from minio_helpers import minio_decoder_helpers
+
+
+###
+# Fixtures
+###
+
+
+@pytest.fixture
+def restore_registry():
+    """
+    Purpose:
+        Restore the decoder registry after a test registers decoders
+    """
+
+    decoders_by_extension = dict(minio_decoder_helpers.DECODERS_BY_EXTENSION)
+    decoders_by_content_type = dict(minio_decoder_helpers.DECODERS_BY_CONTENT_TYPE)
+
+    yield
+
+    minio_decoder_helpers.DECODERS_BY_EXTENSION.clear()
+    minio_decoder_helpers.DECODERS_BY_EXTENSION.update(decoders_by_extension)
+    minio_decoder_helpers.DECODERS_BY_CONTENT_TYPE.clear()
+    minio_decoder_helpers.DECODERS_BY_CONTENT_TYPE.update(decoders_by_content_type)
+
+
+###
+# Mocked Functions
+###
+
+
+def build_response(data, content_length=True):
+    """
+    Purpose:
+        Build a binary stream with the headers of a get_object response
+    """
+
+    response = io.BytesIO(data)
+    response.headers = {"content-length": str(len(data))} if content_length else {}
+
+    return response
+
+
+###
+# Test Payload
+###
+
+
+def test_get_decoder():
+    """
+    Purpose:
+        Decoders are found by extension, then content type, after decompressors
+    """
+
+    decoder, decompressors = minio_decoder_helpers.get_decoder("logs/day.JSON.gz")
+    assert decoder is minio_decoder_helpers.decode_json
+    assert decompressors == [minio_decoder_helpers.decompress_gzip]
+
+    decoder, _ = minio_decoder_helpers.get_decoder(
+        "no_extension", content_type="text/csv; charset=utf-8"
+    )
+    assert decoder is minio_decoder_helpers.decode_csv
+    assert minio_decoder_helpers.get_decoder("archive.v1.bin") == (None, [])
+
+
+def test_decode_object_stream():
+    """
+    Purpose:
+        Streams are decompressed and decoded, unsupported objects raise
+    """
+
+    assert minio_decoder_helpers.decode_object_stream(
+        "data.json.gz", build_response(gzip.compress(b'{"a": [1, 2]}'))
+    ) == {"a": [1, 2]}
+    assert minio_decoder_helpers.decode_object_stream(
+        "data.txt", build_response("café".encode("latin-1")), encoding="latin-1"
+    ) == "café"
+
+    with pytest.raises(minio_decoder_helpers.ObjectDecodingNotSupported):
+        minio_decoder_helpers.decode_object_stream("data.bin", build_response(b""))
+
+
+def test_register_decoder(restore_registry):
+    """
+    Purpose:
+        Registered decoders are used for their extensions and content types
+    """
+
+    decode_upper = mock.MagicMock(return_value="DECODED")
+    minio_decoder_helpers.register_decoder(
+        decode_upper, extensions=["UPPER"], content_types=["text/x-upper"]
+    )
+
+    assert minio_decoder_helpers.decode_object_stream(
+        "data.upper", build_response(b"data")
+    ) == "DECODED"
+    assert minio_decoder_helpers.get_decoder(
+        "data", content_type="text/x-upper"
+    )[0] is decode_upper
+
+
+def test_get_record_iterator():
+    """
+    Purpose:
+        Record iterators are found by extension, then content type
+    """
+
+    record_iterator, decompressors =\
+        minio_decoder_helpers.get_record_iterator("logs/day.jsonl.gz")
+    assert record_iterator is minio_decoder_helpers.iter_ndjson_records
+    assert decompressors == [minio_decoder_helpers.decompress_gzip]
+    assert minio_decoder_helpers.get_record_iterator(
+        "rows", content_type="text/csv"
+    )[0] is minio_decoder_helpers.iter_csv_records
+    assert minio_decoder_helpers.get_record_iterator("data.json") == (None, [])
+
+
+def test_iter_records():
+    """
+    Purpose:
+        NDJSON and CSV records are parsed line by line
+    """
+
+    assert list(
+        minio_decoder_helpers.iter_ndjson_records(
+            build_response(b'{"a": 1}\n\n{"a": 2}')
+        )
+    ) == [{"a": 1}, {"a": 2}]
+    assert list(
+        minio_decoder_helpers.iter_text_lines(build_response(b"a\r\nb\n"))
+    ) == ["a", "b"]
+    assert list(
+        minio_decoder_helpers.iter_csv_records(
+            build_response(b'a,b\n1,"multi\nline"\n')
+        )
+    ) == [{"a": "1", "b": "multi\nline"}]
+
+
+@pytest.mark.parametrize("content_length", [True, False])
+def test_read_object_into_buffer(content_length):
+    """
+    Purpose:
+        Responses are read fully with or without a Content-Length
+    """
+
+    object_content = os.urandom(5000)
+
+    assert minio_decoder_helpers.read_object_into_buffer(
+        build_response(object_content, content_length=content_length),
+        chunk_size=1024,
+    ) == object_content
+
+    truncated_response = build_response(object_content)
+    truncated_response.headers = {"content-length": "6000"}
+    with pytest.raises(minio_decoder_helpers.ObjectDownloadIncomplete):
+        minio_decoder_helpers.read_object_into_buffer(truncated_response)
+
+
+def test_read_object_into_buffer_content_encoding():
+    """
+    Purpose:
+        Responses with a Content-Encoding are read fully, though their
+        Content-Length is of the encoded body
+    """
+
+    object_content = os.urandom(100) * 600
+    encoded_content = gzip.compress(object_content)
+    response = HTTPResponse(
+        body=io.BytesIO(encoded_content),
+        headers={
+            "content-length": str(len(encoded_content)),
+            "content-encoding": "gzip",
+        },
+        preload_content=False,
+    )
+
+    assert minio_decoder_helpers.read_object_into_buffer(
+        response, chunk_size=1024
+    ) == object_content
+
+
+@pytest.mark.parametrize("use_ijson", [False, True], ids=["json", "ijson"])
+def test_decode_json(use_ijson):
+    """
+    Purpose:
+        JSON documents are parsed incrementally with ijson, or from a buffer
+        without it, and trailing data is refused either way
+    """
+
+    ijson = pytest.importorskip("ijson") if use_ijson else None
+
+    with mock.patch.object(minio_decoder_helpers, "ijson", ijson):
+        assert minio_decoder_helpers.decode_json(
+            build_response(b'{"a": [1, 2.5, null], "b": "caf\xc3\xa9"}')
+        ) == {"a": [1, 2.5, None], "b": "café"}
+        assert minio_decoder_helpers.decode_json(
+            build_response('["café"]'.encode("utf-16")), encoding="utf-16"
+        ) == ["café"]
+
+        with pytest.raises(ValueError):
+            minio_decoder_helpers.decode_json(build_response(b'{"a": 1} trailing'))
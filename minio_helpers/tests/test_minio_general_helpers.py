@@ -7,6 +7,8 @@
 # Python Library Imports
 import os
 import sys
+import threading
+import time
 import pytest
 from unittest import mock
 
@@ -19,7 +21,7 @@ from minio_helpers import minio_general_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+# None at the Moment
 
 
 ###
@@ -27,7 +29,16 @@ from minio_helpers import minio_general_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+def square_or_fail(number):
+    """
+    Purpose:
+        Square a number, failing on negative numbers
+    """
+
+    if number < 0:
+        raise ValueError(f"{number} is negative")
+
+    return number * number
 
 
 ###
@@ -35,4 +46,112 @@ from minio_helpers import minio_general_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+def test_iter_batches():
+    """
+    Purpose:
+        Items are grouped lazily into batches of batch_size
+    """
+
+    assert list(minio_general_helpers.iter_batches(iter(range(5)), 2)) ==\
+        [[0, 1], [2, 3], [4]]
+    assert list(minio_general_helpers.iter_batches([], 2)) == []
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_iter_pool_results(max_workers):
+    """
+    Purpose:
+        Every work item is yielded once with its result or error
+    """
+
+    work_results = {
+        work_item: (result, error)
+        for work_item, result, error in minio_general_helpers.iter_pool_results(
+            square_or_fail, iter([1, 2, -3, 4]), max_workers=max_workers
+        )
+    }
+
+    assert work_results[1] == (1, None)
+    assert work_results[4] == (16, None)
+    assert work_results[-3][0] is None
+    assert isinstance(work_results[-3][1], ValueError)
+
+
+def test_iter_pool_results_is_lazy():
+    """
+    Purpose:
+        Work items are only pulled from the iterator up to max_pending
+    """
+
+    pulled_items = []
+
+    def get_work_items():
+        for work_item in range(100):
+            pulled_items.append(work_item)
+            yield work_item
+
+    work_results = minio_general_helpers.iter_pool_results(
+        square_or_fail, get_work_items(), max_workers=2, max_pending=2
+    )
+    next(work_results)
+    work_results.close()
+
+    assert len(pulled_items) <= 3
+
+
+def test_byte_budget():
+    """
+    Purpose:
+        ByteBudget admits oversized requests when idle and tracks bytes in flight
+    """
+
+    byte_budget = minio_general_helpers.ByteBudget(max_bytes=10)
+    byte_budget.acquire(25)
+    assert byte_budget.in_flight_bytes == 25
+    byte_budget.release(25)
+
+    byte_budget.acquire(6)
+    releaser = threading.Timer(0.05, byte_budget.release, args=(6,))
+    releaser.start()
+    byte_budget.acquire(6)
+    releaser.join()
+    assert byte_budget.in_flight_bytes == 6
+
+
+def test_ttl_cache():
+    """
+    Purpose:
+        Entries are evicted least recently used first, and expire after the ttl
+    """
+
+    ttl_cache = minio_general_helpers.TTLCache(max_size=2)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    assert ttl_cache.get("a") == 1
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("b") is None
+    assert ttl_cache.get("a") == 1 and ttl_cache.get("c") == 3
+    assert ttl_cache.pop_matching(lambda key: key in ("a", "b")) == 1
+    assert ttl_cache.pop("c") == 3
+    assert len(ttl_cache) == 0
+
+    ttl_cache = minio_general_helpers.TTLCache(ttl=60)
+    ttl_cache.set("a", None)
+    assert ttl_cache.get("a", "missing") is None
+    with mock.patch.object(
+        minio_general_helpers.time, "monotonic", return_value=time.monotonic() + 61
+    ):
+        assert ttl_cache.get("a", "missing") == "missing"
+
+    ttl_cache = minio_general_helpers.TTLCache(max_size=5, get_size=len)
+    ttl_cache.set("a", [1, 2])
+    ttl_cache.set("b", [1, 2, 3])
+    ttl_cache.set("c", [1])
+    assert ttl_cache.get("a") is None and ttl_cache.total_size == 4
+    ttl_cache.set("d", list(range(6)))
+    assert ttl_cache.get("d") is None and ttl_cache.total_size == 4
+    ttl_cache.set("b", [])
+    assert ttl_cache.total_size == 1
+    ttl_cache.clear()
+    assert ttl_cache.total_size == 0
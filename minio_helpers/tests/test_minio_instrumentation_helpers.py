@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Test File for minio_instrumentation_helpers.py
+"""
+
+# Python Library Imports
+import pytest
+from minio.error import NoSuchKey
+
+# Import File to Test
+from minio_helpers import minio_general_helpers
+from minio_helpers import minio_instrumentation_helpers
+from minio_helpers import minio_object_helpers
+from minio_helpers.minio_instrumentation_helpers import instrumented
+
+
+###
+# Fixtures
+###
+
+
+@pytest.fixture(autouse=True)
+def operation_events():
+    """
+    Purpose:
+        List of OperationEvents reported during the test, with hooks cleared
+        afterwards
+    """
+
+    operation_events = []
+    minio_instrumentation_helpers.register_hook(operation_events.append)
+    yield operation_events
+    minio_instrumentation_helpers.clear_hooks()
+
+
+###
+# Mocked Functions
+###
+
+
+@instrumented(operation="transfer")
+def transfer(bucket_name, object_name, num_bytes):
+    """
+    Purpose:
+        Instrumented helper transferring num_bytes, failing on negative values
+    """
+
+    if num_bytes < 0:
+        raise ValueError(f"{num_bytes} is negative")
+
+    minio_instrumentation_helpers.add_bytes_transferred(num_bytes)
+    minio_instrumentation_helpers.add_retries()
+    return num_bytes
+
+
+@instrumented
+def transfer_many(bucket_name, object_sizes):
+    """
+    Purpose:
+        Instrumented generator transferring objects in a thread pool
+    """
+
+    for _, result, _ in minio_general_helpers.iter_pool_results(
+        lambda num_bytes: transfer(bucket_name, "object", num_bytes),
+        object_sizes, max_workers=2,
+    ):
+        yield result
+
+
+###
+# Test Payload
+###
+
+
+def test_instrumented_events(operation_events):
+    """
+    Purpose:
+        Hooks get the names, bytes, retries, and error class of each call
+    """
+
+    assert transfer("bucket", object_name="object", num_bytes=5) == 5
+    with pytest.raises(ValueError):
+        transfer("bucket", "object", -1)
+
+    assert operation_events[0].operation == "transfer"
+    assert operation_events[0].bucket_name == "bucket"
+    assert operation_events[0].object_name == "object"
+    assert operation_events[0].bytes_transferred == 5
+    assert operation_events[0].retries == 1
+    assert operation_events[0].error_class is None
+    assert operation_events[0].duration >= 0
+    assert operation_events[1].error_class == "ValueError"
+    assert operation_events[1].bytes_transferred == 0
+
+
+def test_instrumented_without_hooks(operation_events):
+    """
+    Purpose:
+        With no hooks registered helpers are called straight through
+    """
+
+    minio_instrumentation_helpers.clear_hooks()
+    assert minio_instrumentation_helpers.get_hooks() == []
+
+    assert transfer("bucket", "object", 3) == 3
+    assert list(transfer_many("bucket", [1, 2])) in ([1, 2], [2, 1])
+    assert operation_events == []
+
+
+def test_instrumented_generator_in_pool(operation_events):
+    """
+    Purpose:
+        Generators report once exhausted, with the bytes of the operations they
+        ran in a thread pool counted towards them as the parent
+    """
+
+    assert sorted(transfer_many("bucket", [1, 2, 3])) == [1, 2, 3]
+
+    transfer_events = [
+        event for event in operation_events if event.operation == "transfer"
+    ]
+    assert len(transfer_events) == 3
+    assert {event.parent_operation for event in transfer_events} ==\
+        {"transfer_many"}
+    assert operation_events[-1].operation == "transfer_many"
+    assert operation_events[-1].bytes_transferred == 6
+    assert operation_events[-1].retries == 3
+    assert operation_events[-1].parent_operation is None
+
+
+def test_instrumented_helpers(fake_s3_server, minio_client, operation_events):
+    """
+    Purpose:
+        Object helpers report the bytes they download and the errors they raise
+    """
+
+    fake_s3_server.put_object("bucket", "a.json", b'{"a": 1}')
+
+    assert minio_object_helpers.download_object_to_memory(
+        minio_client, "bucket", "a.json"
+    ) == {"a": 1}
+    with pytest.raises(NoSuchKey):
+        minio_object_helpers.get_object_stats(minio_client, "bucket", "b.json")
+
+    assert operation_events[0].operation == "download_object_to_memory"
+    assert operation_events[0].object_name == "a.json"
+    assert operation_events[0].bytes_transferred == 8
+    assert operation_events[1].operation == "get_object_stats"
+    assert operation_events[1].error_class == "NoSuchKey"
+
+
+def test_prometheus_hook():
+    """
+    Purpose:
+        PrometheusHook records durations, bytes, retries, and errors
+    """
+
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    minio_instrumentation_helpers.register_hook(
+        minio_instrumentation_helpers.PrometheusHook(registry=registry)
+    )
+
+    transfer("bucket", "object", 5)
+    with pytest.raises(ValueError):
+        transfer("bucket", "object", -1)
+
+    labels = {"operation": "transfer", "bucket": "bucket"}
+    assert registry.get_sample_value(
+        "minio_helpers_operation_duration_seconds_count", labels
+    ) == 2
+    assert registry.get_sample_value(
+        "minio_helpers_operation_bytes_total", labels
+    ) == 5
+    assert registry.get_sample_value(
+        "minio_helpers_operation_retries_total", labels
+    ) == 1
+    assert registry.get_sample_value(
+        "minio_helpers_operation_errors_total",
+        dict(labels, error_class="ValueError"),
+    ) == 1
+
+
+def test_opentelemetry_hook():
+    """
+    Purpose:
+        OpenTelemetryHook records a span per operation
+    """
+
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import\
+        InMemorySpanExporter
+
+    span_exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    minio_instrumentation_helpers.register_hook(
+        minio_instrumentation_helpers.OpenTelemetryHook(
+            tracer=tracer_provider.get_tracer("test"),
+            meter=MeterProvider().get_meter("test"),
+        )
+    )
+
+    transfer("bucket", "object", 5)
+    with pytest.raises(ValueError):
+        transfer("bucket", "object", -1)
+
+    spans = span_exporter.get_finished_spans()
+    assert [span.name for span in spans] == ["minio_helpers.transfer"] * 2
+    assert spans[0].attributes["minio.object"] == "object"
+    assert spans[0].attributes["minio.bytes_transferred"] == 5
+    assert spans[1].attributes["error.type"] == "ValueError"
+    assert spans[1].status.is_ok is False
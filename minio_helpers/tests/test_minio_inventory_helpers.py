@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Test File for minio_inventory_helpers.py
+"""
+
+# Python Library Imports
+import datetime
+import pytest
+from minio.definitions import Object
+
+# Import File to Test
+from minio_helpers import minio_inventory_helpers
+from minio_helpers.minio_exceptions import ObjectListingUnsorted
+
+
+###
+# Fixtures
+###
+
+
+@pytest.fixture(params=[False, True], ids=["array", "numpy"])
+def use_numpy(request):
+    """
+    Purpose:
+        Run each test on the array columns and on NumPy views of them
+    """
+
+    if request.param:
+        pytest.importorskip("numpy")
+
+    return request.param
+
+
+@pytest.fixture
+def bucket_inventory(use_numpy):
+    """
+    Purpose:
+        Inventory of the mocked listing
+    """
+
+    bucket_inventory = minio_inventory_helpers.BucketInventory(use_numpy=use_numpy)
+    bucket_inventory.add_objects(get_mocked_listing())
+
+    return bucket_inventory
+
+
+###
+# Mocked Functions
+###
+
+
+NOW = 1600000000
+DAY = 86400
+
+
+def get_mocked_listing():
+    """
+    Purpose:
+        Sorted recursive listing of objects of various sizes and ages
+    """
+
+    def get_object(object_name, size, age_days, etag="0" * 32):
+        return Object(
+            "bucket",
+            object_name,
+            last_modified=datetime.datetime.fromtimestamp(
+                NOW - age_days * DAY, tz=datetime.timezone.utc
+            ),
+            etag=etag,
+            size=size,
+        )
+
+    return [
+        get_object("a.txt", 1, 0.5),
+        get_object("logs/", 0, 0),
+        get_object("logs/2020/01.log", 100, 400, etag=f"{'a' * 32}-12"),
+        get_object("logs/2020/02.log", 300, 200),
+        get_object("logs/2021/01.log", 50, 20, etag="not-an-md5"),
+        get_object("logs/readme.txt", 5, 3),
+        get_object("logsé.txt", 7, 3),
+        get_object("z.bin", 300, 100),
+    ]
+
+
+###
+# Test Payload
+###
+
+
+def test_inventory_queries(bucket_inventory):
+    """
+    Purpose:
+        Prefix sizes, age histograms, and the largest objects are computed from
+        the columns
+    """
+
+    assert len(bucket_inventory) == 8
+    assert bucket_inventory.get_prefix_size() ==\
+        {"object_count": 8, "total_size": 763}
+    assert bucket_inventory.get_prefix_size("logs/") ==\
+        {"object_count": 5, "total_size": 455}
+    assert bucket_inventory.get_prefix_size("logs/2020") ==\
+        {"object_count": 2, "total_size": 400}
+    assert bucket_inventory.get_prefix_size("missing/") ==\
+        {"object_count": 0, "total_size": 0}
+
+    assert bucket_inventory.get_size_by_prefix() == {
+        "": {"object_count": 3, "total_size": 308},
+        "logs/": {"object_count": 5, "total_size": 455},
+    }
+    assert bucket_inventory.get_size_by_prefix("logs/") == {
+        "logs/": {"object_count": 2, "total_size": 5},
+        "logs/2020/": {"object_count": 2, "total_size": 400},
+        "logs/2021/": {"object_count": 1, "total_size": 50},
+    }
+
+    age_histogram = bucket_inventory.get_age_histogram(bin_days=(1, 30, 365), now=NOW)
+    assert [
+        (age_bin["min_age_days"], age_bin["max_age_days"], age_bin["object_count"],
+         age_bin["total_size"])
+        for age_bin in age_histogram
+    ] == [(0, 1, 2, 1), (1, 30, 3, 62), (30, 365, 2, 600), (365, None, 1, 100)]
+
+    largest_objects = bucket_inventory.get_largest_objects(3)
+    assert [largest_object["object_name"] for largest_object in largest_objects] ==\
+        ["logs/2020/02.log", "z.bin", "logs/2020/01.log"]
+    assert largest_objects[2]["etag"] == f"{'a' * 32}-12"
+    assert largest_objects[2]["last_modified"] == NOW - 400 * DAY
+    assert bucket_inventory.get_largest_objects(5, prefix="logs/2021/") ==\
+        [bucket_inventory.get_object(4)]
+    assert bucket_inventory.get_object(4)["etag"] == "not-an-md5"
+
+
+def test_inventory_snapshot(bucket_inventory, use_numpy, tmp_path):
+    """
+    Purpose:
+        Inventories round trip through snapshots, and truncated snapshots are
+        refused
+    """
+
+    snapshot_filename = str(tmp_path / "inventory.snapshot")
+    bucket_inventory.save(snapshot_filename)
+
+    loaded_inventory = minio_inventory_helpers.load_bucket_inventory(
+        snapshot_filename, use_numpy=use_numpy
+    )
+    assert [loaded_inventory.get_object(index) for index in range(8)] ==\
+        [bucket_inventory.get_object(index) for index in range(8)]
+    assert loaded_inventory.get_memory_size() == bucket_inventory.get_memory_size()
+    assert loaded_inventory.get_prefix_size("logs/")["total_size"] == 455
+
+    loaded_inventory.add_object("zz.bin", 1, NOW, "f" * 32)
+    assert len(loaded_inventory) == 9
+    with pytest.raises(ObjectListingUnsorted):
+        loaded_inventory.add_object("b.txt", 1, NOW, "f" * 32)
+
+    with open(snapshot_filename, "rb") as snapshot_file:
+        snapshot_data = snapshot_file.read()
+    with open(snapshot_filename, "wb") as snapshot_file:
+        snapshot_file.write(snapshot_data[:-10])
+    with pytest.raises(ValueError):
+        minio_inventory_helpers.load_bucket_inventory(snapshot_filename)
+
+
+def test_build_bucket_inventory(fake_s3_server, minio_client, use_numpy):
+    """
+    Purpose:
+        Inventories are built from a bucket's listing
+    """
+
+    for idx in range(5):
+        fake_s3_server.put_object("bucket", f"data/{idx}.bin", b"x" * idx)
+
+    bucket_inventory = minio_inventory_helpers.build_bucket_inventory(
+        minio_client, "bucket", prefix="data/", use_numpy=use_numpy
+    )
+
+    assert len(bucket_inventory) == 5
+    assert bucket_inventory.get_prefix_size("data/")["total_size"] == 10
+    assert bucket_inventory.get_object(4)["etag"] ==\
+        fake_s3_server.buckets["bucket"]["data/4.bin"]["etag"]
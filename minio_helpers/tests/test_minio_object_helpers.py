@@ -5,11 +5,18 @@
 """
 
 # Python Library Imports
+import gzip
+import hashlib
+import io
 import os
 import sys
+import time
 import pytest
 from unittest import mock
 
+from minio.definitions import Object
+from minio.error import MultiDeleteError, NoSuchKey
+
 # Import File to Test
 from minio_helpers import minio_object_helpers
 
@@ -19,7 +26,49 @@ from minio_helpers import minio_object_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+@pytest.fixture
+def object_contents():
+    """
+    Purpose:
+        Contents of the objects stored in the mocked bucket
+    """
+
+    return {
+        "a/1.json": b'{"a": 1}',
+        "a/2.json": b'{"a": 2}',
+        "b/1.txt": b"b1",
+        "b/2.txt": b"b2",
+        "c.txt": bytes(range(256)) * 4,
+    }
+
+
+@pytest.fixture
+def object_names(object_contents):
+    """
+    Purpose:
+        Sorted object names stored in the mocked bucket
+    """
+
+    return sorted(object_contents)
+
+
+@pytest.fixture
+def mocked_minio_client(object_contents):
+    """
+    Purpose:
+        Mocked Minio client backed by the object_contents fixture
+    """
+
+    minio_client = mock.MagicMock()
+    minio_client.list_objects_v2.side_effect = mocked_list_objects_v2(object_contents)
+    minio_client.stat_object.side_effect = mocked_stat_object(object_contents)
+    minio_client.fget_object.side_effect = mocked_fget_object(object_contents)
+    minio_client.get_object.side_effect = mocked_get_partial_object(object_contents)
+    minio_client.get_partial_object.side_effect =\
+        mocked_get_partial_object(object_contents)
+    minio_client.remove_objects.side_effect = mocked_remove_objects(object_contents)
+
+    return minio_client
 
 
 ###
@@ -27,7 +76,125 @@ from minio_helpers import minio_object_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+class MockedResponse(io.BytesIO):
+    """
+    Purpose:
+        Stand-in for the urllib3 response returned by get_object
+    """
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.headers = {"content-length": str(len(data))}
+        self.release_conn = mock.MagicMock()
+
+    def stream(self, amt=1024):
+        for data in iter(lambda: self.read(amt), b""):
+            yield data
+
+
+def mocked_object(bucket_name, object_name, object_content):
+    """
+    Purpose:
+        Build an Object OBJ describing object_content
+    """
+
+    return Object(
+        bucket_name,
+        object_name,
+        last_modified=time.gmtime(0),
+        etag=hashlib.md5(object_content).hexdigest(),
+        size=len(object_content),
+    )
+
+
+def mocked_list_objects_v2(object_contents):
+    """
+    Purpose:
+        Build a list_objects_v2 replacement that filters by prefix/start_after
+    """
+
+    def list_objects_v2(bucket_name, prefix=None, recursive=False, start_after=None):
+        listed_prefixes = set()
+        for object_name in sorted(object_contents):
+            if prefix and not object_name.startswith(prefix):
+                continue
+            if start_after and object_name <= start_after:
+                continue
+
+            delimiter_idx = object_name.find("/", len(prefix or ""))
+            if not recursive and delimiter_idx >= 0:
+                object_prefix = object_name[:delimiter_idx + 1]
+                if object_prefix not in listed_prefixes:
+                    listed_prefixes.add(object_prefix)
+                    yield Object(bucket_name, object_prefix, is_dir=True)
+                continue
+
+            yield mocked_object(bucket_name, object_name, object_contents[object_name])
+
+    return list_objects_v2
+
+
+def mocked_stat_object(object_contents):
+    """
+    Purpose:
+        Build a stat_object replacement raising NoSuchKey for missing objects
+    """
+
+    def stat_object(bucket_name, object_name):
+        if object_name not in object_contents:
+            raise NoSuchKey()
+        return mocked_object(bucket_name, object_name, object_contents[object_name])
+
+    return stat_object
+
+
+def mocked_fget_object(object_contents):
+    """
+    Purpose:
+        Build a fget_object replacement writing the object content to the file
+    """
+
+    def fget_object(bucket_name, object_name, file_path):
+        if object_name not in object_contents:
+            raise NoSuchKey()
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "wb") as object_file:
+            object_file.write(object_contents[object_name])
+        return mocked_object(bucket_name, object_name, object_contents[object_name])
+
+    return fget_object
+
+
+def mocked_get_partial_object(object_contents):
+    """
+    Purpose:
+        Build a get_object/get_partial_object replacement returning a response
+    """
+
+    def get_partial_object(bucket_name, object_name, offset=0, length=0, **kwargs):
+        if object_name not in object_contents:
+            raise NoSuchKey()
+        object_content = object_contents[object_name]
+        end = offset + length if length else len(object_content)
+        return MockedResponse(object_content[offset:end])
+
+    return get_partial_object
+
+
+def mocked_remove_objects(object_contents):
+    """
+    Purpose:
+        Build a remove_objects replacement reporting missing keys as errors
+    """
+
+    def remove_objects(bucket_name, object_names):
+        if len(object_names) > 1000:
+            raise ValueError("Too many keys in a multi-object delete")
+        for object_name in object_names:
+            if object_contents.pop(object_name, None) is None:
+                yield MultiDeleteError(object_name, "NoSuchKey", "Doesn't Exist")
+
+    return remove_objects
 
 
 ###
@@ -35,4 +202,507 @@ from minio_helpers import minio_object_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+def test_iter_objects_is_lazy(mocked_minio_client, object_names):
+    """
+    Purpose:
+        iter_objects yields without materializing the listing and honors filters
+    """
+
+    object_iter = minio_object_helpers.iter_objects(
+        mocked_minio_client, "bucket", recursive=True
+    )
+    mocked_minio_client.list_objects_v2.assert_not_called()
+    assert next(object_iter).object_name == object_names[0]
+
+    assert list(
+        minio_object_helpers.iter_object_names(
+            mocked_minio_client, "bucket", prefix="b/", start_after="b/1.txt"
+        )
+    ) == ["b/2.txt"]
+    assert minio_object_helpers.get_object_names(
+        mocked_minio_client, "bucket", recursive=True, max_keys=2
+    ) == object_names[:2]
+    assert minio_object_helpers.get_objects(
+        mocked_minio_client, "bucket", max_keys=0
+    ) == []
+
+
+def test_get_listing_shards(mocked_minio_client):
+    """
+    Purpose:
+        Shards are the sorted top-level prefixes and objects of the bucket
+    """
+
+    shards = minio_object_helpers.get_listing_shards(mocked_minio_client, "bucket")
+
+    assert [(shard.object_name, shard.is_dir) for shard in shards] ==\
+        [("a/", True), ("b/", True), ("c.txt", False)]
+    assert len(
+        minio_object_helpers.get_listing_shards(
+            mocked_minio_client, "bucket", shard_depth=3
+        )
+    ) == 5
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_get_objects_parallel(mocked_minio_client, object_names, max_workers):
+    """
+    Purpose:
+        Parallel listing returns every object, sorted when ordered is set
+    """
+
+    ordered_objects = minio_object_helpers.get_objects_parallel(
+        mocked_minio_client, "bucket", max_workers=max_workers
+    )
+    assert [obj.object_name for obj in ordered_objects] == object_names
+
+    unordered_objects = minio_object_helpers.get_objects_parallel(
+        mocked_minio_client, "bucket", max_workers=max_workers, ordered=False
+    )
+    assert sorted(obj.object_name for obj in unordered_objects) == object_names
+
+
+def test_is_object_in_bucket_stat(mocked_minio_client):
+    """
+    Purpose:
+        Stat strategy is a single HEAD request per check
+    """
+
+    assert minio_object_helpers.is_object_in_bucket(
+        mocked_minio_client, "bucket", "b/1.txt"
+    )
+    assert not minio_object_helpers.is_object_in_bucket(
+        mocked_minio_client, "bucket", "b/3.txt"
+    )
+    assert mocked_minio_client.stat_object.call_count == 2
+    mocked_minio_client.list_objects_v2.assert_not_called()
+
+
+def test_is_object_in_bucket_prefix(mocked_minio_client):
+    """
+    Purpose:
+        Prefix strategy matches only the exact object name
+    """
+
+    assert minio_object_helpers.is_object_in_bucket(
+        mocked_minio_client, "bucket", "a/1.json", strategy="prefix"
+    )
+    assert not minio_object_helpers.is_object_in_bucket(
+        mocked_minio_client, "bucket", "a/1", strategy="prefix"
+    )
+    assert not minio_object_helpers.is_object_in_bucket(
+        mocked_minio_client, "bucket", "d.txt", strategy="prefix"
+    )
+
+
+def test_is_object_in_bucket_invalid_strategy(mocked_minio_client):
+    """
+    Purpose:
+        Unknown strategies raise a ValueError
+    """
+
+    with pytest.raises(ValueError):
+        minio_object_helpers.is_object_in_bucket(
+            mocked_minio_client, "bucket", "c.txt", strategy="guess"
+        )
+
+
+def test_are_objects_in_bucket(mocked_minio_client):
+    """
+    Purpose:
+        Batch existence check uses one listing bounded by the common prefix
+    """
+
+    objects_exist = minio_object_helpers.are_objects_in_bucket(
+        mocked_minio_client, "bucket", ["b/2.txt", "b/1.txt", "b/0.txt"]
+    )
+
+    assert objects_exist == {"b/2.txt": True, "b/1.txt": True, "b/0.txt": False}
+    mocked_minio_client.list_objects_v2.assert_called_once_with(
+        "bucket", prefix="b/", recursive=True, start_after=None
+    )
+    assert minio_object_helpers.are_objects_in_bucket(
+        mocked_minio_client, "bucket", []
+    ) == {}
+
+
+def test_download_objects(mocked_minio_client, tmpdir):
+    """
+    Purpose:
+        Bulk download fetches every object and reports per-object errors
+    """
+
+    objects = minio_object_helpers.get_objects(
+        mocked_minio_client, "bucket", recursive=True
+    )
+    download_results = minio_object_helpers.download_objects(
+        mocked_minio_client,
+        "bucket",
+        objects + ["missing.txt"],
+        download_dir=str(tmpdir),
+        max_workers=3,
+        max_in_flight_bytes=10,
+    )
+
+    errors = {result["object_name"]: result["error"] for result in download_results}
+    assert len(errors) == len(objects) + 1
+    assert isinstance(errors.pop("missing.txt"), NoSuchKey)
+    assert not any(errors.values())
+    assert tmpdir.join("a", "2.json").read() == '{"a": 2}'
+
+
+def test_download_object_to_file_ranged(mocked_minio_client, object_contents, tmpdir):
+    """
+    Purpose:
+        Ranged download writes every range at its offset and verifies the ETag
+    """
+
+    filename = str(tmpdir.join("c.txt"))
+    minio_object_helpers.download_object_to_file(
+        mocked_minio_client, "bucket", "c.txt", filename=filename, ranged=True,
+        part_size=100, max_workers=4,
+    )
+
+    with open(filename, "rb") as downloaded_file:
+        assert downloaded_file.read() == object_contents["c.txt"]
+    assert mocked_minio_client.get_partial_object.call_count == 11
+    assert os.listdir(str(tmpdir)) == ["c.txt"]
+
+    with pytest.raises(ValueError):
+        minio_object_helpers.download_object_to_file_ranged(
+            mocked_minio_client, "bucket", "c.txt", filename=filename, part_size=0
+        )
+
+
+def test_download_object_to_file_ranged_resumes(
+    mocked_minio_client, object_contents, tmpdir
+):
+    """
+    Purpose:
+        A failed ranged download resumes without refetching completed ranges
+    """
+
+    filename = str(tmpdir.join("c.txt"))
+    get_partial_object = mocked_get_partial_object(object_contents)
+
+    def failing_get_partial_object(bucket_name, object_name, offset=0, length=0):
+        if offset == 500:
+            raise ConnectionError("Dropped Connection")
+        return get_partial_object(bucket_name, object_name, offset, length)
+
+    mocked_minio_client.get_partial_object.side_effect = failing_get_partial_object
+    with pytest.raises(ConnectionError):
+        minio_object_helpers.download_object_to_file_ranged(
+            mocked_minio_client, "bucket", "c.txt", filename=filename,
+            part_size=100, max_workers=1,
+        )
+    assert not os.path.exists(filename)
+
+    mocked_minio_client.get_partial_object.reset_mock()
+    mocked_minio_client.get_partial_object.side_effect = get_partial_object
+    minio_object_helpers.download_object_to_file_ranged(
+        mocked_minio_client, "bucket", "c.txt", filename=filename, part_size=100,
+    )
+
+    with open(filename, "rb") as downloaded_file:
+        assert downloaded_file.read() == object_contents["c.txt"]
+    assert mocked_minio_client.get_partial_object.call_count == 1
+
+
+def test_download_object_to_file_ranged_etag_mismatch(
+    mocked_minio_client, object_contents, tmpdir
+):
+    """
+    Purpose:
+        An object replaced mid-download fails ETag verification
+    """
+
+    get_partial_object = mocked_get_partial_object(dict(object_contents))
+
+    def replacing_get_partial_object(*args, **kwargs):
+        object_contents["c.txt"] = b"replaced"
+        return get_partial_object(*args, **kwargs)
+
+    mocked_minio_client.get_partial_object.side_effect = replacing_get_partial_object
+    with pytest.raises(minio_object_helpers.ObjectChangedDuringDownload):
+        minio_object_helpers.download_object_to_file_ranged(
+            mocked_minio_client, "bucket", "c.txt",
+            filename=str(tmpdir.join("c.txt")), part_size=512,
+        )
+
+
+def test_upload_object_single_put(mocked_minio_client, tmpdir):
+    """
+    Purpose:
+        Files no larger than a part are uploaded with a single PUT
+    """
+
+    upload_file = tmpdir.join("small.txt")
+    upload_file.write("small")
+    mocked_minio_client.put_object.return_value = ("etag", None)
+
+    assert minio_object_helpers.upload_object(
+        mocked_minio_client, "bucket", str(upload_file), metadata={"owner": "me"}
+    ) == "etag"
+    put_args, put_kwargs = mocked_minio_client.put_object.call_args
+    assert put_args[:2] == ("bucket", "small.txt")
+    assert put_kwargs["metadata"] == {"X-Amz-Meta-owner": "me"}
+    mocked_minio_client._new_multipart_upload.assert_not_called()
+
+    with pytest.raises(minio_object_helpers.ObjectAlreadyExists):
+        minio_object_helpers.upload_object(
+            mocked_minio_client, "bucket", str(upload_file), object_name="c.txt",
+            overwrite=False,
+        )
+
+
+def test_upload_object_multipart(mocked_minio_client, tmpdir):
+    """
+    Purpose:
+        Large files are uploaded as parallel parts and completed in order
+    """
+
+    part_size = minio_object_helpers.MIN_PART_SIZE
+    upload_file = tmpdir.join("large.bin")
+    upload_file.write_binary(os.urandom(part_size * 2 + 10))
+
+    uploaded_data = {}
+
+    def do_put_object(bucket_name, object_name, data, length, upload_id, part_number):
+        uploaded_data[part_number] = data
+        return (f"etag-{part_number}", None)
+
+    mocked_minio_client._new_multipart_upload.return_value = "upload-id"
+    mocked_minio_client._do_put_object.side_effect = do_put_object
+    mocked_minio_client._complete_multipart_upload.return_value =\
+        (mock.MagicMock(etag="etag-final"), None)
+
+    assert minio_object_helpers.upload_object(
+        mocked_minio_client, "bucket", str(upload_file), part_size=part_size,
+        max_workers=2,
+    ) == "etag-final"
+    assert b"".join(uploaded_data[part] for part in sorted(uploaded_data)) ==\
+        upload_file.read_binary()
+
+    complete_args = mocked_minio_client._complete_multipart_upload.call_args[0]
+    assert sorted(complete_args[3]) == [1, 2, 3]
+    assert complete_args[3][2].etag == "etag-2"
+
+    mocked_minio_client._do_put_object.side_effect = ConnectionError("Dropped")
+    with pytest.raises(ConnectionError):
+        minio_object_helpers.upload_object(
+            mocked_minio_client, "bucket", str(upload_file), part_size=part_size,
+        )
+    mocked_minio_client._remove_incomplete_upload.assert_called_once_with(
+        "bucket", "large.bin", "upload-id"
+    )
+
+
+@pytest.mark.parametrize(
+    "compare,skipped_names", [("hash", ["b/1.txt"]), ("size_mtime", [])]
+)
+def test_upload_directory(mocked_minio_client, tmpdir, compare, skipped_names):
+    """
+    Purpose:
+        Directory upload skips unchanged files using a single listing
+    """
+
+    tmpdir.join("b", "1.txt").write_binary(b"b1", ensure=True)
+    tmpdir.join("b", "2.txt").write_binary(b"changed", ensure=True)
+    tmpdir.join("new.txt").write_binary(b"new")
+    mocked_minio_client.put_object.return_value = ("etag", None)
+
+    upload_results = minio_object_helpers.upload_directory(
+        mocked_minio_client, "bucket", str(tmpdir), compare=compare, max_workers=2
+    )
+
+    assert sorted(result["object_name"] for result in upload_results) ==\
+        ["b/1.txt", "b/2.txt", "new.txt"]
+    assert sorted(
+        result["object_name"] for result in upload_results if result["skipped"]
+    ) == skipped_names
+    assert not any(result["error"] for result in upload_results)
+    assert mocked_minio_client.put_object.call_count == 3 - len(skipped_names)
+    mocked_minio_client.list_objects_v2.assert_called_once()
+    mocked_minio_client.stat_object.assert_not_called()
+
+
+def test_iter_directory_files(tmpdir):
+    """
+    Purpose:
+        Files are named by their relative paths under a directory prefix
+    """
+
+    tmpdir.join("b", "1.txt").write_binary(b"b1", ensure=True)
+    tmpdir.join("new.txt").write_binary(b"new")
+
+    for prefix in ("backups", "backups/"):
+        assert sorted(
+            object_name for _, object_name in
+            minio_object_helpers.iter_directory_files(str(tmpdir), prefix=prefix)
+        ) == ["backups/b/1.txt", "backups/new.txt"]
+    assert sorted(
+        object_name for _, object_name in
+        minio_object_helpers.iter_directory_files(str(tmpdir))
+    ) == ["b/1.txt", "new.txt"]
+
+
+def test_is_file_unchanged_size_mtime(tmpdir):
+    """
+    Purpose:
+        size_mtime treats files modified after the upload as changed
+    """
+
+    local_file = tmpdir.join("file.txt")
+    local_file.write("data")
+    file_mtime = os.stat(str(local_file)).st_mtime
+
+    assert minio_object_helpers.is_file_unchanged(
+        str(local_file), 4, file_mtime + 1, "etag"
+    )
+    assert not minio_object_helpers.is_file_unchanged(
+        str(local_file), 4, file_mtime - 1, "etag"
+    )
+    assert not minio_object_helpers.is_file_unchanged(
+        str(local_file), 5, file_mtime + 1, "etag"
+    )
+
+
+def test_delete_object(mocked_minio_client):
+    """
+    Purpose:
+        Deleting a missing object raises ObjectDoesntExist unless unchecked
+    """
+
+    minio_object_helpers.delete_object(mocked_minio_client, "bucket", "c.txt")
+    mocked_minio_client.remove_object.assert_called_once_with("bucket", "c.txt")
+
+    with pytest.raises(minio_object_helpers.ObjectDoesntExist):
+        minio_object_helpers.delete_object(mocked_minio_client, "bucket", "d.txt")
+
+    minio_object_helpers.delete_object(
+        mocked_minio_client, "bucket", "d.txt", check_exists=False
+    )
+    assert mocked_minio_client.remove_object.call_count == 2
+
+
+def test_delete_objects(mocked_minio_client, object_contents):
+    """
+    Purpose:
+        Batch delete groups keys into requests and returns per-key failures
+    """
+
+    delete_failures = minio_object_helpers.delete_objects(
+        mocked_minio_client, "bucket", iter(["a/1.json", "b/1.txt", "x.txt"]),
+        batch_size=2,
+    )
+
+    assert delete_failures == [
+        {"object_name": "x.txt", "error_code": "NoSuchKey",
+         "error_message": "Doesn't Exist"}
+    ]
+    assert mocked_minio_client.remove_objects.call_count == 2
+    assert sorted(object_contents) == ["a/2.json", "b/2.txt", "c.txt"]
+
+
+def test_delete_objects_batch_error(mocked_minio_client):
+    """
+    Purpose:
+        A failed delete request reports every key in its batch
+    """
+
+    mocked_minio_client.remove_objects.side_effect = ConnectionError("Dropped")
+
+    delete_failures = minio_object_helpers.delete_objects(
+        mocked_minio_client, "bucket", ["a/1.json", "b/1.txt"]
+    )
+
+    assert [failure["object_name"] for failure in delete_failures] ==\
+        ["a/1.json", "b/1.txt"]
+    assert delete_failures[0]["error_code"] == "ConnectionError"
+
+
+def test_delete_objects_by_prefix(mocked_minio_client, object_contents):
+    """
+    Purpose:
+        Prefix delete removes only the objects under the prefix
+    """
+
+    assert minio_object_helpers.delete_objects_by_prefix(
+        mocked_minio_client, "bucket", "a/"
+    ) == []
+    assert sorted(object_contents) == ["b/1.txt", "b/2.txt", "c.txt"]
+
+
+def test_download_object_to_memory(mocked_minio_client, object_contents):
+    """
+    Purpose:
+        Objects are parsed by extension and the connection is released
+    """
+
+    object_contents["c.bin"] = b"binary"
+
+    assert minio_object_helpers.download_object_to_memory(
+        mocked_minio_client, "bucket", "a/1.json"
+    ) == {"a": 1}
+    assert minio_object_helpers.download_object_to_memory(
+        mocked_minio_client, "bucket", "b/1.txt"
+    ) == "b1"
+    assert mocked_minio_client.get_object.call_count == 2
+
+    with pytest.raises(minio_object_helpers.ObjectDecodingNotSupported):
+        minio_object_helpers.download_object_to_memory(
+            mocked_minio_client, "bucket", "c.bin"
+        )
+
+
+def test_download_object_to_memory_compressed(mocked_minio_client, object_contents):
+    """
+    Purpose:
+        Compressed objects are decompressed and decoded by their inner extension
+    """
+
+    object_contents["records.ndjson.gz"] = gzip.compress(b'{"a": 1}\n\n{"a": 2}\n')
+    object_contents["records.csv"] = b"a,b\r\n1,2\r\n"
+
+    assert minio_object_helpers.download_object_to_memory(
+        mocked_minio_client, "bucket", "records.ndjson.gz"
+    ) == [{"a": 1}, {"a": 2}]
+    assert minio_object_helpers.download_object_to_memory(
+        mocked_minio_client, "bucket", "records.csv"
+    ) == [{"a": "1", "b": "2"}]
+
+
+def test_iter_records(mocked_minio_client, object_contents):
+    """
+    Purpose:
+        Records are streamed, batched, and the connection is released
+    """
+
+    object_contents["logs/day.log.gz"] = gzip.compress(
+        b"".join(b'{"line": %d}\n' % line_idx for line_idx in range(5))
+    )
+
+    record_batches = list(
+        minio_object_helpers.iter_records(
+            mocked_minio_client, "bucket", "logs/day.log.gz",
+            record_format="ndjson",
+            batch_size=2,
+        )
+    )
+    assert record_batches == [
+        [{"line": 0}, {"line": 1}], [{"line": 2}, {"line": 3}], [{"line": 4}]
+    ]
+
+    lines = minio_object_helpers.iter_records(
+        mocked_minio_client, "bucket", "logs/day.log.gz"
+    )
+    assert next(lines) == '{"line": 0}'
+    lines.close()
+
+    with pytest.raises(minio_object_helpers.ObjectDecodingNotSupported):
+        list(
+            minio_object_helpers.iter_records(
+                mocked_minio_client, "bucket", "c.txt", record_format="bin"
+            )
+        )
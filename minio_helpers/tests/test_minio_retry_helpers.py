@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Test File for minio_retry_helpers.py
+"""
+
+# Python Library Imports
+import io
+import threading
+import pytest
+from unittest import mock
+from minio.definitions import Object
+from minio.error import InternalError, NoSuchKey, ServiceUnavailable
+
+# Import File to Test
+from minio_helpers import minio_object_helpers
+from minio_helpers import minio_retry_helpers
+from minio_helpers.minio_exceptions import OperationDeadlineExceeded
+
+
+###
+# Fixtures
+###
+
+
+@pytest.fixture
+def retry_policy():
+    """
+    Purpose:
+        RetryPolicy without backoff sleeps, closed after the test
+    """
+
+    retry_policy = minio_retry_helpers.RetryPolicy(max_attempts=3, base_delay=0)
+    yield retry_policy
+    retry_policy.close()
+
+
+###
+# Mocked Functions
+###
+
+
+class MockedObjectResponse(io.BytesIO):
+    """
+    Purpose:
+        get_object response over an object's bytes
+    """
+
+    def __init__(self, object_data):
+        super().__init__(object_data)
+        self.headers = {"content-length": str(len(object_data))}
+
+    def release_conn(self):
+        pass
+
+
+def get_failing_func(errors, result="result"):
+    """
+    Purpose:
+        Mock raising each of errors in turn, then returning result
+    """
+
+    return mock.Mock(side_effect=list(errors) + [result])
+
+
+###
+# Test Payload
+###
+
+
+def test_retry_policy_retries_transient_errors(retry_policy):
+    """
+    Purpose:
+        Transient errors are retried up to max_attempts, others are raised
+    """
+
+    retried_func = get_failing_func([ServiceUnavailable(), ConnectionResetError()])
+    assert retry_policy.call("get_object", retried_func) == "result"
+    assert retried_func.call_count == 3
+    assert retry_policy.get_counters()["retries"] == 2
+
+    exhausted_func = get_failing_func([InternalError()] * 3)
+    with pytest.raises(InternalError):
+        retry_policy.call("get_object", exhausted_func)
+    assert exhausted_func.call_count == 3
+
+    missing_func = get_failing_func([NoSuchKey()])
+    with pytest.raises(NoSuchKey):
+        retry_policy.call("get_object", missing_func)
+    assert missing_func.call_count == 1
+
+    assert minio_retry_helpers.call_with_retry_policy(
+        None, "get_object", lambda: "direct"
+    ) == "direct"
+
+
+def test_retry_policy_backoff_and_deadline():
+    """
+    Purpose:
+        Backoff delays are jittered below the exponential cap, and no attempt is
+        started past the deadline
+    """
+
+    retry_policy = minio_retry_helpers.RetryPolicy(
+        max_attempts=10, base_delay=0.1, max_delay=0.5, deadline=0.05
+    )
+
+    for attempt, max_delay in [(1, 0.1), (2, 0.2), (3, 0.4), (6, 0.5)]:
+        assert all(
+            0 <= retry_policy.get_backoff_delay(attempt) <= max_delay
+            for _ in range(20)
+        )
+
+    failing_func = get_failing_func([ServiceUnavailable()] * 10)
+    with mock.patch.object(retry_policy, "get_backoff_delay", return_value=1):
+        with pytest.raises(ServiceUnavailable):
+            retry_policy.call("stat_object", failing_func)
+
+    assert failing_func.call_count == 1
+    assert retry_policy.get_counters()["deadlines_exceeded"] == 1
+
+
+def test_hedged_reads():
+    """
+    Purpose:
+        A read that has not answered after the hedge delay is duplicated, the
+        first answer is used, and the late answer is discarded
+    """
+
+    retry_policy = minio_retry_helpers.RetryPolicy(hedge_reads=True, hedge_delay=0.02)
+    release_slow_request = threading.Event()
+    discarded = []
+    discarded_event = threading.Event()
+    calls = []
+
+    def read():
+        calls.append(len(calls))
+        if len(calls) == 1:
+            release_slow_request.wait(5)
+            return "slow"
+        return "fast"
+
+    def discard_result(result):
+        discarded.append(result)
+        discarded_event.set()
+
+    try:
+        assert retry_policy.call(
+            "get_object", read, hedged=True, discard_result=discard_result
+        ) == "fast"
+        release_slow_request.set()
+        assert discarded_event.wait(5)
+        assert discarded == ["slow"]
+        assert retry_policy.get_counters()["hedged_requests"] == 1
+        assert retry_policy.get_counters()["hedge_wins"] == 1
+
+        # Reads that answer before the hedge delay are not duplicated
+        assert retry_policy.call("get_object", lambda: "quick", hedged=True) ==\
+            "quick"
+        assert retry_policy.get_counters()["hedged_requests"] == 1
+    finally:
+        release_slow_request.set()
+        retry_policy.close()
+
+
+def test_hedged_read_deadline():
+    """
+    Purpose:
+        Hedged reads stop being waited on at the deadline
+    """
+
+    retry_policy = minio_retry_helpers.RetryPolicy(
+        hedge_reads=True, hedge_delay=0.01, deadline=0.05
+    )
+    release_requests = threading.Event()
+
+    try:
+        with pytest.raises(OperationDeadlineExceeded):
+            retry_policy.call(
+                "stat_object", lambda: release_requests.wait(5), hedged=True
+            )
+        assert retry_policy.get_counters()["deadlines_exceeded"] == 1
+    finally:
+        release_requests.set()
+        retry_policy.close()
+
+
+def test_hedge_delay_from_latency_quantile():
+    """
+    Purpose:
+        Without a fixed hedge delay, reads are hedged after the tracked quantile
+        once enough latencies are tracked
+    """
+
+    retry_policy = minio_retry_helpers.RetryPolicy(
+        hedge_reads=True, hedge_quantile=0.9, hedge_min_samples=10
+    )
+
+    for latency_idx in range(9):
+        retry_policy.record_latency("get_object", latency_idx / 100)
+    assert retry_policy.get_hedge_delay("get_object") is None
+
+    retry_policy.record_latency("get_object", 0.09)
+    assert retry_policy.get_hedge_delay("get_object") == 0.09
+    assert retry_policy.get_hedge_delay("stat_object") is None
+
+    latency_tracker = minio_retry_helpers.LatencyTracker(window=4)
+    for latency in [5, 1, 2, 3, 4]:
+        latency_tracker.add(latency)
+    assert len(latency_tracker) == 4
+    assert latency_tracker.get_quantile(0) == 1
+    assert latency_tracker.get_quantile(0.5) == 3
+
+
+def test_retried_helpers(retry_policy):
+    """
+    Purpose:
+        Helpers retry their requests, and listings resume after the last object
+        yielded
+    """
+
+    minio_client = mock.MagicMock()
+    minio_client.get_object.side_effect = [
+        InternalError(), MockedObjectResponse(b'{"a": 1}')
+    ]
+    assert minio_object_helpers.download_object_to_memory(
+        minio_client, "bucket", "a.json", retry_policy=retry_policy
+    ) == {"a": 1}
+    assert minio_client.get_object.call_count == 2
+
+    def list_objects_v2(bucket_name, start_after=None, **kwargs):
+        if start_after is None:
+            yield Object(bucket_name, "a.txt")
+            yield Object(bucket_name, "b/", is_dir=True)
+            raise ServiceUnavailable()
+
+        yield Object(bucket_name, "b/", is_dir=True)
+        yield Object(bucket_name, "c.txt")
+
+    minio_client.list_objects_v2.side_effect = list_objects_v2
+    assert minio_object_helpers.get_object_names(
+        minio_client, "bucket", retry_policy=retry_policy
+    ) == ["a.txt", "b/", "c.txt"]
+    assert minio_client.list_objects_v2.call_args.kwargs["start_after"] == "b/"
+
+    minio_client.list_objects_v2.side_effect = list_objects_v2
+    with pytest.raises(ServiceUnavailable):
+        minio_object_helpers.get_object_names(minio_client, "bucket")
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Test File for minio_sync_helpers.py
+"""
+
+# Python Library Imports
+import pytest
+from unittest import mock
+from minio.definitions import Object
+
+# Import File to Test
+from minio_helpers import minio_sync_helpers
+from minio_helpers.minio_exceptions import ObjectListingUnsorted
+from minio_helpers.tests.fake_s3_server import FakeS3Server
+
+
+###
+# Fixtures
+###
+
+
+@pytest.fixture
+def source_s3_server():
+    """
+    Purpose:
+        Second running FakeS3Server to sync from, stopped after the test
+    """
+
+    with FakeS3Server() as source_s3_server:
+        yield source_s3_server
+
+
+###
+# Mocked Functions
+###
+
+
+def get_objects(*object_names):
+    """
+    Purpose:
+        Listing of objects with the given names, names ending in / are dirs
+    """
+
+    return [
+        Object("bucket", object_name, is_dir=object_name.endswith("/"))
+        for object_name in object_names
+    ]
+
+
+###
+# Test Payload
+###
+
+
+def test_iter_listing_diff():
+    """
+    Purpose:
+        Listings are merged on their names relative to their prefixes, and
+        unsorted listings are refused
+    """
+
+    listing_diff = minio_sync_helpers.iter_listing_diff(
+        get_objects("src/a", "src/b/", "src/c", "src/d"),
+        get_objects("dst/b", "dst/c", "dst/e"),
+        source_prefix="src/",
+        destination_prefix="dst/",
+    )
+    assert [
+        (relative_name, source_object is not None, destination_object is not None)
+        for relative_name, source_object, destination_object in listing_diff
+    ] == [
+        ("a", True, False),
+        ("b", False, True),
+        ("c", True, True),
+        ("d", True, False),
+        ("e", False, True),
+    ]
+
+    with pytest.raises(ObjectListingUnsorted):
+        list(minio_sync_helpers.iter_listing_diff(get_objects("b", "a"), []))
+
+
+def test_sync_bucket_same_endpoint(fake_s3_server, minio_client):
+    """
+    Purpose:
+        Buckets on the same Minio are synced with server-side copies, copying
+        only new and changed objects and optionally deleting extra ones
+    """
+
+    fake_s3_server.buckets["destination"] = {}
+    fake_s3_server.put_object(
+        "source", "data/new.json", b"{}", content_type="application/json",
+        metadata={"X-Amz-Meta-Owner": "team"},
+    )
+    fake_s3_server.put_object("source", "data/changed.txt", b"changed")
+    fake_s3_server.put_object("source", "data/same.txt", b"same")
+    fake_s3_server.put_object("destination", "copy/changed.txt", b"old")
+    fake_s3_server.put_object("destination", "copy/same.txt", b"same")
+    fake_s3_server.put_object("destination", "copy/extra.txt", b"extra")
+    fake_s3_server.buckets["source"]["data/same.txt"]["last_modified"] -= 60
+
+    with mock.patch.object(minio_client, "get_object", side_effect=AssertionError):
+        sync_summary = minio_sync_helpers.sync_bucket(
+            minio_client, "destination", "source", prefix="copy/",
+            source_prefix="data/", delete=True, max_workers=2,
+        )
+
+    assert sync_summary["copied_objects"] == 2
+    assert sync_summary["copied_bytes"] == 9
+    assert sync_summary["unchanged_objects"] == 1
+    assert sync_summary["deleted_objects"] == 1
+    assert sync_summary["copy_failures"] == []
+    assert sync_summary["delete_failures"] == []
+
+    destination = fake_s3_server.buckets["destination"]
+    assert sorted(destination) == ["copy/changed.txt", "copy/new.json", "copy/same.txt"]
+    assert destination["copy/changed.txt"]["data"] == b"changed"
+    assert destination["copy/new.json"]["content_type"] == "application/json"
+    assert destination["copy/new.json"]["metadata"] == {"X-Amz-Meta-Owner": "team"}
+
+    sync_summary = minio_sync_helpers.sync_bucket(
+        minio_client, "destination", "source", prefix="copy/", source_prefix="data/"
+    )
+    assert sync_summary["copied_objects"] == 0
+    assert sync_summary["unchanged_objects"] == 3
+
+    with pytest.raises(ValueError):
+        minio_sync_helpers.sync_bucket(
+            minio_client, "destination", "source", compare="hash"
+        )
+
+
+def test_sync_bucket_across_endpoints(
+    fake_s3_server, minio_client, source_s3_server, connect_to_fake_s3_server
+):
+    """
+    Purpose:
+        Buckets on different Minios are synced by piping objects between them,
+        with large objects piped as multipart uploads
+    """
+
+    source_server, destination_server = source_s3_server, fake_s3_server
+    large_data = bytes(range(256)) * (11 * 1024 * 1024 // 256)
+    source_server.put_object(
+        "source", "large.bin", large_data, metadata={"X-Amz-Meta-Owner": "team"}
+    )
+    source_server.put_object("source", "small.txt", b"small")
+    destination_server.buckets["destination"] = {}
+
+    source_client = connect_to_fake_s3_server(source_server)
+    sync_summary = minio_sync_helpers.sync_bucket(
+        minio_client, "destination", "source", source_client=source_client
+    )
+    assert sync_summary["copied_objects"] == 2
+    assert destination_server.buckets["destination"]["large.bin"]["data"] ==\
+        large_data
+    assert destination_server.buckets["destination"]["small.txt"]["data"] ==\
+        b"small"
+
+    etag = minio_sync_helpers.pipe_object(
+        minio_client, "destination", "parts.bin", source_client, "source",
+        "large.bin", part_size=5 * 1024 * 1024,
+    )
+    piped_object = destination_server.buckets["destination"]["parts.bin"]
+    assert etag.endswith("-3")
+    assert piped_object["data"] == large_data
+    assert {
+        header_name.lower(): header_value
+        for header_name, header_value in piped_object["metadata"].items()
+    } == {"x-amz-meta-owner": "team"}
+    assert destination_server.uploads == {}
+
+
+def test_sync_bucket_different_credentials(
+    fake_s3_server, minio_client, connect_to_fake_s3_server
+):
+    """
+    Purpose:
+        Clients of the same Minio with different credentials pipe objects
+        instead of copying them server-side
+    """
+
+    fake_s3_server.put_object("source", "data.txt", b"data")
+    fake_s3_server.buckets["destination"] = {}
+
+    source_client = connect_to_fake_s3_server(fake_s3_server, access_key="reader")
+    with mock.patch.object(
+        minio_sync_helpers, "copy_object", side_effect=AssertionError
+    ):
+        sync_summary = minio_sync_helpers.sync_bucket(
+            minio_client, "destination", "source", source_client=source_client
+        )
+
+    assert sync_summary["copied_objects"] == 1
+    assert fake_s3_server.buckets["destination"]["data.txt"]["data"] == b"data"
+
+
+def test_copy_object_multipart(fake_s3_server, minio_client):
+    """
+    Purpose:
+        Objects over the single copy limit are copied as ranges of the source
+    """
+
+    large_data = bytes(range(256)) * (11 * 1024 * 1024 // 256)
+    fake_s3_server.put_object(
+        "bucket", "large.bin", large_data, content_type="application/x-test"
+    )
+
+    with mock.patch.object(minio_sync_helpers, "MAX_COPY_OBJECT_SIZE", 1024):
+        etag = minio_sync_helpers.copy_object(
+            minio_client, "bucket", "copy.bin", "bucket", "large.bin",
+            part_size=5 * 1024 * 1024,
+        )
+
+    copied_object = fake_s3_server.buckets["bucket"]["copy.bin"]
+    assert etag.endswith("-3")
+    assert copied_object["data"] == large_data
+    assert copied_object["content_type"] == "application/x-test"
+    assert fake_s3_server.uploads == {}
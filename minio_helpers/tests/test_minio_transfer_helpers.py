@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Test File for minio_transfer_helpers.py
+"""
+
+# Python Library Imports
+from minio.error import ServiceUnavailable
+
+# Import File to Test
+from minio_helpers import minio_object_helpers
+from minio_helpers import minio_transfer_helpers
+
+
+###
+# Mocked Functions
+###
+
+
+def fail_once(func, should_fail):
+    """
+    Purpose:
+        Wrap func to raise ServiceUnavailable the first time should_fail is true
+        of its arguments
+    """
+
+    failed = []
+
+    def failing_func(*args, **kwargs):
+        if not failed and should_fail(*args, **kwargs):
+            failed.append(True)
+            raise ServiceUnavailable()
+        return func(*args, **kwargs)
+
+    return failing_func
+
+
+###
+# Test Payload
+###
+
+
+def test_transfer_checkpoint(tmp_path):
+    """
+    Purpose:
+        Records survive reopening the checkpoint, are batched, and are compacted
+        to one line per transfer
+    """
+
+    checkpoint_filename = str(tmp_path / "checkpoint.jsonl")
+    with minio_transfer_helpers.TransferCheckpoint(
+        checkpoint_filename, save_interval=60
+    ) as checkpoint:
+        checkpoint.record_completed("bucket/a", "etag-a")
+        for part_number in range(3):
+            checkpoint.record_part("bucket/b", "etag-b", 10, part_number)
+        checkpoint.record_part("bucket/c", "1:2", 10, 1, part_etag="p1", upload_id="u")
+        checkpoint.record_completed("bucket/d", "etag-d")
+        checkpoint.forget("bucket/d")
+
+        assert checkpoint.get_counters() ==\
+            {"completed": 1, "partial": 2, "pending": 7}
+        checkpoint.flush()
+        assert checkpoint.get_counters()["pending"] == 0
+        with open(checkpoint_filename) as checkpoint_file:
+            assert len(checkpoint_file.readlines()) == 5
+
+        checkpoint.record_part("bucket/b", "etag-b", 10, 3)
+
+    with open(checkpoint_filename, "a") as checkpoint_file:
+        checkpoint_file.write('{"k": "bucket/e", "v"')
+
+    checkpoint = minio_transfer_helpers.TransferCheckpoint(checkpoint_filename)
+    assert checkpoint.is_completed("bucket/a", "etag-a")
+    assert not checkpoint.is_completed("bucket/a", "etag-changed")
+    assert not checkpoint.is_completed("bucket/d", "etag-d")
+    assert checkpoint.get_partial_state("bucket/b", "etag-b", 10) ==\
+        {"upload_id": None, "parts": {0: None, 1: None, 2: None, 3: None}}
+    assert checkpoint.get_partial_state("bucket/b", "etag-b", 20) is None
+    assert checkpoint.get_partial_state("bucket/c", "1:2", 10) ==\
+        {"upload_id": "u", "parts": {1: "p1"}}
+    with open(checkpoint_filename) as checkpoint_file:
+        assert len(checkpoint_file.readlines()) == 3
+
+
+def test_transfer_job_download_resume(fake_s3_server, minio_client, tmp_path):
+    """
+    Purpose:
+        A restarted download job skips finished objects and resumes the ranges
+        of a partial object
+    """
+
+    large_data = bytes(range(256)) * 4096
+    fake_s3_server.put_object("bucket", "large.bin", large_data)
+    for idx in range(3):
+        fake_s3_server.put_object("bucket", f"small/{idx}.txt", f"{idx}".encode())
+
+    checkpoint_filename = str(tmp_path / "checkpoint.jsonl")
+    download_dir = str(tmp_path / "download")
+    get_partial_object = minio_client.get_partial_object
+    minio_client.get_partial_object = fail_once(
+        get_partial_object, lambda *args, offset=0, **kwargs: offset >= 512 * 1024
+    )
+
+    def run_job():
+        with minio_transfer_helpers.TransferJob(
+            minio_client, checkpoint_filename, ranged_min_size=512 * 1024,
+            range_part_size=128 * 1024,
+        ) as transfer_job:
+            return {
+                result["object_name"]: result
+                for result in transfer_job.download_objects(
+                    "bucket",
+                    minio_object_helpers.iter_objects(
+                        minio_client, "bucket", recursive=True
+                    ),
+                    download_dir=download_dir,
+                )
+            }
+
+    first_results = run_job()
+    assert isinstance(first_results["large.bin"]["error"], ServiceUnavailable)
+    assert all(
+        result["error"] is None for name, result in first_results.items()
+        if name != "large.bin"
+    )
+
+    requests_before = fake_s3_server.request_count
+    second_results = run_job()
+    assert all(result["error"] is None for result in second_results.values())
+    assert sorted(
+        name for name, result in second_results.items() if result["skipped"]
+    ) == ["small/0.txt", "small/1.txt", "small/2.txt"]
+    with open(f"{download_dir}/large.bin", "rb") as download_file:
+        assert download_file.read() == large_data
+    # Listing, stat, the one failed range, and the re-stat verifying the ETag
+    assert fake_s3_server.request_count - requests_before == 4
+
+    third_results = run_job()
+    assert all(result["skipped"] for result in third_results.values())
+
+
+def test_transfer_job_upload_resume(fake_s3_server, minio_client, tmp_path):
+    """
+    Purpose:
+        A restarted upload job skips finished files and resumes the kept
+        multipart upload of a partial file
+    """
+
+    fake_s3_server.buckets["bucket"] = {}
+    upload_dir = tmp_path / "upload"
+    (upload_dir / "nested").mkdir(parents=True)
+    large_data = bytes(range(256)) * (11 * 1024 * 1024 // 256)
+    (upload_dir / "large.bin").write_bytes(large_data)
+    (upload_dir / "nested" / "small.txt").write_text("small")
+
+    checkpoint_filename = str(tmp_path / "checkpoint.jsonl")
+    do_put_object = minio_client._do_put_object
+    minio_client._do_put_object = fail_once(
+        do_put_object, lambda *args, part_number=None, **kwargs: part_number == 3
+    )
+
+    def run_job():
+        with minio_transfer_helpers.TransferJob(
+            minio_client, checkpoint_filename, upload_part_size=5 * 1024 * 1024,
+        ) as transfer_job:
+            return {
+                result["object_name"]: result
+                for result in transfer_job.upload_directory(
+                    "bucket", str(upload_dir), prefix="data/"
+                )
+            }
+
+    first_results = run_job()
+    assert isinstance(first_results["data/large.bin"]["error"], ServiceUnavailable)
+    assert first_results["data/nested/small.txt"]["error"] is None
+    assert len(fake_s3_server.uploads) == 1
+
+    requests_before = fake_s3_server.request_count
+    second_results = run_job()
+    assert second_results["data/large.bin"]["error"] is None
+    assert second_results["data/nested/small.txt"]["skipped"]
+    assert fake_s3_server.buckets["bucket"]["data/large.bin"]["data"] == large_data
+    assert fake_s3_server.uploads == {}
+    # Only the failed part and the completion are sent
+    assert fake_s3_server.request_count - requests_before == 2
+
+    third_results = run_job()
+    assert all(result["skipped"] for result in third_results.values())
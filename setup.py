@@ -157,6 +157,18 @@ def main():
     test_requirements = get_requirements_from_packages(test_packages)
     setup_requirements = ["pytest-runner", "pytest", "pytest-cov"]
 
+    # Get Optional Requirements (Installed as Extras)
+    extras_requirements = {
+        "async": ["aiohttp"],
+        "avro": ["fastavro"],
+        "json": ["ijson"],
+        "numpy": ["numpy"],
+        "opentelemetry": ["opentelemetry-api"],
+        "parquet": ["pyarrow"],
+        "prometheus": ["prometheus_client"],
+        "zstd": ["zstandard"],
+    }
+
     # Get Dependency Links For Each Requirement (As Necessary)
     dependency_links = []
 
@@ -174,6 +186,7 @@ def main():
             'Programming Language :: Python :: 3.8',
         ],
         description=("Python utilities used for interacting with Minio Object Storage"),
+        extras_require=extras_requirements,
         include_package_data=True,
         install_requires=install_requirements,
         keywords=["python", "libraries", "minio", "object storage"],